@@ -116,14 +116,18 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 log_info "Installing systemd unit files..."
 cp "${SCRIPT_DIR}/second-brain.service" /etc/systemd/system/
 cp "${SCRIPT_DIR}/second-brain-briefing.service" /etc/systemd/system/
+cp "${SCRIPT_DIR}/second-brain-briefing-precompute.service" /etc/systemd/system/
 cp "${SCRIPT_DIR}/second-brain-briefing.timer" /etc/systemd/system/
+cp "${SCRIPT_DIR}/second-brain-briefing-precompute.timer" /etc/systemd/system/
 cp "${SCRIPT_DIR}/second-brain-nudge.service" /etc/systemd/system/
 cp "${SCRIPT_DIR}/second-brain-nudge.timer" /etc/systemd/system/
 
 # Set permissions
 chmod 644 /etc/systemd/system/second-brain.service
 chmod 644 /etc/systemd/system/second-brain-briefing.service
+chmod 644 /etc/systemd/system/second-brain-briefing-precompute.service
 chmod 644 /etc/systemd/system/second-brain-briefing.timer
+chmod 644 /etc/systemd/system/second-brain-briefing-precompute.timer
 chmod 644 /etc/systemd/system/second-brain-nudge.service
 chmod 644 /etc/systemd/system/second-brain-nudge.timer
 
@@ -135,6 +139,7 @@ systemctl daemon-reload
 log_info "Enabling services..."
 systemctl enable second-brain.service
 systemctl enable second-brain-briefing.timer
+systemctl enable second-brain-briefing-precompute.timer
 systemctl enable second-brain-nudge.timer
 
 log_info "Installation complete!"
@@ -145,6 +150,7 @@ echo "  2. Build or pull the Docker image: docker build -t second-brain:latest .
 echo "  3. Start the bot: sudo systemctl start second-brain.service"
 echo "  4. Start the timers:"
 echo "     sudo systemctl start second-brain-briefing.timer  # 7am briefing"
+echo "     sudo systemctl start second-brain-briefing-precompute.timer  # 6:40am snapshot"
 echo "     sudo systemctl start second-brain-nudge.timer     # 9am/2pm/6pm nudges"
 echo
 echo "Useful commands:"
@@ -29,6 +29,7 @@ async def run_bot() -> None:
 
 async def send_briefing() -> None:
     from assistant.services import BriefingGenerator
+    from assistant.services.briefing import get_briefing_snapshot_store
     from assistant.telegram import SecondBrainBot
 
     if not settings.has_telegram:
@@ -39,7 +40,8 @@ async def send_briefing() -> None:
         print("Error: USER_TELEGRAM_CHAT_ID not configured")
         sys.exit(1)
 
-    generator = BriefingGenerator()
+    # Refreshes the pre-computed snapshot if one was built earlier today
+    generator = BriefingGenerator(snapshot_store=get_briefing_snapshot_store())
     briefing = await generator.generate_morning_briefing()
 
     bot = SecondBrainBot()
@@ -49,6 +51,22 @@ async def send_briefing() -> None:
     print("Briefing sent successfully")
 
 
+async def precompute_briefing() -> None:
+    """Build the morning briefing snapshot ahead of the scheduled send."""
+    from assistant.services.briefing import precompute_briefing as build_snapshot
+
+    if not settings.has_notion:
+        print("Error: NOTION_API_KEY not configured")
+        sys.exit(1)
+
+    snapshot = await build_snapshot()
+    if snapshot is None:
+        print("Error: briefing snapshot could not be saved")
+        sys.exit(1)
+
+    print(f"Briefing snapshot saved ({snapshot.generated_at.strftime('%H:%M')})")
+
+
 async def check_config() -> None:
     print("Second Brain Configuration Check\n")
 
@@ -271,6 +289,7 @@ def main() -> None:
 
     subparsers.add_parser("run", help="Start the Telegram bot")
     subparsers.add_parser("briefing", help="Send morning briefing")
+    subparsers.add_parser("briefing-precompute", help="Pre-compute morning briefing snapshot")
     subparsers.add_parser("check", help="Check configuration")
     subparsers.add_parser("sync", help="Process offline queue")
     subparsers.add_parser("nudge", help="Send proactive task reminders")
@@ -292,6 +311,8 @@ def main() -> None:
             asyncio.run(run_bot())
         elif args.command == "briefing":
             asyncio.run(send_briefing())
+        elif args.command == "briefing-precompute":
+            asyncio.run(precompute_briefing())
         elif args.command == "check":
             asyncio.run(check_config())
         elif args.command == "sync":
@@ -9,9 +9,15 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     gemini_api_key: str = ""
     gemini_model: str = "gemini-2.0-flash"  # Fast: 200+ tokens/sec
+    llm_parser_latency_budget: float = 3.0  # seconds before falling back to regex parser
     anthropic_api_key: str = ""
     openrouter_api_key: str = ""
     openrouter_model: str = "openai/gpt-4o"  # High performance via OpenRouter
+    llm_hedge_delay: float = 2.0  # seconds before racing the next provider (until p95 is known)
+    llm_hedge_percentile: float = 0.95  # latency percentile that triggers a hedged request
+    llm_cache_enabled: bool = True  # cache LLM responses in memory and under data_dir
+    llm_cache_max_entries: int = 512  # in-memory LRU size
+    llm_cache_ttl: int = 3600  # default seconds a cached response stays valid
 
     notion_inbox_db_id: str = ""
     notion_tasks_db_id: str = ""
@@ -26,6 +32,12 @@ class Settings(BaseSettings):
     google_client_id: str = ""
     google_client_secret: str = ""
     google_maps_api_key: str = ""
+    maps_cache_enabled: bool = True  # cache geocode/place lookups in memory and under data_dir
+    maps_cache_max_entries: int = 1024  # in-memory LRU size
+    place_index_enabled: bool = True  # geohash index of place coordinates under data_dir
+    place_geocode_enabled: bool = True  # back-fill coordinates for places in the background
+    place_geocode_interval: int = 900  # seconds between back-fill cycles
+    place_geocode_batch_size: int = 20  # places geocoded per cycle
 
     # WhatsApp Business Cloud API settings
     whatsapp_phone_number_id: str = ""
@@ -50,6 +62,37 @@ class Settings(BaseSettings):
     email_scan_interval: int = 300  # seconds (5 min default)
     email_importance_threshold: int = 50  # minimum score to flag as important
     email_llm_model: str = "google/gemini-2.0-flash-exp"  # Gemini 3 Flash via OpenRouter
+    email_analysis_concurrency: int = 4  # parallel LLM analyses (keep under OpenRouter rate limit)
+    email_analysis_batch_size: int = 10  # emails per batched LLM request (1 disables batching)
+    email_incremental_sync: bool = True  # fetch only Gmail history deltas between scans
+
+    # Shared HTTP connection pool (opened for the bot's lifetime)
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 60.0  # seconds an idle connection stays open
+    http2_enabled: bool = True  # only takes effect when the h2 package is installed
+
+    # Local Notion replica (reads served from SQLite under data_dir)
+    notion_replica_enabled: bool = False
+    notion_replica_sync_interval: int = 60  # seconds between incremental syncs
+    notion_replica_full_sync_interval: int = 3600  # seconds between full resyncs
+
+    # Client-wide guards on Notion API requests
+    notion_rate_limit: float = 3.0  # average requests/second (Notion allows ~3)
+    notion_circuit_failure_threshold: int = 5  # consecutive failures before failing fast
+    notion_circuit_reset_timeout: float = 30.0  # seconds before probing Notion again
+
+    # Audit log entries buffered and written to Notion in the background
+    audit_buffer_enabled: bool = True
+    audit_batch_size: int = 20  # buffered entries that trigger an immediate flush
+    audit_flush_interval: float = 2.0  # seconds an entry may wait before a flush
+
+    # Local index of idempotency keys already written to Notion (under data_dir)
+    idempotency_index_enabled: bool = True
+    idempotency_ttl_days: int = 90  # days a key is remembered
+    idempotency_max_entries: int = 100_000  # keys kept at most (oldest dropped first)
+
+    pattern_cache_ttl: int = 300  # seconds before learned patterns are refreshed from Notion
 
     confidence_threshold: int = 80
     morning_briefing_hour: int = 7
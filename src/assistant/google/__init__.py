@@ -19,18 +19,23 @@ from assistant.google.gmail import (
     EmailListResult,
     EmailMessage,
     GmailClient,
+    HistoryResult,
     get_email_by_id,
     get_gmail_client,
     list_emails,
     list_emails_needing_response,
     list_unread_emails,
 )
-from assistant.google.maps import MapsClient, PlaceDetails, TravelTime
+from assistant.google.maps import MapsClient, PlaceDetails, TravelTime, TravelTimeBatcher
+from assistant.google.place_cache import PlaceCache, get_place_cache
 
 __all__ = [
     "MapsClient",
     "PlaceDetails",
     "TravelTime",
+    "TravelTimeBatcher",
+    "PlaceCache",
+    "get_place_cache",
     "DriveClient",
     "DriveFile",
     "GoogleAuth",
@@ -50,6 +55,7 @@ __all__ = [
     "GmailClient",
     "EmailMessage",
     "EmailListResult",
+    "HistoryResult",
     "get_gmail_client",
     "list_emails",
     "list_unread_emails",
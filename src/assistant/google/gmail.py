@@ -40,6 +40,19 @@ logger = logging.getLogger(__name__)
 # Default number of emails to fetch for briefings
 DEFAULT_EMAIL_LIMIT = 20
 
+# Message detail fetches per Gmail batch request (Gmail recommends <= 50)
+DETAIL_BATCH_SIZE = 50
+
+# Only the headers _parse_message reads
+METADATA_HEADERS = ["Subject", "From", "Date"]
+
+# Partial response projection for message details: headers, snippet, labels,
+# and just enough of the MIME tree to detect attachments
+DETAIL_FIELDS = (
+    "id,threadId,labelIds,snippet,"
+    "payload(headers(name,value),parts(filename,parts(filename,parts(filename))))"
+)
+
 # Labels to exclude from attention-needing emails
 SKIP_LABELS = {"CATEGORY_PROMOTIONS", "CATEGORY_SOCIAL", "CATEGORY_UPDATES", "SPAM", "TRASH"}
 
@@ -83,6 +96,21 @@ class EmailListResult:
     total_count: int = 0
 
 
+@dataclass
+class HistoryResult:
+    """Result of an incremental history sync.
+
+    expired is True when Gmail no longer has the requested start point
+    (HTTP 404); the caller must fall back to a full resync.
+    """
+
+    success: bool
+    message_ids: list[str] = field(default_factory=list)
+    history_id: str | None = None
+    expired: bool = False
+    error: str | None = None
+
+
 @dataclass
 class DraftResult:
     """Result of creating or retrieving a draft.
@@ -238,14 +266,15 @@ class GmailClient:
             if not messages:
                 return EmailListResult(success=True, emails=[], total_count=0)
 
-            # Fetch details for each message
-            emails: list[EmailMessage] = []
-            for msg_ref in messages:
-                email = await self._get_email_details(msg_ref["id"])
-                if email:
-                    # Skip promotional/social emails
-                    if not any(label in SKIP_LABELS for label in email.labels):
-                        emails.append(email)
+            # Fetch details for all messages in batched requests
+            details = await self._get_email_details_batch([m["id"] for m in messages])
+
+            # Skip promotional/social emails
+            emails = [
+                email
+                for email in details
+                if not any(label in SKIP_LABELS for label in email.labels)
+            ]
 
             # Sort by received date, newest first
             emails.sort(key=lambda e: e.received_at, reverse=True)
@@ -286,15 +315,7 @@ class GmailClient:
             loop = asyncio.get_event_loop()
 
             def do_get() -> dict[str, Any]:
-                return cast(
-                    dict[str, Any],
-                    (
-                        self.service.users()
-                        .messages()
-                        .get(userId="me", id=message_id, format="metadata")
-                        .execute()
-                    ),
-                )
+                return cast(dict[str, Any], self._details_request(message_id).execute())
 
             msg = await loop.run_in_executor(None, do_get)
             return self._parse_message(msg)
@@ -303,6 +324,83 @@ class GmailClient:
             logger.warning(f"Failed to get email details for {message_id}: {e}")
             return None
 
+    async def _get_email_details_batch(self, message_ids: list[str]) -> list[EmailMessage]:
+        """Get details for many messages using Gmail batch requests.
+
+        Up to DETAIL_BATCH_SIZE detail fetches are sent in one HTTP round-trip
+        instead of one call per message. A message that fails is logged and
+        skipped; if a whole batch fails, its messages are fetched one by one.
+
+        Args:
+            message_ids: Gmail message IDs
+
+        Returns:
+            Parsed EmailMessage objects in input order (failures omitted)
+        """
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        fetched: dict[str, dict[str, Any]] = {}
+        retry: list[str] = []
+
+        def do_batches() -> None:
+            # googleapiclient's HTTP transport is not thread-safe, so batches
+            # run one after another inside a single executor call
+            for start in range(0, len(message_ids), DETAIL_BATCH_SIZE):
+                chunk = message_ids[start : start + DETAIL_BATCH_SIZE]
+
+                def callback(
+                    request_id: str, response: dict[str, Any] | None, exception: Exception | None
+                ) -> None:
+                    if exception is not None:
+                        logger.warning(f"Failed to get email details for {request_id}: {exception}")
+                    elif response is not None:
+                        fetched[request_id] = response
+
+                try:
+                    batch = self.service.new_batch_http_request(callback=callback)
+                    for message_id in chunk:
+                        batch.add(self._details_request(message_id), request_id=message_id)
+                    batch.execute()
+                except Exception as e:
+                    logger.warning(f"Gmail batch request failed, fetching individually: {e}")
+                    retry.extend(mid for mid in chunk if mid not in fetched)
+
+        await loop.run_in_executor(None, do_batches)
+
+        emails_by_id: dict[str, EmailMessage] = {}
+        for message_id, msg in fetched.items():
+            email = self._parse_message(msg)
+            if email:
+                emails_by_id[message_id] = email
+        for message_id in retry:
+            retried = await self._get_email_details(message_id)
+            if retried:
+                emails_by_id[message_id] = retried
+
+        return [emails_by_id[mid] for mid in message_ids if mid in emails_by_id]
+
+    def _details_request(self, message_id: str) -> Any:
+        """Build a metadata-only messages.get request for one message.
+
+        Args:
+            message_id: Gmail message ID
+
+        Returns:
+            Unexecuted googleapiclient HttpRequest
+        """
+        return (
+            self.service.users()
+            .messages()
+            .get(
+                userId="me",
+                id=message_id,
+                format="metadata",
+                metadataHeaders=METADATA_HEADERS,
+                fields=DETAIL_FIELDS,
+            )
+        )
+
     async def get_email(self, message_id: str) -> EmailMessage | None:
         """Get a single email by ID.
 
@@ -317,6 +415,135 @@ class GmailClient:
 
         return await self._get_email_details(message_id)
 
+    async def get_emails(self, message_ids: list[str]) -> EmailListResult:
+        """Get several emails by ID in batched requests.
+
+        Promotional/social emails are filtered out, as in list_emails.
+
+        Args:
+            message_ids: Gmail message IDs
+
+        Returns:
+            EmailListResult with the emails that could be fetched, newest first
+        """
+        if not self.is_authenticated():
+            return EmailListResult(
+                success=False,
+                error="Gmail not authenticated. Please run OAuth flow first.",
+            )
+
+        details = await self._get_email_details_batch(message_ids)
+        emails = [e for e in details if not any(label in SKIP_LABELS for label in e.labels)]
+        emails.sort(key=lambda e: e.received_at, reverse=True)
+        return EmailListResult(success=True, emails=emails, total_count=len(emails))
+
+    async def get_history_id(self) -> str | None:
+        """Get the mailbox's current historyId.
+
+        Used as the starting checkpoint for list_history.
+
+        Returns:
+            historyId string, or None if unavailable
+        """
+        if not self.is_authenticated():
+            return None
+
+        try:
+            import asyncio
+
+            loop = asyncio.get_event_loop()
+
+            def do_get() -> dict[str, Any]:
+                return cast(
+                    dict[str, Any],
+                    self.service.users().getProfile(userId="me").execute(),
+                )
+
+            profile = await loop.run_in_executor(None, do_get)
+            history_id = profile.get("historyId")
+            return str(history_id) if history_id else None
+
+        except Exception as e:
+            logger.warning(f"Failed to get Gmail historyId: {e}")
+            return None
+
+    async def list_history(
+        self,
+        start_history_id: str,
+        label_id: str = "INBOX",
+    ) -> HistoryResult:
+        """List messages added since a history checkpoint.
+
+        Pages through users.history.list for messageAdded events, so only
+        the changes since start_history_id are transferred.
+
+        Args:
+            start_history_id: historyId from a previous sync
+            label_id: Only report messages added with this label
+
+        Returns:
+            HistoryResult with added message IDs (oldest first) and the new
+            checkpoint; expired=True if start_history_id is too old
+        """
+        if not self.is_authenticated():
+            return HistoryResult(
+                success=False,
+                error="Gmail not authenticated. Please run OAuth flow first.",
+            )
+
+        try:
+            import asyncio
+
+            loop = asyncio.get_event_loop()
+
+            def do_list() -> tuple[list[str], str | None]:
+                message_ids: list[str] = []
+                seen: set[str] = set()
+                history_id: str | None = None
+                page_token: str | None = None
+                while True:
+                    kwargs: dict[str, Any] = {
+                        "userId": "me",
+                        "startHistoryId": start_history_id,
+                        "historyTypes": ["messageAdded"],
+                        "labelId": label_id,
+                    }
+                    if page_token:
+                        kwargs["pageToken"] = page_token
+                    response = self.service.users().history().list(**kwargs).execute()
+
+                    for record in response.get("history", []):
+                        for added in record.get("messagesAdded", []):
+                            message_id = added.get("message", {}).get("id")
+                            if message_id and message_id not in seen:
+                                seen.add(message_id)
+                                message_ids.append(message_id)
+
+                    history_id = response.get("historyId", history_id)
+                    page_token = response.get("nextPageToken")
+                    if not page_token:
+                        return message_ids, history_id
+
+            message_ids, history_id = await loop.run_in_executor(None, do_list)
+            return HistoryResult(
+                success=True,
+                message_ids=message_ids,
+                history_id=str(history_id) if history_id else start_history_id,
+            )
+
+        except HttpError as e:
+            if e.resp.status == 404:
+                logger.info(f"Gmail historyId {start_history_id} expired, full resync needed")
+                return HistoryResult(success=False, expired=True, error="History expired")
+            logger.exception(f"Gmail API error: {e}")
+            return HistoryResult(
+                success=False,
+                error=f"Gmail API error: {e.reason if hasattr(e, 'reason') else str(e)}",
+            )
+        except Exception as e:
+            logger.exception(f"Failed to list Gmail history: {e}")
+            return HistoryResult(success=False, error=f"Failed to list history: {str(e)}")
+
     async def list_unread(
         self,
         max_results: int = DEFAULT_EMAIL_LIMIT,
@@ -1,15 +1,60 @@
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Any
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from assistant.config import settings
+from assistant.http_pool import get_shared_client
+
+if TYPE_CHECKING:
+    from assistant.google.place_cache import PlaceCache
+    from assistant.google.travel_cache import TravelTimeCache
 
 logger = logging.getLogger(__name__)
 
 MAPS_BASE_URL = "https://maps.googleapis.com/maps/api"
 
+# Distance Matrix limits per request (traffic-aware requests share the element cap)
+MATRIX_MAX_ORIGINS = 25
+MATRIX_MAX_DESTINATIONS = 25
+MATRIX_MAX_ELEMENTS = 100
+
+# Seconds to wait for the API before answering from travel-time history
+SLOW_MATRIX_TIMEOUT = 3.0
+
+# Lookup statuses that mean "no such place" (cached); anything else may be transient
+NOT_FOUND_STATUSES = frozenset({"ZERO_RESULTS", "NOT_FOUND"})
+
+Location = str | tuple[float, float]
+
+
+def format_location(location: Location) -> str:
+    """Render an address or (lat, lng) pair as a Distance Matrix parameter."""
+    if isinstance(location, str):
+        return location
+    return f"{location[0]},{location[1]}"
+
+
+def matrix_chunks(n_origins: int, n_destinations: int) -> list[tuple[slice, slice]]:
+    """Split an origins x destinations matrix into requests within API limits.
+
+    Returns:
+        (origin slice, destination slice) pairs covering every element once
+    """
+    if n_origins <= 0 or n_destinations <= 0:
+        return []
+    origin_step = min(MATRIX_MAX_ORIGINS, n_origins, MATRIX_MAX_ELEMENTS)
+    dest_step = min(MATRIX_MAX_DESTINATIONS, n_destinations, MATRIX_MAX_ELEMENTS // origin_step)
+    return [
+        (slice(o, o + origin_step), slice(d, d + dest_step))
+        for o in range(0, n_origins, origin_step)
+        for d in range(0, n_destinations, dest_step)
+    ]
+
 
 @dataclass
 class PlaceDetails:
@@ -34,6 +79,7 @@ class TravelTime:
     distance_meters: int
     duration_seconds: int
     duration_in_traffic_seconds: int | None = None
+    estimated: bool = False  # from travel-time history rather than a live API answer
 
     @property
     def distance_km(self) -> float:
@@ -65,16 +111,48 @@ class TravelTime:
 
 
 class MapsClient:
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache: "PlaceCache | None" = None,
+        travel_cache: "TravelTimeCache | None" = None,
+    ):
         self.api_key = api_key or settings.google_maps_api_key
         self._client: httpx.AsyncClient | None = None
+        if cache is None:
+            from assistant.google.place_cache import get_place_cache
+
+            cache = get_place_cache()
+        self.cache = cache
+        if travel_cache is None:
+            from assistant.google.travel_cache import get_travel_time_cache
+
+            travel_cache = get_travel_time_cache()
+        self.travel_cache = travel_cache
+
+    def _cached(self, kind: str, key: str) -> tuple[bool, PlaceDetails | None]:
+        """Look up a cached place; returns (hit, place) where place is None if not found."""
+        if self.cache is None:
+            return False, None
+        hit = self.cache.get(kind, key)
+        if isinstance(hit, PlaceDetails):
+            return True, hit
+        return hit is not None, None
+
+    def _cache_result(self, kind: str, key: str, place: PlaceDetails | None) -> None:
+        if self.cache is not None:
+            self.cache.set(kind, key, place)
 
     async def _get_client(self) -> httpx.AsyncClient:
+        shared = get_shared_client()
+        if shared is not None:
+            return shared
         if self._client is None:
             self._client = httpx.AsyncClient(timeout=30.0)
         return self._client
 
     async def close(self) -> None:
+        # Only closes a private client; the shared pool is closed at shutdown
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -84,6 +162,10 @@ class MapsClient:
             logger.warning("Google Maps API key not configured")
             return None
 
+        hit, cached = self._cached("geocode", address)
+        if hit:
+            return replace(cached, name=address) if cached else None
+
         client = await self._get_client()
 
         try:
@@ -96,6 +178,8 @@ class MapsClient:
 
             if data["status"] != "OK" or not data.get("results"):
                 logger.warning(f"Geocoding failed for '{address}': {data['status']}")
+                if data["status"] in NOT_FOUND_STATUSES:
+                    self._cache_result("geocode", address, None)
                 return None
 
             result = data["results"][0]
@@ -105,7 +189,7 @@ class MapsClient:
             if result.get("types"):
                 place_type = result["types"][0]
 
-            return PlaceDetails(
+            place = PlaceDetails(
                 name=address,
                 address=result["formatted_address"],
                 lat=location["lat"],
@@ -113,6 +197,8 @@ class MapsClient:
                 place_id=result["place_id"],
                 place_type=place_type,
             )
+            self._cache_result("geocode", address, place)
+            return place
         except Exception as e:
             logger.error(f"Geocoding error for '{address}': {e}")
             return None
@@ -122,6 +208,10 @@ class MapsClient:
             logger.warning("Google Maps API key not configured")
             return None
 
+        hit, cached = self._cached("search", query)
+        if hit:
+            return cached
+
         client = await self._get_client()
 
         try:
@@ -134,12 +224,14 @@ class MapsClient:
 
             if data["status"] != "OK" or not data.get("results"):
                 logger.warning(f"Place search failed for '{query}': {data['status']}")
+                if data["status"] in NOT_FOUND_STATUSES:
+                    self._cache_result("search", query, None)
                 return None
 
             result = data["results"][0]
             location = result["geometry"]["location"]
 
-            return PlaceDetails(
+            place = PlaceDetails(
                 name=result.get("name", query),
                 address=result.get("formatted_address", ""),
                 lat=location["lat"],
@@ -147,6 +239,8 @@ class MapsClient:
                 place_id=result["place_id"],
                 place_type=result.get("types", [None])[0],
             )
+            self._cache_result("search", query, place)
+            return place
         except Exception as e:
             logger.error(f"Place search error for '{query}': {e}")
             return None
@@ -155,6 +249,10 @@ class MapsClient:
         if not self.api_key:
             return None
 
+        hit, cached = self._cached("details", place_id)
+        if hit:
+            return cached
+
         client = await self._get_client()
 
         try:
@@ -171,12 +269,14 @@ class MapsClient:
             data = response.json()
 
             if data["status"] != "OK":
+                if data["status"] in NOT_FOUND_STATUSES:
+                    self._cache_result("details", place_id, None)
                 return None
 
             result = data["result"]
             location = result["geometry"]["location"]
 
-            return PlaceDetails(
+            place = PlaceDetails(
                 name=result["name"],
                 address=result.get("formatted_address", ""),
                 lat=location["lat"],
@@ -186,30 +286,125 @@ class MapsClient:
                 phone=result.get("formatted_phone_number"),
                 website=result.get("website"),
             )
+            self._cache_result("details", place_id, place)
+            return place
         except Exception as e:
             logger.error(f"Place details error for '{place_id}': {e}")
             return None
 
     async def get_travel_time(
         self,
-        origin: str | tuple[float, float],
-        destination: str | tuple[float, float],
+        origin: Location,
+        destination: Location,
         mode: str = "driving",
     ) -> TravelTime | None:
         if not self.api_key:
             return None
 
-        client = await self._get_client()
+        matrix = await self.get_travel_time_matrix([origin], [destination], mode)
+        return matrix[0][0]
 
-        origin_str = origin if isinstance(origin, str) else f"{origin[0]},{origin[1]}"
-        dest_str = (
-            destination if isinstance(destination, str) else f"{destination[0]},{destination[1]}"
+    async def get_travel_time_matrix(
+        self,
+        origins: Sequence[Location],
+        destinations: Sequence[Location],
+        mode: str = "driving",
+    ) -> list[list[TravelTime | None]]:
+        """Get travel times for every origin x destination pair.
+
+        Pairs with a fresh entry in the travel-time cache are answered
+        locally. The rest are split into as few Distance Matrix requests as
+        the API limits allow, and the requests run concurrently. A request
+        that fails or is slow is answered from travel-time history, and those
+        cells are marked estimated.
+
+        Args:
+            origins: Addresses or (lat, lng) pairs
+            destinations: Addresses or (lat, lng) pairs
+            mode: Travel mode (driving, walking, bicycling, transit)
+
+        Returns:
+            Rows per origin, columns per destination. Failed routes are None.
+        """
+        origin_strs = [format_location(o) for o in origins]
+        dest_strs = [format_location(d) for d in destinations]
+        matrix: list[list[TravelTime | None]] = [[None] * len(dest_strs) for _ in origin_strs]
+        if not self.api_key or not origin_strs or not dest_strs:
+            return matrix
+
+        missing: list[tuple[int, int]] = []
+        for i, origin in enumerate(origin_strs):
+            for j, destination in enumerate(dest_strs):
+                cached = (
+                    self.travel_cache.get(origin, destination, mode) if self.travel_cache else None
+                )
+                if cached is not None:
+                    matrix[i][j] = cached
+                else:
+                    missing.append((i, j))
+        if not missing:
+            return matrix
+
+        # Only request the rows and columns that still have gaps
+        rows = sorted({i for i, _ in missing})
+        cols = sorted({j for _, j in missing})
+        sub_origins = [origin_strs[i] for i in rows]
+        sub_dests = [dest_strs[j] for j in cols]
+        chunks = matrix_chunks(len(rows), len(cols))
+        fetched = await asyncio.gather(
+            *(self._fetch_or_estimate(sub_origins[os], sub_dests[ds], mode) for os, ds in chunks)
         )
+        for (os, ds), sub in zip(chunks, fetched, strict=True):
+            for i, row in zip(rows[os], sub, strict=True):
+                for j, travel_time in zip(cols[ds], row, strict=True):
+                    if matrix[i][j] is None:
+                        matrix[i][j] = travel_time
+        return matrix
+
+    async def _fetch_or_estimate(
+        self, origins: list[str], destinations: list[str], mode: str
+    ) -> list[list[TravelTime | None]]:
+        """Fetch one chunk, falling back to history if the API fails or is slow.
+
+        The API only gets SLOW_MATRIX_TIMEOUT seconds when every pair in the
+        chunk already has a historical estimate to fall back on.
+        """
+        estimates: list[list[TravelTime | None]] = [[None] * len(destinations) for _ in origins]
+        if self.travel_cache is not None:
+            estimates = [
+                [self.travel_cache.estimate(o, d, mode) for d in destinations] for o in origins
+            ]
+
+        fetch = self._fetch_matrix(origins, destinations, mode)
+        if all(e is not None for row in estimates for e in row):
+            try:
+                rows = await asyncio.wait_for(fetch, SLOW_MATRIX_TIMEOUT)
+            except TimeoutError:
+                logger.warning(f"Distance matrix slower than {SLOW_MATRIX_TIMEOUT}s, using history")
+                rows = None
+        else:
+            rows = await fetch
+
+        if rows is None:
+            return estimates
+
+        if self.travel_cache is not None:
+            for row in rows:
+                for travel_time in row:
+                    if travel_time is not None:
+                        self.travel_cache.record(travel_time, mode)
+        return rows
+
+    async def _fetch_matrix(
+        self, origins: list[str], destinations: list[str], mode: str
+    ) -> list[list[TravelTime | None]] | None:
+        """Issue one Distance Matrix request (caller keeps it within limits)."""
+        client = await self._get_client()
 
         try:
             params: dict[str, Any] = {
-                "origins": origin_str,
-                "destinations": dest_str,
+                "origins": "|".join(origins),
+                "destinations": "|".join(destinations),
                 "mode": mode,
                 "key": self.api_key,
             }
@@ -228,26 +423,35 @@ class MapsClient:
                 logger.warning(f"Distance matrix failed: {data['status']}")
                 return None
 
-            element = data["rows"][0]["elements"][0]
-            if element["status"] != "OK":
-                logger.warning(f"Route not found: {element['status']}")
-                return None
-
-            duration_in_traffic = None
-            if "duration_in_traffic" in element:
-                duration_in_traffic = element["duration_in_traffic"]["value"]
-
-            return TravelTime(
-                origin=origin_str,
-                destination=dest_str,
-                distance_meters=element["distance"]["value"],
-                duration_seconds=element["duration"]["value"],
-                duration_in_traffic_seconds=duration_in_traffic,
-            )
+            return [
+                [
+                    self._parse_element(element, origin, destination)
+                    for destination, element in zip(destinations, row["elements"], strict=True)
+                ]
+                for origin, row in zip(origins, data["rows"], strict=True)
+            ]
         except Exception as e:
             logger.error(f"Travel time error: {e}")
             return None
 
+    @staticmethod
+    def _parse_element(element: dict[str, Any], origin: str, destination: str) -> TravelTime | None:
+        if element["status"] != "OK":
+            logger.warning(f"Route not found: {element['status']}")
+            return None
+
+        duration_in_traffic = None
+        if "duration_in_traffic" in element:
+            duration_in_traffic = element["duration_in_traffic"]["value"]
+
+        return TravelTime(
+            origin=origin,
+            destination=destination,
+            distance_meters=element["distance"]["value"],
+            duration_seconds=element["duration"]["value"],
+            duration_in_traffic_seconds=duration_in_traffic,
+        )
+
     async def enrich_place(self, place_name: str) -> PlaceDetails | None:
         place = await self.search_place(place_name)
         if place and place.place_id:
@@ -255,3 +459,81 @@ class MapsClient:
             if detailed:
                 return detailed
         return place
+
+
+class TravelTimeBatcher:
+    """Collect the travel-time lookups of one operation and resolve them together.
+
+    Callers ``add`` every (origin, destination) pair they will need, ``await
+    resolve()`` once, then read results with ``get``. Pairs are grouped into
+    as few Distance Matrix requests as possible: one request when the whole
+    origins x destinations grid fits, otherwise one matrix per set of origins
+    sharing the same destinations.
+    """
+
+    def __init__(self, client: MapsClient, mode: str = "driving"):
+        self.client = client
+        self.mode = mode
+        self._pending: dict[tuple[str, str], None] = {}
+        self._results: dict[tuple[str, str], TravelTime | None] = {}
+
+    def add(self, origin: Location, destination: Location) -> tuple[str, str]:
+        """Queue a lookup; returns the key used by ``get``."""
+        key = (format_location(origin), format_location(destination))
+        if key not in self._results:
+            self._pending[key] = None
+        return key
+
+    def has(self, origin: Location, destination: Location) -> bool:
+        """Whether a pair has already been resolved."""
+        return (format_location(origin), format_location(destination)) in self._results
+
+    def get(self, origin: Location, destination: Location) -> TravelTime | None:
+        """Result of a resolved lookup (None if unresolved or no route)."""
+        return self._results.get((format_location(origin), format_location(destination)))
+
+    async def resolve(self) -> dict[tuple[str, str], TravelTime | None]:
+        """Fetch every pending lookup and return all results so far."""
+        pending = list(self._pending)
+        self._pending.clear()
+        if not pending:
+            return self._results
+
+        try:
+            if len(pending) == 1:
+                origin, destination = pending[0]
+                self._results[pending[0]] = await self.client.get_travel_time(
+                    origin=origin, destination=destination, mode=self.mode
+                )
+            else:
+                await self._resolve_matrices(pending)
+        except Exception as e:
+            logger.warning(f"Batched travel time lookup failed: {e}")
+        for key in pending:
+            self._results.setdefault(key, None)
+        return self._results
+
+    async def _resolve_matrices(self, pending: list[tuple[str, str]]) -> None:
+        origins = list(dict.fromkeys(o for o, _ in pending))
+        destinations = list(dict.fromkeys(d for _, d in pending))
+        if len(origins) * len(destinations) <= MATRIX_MAX_ELEMENTS:
+            groups = [(origins, destinations)]
+        else:
+            by_origin: dict[str, list[str]] = defaultdict(list)
+            for origin, destination in pending:
+                by_origin[origin].append(destination)
+            by_destinations: dict[tuple[str, ...], list[str]] = defaultdict(list)
+            for origin, dests in by_origin.items():
+                by_destinations[tuple(dests)].append(origin)
+            groups = [(group, list(dests)) for dests, group in by_destinations.items()]
+
+        matrices = await asyncio.gather(
+            *(
+                self.client.get_travel_time_matrix(group, dests, mode=self.mode)
+                for group, dests in groups
+            )
+        )
+        for (group, dests), matrix in zip(groups, matrices, strict=True):
+            for origin, row in zip(group, matrix, strict=True):
+                for destination, travel_time in zip(dests, row, strict=True):
+                    self._results[(origin, destination)] = travel_time
@@ -0,0 +1,290 @@
+"""Persistent cache for Google Maps geocoding and place lookups.
+
+The same home address, office and favourite places are geocoded on every
+briefing, proximity query and place enrichment. Their coordinates almost
+never change, so lookups are cached in two tiers:
+    - an in-memory LRU of the most recently used entries
+    - an SQLite table under data_dir that survives restarts, bounded by
+      evicting the least recently used rows
+
+Keys are the lookup kind plus a normalized address/query or a place_id.
+Coordinates (geocode, text search) are kept for months; place details carry
+phone numbers and websites that do change, so they expire sooner. Not-found
+answers are cached too (briefly) so a typo'd address is not retried on
+every briefing.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from assistant.config import settings
+from assistant.google.maps import PlaceDetails
+from assistant.sqlite_db import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+# Defaults used when settings do not override them
+DEFAULT_MAX_ENTRIES = 1024  # memory tier
+DEFAULT_MAX_DISK_ENTRIES = 20_000
+
+# Per-lookup TTLs (seconds)
+COORDINATES_CACHE_TTL = 90 * 24 * 3600  # geocode / text search results
+DETAILS_CACHE_TTL = 7 * 24 * 3600  # phone, website, opening details
+NOT_FOUND_CACHE_TTL = 24 * 3600  # negative results
+
+# Sentinel distinguishing a cached "not found" from a cache miss
+NOT_FOUND = object()
+
+# Disk hits whose access times are buffered before one batched UPDATE
+TOUCH_BATCH_SIZE = 64
+
+PLACE_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS places (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_places_lru ON places (last_used);
+"""
+
+
+def default_ttl(kind: str, place: PlaceDetails | None) -> float:
+    """TTL for a lookup result: short for not found, shorter for details."""
+    if place is None:
+        return NOT_FOUND_CACHE_TTL
+    if kind == "details":
+        return DETAILS_CACHE_TTL
+    return COORDINATES_CACHE_TTL
+
+
+def get_place_cache_path() -> Path:
+    """Get path to the on-disk place cache."""
+    return Path(settings.data_dir).expanduser() / "cache" / "places.db"
+
+
+def normalize_place_key(text: str) -> str:
+    """Normalize an address or place query so trivial variants share a key.
+
+    "123  Main St., " and "123 main st" map to the same key.
+    """
+    text = re.sub(r"[\s,]+", " ", text.lower())
+    return text.strip(" .,;")
+
+
+class PlaceCache:
+    """Two-tier (memory LRU + SQLite) cache of Maps place lookups."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        persist: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite path for the disk tier (defaults to data_dir/cache/places.db)
+            max_entries: Maximum entries held in the memory tier
+            max_disk_entries: Maximum rows kept in the disk tier
+            persist: Keep a disk tier; False for a memory-only cache
+        """
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[str, tuple[float, PlaceDetails | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.path: Path | None = (path or get_place_cache_path()) if persist else None
+        self._conn: sqlite3.Connection | None = None
+        # Disk-hit access times not yet written (key -> unix time)
+        self._touched: dict[str, float] = {}
+
+    def _db(self) -> sqlite3.Connection | None:
+        """Open the disk tier on first use (None for a memory-only cache)."""
+        if self._conn is None and self.path is not None:
+            conn = open_sqlite(self.path, PLACE_CACHE_SCHEMA)
+            if conn is None:
+                self.path = None
+                return None
+            try:
+                conn.execute("DELETE FROM places WHERE expires_at <= ?", (time.time(),))
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Place cache cleanup failed: %s", e)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Write pending access times and close the disk tier."""
+        if self._conn is not None:
+            self._flush_touches()
+            self._conn.close()
+            self._conn = None
+
+    def _flush_touches(self) -> None:
+        """Write buffered disk-hit access times in one statement."""
+        if not self._touched or self._conn is None:
+            return
+        touched, self._touched = self._touched, {}
+        try:
+            self._conn.executemany(
+                "UPDATE places SET last_used = ? WHERE key = ?",
+                [(used_at, key) for key, used_at in touched.items()],
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Place cache access-time update failed: %s", e)
+
+    def get(self, kind: str, key: str) -> PlaceDetails | None | object:
+        """Look up a cached place.
+
+        Args:
+            kind: Lookup kind ("geocode", "search", "details")
+            key: Address, query or place_id (normalized here)
+
+        Returns:
+            The cached PlaceDetails, NOT_FOUND for a cached negative result,
+            or None on miss/expiry
+        """
+        cache_key = self._key(kind, key)
+        now = time.time()
+
+        entry = self._memory.get(cache_key)
+        if entry is not None:
+            expires_at, place = entry
+            if expires_at > now:
+                self._memory.move_to_end(cache_key)
+                self.hits += 1
+                return NOT_FOUND if place is None else place
+            del self._memory[cache_key]
+
+        try:
+            conn = self._db()
+            if conn is not None:
+                row = conn.execute(
+                    "SELECT expires_at, data FROM places WHERE key = ?", (cache_key,)
+                ).fetchone()
+                if row and row[0] > now:
+                    data = json.loads(row[1])
+                    place = PlaceDetails(**data) if data is not None else None
+                    self._remember(cache_key, row[0], place)
+                    # Access times only order disk eviction, so they are
+                    # written in batches rather than on every hit
+                    self._touched[cache_key] = now
+                    if len(self._touched) >= TOUCH_BATCH_SIZE:
+                        self._flush_touches()
+                    self.hits += 1
+                    return NOT_FOUND if place is None else place
+                if row:
+                    conn.execute("DELETE FROM places WHERE key = ?", (cache_key,))
+                    conn.commit()
+        except (sqlite3.Error, json.JSONDecodeError, TypeError) as e:
+            logger.warning("Place cache read failed for %s: %s", cache_key, e)
+
+        self.misses += 1
+        return None
+
+    def set(
+        self, kind: str, key: str, place: PlaceDetails | None, ttl: float | None = None
+    ) -> None:
+        """Store a lookup result (None records a not-found answer).
+
+        Args:
+            kind: Lookup kind ("geocode", "search", "details")
+            key: Address, query or place_id (normalized here)
+            place: Result to cache, or None for not found
+            ttl: Seconds the entry stays valid (by kind and outcome when None)
+        """
+        if ttl is None:
+            ttl = default_ttl(kind, place)
+        if ttl <= 0:
+            return
+        cache_key = self._key(kind, key)
+        now = time.time()
+        expires_at = now + ttl
+        self._remember(cache_key, expires_at, place)
+
+        try:
+            conn = self._db()
+            if conn is not None:
+                self._touched.pop(cache_key, None)
+                self._flush_touches()
+                data = json.dumps(asdict(place) if place is not None else None)
+                conn.execute(
+                    "INSERT OR REPLACE INTO places (key, expires_at, last_used, data) "
+                    "VALUES (?, ?, ?, ?)",
+                    (cache_key, expires_at, now, data),
+                )
+                conn.execute(
+                    "DELETE FROM places WHERE key IN ("
+                    "SELECT key FROM places ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Place cache write failed for %s: %s", cache_key, e)
+
+    @staticmethod
+    def _key(kind: str, key: str) -> str:
+        # place_ids are case-sensitive; addresses and queries are not
+        return f"{kind}:{key if kind == 'details' else normalize_place_key(key)}"
+
+    def _remember(self, key: str, expires_at: float, place: PlaceDetails | None) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = (expires_at, place)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached place."""
+        self._memory.clear()
+        self._touched.clear()
+        conn = self._db()
+        if conn is not None:
+            conn.execute("DELETE FROM places")
+            conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters and tier sizes."""
+        lookups = self.hits + self.misses
+        disk_entries = 0
+        conn = self._db()
+        if conn is not None:
+            row = conn.execute("SELECT COUNT(*) FROM places").fetchone()
+            disk_entries = row[0] if row else 0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": disk_entries,
+            "evictions": self.evictions,
+        }
+
+
+# Module-level singleton
+_cache: PlaceCache | None = None
+
+
+def get_place_cache() -> PlaceCache | None:
+    """Get the shared place cache, or None if caching is disabled."""
+    global _cache
+    if not settings.maps_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = PlaceCache(max_entries=settings.maps_cache_max_entries)
+    return _cache
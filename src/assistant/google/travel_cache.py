@@ -0,0 +1,304 @@
+"""Time-bucketed cache and historical model of Maps travel times.
+
+The same (origin, destination) pairs are looked up with departure_time=now
+many times a day by briefings, schedule-conflict checks and proximity
+queries. Results are stored per pair, travel mode and time bucket (day of
+week and hour), so a 08:00 Monday answer is reused for the rest of that hour
+but never for 14:00 on Saturday.
+
+Each row keeps the latest observation, used while it is fresh, and a running
+average across every observation in that bucket. The averages form a small
+historical model. When the Distance Matrix API is slow or unavailable, the
+model gives an immediate offline estimate.
+
+Freshness depends on how fast conditions change for the mode: driving
+results follow live traffic and expire within minutes, while walking and
+cycling times are stable for days.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytz
+from assistant.config import settings
+from assistant.google.maps import TravelTime
+from assistant.google.place_cache import normalize_place_key
+from assistant.sqlite_db import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Seconds a fresh observation is served without calling the API, by mode
+TRAVEL_TIME_TTLS = {
+    "driving": 15 * 60,  # live traffic moves quickly
+    "transit": 6 * 3600,  # timetables change, but rarely within a day
+    "bicycling": 7 * 24 * 3600,
+    "walking": 7 * 24 * 3600,
+}
+DEFAULT_TRAVEL_TIME_TTL = 3600
+
+# Weight of the newest observation in the bucket's running average
+HISTORY_SMOOTHING = 0.3
+
+# Coordinates are rounded to ~100 m so nearby points share entries
+COORDINATE_PRECISION = 3
+
+TRAVEL_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS travel_times (
+    pair TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    distance_meters INTEGER NOT NULL,
+    duration_seconds INTEGER NOT NULL,
+    traffic_seconds INTEGER,
+    avg_duration REAL NOT NULL,
+    avg_traffic REAL,
+    samples INTEGER NOT NULL,
+    PRIMARY KEY (pair, bucket)
+);
+CREATE INDEX IF NOT EXISTS idx_travel_fetched ON travel_times (fetched_at);
+"""
+
+_COORDINATES_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def get_travel_cache_path() -> Path:
+    """Get path to the on-disk travel-time cache."""
+    return Path(settings.data_dir).expanduser() / "cache" / "travel_times.db"
+
+
+def normalize_location(location: str) -> str:
+    """Round "lat,lng" strings and normalize addresses for use in keys."""
+    match = _COORDINATES_RE.match(location)
+    if match:
+        lat, lng = (round(float(v), COORDINATE_PRECISION) for v in match.groups())
+        return f"{lat},{lng}"
+    return normalize_place_key(location)
+
+
+def time_bucket(when: datetime) -> str:
+    """Day-of-week and hour bucket, e.g. "0-08" for Monday 08:00-08:59."""
+    return f"{when.weekday()}-{when.hour:02d}"
+
+
+def ttl_for_mode(mode: str) -> float:
+    """Seconds a fresh observation stays valid for a travel mode."""
+    return TRAVEL_TIME_TTLS.get(mode, DEFAULT_TRAVEL_TIME_TTL)
+
+
+class TravelTimeCache:
+    """SQLite cache of travel times per location pair, mode and time bucket."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        persist: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite path (defaults to data_dir/cache/travel_times.db)
+            max_entries: Maximum (pair, mode, bucket) rows kept
+            persist: Keep the cache on disk; False for an in-memory database
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.path: Path | None = (path or get_travel_cache_path()) if persist else None
+        self._conn: sqlite3.Connection | None = None
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the database on first use.
+
+        If the file cannot be opened the cache falls back to an in-memory
+        database for the life of the process.
+        """
+        if self._conn is None:
+            conn = open_sqlite(self.path, TRAVEL_CACHE_SCHEMA) if self.path else None
+            if conn is None:
+                self.path = None
+                conn = open_sqlite(None, TRAVEL_CACHE_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _pair(origin: str, destination: str, mode: str) -> str:
+        return f"{normalize_location(origin)}|{normalize_location(destination)}|{mode}"
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(pytz.timezone(settings.user_timezone))
+
+    def get(
+        self, origin: str, destination: str, mode: str, when: datetime | None = None
+    ) -> TravelTime | None:
+        """Return a fresh observation for this pair and time bucket, if any."""
+        when = when or self._now()
+        try:
+            row = (
+                self._db()
+                .execute(
+                    "SELECT fetched_at, distance_meters, duration_seconds, traffic_seconds "
+                    "FROM travel_times WHERE pair = ? AND bucket = ?",
+                    (self._pair(origin, destination, mode), time_bucket(when)),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning("Travel-time cache read failed: %s", e)
+            row = None
+
+        if row is None or row[0] + ttl_for_mode(mode) <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return TravelTime(
+            origin=origin,
+            destination=destination,
+            distance_meters=row[1],
+            duration_seconds=row[2],
+            duration_in_traffic_seconds=row[3],
+        )
+
+    def record(self, travel_time: TravelTime, mode: str, when: datetime | None = None) -> None:
+        """Store an API observation and fold it into the bucket's average."""
+        when = when or self._now()
+        pair = self._pair(travel_time.origin, travel_time.destination, mode)
+        bucket = time_bucket(when)
+        traffic = travel_time.duration_in_traffic_seconds
+        try:
+            conn = self._db()
+            row = conn.execute(
+                "SELECT avg_duration, avg_traffic, samples FROM travel_times "
+                "WHERE pair = ? AND bucket = ?",
+                (pair, bucket),
+            ).fetchone()
+            if row is None:
+                avg_duration = float(travel_time.duration_seconds)
+                avg_traffic = float(traffic) if traffic is not None else None
+                samples = 1
+            else:
+                avg_duration = _smooth(row[0], travel_time.duration_seconds)
+                avg_traffic = _smooth(row[1], traffic) if traffic is not None else row[1]
+                samples = row[2] + 1
+            conn.execute(
+                "INSERT OR REPLACE INTO travel_times (pair, bucket, fetched_at, "
+                "distance_meters, duration_seconds, traffic_seconds, avg_duration, "
+                "avg_traffic, samples) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    pair,
+                    bucket,
+                    time.time(),
+                    travel_time.distance_meters,
+                    travel_time.duration_seconds,
+                    traffic,
+                    avg_duration,
+                    avg_traffic,
+                    samples,
+                ),
+            )
+            conn.execute(
+                "DELETE FROM travel_times WHERE rowid IN ("
+                "SELECT rowid FROM travel_times ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Travel-time cache write failed: %s", e)
+
+    def estimate(
+        self, origin: str, destination: str, mode: str, when: datetime | None = None
+    ) -> TravelTime | None:
+        """Estimate a travel time from history, ignoring freshness.
+
+        Prefers the same day and hour, then the same hour on any day, then
+        the sample-weighted average over every bucket for the pair.
+
+        Returns:
+            TravelTime with estimated=True, or None if the pair was never seen
+        """
+        when = when or self._now()
+        bucket = time_bucket(when)
+        hour = bucket.split("-")[1]
+        try:
+            rows = (
+                self._db()
+                .execute(
+                    "SELECT bucket, distance_meters, avg_duration, avg_traffic, samples "
+                    "FROM travel_times WHERE pair = ?",
+                    (self._pair(origin, destination, mode),),
+                )
+                .fetchall()
+            )
+        except sqlite3.Error as e:
+            logger.warning("Travel-time history read failed: %s", e)
+            return None
+        if not rows:
+            return None
+
+        exact = [r for r in rows if r[0] == bucket]
+        same_hour = [r for r in rows if r[0].endswith(f"-{hour}")]
+        chosen = exact or same_hour or rows
+        weight = sum(r[4] for r in chosen)
+        duration = sum(r[2] * r[4] for r in chosen) / weight
+        traffic_rows = [r for r in chosen if r[3] is not None]
+        traffic = None
+        if traffic_rows:
+            traffic_weight = sum(r[4] for r in traffic_rows)
+            traffic = round(sum(r[3] * r[4] for r in traffic_rows) / traffic_weight)
+
+        return TravelTime(
+            origin=origin,
+            destination=destination,
+            distance_meters=chosen[0][1],
+            duration_seconds=round(duration),
+            duration_in_traffic_seconds=traffic,
+            estimated=True,
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters and row count."""
+        lookups = self.hits + self.misses
+        row = self._db().execute("SELECT COUNT(*) FROM travel_times").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": row[0] if row else 0,
+        }
+
+
+def _smooth(average: float | None, value: float) -> float:
+    if average is None:
+        return float(value)
+    return (1 - HISTORY_SMOOTHING) * average + HISTORY_SMOOTHING * value
+
+
+# Module-level singleton
+_cache: TravelTimeCache | None = None
+
+
+def get_travel_time_cache() -> TravelTimeCache | None:
+    """Get the shared travel-time cache, or None if caching is disabled."""
+    global _cache
+    if not settings.maps_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = TravelTimeCache()
+    return _cache
@@ -0,0 +1,141 @@
+"""Application-scoped HTTP connection pool for Second Brain.
+
+Every outbound API client (Notion, Google Maps, WhatsApp, Whisper) used to
+build its own httpx.AsyncClient, and short-lived callers closed it after each
+use, so every Telegram message paid a fresh TCP + TLS handshake to Notion.
+
+This module owns one pooled httpx.AsyncClient for the lifetime of the bot:
+    - open_http_pool() at startup (SecondBrainBot.start)
+    - close_http_pool() at shutdown
+
+While the pool is open, API clients borrow the shared client via
+get_shared_client() and their own close() becomes a no-op for it. When the
+pool is not open (CLI commands, tests) clients fall back to private
+httpx.AsyncClient instances exactly as before.
+
+HTTP/2 is used when the optional ``h2`` package is installed
+(``pip install httpx[http2]``); otherwise the pool speaks HTTP/1.1 with
+keep-alive.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import httpx
+
+from assistant.config import settings
+
+# h2 is optional - HTTP/2 is only enabled when it is installed
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Default request timeout for pooled requests (seconds)
+DEFAULT_POOL_TIMEOUT = 30.0
+
+
+class HttpPool:
+    """Owner of the shared, pooled httpx.AsyncClient."""
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+        timeout: float = DEFAULT_POOL_TIMEOUT,
+    ):
+        """Initialize the pool (the client is created by open()).
+
+        Args:
+            max_connections: Maximum concurrent connections across all hosts
+            max_keepalive_connections: Idle connections kept alive for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Use HTTP/2 if the h2 package is available
+            timeout: Default request timeout in seconds
+        """
+        self.max_connections = max_connections or settings.http_max_connections
+        self.max_keepalive_connections = (
+            max_keepalive_connections or settings.http_max_keepalive_connections
+        )
+        self.keepalive_expiry = (
+            settings.http_keepalive_expiry if keepalive_expiry is None else keepalive_expiry
+        )
+        self.http2 = (settings.http2_enabled if http2 is None else http2) and HTTP2_AVAILABLE
+        self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the shared client is open."""
+        return self._client is not None and not self._client.is_closed
+
+    @property
+    def client(self) -> httpx.AsyncClient | None:
+        """Get the shared client, or None if the pool is not open."""
+        return self._client if self.is_open else None
+
+    async def open(self) -> httpx.AsyncClient:
+        """Open the pool (idempotent) and return the shared client."""
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+
+        self._client = httpx.AsyncClient(
+            http2=self.http2,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+        logger.info(
+            "HTTP pool opened (max_connections=%d, keepalive=%d, http2=%s)",
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.http2,
+        )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared client and all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("HTTP pool closed")
+
+
+# Module-level singleton
+_pool: HttpPool | None = None
+
+
+def get_http_pool() -> HttpPool:
+    """Get or create the HTTP pool singleton."""
+    global _pool
+    if _pool is None:
+        _pool = HttpPool()
+    return _pool
+
+
+def get_shared_client() -> httpx.AsyncClient | None:
+    """Get the shared client if the pool is open, else None."""
+    if _pool is None:
+        return None
+    return _pool.client
+
+
+async def open_http_pool() -> httpx.AsyncClient:
+    """Open the application HTTP pool (convenience function)."""
+    return await get_http_pool().open()
+
+
+async def close_http_pool() -> None:
+    """Close the application HTTP pool (convenience function)."""
+    if _pool is not None:
+        await _pool.close()
@@ -1,4 +1,6 @@
 from assistant.notion.client import NotionClient
+from assistant.notion.idempotency import IdempotencyIndex
+from assistant.notion.replica import NotionReplica
 from assistant.notion.schemas import (
     Email,
     InboxItem,
@@ -13,6 +15,8 @@ from assistant.notion.schemas import (
 
 __all__ = [
     "NotionClient",
+    "NotionReplica",
+    "IdempotencyIndex",
     "InboxItem",
     "Task",
     "Person",
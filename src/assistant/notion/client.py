@@ -1,13 +1,28 @@
+import asyncio
 import hashlib
-import json
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import suppress
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any, TypeVar, cast
 
 import httpx
 from pydantic import BaseModel
 
 from assistant.config import settings
+from assistant.http_pool import get_shared_client
+from assistant.notion.idempotency import (
+    DEDUPE_KEY_PROPERTIES,
+    IdempotencyIndex,
+    get_idempotency_index,
+)
+from assistant.notion.replica import (
+    MAX_PAGE_SIZE,
+    NotionReplica,
+    UnsupportedFilterError,
+    database_id_for,
+    get_notion_replica,
+)
 from assistant.notion.schemas import (
     ActionType,
     Email,
@@ -19,19 +34,157 @@ from assistant.notion.schemas import (
     Project,
     Task,
 )
+from assistant.notion.throttle import (
+    CircuitBreaker,
+    CircuitOpenError,
+    NotionRateLimiter,
+    get_circuit_breaker,
+    get_rate_limiter,
+)
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
 NOTION_API_URL = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28"
+NOTION_TIMEOUT = 30.0
+
+# Pages fetched ahead of the consumer when streaming query results
+DEFAULT_PREFETCH = 1
+
+QueryRequest = Callable[[str, str, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+async def _iter_result_batches(
+    request: QueryRequest,
+    path: str,
+    body: dict[str, Any],
+    limit: int | None,
+    page_size: int,
+) -> AsyncGenerator[list[dict[str, Any]], None]:
+    """Yield one list of results per Notion query page, following next_cursor."""
+    remaining = limit
+    cursor: str | None = None
+
+    while True:
+        request_body = dict(body)
+        request_body["page_size"] = (
+            min(page_size, remaining) if remaining is not None else page_size
+        )
+        if cursor:
+            request_body["start_cursor"] = cursor
+
+        result = await request("POST", path, request_body)
+        results: list[dict[str, Any]] = list(result.get("results", []))
+        if remaining is not None:
+            results = results[:remaining]
+            remaining -= len(results)
+        yield results
+
+        next_cursor = result.get("next_cursor")
+        if result.get("has_more") is not True or not isinstance(next_cursor, str):
+            return
+        if remaining is not None and remaining <= 0:
+            return
+        cursor = next_cursor
+
+
+async def iter_query_results(
+    request: QueryRequest,
+    path: str,
+    body: dict[str, Any] | None = None,
+    limit: int | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Stream every result of a Notion database query, page by page.
+
+    Pages are requested lazily with start_cursor/has_more, so a consumer that
+    stops early (break, aclose) never fetches the remaining pages. With
+    prefetch > 0 a background task reads up to that many pages ahead of the
+    consumer so network time overlaps with processing.
+
+    Args:
+        request: Coroutine performing the HTTP call (usually NotionClient._request)
+        path: Query endpoint path (/databases/{id}/query)
+        body: Query body (filter, sorts); page_size/start_cursor are managed here
+        limit: Maximum number of results in total (None for all)
+        page_size: Results per request (capped at Notion's maximum of 100)
+        prefetch: Pages to buffer ahead of the consumer (0 fetches on demand)
+
+    Yields:
+        Raw Notion page objects
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    batches = _iter_result_batches(
+        request, path, dict(body or {}), limit, min(page_size, MAX_PAGE_SIZE)
+    )
+
+    if prefetch <= 0:
+        try:
+            async for batch in batches:
+                for page in batch:
+                    yield page
+        finally:
+            await batches.aclose()
+        return
 
-OFFLINE_QUEUE_PATH = Path.home() / ".second-brain" / "queue" / "pending.jsonl"
+    queue: asyncio.Queue[list[dict[str, Any]] | Exception | None] = asyncio.Queue(maxsize=prefetch)
+
+    async def produce() -> None:
+        try:
+            async for batch in batches:
+                await queue.put(batch)
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            for page in item:
+                yield page
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
+        await batches.aclose()
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Seconds to wait from a 429 response's Retry-After header (default 1)."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "1")))
+    except ValueError:
+        return 1.0
 
 
 class NotionClient:
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        replica: NotionReplica | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: NotionRateLimiter | None = None,
+        idempotency_index: IdempotencyIndex | None = None,
+    ):
         self.api_key = api_key or settings.notion_api_key
         self._client: httpx.AsyncClient | None = None
+        self._replica = replica if replica is not None else get_notion_replica()
+        self._idempotency = (
+            idempotency_index if idempotency_index is not None else get_idempotency_index()
+        )
+        # Shared by all clients unless injected, so concurrent callers back off together
+        self._breaker = circuit_breaker or get_circuit_breaker()
+        self._rate_limiter = rate_limiter or get_rate_limiter()
 
     @property
     def headers(self) -> dict[str, str]:
@@ -42,15 +195,16 @@ class NotionClient:
         }
 
     async def _get_client(self) -> httpx.AsyncClient:
+        # Prefer the application-wide pool so connections survive across calls
+        shared = get_shared_client()
+        if shared is not None:
+            return shared
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=NOTION_API_URL,
-                headers=self.headers,
-                timeout=30.0,
-            )
+            self._client = httpx.AsyncClient(timeout=NOTION_TIMEOUT)
         return self._client
 
     async def close(self) -> None:
+        # Only closes a private client; the shared pool is closed at shutdown
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -61,45 +215,202 @@ class NotionClient:
         path: str,
         json_data: dict[str, Any] | None = None,
         retries: int = 3,
+        queue_offline: bool = True,
     ) -> dict[str, Any]:
         client = await self._get_client()
         last_error: Exception | None = None
 
         for attempt in range(retries):
+            # Reading the state first tells us whether allow_request hands us the probe
+            probing = self._breaker.state == CircuitBreaker.HALF_OPEN
+            if not self._breaker.allow_request():
+                # Notion is known to be down; fail fast instead of waiting out timeouts
+                last_error = CircuitOpenError(f"Notion circuit open, not sending {method} {path}")
+                break
+
             try:
-                response = await client.request(method, path, json=json_data)
+                await self._rate_limiter.acquire()
+
+                try:
+                    response = await client.request(
+                        method,
+                        f"{NOTION_API_URL}{path}",
+                        json=json_data,
+                        headers=self.headers,
+                        timeout=NOTION_TIMEOUT,
+                    )
+
+                    if response.status_code == 429:
+                        # Throttling, not an outage: the limiter holds every caller back
+                        self._breaker.record_success()
+                        self._rate_limiter.record_throttle(_retry_after(response))
+                        last_error = httpx.HTTPStatusError(
+                            "Rate limited by Notion", request=response.request, response=response
+                        )
+                        continue
+
+                    response.raise_for_status()
+                    self._breaker.record_success()
+                    self._rate_limiter.record_success()
+                    result = cast(dict[str, Any], response.json())
+                    await self._mirror_write(method, path, result)
+                    return result
+
+                except httpx.HTTPStatusError as e:
+                    last_error = e
+                    if e.response.status_code >= 500:
+                        self._breaker.record_failure()
+                        if attempt + 1 < retries:
+                            await asyncio.sleep(2**attempt)
+                        continue
+                    # Notion is up; the request itself was rejected
+                    self._breaker.record_success()
+                    raise
+
+                except httpx.RequestError as e:
+                    last_error = e
+                    self._breaker.record_failure()
+                    if attempt + 1 < retries:
+                        await asyncio.sleep(2**attempt)
+                    continue
+            finally:
+                if probing:
+                    # A probe cancelled mid-request must not wedge the circuit half-open
+                    self._breaker.release_probe()
 
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", "1"))
-                    import asyncio
+        if last_error:
+            if queue_offline:
+                self._queue_offline(method, path, json_data)
+            raise last_error
 
-                    await asyncio.sleep(retry_after)
-                    continue
+        raise RuntimeError("Request failed without error")
 
-                response.raise_for_status()
-                return cast(dict[str, Any], response.json())
+    async def _mirror_write(self, method: str, path: str, result: dict[str, Any]) -> None:
+        """Write a page returned by a successful create/update through to the replica."""
+        if self._replica is None or not path.startswith("/pages"):
+            return
+        if method not in ("POST", "PATCH") or result.get("object") != "page":
+            return
+        try:
+            await self._replica.aupsert_page(result)
+        except Exception as e:
+            # The write already succeeded in Notion; the next sync will catch up
+            logger.warning("Replica write-through failed: %s", e)
 
-            except httpx.HTTPStatusError as e:
-                last_error = e
-                if e.response.status_code >= 500:
-                    import asyncio
+    def _database_id(self, db_type: str) -> str:
+        """Get the configured Notion database ID for a db_type."""
+        return database_id_for(db_type)
 
-                    await asyncio.sleep(2**attempt)
-                    continue
-                raise
+    def _replica_ready(self, db_type: str) -> bool:
+        return self._replica is not None and self._replica.is_ready(db_type)
 
-            except httpx.RequestError as e:
-                last_error = e
-                import asyncio
+    async def _query_database(self, db_type: str, body: dict[str, Any]) -> dict[str, Any]:
+        """Run a single-page database query, answering from the replica when possible.
 
-                await asyncio.sleep(2**attempt)
-                continue
+        Args:
+            db_type: Database type (tasks, people, places, ...)
+            body: Notion query body (filter, sorts, page_size)
 
-        if last_error:
-            self._queue_offline(method, path, json_data)
-            raise last_error
+        Returns:
+            Notion query response dict with "results"
+        """
+        if self._replica is not None and self._replica_ready(db_type):
+            try:
+                return {
+                    "object": "list",
+                    "results": self._replica.query(
+                        db_type,
+                        body,
+                        limit=min(body.get("page_size") or MAX_PAGE_SIZE, MAX_PAGE_SIZE),
+                    ),
+                    "has_more": False,
+                    "next_cursor": None,
+                }
+            except UnsupportedFilterError:
+                pass
 
-        raise RuntimeError("Request failed without error")
+        return await self._request("POST", f"/databases/{self._database_id(db_type)}/query", body)
+
+    async def iter_query(
+        self,
+        db_type: str,
+        body: dict[str, Any] | None = None,
+        limit: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream all results of a database query without truncation.
+
+        Results come from the local replica when it is ready, otherwise from
+        Notion via cursor pagination (see iter_query_results).
+
+        Args:
+            db_type: Database type (tasks, people, places, emails, log, ...)
+            body: Query body with optional filter and sorts
+            limit: Maximum number of results (None for all)
+            page_size: Results per Notion request
+            prefetch: Pages to fetch ahead of the consumer
+
+        Yields:
+            Raw Notion page objects
+        """
+        if self._replica is not None and self._replica_ready(db_type):
+            try:
+                pages = self._replica.query(db_type, body, limit=limit)
+            except UnsupportedFilterError:
+                pass
+            else:
+                for page in pages:
+                    yield page
+                return
+
+        results = iter_query_results(
+            self._request,
+            f"/databases/{self._database_id(db_type)}/query",
+            body,
+            limit=limit,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+        try:
+            async for page in results:
+                yield page
+        finally:
+            await results.aclose()
+
+    async def query_all(
+        self,
+        db_type: str,
+        body: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Collect the results of a paginated database query into a list.
+
+        Args:
+            db_type: Database type (tasks, people, places, emails, log, ...)
+            body: Query body with optional filter and sorts
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            List of raw Notion page objects
+        """
+        return [page async for page in self.iter_query(db_type, body, limit=limit)]
+
+    async def _get_page(self, page_id: str) -> dict[str, Any] | None:
+        """Get a page by ID, answering from the local replica when possible."""
+        if self._replica is not None:
+            cached = self._replica.get_page(page_id)
+            if cached is not None:
+                return cached
+
+        try:
+            page = await self._request("GET", f"/pages/{page_id}")
+        except Exception:
+            return None
+
+        if self._replica is not None:
+            await self._replica.aupsert_page(page)
+        return page
 
     def _queue_offline(
         self,
@@ -107,15 +418,26 @@ class NotionClient:
         path: str,
         json_data: dict[str, Any] | None,
     ) -> None:
-        OFFLINE_QUEUE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "method": method,
-            "path": path,
-            "data": json_data,
-        }
-        with open(OFFLINE_QUEUE_PATH, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        """Record a failed write in the shared offline queue for replay on recovery."""
+        if method == "GET" or path.endswith("/query"):
+            # Reads have nothing to replay; the caller sees the error
+            return
+
+        from assistant.services.offline_queue import (
+            get_offline_queue,
+            is_replaying,
+            notion_request_action,
+        )
+
+        if is_replaying():
+            # The queued action being replayed is kept for retry; queueing the
+            # raw request as well would write the page twice on recovery
+            return
+
+        try:
+            get_offline_queue().enqueue(notion_request_action(method, path, json_data))
+        except OSError as e:
+            logger.error("Could not queue %s %s for offline sync: %s", method, path, e)
 
     def _generate_dedupe_key(self, *args: Any) -> str:
         content = "|".join(str(a) for a in args)
@@ -188,10 +510,16 @@ class NotionClient:
         self,
         model: BaseModel,
         db_type: str,
+    ) -> dict[str, Any]:
+        return self._values_to_notion_properties(model.model_dump(exclude_none=True), db_type)
+
+    def _values_to_notion_properties(
+        self,
+        data: dict[str, Any],
+        db_type: str,
     ) -> dict[str, Any]:
         from enum import Enum
 
-        data = model.model_dump(exclude_none=True)
         properties: dict[str, Any] = {}
 
         # Get valid properties for this database type
@@ -266,7 +594,10 @@ class NotionClient:
                 "properties": properties,
             },
         )
-        return cast(str, result["id"])
+        page_id = cast(str, result["id"])
+        if self._idempotency is not None:
+            self._idempotency.record("inbox", item.dedupe_key, page_id)
+        return page_id
 
     async def create_task(self, task: Task) -> str:
         properties = self._model_to_notion_properties(task, "tasks")
@@ -295,7 +626,7 @@ class NotionClient:
         )
         return cast(str, result["id"])
 
-    async def create_log_entry(self, entry: LogEntry) -> str:
+    async def create_log_entry(self, entry: LogEntry, queue_offline: bool = True) -> str:
         if entry.idempotency_key:
             existing = await self._check_dedupe("log", entry.idempotency_key)
             if existing:
@@ -309,19 +640,29 @@ class NotionClient:
                 "parent": {"database_id": settings.notion_log_db_id},
                 "properties": properties,
             },
+            queue_offline=queue_offline,
         )
-        return cast(str, result["id"])
+        page_id = cast(str, result["id"])
+        if entry.idempotency_key and self._idempotency is not None:
+            self._idempotency.record("log", entry.idempotency_key, page_id, entry.error_code)
+        return page_id
 
     async def _check_dedupe(self, db_type: str, key: str) -> str | None:
-        db_id_map = {
-            "inbox": settings.notion_inbox_db_id,
-            "log": settings.notion_log_db_id,
-        }
-        db_id = db_id_map.get(db_type)
-        if not db_id:
-            return None
+        """Find the page already written with an idempotency key.
 
-        key_field = "dedupe_key" if db_type == "inbox" else "idempotency_key"
+        The local idempotency index answers first; once it has been
+        backfilled for db_type its answer is final and Notion is not queried.
+        """
+        index = self._idempotency
+        if index is not None:
+            existing = index.lookup(db_type, key)
+            if existing or index.is_backfilled(db_type):
+                return existing
+
+        db_id = self._database_id(db_type)
+        key_field = DEDUPE_KEY_PROPERTIES.get(db_type)
+        if not db_id or not key_field:
+            return None
 
         result = await self._request(
             "POST",
@@ -336,7 +677,10 @@ class NotionClient:
         )
 
         if result.get("results"):
-            return cast(str, result["results"][0]["id"])
+            page_id = cast(str, result["results"][0]["id"])
+            if index is not None:
+                index.record(db_type, key, page_id)
+            return page_id
         return None
 
     async def query_tasks(
@@ -346,7 +690,7 @@ class NotionClient:
         due_before: datetime | None = None,
         due_after: datetime | None = None,
         include_deleted: bool = False,
-        limit: int = 100,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Query tasks with optional filters.
 
@@ -356,7 +700,7 @@ class NotionClient:
             due_before: Tasks due on or before this datetime
             due_after: Tasks due on or after this datetime
             include_deleted: Include soft-deleted tasks
-            limit: Maximum number of results
+            limit: Maximum number of results (None for all)
 
         Returns:
             List of task results from Notion
@@ -406,35 +750,24 @@ class NotionClient:
 
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_tasks_db_id}/query",
-            {
-                "filter": query_filter,
-                "page_size": limit,
-                "sorts": [{"property": "due_date", "direction": "ascending"}],
-            }
-            if query_filter
-            else {
-                "page_size": limit,
-                "sorts": [{"property": "due_date", "direction": "ascending"}],
-            },
-        )
+        body: dict[str, Any] = {"sorts": [{"property": "due_date", "direction": "ascending"}]}
+        if query_filter:
+            body["filter"] = query_filter
 
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return await self.query_all("tasks", body, limit=limit)
 
     async def query_inbox(
         self,
         needs_clarification: bool | None = None,
         processed: bool | None = None,
-        limit: int = 100,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Query inbox items with optional filters.
 
         Args:
             needs_clarification: Filter by needs_clarification flag
             processed: Filter by processed flag
-            limit: Maximum number of results
+            limit: Maximum number of results (None for all)
 
         Returns:
             List of inbox item results from Notion
@@ -459,22 +792,11 @@ class NotionClient:
 
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_inbox_db_id}/query",
-            {
-                "filter": query_filter,
-                "page_size": limit,
-                "sorts": [{"property": "timestamp", "direction": "descending"}],
-            }
-            if query_filter
-            else {
-                "page_size": limit,
-                "sorts": [{"property": "timestamp", "direction": "descending"}],
-            },
-        )
+        body: dict[str, Any] = {"sorts": [{"property": "timestamp", "direction": "descending"}]}
+        if query_filter:
+            body["filter"] = query_filter
 
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return await self.query_all("inbox", body, limit=limit)
 
     async def mark_inbox_processed(
         self,
@@ -499,6 +821,7 @@ class NotionClient:
         self,
         name: str | None = None,
         include_archived: bool = False,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         filters: list[dict[str, Any]] = []
 
@@ -522,19 +845,19 @@ class NotionClient:
 
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_people_db_id}/query",
+        return await self.query_all(
+            "people",
             {"filter": query_filter} if query_filter else {},
+            limit=limit,
         )
 
-        return cast(list[dict[str, Any]], result.get("results", []))
-
     async def query_places(
         self,
         name: str | None = None,
         place_type: str | None = None,
         include_archived: bool = False,
+        limit: int | None = None,
+        missing_coordinates: bool = False,
     ) -> list[dict[str, Any]]:
         """Query places with optional filters.
 
@@ -542,6 +865,8 @@ class NotionClient:
             name: Filter by place name (partial match)
             place_type: Filter by place type (restaurant, cinema, etc.)
             include_archived: Include archived places
+            limit: Maximum number of results (None for all)
+            missing_coordinates: Only places without a lat or lng
 
         Returns:
             List of place results from Notion
@@ -572,16 +897,24 @@ class NotionClient:
                 }
             )
 
+        if missing_coordinates:
+            filters.append(
+                {
+                    "or": [
+                        {"property": "lat", "number": {"is_empty": True}},
+                        {"property": "lng", "number": {"is_empty": True}},
+                    ]
+                }
+            )
+
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_places_db_id}/query",
+        return await self.query_all(
+            "places",
             {"filter": query_filter} if query_filter else {},
+            limit=limit,
         )
 
-        return cast(list[dict[str, Any]], result.get("results", []))
-
     async def create_place(self, place: Place) -> str:
         """Create a new place in Notion.
 
@@ -654,16 +987,14 @@ class NotionClient:
         Returns:
             Place data dict or None if not found
         """
-        try:
-            return await self._request("GET", f"/pages/{place_id}")
-        except Exception:
-            return None
+        return await self._get_page(place_id)
 
     async def query_projects(
         self,
         name: str | None = None,
         status: str | None = None,
         include_archived: bool = False,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Query projects with optional filters.
 
@@ -671,6 +1002,7 @@ class NotionClient:
             name: Filter by project name (partial match)
             status: Filter by status (active, paused, completed, cancelled)
             include_archived: Include archived projects
+            limit: Maximum number of results (None for all)
 
         Returns:
             List of project results from Notion
@@ -703,14 +1035,12 @@ class NotionClient:
 
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_projects_db_id}/query",
+        return await self.query_all(
+            "projects",
             {"filter": query_filter} if query_filter else {},
+            limit=limit,
         )
 
-        return cast(list[dict[str, Any]], result.get("results", []))
-
     async def create_project(self, project: Project) -> str:
         """Create a new project in Notion.
 
@@ -731,6 +1061,21 @@ class NotionClient:
         )
         return cast(str, result["id"])
 
+    async def update_page(self, page_id: str, db_type: str, values: dict[str, Any]) -> None:
+        """Update page properties from model field values.
+
+        Values are converted the same way as when the page was created;
+        fields that are not properties of the database are ignored.
+
+        Args:
+            page_id: Notion page ID
+            db_type: Database type the page belongs to (tasks, people, ...)
+            values: Model field name -> new value
+        """
+        properties = self._values_to_notion_properties(values, db_type)
+        if properties:
+            await self._request("PATCH", f"/pages/{page_id}", {"properties": properties})
+
     async def soft_delete(self, page_id: str) -> None:
         await self._request(
             "PATCH",
@@ -780,7 +1125,15 @@ class NotionClient:
         external_resource_id: str | None = None,
         error_code: str | None = None,
         error_message: str | None = None,
-    ) -> str:
+    ) -> str | None:
+        """Log an action to the Log database.
+
+        While the audit log writer is running the entry is buffered and
+        written in the background, and None is returned.
+
+        Returns:
+            Log page ID, or None if the entry was buffered
+        """
         entry = LogEntry(
             action_type=action_type,
             idempotency_key=idempotency_key,
@@ -793,6 +1146,11 @@ class NotionClient:
             error_code=error_code,
             error_message=error_message,
         )
+
+        from assistant.services.audit_writer import get_audit_writer
+
+        if await get_audit_writer().submit(entry):
+            return None
         return await self.create_log_entry(entry)
 
     async def query_log_corrections(
@@ -826,18 +1184,17 @@ class NotionClient:
 
         query_filter = {"and": filters} if len(filters) > 1 else filters[0]
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_log_db_id}/query",
+        pages = self.iter_query(
+            "log",
             {
                 "filter": query_filter,
-                "page_size": limit,
                 "sorts": [{"property": "timestamp", "direction": "descending"}],
             },
+            limit=limit,
         )
 
         entries = []
-        for page in result.get("results", []):
+        async for page in pages:
             props = page.get("properties", {})
 
             # Extract timestamp
@@ -896,7 +1253,8 @@ class NotionClient:
         trigger: str | None = None,
         min_confidence: int | None = None,
         created_after: datetime | None = None,
-        limit: int = 100,
+        limit: int | None = None,
+        edited_after: str | None = None,
     ) -> list[dict[str, Any]]:
         """Query patterns with optional filters.
 
@@ -904,7 +1262,9 @@ class NotionClient:
             trigger: Filter by trigger text (partial match)
             min_confidence: Minimum confidence score
             created_after: Filter to patterns created after this time (for TIL)
-            limit: Maximum number of results
+            limit: Maximum number of results (None for all)
+            edited_after: Only patterns whose last_edited_time is at or after
+                this ISO timestamp (for incremental cache refreshes)
 
         Returns:
             List of pattern results from Notion
@@ -935,27 +1295,24 @@ class NotionClient:
                 }
             )
 
+        if edited_after is not None:
+            filters.append(
+                {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": edited_after},
+                }
+            )
+
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
         # Sort by created_at descending if filtering by creation time, else by confidence
         sort_prop = "created_at" if created_after else "confidence"
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_patterns_db_id}/query",
-            {
-                "filter": query_filter,
-                "page_size": limit,
-                "sorts": [{"property": sort_prop, "direction": "descending"}],
-            }
-            if query_filter
-            else {
-                "page_size": limit,
-                "sorts": [{"property": sort_prop, "direction": "descending"}],
-            },
-        )
+        body: dict[str, Any] = {"sorts": [{"property": sort_prop, "direction": "descending"}]}
+        if query_filter:
+            body["filter"] = query_filter
 
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return await self.query_all("patterns", body, limit=limit)
 
     async def update_pattern_confidence(
         self,
@@ -1076,9 +1433,8 @@ class NotionClient:
                 }
             )
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_tasks_db_id}/query",
+        result = await self._query_database(
+            "tasks",
             {
                 "filter": {"and": filters} if len(filters) > 1 else filters[0],
                 "page_size": 1,
@@ -1097,10 +1453,7 @@ class NotionClient:
         Returns:
             Task page data from Notion, or None if not found
         """
-        try:
-            return await self._request("GET", f"/pages/{page_id}")
-        except Exception:
-            return None
+        return await self._get_page(page_id)
 
     # -------------------------------------------------------------------------
     # Email Methods
@@ -1164,7 +1517,7 @@ class NotionClient:
         category: str | None = None,
         received_after: datetime | None = None,
         received_before: datetime | None = None,
-        limit: int = 100,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Query emails with optional filters.
 
@@ -1176,7 +1529,7 @@ class NotionClient:
             category: Filter by category
             received_after: Emails received after this datetime
             received_before: Emails received before this datetime
-            limit: Maximum number of results
+            limit: Maximum number of results (None for all)
 
         Returns:
             List of email results from Notion
@@ -1241,22 +1594,13 @@ class NotionClient:
 
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
-        result = await self._request(
-            "POST",
-            f"/databases/{settings.notion_emails_db_id}/query",
-            {
-                "filter": query_filter,
-                "page_size": limit,
-                "sorts": [{"property": "received_at", "direction": "descending"}],
-            }
-            if query_filter
-            else {
-                "page_size": limit,
-                "sorts": [{"property": "received_at", "direction": "descending"}],
-            },
-        )
+        body: dict[str, Any] = {
+            "sorts": [{"property": "received_at", "direction": "descending"}],
+        }
+        if query_filter:
+            body["filter"] = query_filter
 
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return await self.query_all("emails", body, limit=limit)
 
     async def update_email(
         self,
@@ -1376,31 +1720,12 @@ class NotionClient:
         )
 
     async def process_offline_queue(self) -> int:
-        if not OFFLINE_QUEUE_PATH.exists():
-            return 0
-
-        processed = 0
-        failed_entries: list[str] = []
-
-        with open(OFFLINE_QUEUE_PATH) as f:
-            entries = f.readlines()
-
-        for line in entries:
-            try:
-                entry = json.loads(line)
-                await self._request(
-                    entry["method"],
-                    entry["path"],
-                    entry.get("data"),
-                )
-                processed += 1
-            except Exception:
-                failed_entries.append(line)
+        """Replay the shared offline queue through this client.
 
-        if failed_entries:
-            with open(OFFLINE_QUEUE_PATH, "w") as f:
-                f.writelines(failed_entries)
-        else:
-            OFFLINE_QUEUE_PATH.unlink(missing_ok=True)
+        Returns:
+            Number of queued actions synced
+        """
+        from assistant.services.offline_queue import get_offline_queue
 
-        return processed
+        result = await get_offline_queue().process_queue(notion_client=self)
+        return result.successful
@@ -0,0 +1,455 @@
+"""Persistent index of idempotency keys already written to Notion.
+
+Deduplicating a new inbox item or log entry used to run a `rich_text equals`
+query against the Inbox or Log database, one network round-trip per check,
+and AuditLogger kept an unbounded in-process dict of keys that was lost on
+restart. This index keeps (database, key) -> page ID in SQLite instead:
+- Entries expire after a TTL and the table is capped at max_entries
+  (oldest dropped first)
+- A Bloom filter over the stored keys answers "definitely new" without
+  touching SQLite; only possible hits are looked up. Other processes (CLI
+  commands, timers) write the same file, so before trusting a miss the
+  index checks SQLite's data_version and rebuilds the filter if another
+  connection has committed since it was built
+- Each database is seeded once from Notion (backfill_idempotency_index);
+  after that the index is authoritative and dedupe checks never go to the
+  network. Until then a miss still falls back to the Notion query.
+
+NotionClient records every inbox item and log entry it creates, and the
+offline queue records the keys of page creates it replays, so the index
+stays current without further Notion reads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import math
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from assistant.config import settings
+from assistant.notion.replica import database_id_for, normalize_id
+from assistant.sqlite_db import open_sqlite
+
+if TYPE_CHECKING:
+    from assistant.notion.client import NotionClient
+
+logger = logging.getLogger(__name__)
+
+# Property holding the idempotency key in each deduplicated database
+DEDUPE_KEY_PROPERTIES = {
+    "inbox": "dedupe_key",
+    "log": "idempotency_key",
+}
+
+# Target false-positive rate of the Bloom filter at max_entries keys
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+
+# Records between pruning passes over expired and excess entries
+PRUNE_INTERVAL = 1000
+
+IDEMPOTENCY_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    db_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    error_code TEXT,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (db_type, key)
+);
+CREATE INDEX IF NOT EXISTS idx_idempotency_created ON idempotency_keys (created_at);
+CREATE TABLE IF NOT EXISTS backfills (
+    db_type TEXT PRIMARY KEY,
+    completed_at REAL NOT NULL
+);
+"""
+
+
+def get_idempotency_index_path() -> Path:
+    """Get path to the on-disk idempotency index."""
+    return Path(settings.data_dir).expanduser() / "index" / "idempotency.db"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, false_positive_rate: float = BLOOM_FALSE_POSITIVE_RATE):
+        """Size the filter for capacity items at the given false-positive rate."""
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: two 64-bit halves of one digest give every probe
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+
+@dataclass
+class IdempotencyRecord:
+    """A key recorded in the index."""
+
+    page_id: str
+    error_code: str | None = None  # set for log entries that recorded a failure
+    created_at: float = 0.0
+
+
+class IdempotencyIndex:
+    """SQLite-backed idempotency key index with a Bloom filter front."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        persist: bool = True,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+    ):
+        """Initialize the index.
+
+        Args:
+            path: SQLite path (defaults to data_dir/index/idempotency.db)
+            persist: Keep the index on disk; False for an in-memory index
+            ttl_seconds: Seconds a key is remembered (defaults to the configured TTL)
+            max_entries: Keys kept at most (defaults to the configured limit)
+        """
+        self.path: Path | None = (path or get_idempotency_index_path()) if persist else None
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.idempotency_ttl_days * 86400
+        )
+        self.max_entries = max(
+            1, max_entries if max_entries is not None else settings.idempotency_max_entries
+        )
+        self._conn: sqlite3.Connection | None = None
+        self._bloom = BloomFilter(self.max_entries)
+        self._bloom_version: int | None = None  # data_version the filter was built at
+        self._records_since_prune = 0
+
+        self.lookups = 0
+        self.bloom_rejects = 0  # lookups answered by the Bloom filter alone
+        self.hits = 0
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the database on first use (in memory if the file is unusable)."""
+        if self._conn is None:
+            conn = open_sqlite(self.path, IDEMPOTENCY_INDEX_SCHEMA) if self.path else None
+            if conn is None:
+                self.path = None
+                conn = open_sqlite(None, IDEMPOTENCY_INDEX_SCHEMA)
+            self._conn = conn
+            self._prune()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        row = self._db().execute("SELECT COUNT(*) FROM idempotency_keys").fetchone()
+        return int(row[0]) if row else 0
+
+    def _prune(self) -> None:
+        """Drop expired keys and the oldest beyond max_entries, then rebuild the filter."""
+        conn = self._db()
+        conn.execute(
+            "DELETE FROM idempotency_keys WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        conn.execute(
+            "DELETE FROM idempotency_keys WHERE rowid IN ("
+            "SELECT rowid FROM idempotency_keys ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        conn.commit()
+
+        # Removed keys cannot be cleared from a Bloom filter, so rebuild it
+        self._rebuild_bloom()
+        self._records_since_prune = 0
+
+    def _rebuild_bloom(self) -> None:
+        """Rebuild the Bloom filter from the keys on disk."""
+        conn = self._db()
+        self._bloom_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        self._bloom = BloomFilter(self.max_entries)
+        for db_type, key in conn.execute("SELECT db_type, key FROM idempotency_keys"):
+            self._bloom.add(f"{db_type}:{key}")
+
+    def _bloom_is_current(self) -> bool:
+        """Check that no other connection has committed since the filter was built."""
+        if self.path is None:
+            # A private in-memory database has no other writers
+            return True
+        version = self._db().execute("PRAGMA data_version").fetchone()[0]
+        return bool(version == self._bloom_version)
+
+    def get(self, db_type: str, key: str) -> IdempotencyRecord | None:
+        """Look up a key, or None if it has not been recorded (or has expired)."""
+        conn = self._db()
+        self.lookups += 1
+        bloom_key = f"{db_type}:{key}"
+        if bloom_key not in self._bloom:
+            if self._bloom_is_current():
+                self.bloom_rejects += 1
+                return None
+            # Another process recorded keys since the filter was built
+            self._rebuild_bloom()
+            if bloom_key not in self._bloom:
+                self.bloom_rejects += 1
+                return None
+
+        row = conn.execute(
+            "SELECT page_id, error_code, created_at FROM idempotency_keys "
+            "WHERE db_type = ? AND key = ? AND created_at >= ?",
+            (db_type, key, time.time() - self.ttl_seconds),
+        ).fetchone()
+        if row is None:
+            return None
+        self.hits += 1
+        return IdempotencyRecord(*row)
+
+    def lookup(self, db_type: str, key: str) -> str | None:
+        """Page ID recorded for a key, or None."""
+        record = self.get(db_type, key)
+        return record.page_id if record else None
+
+    def record(
+        self,
+        db_type: str,
+        key: str,
+        page_id: str,
+        error_code: str | None = None,
+        created_at: float | None = None,
+    ) -> None:
+        """Remember that key was written as page_id."""
+        self.record_many(db_type, [(key, page_id, error_code, created_at)])
+
+    def record_many(
+        self,
+        db_type: str,
+        records: Iterable[tuple[str, str, str | None, float | None]],
+    ) -> int:
+        """Remember (key, page_id, error_code, created_at) tuples in one transaction.
+
+        Returns:
+            Number of keys recorded
+        """
+        now = time.time()
+        rows = [
+            (db_type, key, page_id, error_code, created_at or now)
+            for key, page_id, error_code, created_at in records
+        ]
+        if not rows:
+            return 0
+        try:
+            conn = self._db()
+            conn.executemany(
+                "INSERT OR REPLACE INTO idempotency_keys "
+                "(db_type, key, page_id, error_code, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Idempotency index write failed for %s: %s", db_type, e)
+            return 0
+
+        for row in rows:
+            self._bloom.add(f"{db_type}:{row[1]}")
+        self._records_since_prune += len(rows)
+        if self._records_since_prune >= PRUNE_INTERVAL:
+            self._prune()
+        return len(rows)
+
+    def record_created_page(self, body: dict[str, Any] | None, page_id: str) -> bool:
+        """Remember the key of a deduplicated page created from a raw POST /pages body.
+
+        Args:
+            body: Request body ({"parent": {"database_id": ...}, "properties": ...})
+            page_id: ID of the created page
+
+        Returns:
+            True if the body created an inbox item or log entry with a key
+        """
+        body = body or {}
+        parent_id = (body.get("parent") or {}).get("database_id")
+        if not parent_id or not page_id:
+            return False
+        for db_type, key_field in DEDUPE_KEY_PROPERTIES.items():
+            db_id = database_id_for(db_type)
+            if db_id and normalize_id(db_id) == normalize_id(parent_id):
+                key = _rich_text_value(body.get("properties", {}), key_field)
+                return bool(key) and self.record_many(db_type, [(key, page_id, None, None)]) > 0
+        return False
+
+    def is_backfilled(self, db_type: str) -> bool:
+        """Check if the keys of a database have been seeded from Notion."""
+        row = self._db().execute("SELECT 1 FROM backfills WHERE db_type = ?", (db_type,)).fetchone()
+        return row is not None
+
+    def mark_backfilled(self, db_type: str) -> None:
+        """Record that a database's keys have been seeded from Notion."""
+        conn = self._db()
+        conn.execute(
+            "INSERT OR REPLACE INTO backfills (db_type, completed_at) VALUES (?, ?)",
+            (db_type, time.time()),
+        )
+        conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Size and lookup counters."""
+        return {
+            "keys": len(self),
+            "lookups": self.lookups,
+            "bloom_rejects": self.bloom_rejects,
+            "hits": self.hits,
+            "backfilled": [
+                db_type for db_type in DEDUPE_KEY_PROPERTIES if self.is_backfilled(db_type)
+            ],
+        }
+
+
+def _rich_text_value(properties: dict[str, Any], key_field: str) -> str:
+    """Plain text of a rich_text property in a page or a page create body."""
+    text = properties.get(key_field, {}).get("rich_text", [])
+    return "".join(
+        part.get("plain_text") or part.get("text", {}).get("content", "") for part in text
+    )
+
+
+def _parse_key_page(page: dict[str, Any], key_field: str) -> tuple[str, str, None, float] | None:
+    """Extract (key, page_id, None, created_at) from a Notion page."""
+    key = _rich_text_value(page.get("properties", {}), key_field)
+    if not key:
+        return None
+    created = page.get("created_time")
+    created_at = datetime.fromisoformat(created).timestamp() if created else time.time()
+    return key, page["id"], None, created_at
+
+
+async def backfill_idempotency_index(
+    index: IdempotencyIndex,
+    notion_client: NotionClient | None = None,
+    db_types: Iterable[str] = DEDUPE_KEY_PROPERTIES,
+) -> int:
+    """Seed the index with keys already in Notion, once per database.
+
+    Only pages created within the index TTL are read. A database is marked
+    as backfilled only after all its pages were read, so an interrupted
+    backfill starts over next time.
+
+    Args:
+        index: Index to seed
+        notion_client: Client used to read Notion (created if not provided)
+        db_types: Databases to seed (inbox, log)
+
+    Returns:
+        Number of keys recorded
+    """
+    from assistant.notion.client import NotionClient
+
+    pending = [db_type for db_type in db_types if not index.is_backfilled(db_type)]
+    if not pending:
+        return 0
+
+    client = notion_client or NotionClient()
+    cutoff = datetime.fromtimestamp(time.time() - index.ttl_seconds, UTC)
+    total = 0
+    try:
+        for db_type in pending:
+            key_field = DEDUPE_KEY_PROPERTIES[db_type]
+            body = {
+                "filter": {
+                    "and": [
+                        {"property": key_field, "rich_text": {"is_not_empty": True}},
+                        {
+                            "timestamp": "created_time",
+                            "created_time": {"on_or_after": cutoff.isoformat()},
+                        },
+                    ]
+                },
+                "sorts": [{"timestamp": "created_time", "direction": "descending"}],
+            }
+            batch: list[tuple[str, str, None, float]] = []
+            count = 0
+            async for page in client.iter_query(db_type, body, limit=index.max_entries):
+                parsed = _parse_key_page(page, key_field)
+                if parsed:
+                    batch.append(parsed)
+                if len(batch) >= 500:
+                    count += index.record_many(db_type, batch)
+                    batch = []
+            count += index.record_many(db_type, batch)
+
+            index.mark_backfilled(db_type)
+            total += count
+            logger.info("Idempotency index seeded with %d %s keys", count, db_type)
+    finally:
+        if notion_client is None:
+            await client.close()
+    return total
+
+
+# Module-level singleton
+_index: IdempotencyIndex | None = None
+_backfill_task: asyncio.Task[int] | None = None
+
+
+def get_idempotency_index() -> IdempotencyIndex | None:
+    """Get the shared on-disk idempotency index, or None if it is disabled."""
+    global _index
+    if not settings.idempotency_index_enabled:
+        return None
+    if _index is None:
+        _index = IdempotencyIndex()
+    return _index
+
+
+async def _run_backfill(index: IdempotencyIndex) -> int:
+    try:
+        return await backfill_idempotency_index(index)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        # Dedupe checks keep falling back to Notion; the next start retries
+        logger.warning("Idempotency index backfill failed: %s", e)
+        return 0
+
+
+async def start_idempotency_backfill() -> None:
+    """Seed the shared index from Notion in the background, if not done yet."""
+    global _backfill_task
+    index = get_idempotency_index()
+    if index is None or not settings.has_notion or _backfill_task is not None:
+        return
+    if all(index.is_backfilled(db_type) for db_type in DEDUPE_KEY_PROPERTIES):
+        return
+    _backfill_task = asyncio.create_task(_run_backfill(index))
+
+
+async def stop_idempotency_backfill() -> None:
+    """Cancel a backfill that is still running."""
+    global _backfill_task
+    if _backfill_task is None:
+        return
+    _backfill_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _backfill_task
+    _backfill_task = None
@@ -0,0 +1,705 @@
+"""Local SQLite replica of the Notion databases.
+
+Keeps an embedded copy of the Tasks, People, Places, Projects, Patterns and
+Inbox databases under ``settings.data_dir`` so that NotionClient reads can be
+answered locally instead of paying an HTTPS round-trip to api.notion.com.
+
+The replica stores raw Notion page objects. Database queries are evaluated
+locally against the same filter/sort JSON that would be sent to the Notion
+query endpoint, so callers do not need to know whether a result came from the
+replica or the network. Filters the evaluator does not understand raise
+UnsupportedFilterError and the caller falls back to Notion. Like Notion,
+date-only values ("2026-10-16") are compared by calendar day, in the
+user's timezone, rather than as midnight UTC.
+
+Writes always go to Notion first; the page object returned by Notion is then
+mirrored into the replica (write-through). The ReplicaSyncService in
+assistant.services.replica_sync keeps the copy current via incremental
+``last_edited_time`` syncs. The async write methods (aupsert_page,
+aapply_pages, areplace_all, aset_sync_state) update the in-memory copy on
+the calling thread and serialise and commit to SQLite in a worker thread,
+so neither write-through nor a full resync blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from datetime import UTC, date, datetime, tzinfo
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from assistant.config import settings
+from assistant.sqlite_db import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+# Settings attribute holding the database ID for each db_type
+DATABASE_ID_SETTINGS: dict[str, str] = {
+    "inbox": "notion_inbox_db_id",
+    "tasks": "notion_tasks_db_id",
+    "people": "notion_people_db_id",
+    "projects": "notion_projects_db_id",
+    "places": "notion_places_db_id",
+    "preferences": "notion_preferences_db_id",
+    "patterns": "notion_patterns_db_id",
+    "emails": "notion_emails_db_id",
+    "log": "notion_log_db_id",
+}
+
+# Databases mirrored locally
+REPLICATED_DATABASES: tuple[str, ...] = (
+    "tasks",
+    "people",
+    "places",
+    "projects",
+    "patterns",
+    "inbox",
+)
+
+# Notion's maximum page_size for database queries
+MAX_PAGE_SIZE = 100
+
+REPLICA_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    page_id TEXT PRIMARY KEY,
+    db_type TEXT NOT NULL,
+    last_edited_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_db_type ON pages (db_type);
+CREATE TABLE IF NOT EXISTS sync_state (
+    db_type TEXT PRIMARY KEY,
+    watermark TEXT,
+    last_full_sync TEXT
+);
+"""
+
+
+class UnsupportedFilterError(Exception):
+    """Raised when a Notion filter/sort cannot be evaluated locally."""
+
+
+def get_replica_path() -> Path:
+    """Get path to the replica SQLite database."""
+    return Path(settings.data_dir).expanduser() / "replica" / "notion.db"
+
+
+def database_id_for(db_type: str) -> str:
+    """Get the configured Notion database ID for a db_type ("" if unknown or unset)."""
+    attr = DATABASE_ID_SETTINGS.get(db_type)
+    return getattr(settings, attr, "") if attr else ""
+
+
+def normalize_id(notion_id: str) -> str:
+    """Normalize a Notion ID (dashed or undashed) for comparison."""
+    return notion_id.replace("-", "").lower()
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse a Notion date/datetime string into an aware datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _parse_date(value: str | None) -> date | datetime | None:
+    """Parse a Notion date value, keeping a date-only value as a calendar day."""
+    if value and len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return _parse_datetime(value)
+
+
+def _user_timezone() -> tzinfo:
+    try:
+        return ZoneInfo(settings.user_timezone)
+    except (KeyError, TypeError, ValueError):
+        return UTC
+
+
+def _local_day(value: date | datetime) -> date:
+    """Calendar day of a value in the user's timezone."""
+    if isinstance(value, datetime):
+        return value.astimezone(_user_timezone()).date()
+    return value
+
+
+def _plain_text(rich: list[dict[str, Any]] | None) -> str:
+    """Join a Notion title/rich_text array into plain text."""
+    if not rich:
+        return ""
+    parts = []
+    for item in rich:
+        if "plain_text" in item:
+            parts.append(item["plain_text"])
+        else:
+            parts.append(item.get("text", {}).get("content", ""))
+    return "".join(parts)
+
+
+def property_value(page: dict[str, Any], name: str) -> Any:
+    """Extract a comparable Python value for a page property.
+
+    Returns:
+        str for title/rich_text/select/url, float for number, bool for checkbox,
+        datetime for date, list[str] for multi_select, None when empty.
+    """
+    prop = page.get("properties", {}).get(name)
+    if prop is None:
+        return None
+
+    prop_type = prop.get("type")
+    if prop_type is None:
+        # Pages we built ourselves (write-through) may omit "type"
+        prop_type = next((k for k in prop if k not in ("id", "type")), None)
+
+    raw = prop.get(prop_type) if prop_type else None
+
+    if prop_type in ("title", "rich_text"):
+        return _plain_text(raw) or None
+    if prop_type in ("select", "status"):
+        return raw.get("name") if raw else None
+    if prop_type == "multi_select":
+        return [option.get("name") for option in raw or []]
+    if prop_type == "checkbox":
+        return bool(raw)
+    if prop_type == "number":
+        return raw
+    if prop_type == "date":
+        return _parse_datetime(raw.get("start")) if raw else None
+    if prop_type in ("url", "email", "phone_number"):
+        return raw or None
+    if prop_type in ("created_time", "last_edited_time"):
+        return _parse_datetime(raw)
+    raise UnsupportedFilterError(f"Unsupported property type: {prop_type}")
+
+
+def _date_filter_value(page: dict[str, Any], name: str) -> date | datetime | None:
+    """Value a date filter compares: date-only starts stay calendar days."""
+    prop = page.get("properties", {}).get(name) or {}
+    raw = prop.get("date")
+    if isinstance(raw, dict):
+        return _parse_date(raw.get("start"))
+    return property_value(page, name)
+
+
+def _timestamp_value(page: dict[str, Any], timestamp: str) -> datetime | None:
+    if timestamp not in ("created_time", "last_edited_time"):
+        raise UnsupportedFilterError(f"Unsupported timestamp: {timestamp}")
+    return _parse_datetime(page.get(timestamp))
+
+
+def _match_text(value: str | None, condition: dict[str, Any]) -> bool:
+    text = (value or "").lower()
+    for op, arg in condition.items():
+        needle = str(arg).lower() if isinstance(arg, str) else arg
+        if op == "equals":
+            return text == needle
+        if op == "does_not_equal":
+            return text != needle
+        if op == "contains":
+            return needle in text
+        if op == "does_not_contain":
+            return needle not in text
+        if op == "starts_with":
+            return text.startswith(needle)
+        if op == "ends_with":
+            return text.endswith(needle)
+        if op == "is_empty":
+            return not text
+        if op == "is_not_empty":
+            return bool(text)
+    raise UnsupportedFilterError(f"Unsupported text condition: {condition}")
+
+
+def _match_number(value: float | None, condition: dict[str, Any]) -> bool:
+    for op, arg in condition.items():
+        if op == "is_empty":
+            return value is None
+        if op == "is_not_empty":
+            return value is not None
+        if value is None:
+            return False
+        if op == "equals":
+            return bool(value == arg)
+        if op == "does_not_equal":
+            return bool(value != arg)
+        if op == "greater_than":
+            return bool(value > arg)
+        if op == "less_than":
+            return bool(value < arg)
+        if op == "greater_than_or_equal_to":
+            return bool(value >= arg)
+        if op == "less_than_or_equal_to":
+            return bool(value <= arg)
+    raise UnsupportedFilterError(f"Unsupported number condition: {condition}")
+
+
+def _match_checkbox(value: bool | None, condition: dict[str, Any]) -> bool:
+    checked = bool(value)
+    if "equals" in condition:
+        return checked == condition["equals"]
+    if "does_not_equal" in condition:
+        return checked != condition["does_not_equal"]
+    raise UnsupportedFilterError(f"Unsupported checkbox condition: {condition}")
+
+
+def _match_select(value: str | None, condition: dict[str, Any]) -> bool:
+    if "equals" in condition:
+        return value == condition["equals"]
+    if "does_not_equal" in condition:
+        return value != condition["does_not_equal"]
+    if "is_empty" in condition:
+        return value is None
+    if "is_not_empty" in condition:
+        return value is not None
+    raise UnsupportedFilterError(f"Unsupported select condition: {condition}")
+
+
+def _match_multi_select(value: list[str] | None, condition: dict[str, Any]) -> bool:
+    options = value or []
+    if "contains" in condition:
+        return condition["contains"] in options
+    if "does_not_contain" in condition:
+        return condition["does_not_contain"] not in options
+    if "is_empty" in condition:
+        return not options
+    if "is_not_empty" in condition:
+        return bool(options)
+    raise UnsupportedFilterError(f"Unsupported multi_select condition: {condition}")
+
+
+def _match_date(value: date | datetime | None, condition: dict[str, Any]) -> bool:
+    for op, arg in condition.items():
+        if op == "is_empty":
+            return value is None
+        if op == "is_not_empty":
+            return value is not None
+        target = _parse_date(arg) if isinstance(arg, str) else None
+        if target is None:
+            raise UnsupportedFilterError(f"Unsupported date condition: {condition}")
+        if value is None:
+            return False
+        left: date | datetime = value
+        right: date | datetime = target
+        if not (isinstance(value, datetime) and isinstance(target, datetime)):
+            # Notion compares a date-only value with anything by calendar day
+            left, right = _local_day(value), _local_day(target)
+        if op == "equals":
+            return left == right
+        if op == "before":
+            return left < right
+        if op == "after":
+            return left > right
+        if op == "on_or_before":
+            return left <= right
+        if op == "on_or_after":
+            return left >= right
+    raise UnsupportedFilterError(f"Unsupported date condition: {condition}")
+
+
+_MATCHERS: dict[str, Any] = {
+    "title": _match_text,
+    "rich_text": _match_text,
+    "url": _match_text,
+    "email": _match_text,
+    "phone_number": _match_text,
+    "number": _match_number,
+    "checkbox": _match_checkbox,
+    "select": _match_select,
+    "status": _match_select,
+    "multi_select": _match_multi_select,
+    "date": _match_date,
+}
+
+
+def matches_filter(page: dict[str, Any], query_filter: dict[str, Any] | None) -> bool:
+    """Evaluate a Notion database query filter against a page.
+
+    Args:
+        page: Raw Notion page object
+        query_filter: Filter in Notion query format (or None for match-all)
+
+    Returns:
+        True if the page satisfies the filter
+
+    Raises:
+        UnsupportedFilterError: If the filter uses an unsupported construct
+    """
+    if not query_filter:
+        return True
+
+    if "and" in query_filter:
+        return all(matches_filter(page, f) for f in query_filter["and"])
+    if "or" in query_filter:
+        return any(matches_filter(page, f) for f in query_filter["or"])
+
+    if "timestamp" in query_filter:
+        timestamp = query_filter["timestamp"]
+        return _match_date(_timestamp_value(page, timestamp), query_filter.get(timestamp, {}))
+
+    name = query_filter.get("property")
+    if name is None:
+        raise UnsupportedFilterError(f"Unsupported filter: {query_filter}")
+
+    for filter_type, matcher in _MATCHERS.items():
+        if filter_type in query_filter:
+            if filter_type == "date":
+                value: Any = _date_filter_value(page, name)
+            else:
+                value = _coerce(property_value(page, name), filter_type)
+            return bool(matcher(value, query_filter[filter_type]))
+
+    raise UnsupportedFilterError(f"Unsupported filter: {query_filter}")
+
+
+def _coerce(value: Any, filter_type: str) -> Any:
+    """Coerce an extracted property value to the type a matcher expects."""
+    if filter_type in ("title", "rich_text", "url", "email", "phone_number", "select", "status"):
+        return value if value is None or isinstance(value, str) else str(value)
+    return value
+
+
+def sort_pages(
+    pages: list[dict[str, Any]],
+    sorts: list[dict[str, Any]] | None,
+) -> list[dict[str, Any]]:
+    """Sort pages the way the Notion query endpoint does.
+
+    Empty values always sort last regardless of direction.
+    """
+    ordered = list(pages)
+    for sort in reversed(sorts or []):
+        descending = sort.get("direction") == "descending"
+        keyed: list[tuple[Any, dict[str, Any]]]
+        if "timestamp" in sort:
+            keyed = [(_timestamp_value(p, sort["timestamp"]), p) for p in ordered]
+        elif "property" in sort:
+            keyed = [(property_value(p, sort["property"]), p) for p in ordered]
+        else:
+            raise UnsupportedFilterError(f"Unsupported sort: {sort}")
+
+        present = [item for item in keyed if item[0] is not None]
+        empty = [item for item in keyed if item[0] is None]
+        try:
+            present.sort(key=lambda item: item[0], reverse=descending)
+        except TypeError as e:
+            raise UnsupportedFilterError(f"Incomparable sort values: {e}") from e
+        ordered = [p for _, p in present] + [p for _, p in empty]
+    return ordered
+
+
+class NotionReplica:
+    """Embedded SQLite copy of the replicated Notion databases.
+
+    Pages are also held in memory (db_type -> page_id -> page) so reads never
+    touch disk; SQLite provides durability across restarts.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the replica.
+
+        Args:
+            path: SQLite database path (defaults to data_dir/replica/notion.db)
+
+        Raises:
+            sqlite3.OperationalError: If the database file cannot be opened
+        """
+        self.path = path or get_replica_path()
+        conn = open_sqlite(self.path, REPLICA_SCHEMA)
+        if conn is None:
+            # Unlike the caches there is no in-memory fallback: an empty
+            # replica that never persists would only shadow Notion
+            raise sqlite3.OperationalError(f"Cannot open replica database {self.path}")
+        self._conn = conn
+        # Guards the connection: async writes commit from a worker thread
+        self._db_lock = threading.Lock()
+        self._pages: dict[str, dict[str, dict[str, Any]]] = {db: {} for db in REPLICATED_DATABASES}
+        self._page_db: dict[str, str] = {}
+        # db_type -> (watermark, last_full_sync), so reads never wait on the lock
+        self._sync_state: dict[str, tuple[str | None, str | None]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load all stored pages and sync state into memory."""
+        for page_id, db_type, data in self._conn.execute(
+            "SELECT page_id, db_type, data FROM pages"
+        ):
+            try:
+                self._pages.setdefault(db_type, {})[page_id] = json.loads(data)
+                self._page_db[page_id] = db_type
+            except json.JSONDecodeError:
+                logger.warning("Dropping corrupt replica row for page %s", page_id)
+        for db_type, watermark, last_full_sync in self._conn.execute(
+            "SELECT db_type, watermark, last_full_sync FROM sync_state"
+        ):
+            self._sync_state[db_type] = (watermark, last_full_sync)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._db_lock:
+            self._conn.close()
+
+    # -------------------------------------------------------------------------
+    # Sync state
+    # -------------------------------------------------------------------------
+
+    def is_ready(self, db_type: str) -> bool:
+        """True once the database has completed at least one full sync."""
+        state = self._sync_state.get(db_type)
+        return bool(state and state[1])
+
+    def get_watermark(self, db_type: str) -> str | None:
+        """Get the last_edited_time watermark for incremental sync."""
+        state = self._sync_state.get(db_type)
+        return state[0] if state else None
+
+    def get_last_full_sync(self, db_type: str) -> datetime | None:
+        """Get when the database was last fully resynced."""
+        state = self._sync_state.get(db_type)
+        return _parse_datetime(state[1]) if state else None
+
+    def set_sync_state(self, db_type: str, watermark: str | None, full: bool = False) -> None:
+        """Record sync progress for a database."""
+        self._persist_sync_state(self._stage_sync_state(db_type, watermark, full))
+
+    async def aset_sync_state(
+        self, db_type: str, watermark: str | None, full: bool = False
+    ) -> None:
+        """Record sync progress, committing off the event loop."""
+        row = self._stage_sync_state(db_type, watermark, full)
+        await asyncio.to_thread(self._persist_sync_state, row)
+
+    def _stage_sync_state(
+        self, db_type: str, watermark: str | None, full: bool
+    ) -> tuple[str, str | None, str | None]:
+        last_full_sync = (
+            datetime.now(UTC).isoformat()
+            if full
+            else self._sync_state.get(db_type, (None, None))[1]
+        )
+        self._sync_state[db_type] = (watermark, last_full_sync)
+        return db_type, watermark, last_full_sync
+
+    def _persist_sync_state(self, row: tuple[str, str | None, str | None]) -> None:
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (db_type, watermark, last_full_sync) "
+                "VALUES (?, ?, ?)",
+                row,
+            )
+            self._conn.commit()
+
+    # -------------------------------------------------------------------------
+    # Page storage
+    # -------------------------------------------------------------------------
+
+    def db_type_for_page(self, page: dict[str, Any]) -> str | None:
+        """Determine which replicated database a page belongs to."""
+        page_id = page.get("id")
+        if page_id and page_id in self._page_db:
+            return self._page_db[page_id]
+
+        parent_id = page.get("parent", {}).get("database_id")
+        if not parent_id:
+            return None
+        parent_id = normalize_id(parent_id)
+        for db_type in REPLICATED_DATABASES:
+            db_id = database_id_for(db_type)
+            if db_id and normalize_id(db_id) == parent_id:
+                return db_type
+        return None
+
+    def upsert_page(self, page: dict[str, Any], db_type: str | None = None) -> bool:
+        """Insert or update a page (or remove it if Notion reports it archived).
+
+        Returns:
+            True if the page belongs to a replicated database and was applied
+        """
+        db_type = db_type or self.db_type_for_page(page)
+        if not db_type or not page.get("id"):
+            return False
+        self._persist(db_type, *self._stage(db_type, [page]))
+        return True
+
+    async def aupsert_page(self, page: dict[str, Any], db_type: str | None = None) -> bool:
+        """upsert_page, committing off the event loop."""
+        db_type = db_type or self.db_type_for_page(page)
+        if not db_type or not page.get("id"):
+            return False
+        await asyncio.to_thread(self._persist, db_type, *self._stage(db_type, [page]))
+        return True
+
+    def delete_page(self, page_id: str) -> None:
+        """Remove a page from the replica."""
+        self._forget(page_id)
+        self._persist("", [], [page_id])
+
+    def apply_pages(self, db_type: str, pages: list[dict[str, Any]]) -> None:
+        """Upsert a batch of pages from an incremental sync in one transaction."""
+        self._persist(db_type, *self._stage(db_type, pages))
+
+    async def aapply_pages(self, db_type: str, pages: list[dict[str, Any]]) -> None:
+        """apply_pages, committing off the event loop."""
+        await asyncio.to_thread(self._persist, db_type, *self._stage(db_type, pages))
+
+    def replace_all(self, db_type: str, pages: list[dict[str, Any]]) -> None:
+        """Replace a database's contents with a full snapshot.
+
+        Pages missing from the snapshot (deleted or archived in Notion) are dropped.
+        """
+        live = self._stage_replace(db_type, pages)
+        self._persist(db_type, *self._stage(db_type, pages), live=live)
+
+    async def areplace_all(self, db_type: str, pages: list[dict[str, Any]]) -> None:
+        """replace_all, committing off the event loop."""
+        live = self._stage_replace(db_type, pages)
+        upserts, deletes = self._stage(db_type, pages)
+        await asyncio.to_thread(self._persist, db_type, upserts, deletes, live)
+
+    def _forget(self, page_id: str) -> None:
+        db_type = self._page_db.pop(page_id, None)
+        if db_type:
+            self._pages.get(db_type, {}).pop(page_id, None)
+
+    def _stage(
+        self, db_type: str, pages: list[dict[str, Any]]
+    ) -> tuple[list[tuple[str, dict[str, Any]]], list[str]]:
+        """Apply a batch to the in-memory copy.
+
+        Returns:
+            (page_id, page) rows to store and page IDs to delete on disk
+        """
+        upserts: list[tuple[str, dict[str, Any]]] = []
+        deletes: list[str] = []
+        for page in pages:
+            page_id = page.get("id")
+            if not page_id:
+                continue
+            if page.get("archived") or page.get("in_trash"):
+                self._forget(page_id)
+                deletes.append(page_id)
+                continue
+            previous = self._page_db.get(page_id)
+            if previous and previous != db_type:
+                self._pages.get(previous, {}).pop(page_id, None)
+            self._pages.setdefault(db_type, {})[page_id] = page
+            self._page_db[page_id] = db_type
+            upserts.append((page_id, page))
+        return upserts, deletes
+
+    def _stage_replace(self, db_type: str, pages: list[dict[str, Any]]) -> list[str]:
+        """Drop in-memory pages missing from a full snapshot; return the live IDs."""
+        live = sorted({p["id"] for p in pages if p.get("id")})
+        kept = set(live)
+        for page_id in list(self._pages.get(db_type, {})):
+            if page_id not in kept:
+                self._forget(page_id)
+        return live
+
+    def _persist(
+        self,
+        db_type: str,
+        upserts: list[tuple[str, dict[str, Any]]],
+        deletes: list[str],
+        live: list[str] | None = None,
+    ) -> None:
+        """Write staged changes to SQLite in one transaction (safe from a worker thread).
+
+        Args:
+            db_type: Database the upserted pages belong to
+            upserts: (page_id, page) rows to insert or replace
+            deletes: Page IDs to delete
+            live: For a full snapshot, the only page IDs of db_type to keep
+        """
+        rows = [
+            (page_id, db_type, page.get("last_edited_time"), json.dumps(page))
+            for page_id, page in upserts
+        ]
+        with self._db_lock:
+            if live is not None:
+                self._conn.execute(
+                    "DELETE FROM pages WHERE db_type = ? "
+                    "AND page_id NOT IN (SELECT value FROM json_each(?))",
+                    (db_type, json.dumps(live)),
+                )
+            self._conn.executemany(
+                "DELETE FROM pages WHERE page_id = ?", [(page_id,) for page_id in deletes]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages (page_id, db_type, last_edited_time, data) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def get_page(self, page_id: str) -> dict[str, Any] | None:
+        """Get a replicated page by ID."""
+        db_type = self._page_db.get(page_id)
+        if db_type is None:
+            return None
+        return self._pages.get(db_type, {}).get(page_id)
+
+    def count(self, db_type: str) -> int:
+        """Number of pages replicated for a database."""
+        return len(self._pages.get(db_type, {}))
+
+    def query(
+        self,
+        db_type: str,
+        body: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Evaluate a Notion database query body locally.
+
+        Args:
+            db_type: Replicated database type
+            body: Notion query body (filter, sorts)
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            Matching pages, sorted
+
+        Raises:
+            UnsupportedFilterError: If the body can't be evaluated locally
+        """
+        body = body or {}
+        query_filter = body.get("filter")
+        matched = [
+            p for p in self._pages.get(db_type, {}).values() if matches_filter(p, query_filter)
+        ]
+        matched = sort_pages(matched, body.get("sorts"))
+        return matched[:limit] if limit is not None else matched
+
+
+# Module-level singleton (only created when the replica is enabled)
+_replica: NotionReplica | None = None
+_replica_failed = False  # opening failed; not retried for every NotionClient
+
+
+def get_notion_replica() -> NotionReplica | None:
+    """Get the replica singleton, or None if it is disabled or cannot be opened."""
+    global _replica, _replica_failed
+    if not settings.notion_replica_enabled or _replica_failed:
+        return None
+    if _replica is None:
+        try:
+            _replica = NotionReplica()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Notion replica unavailable, reading from Notion: %s", e)
+            _replica_failed = True
+            return None
+    return _replica
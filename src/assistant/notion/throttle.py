@@ -0,0 +1,245 @@
+"""Client-wide circuit breaker and rate limiter for Notion API requests.
+
+NotionClient instances are cheap and short-lived, so per-instance retry
+state let concurrent callers pile onto a failing or throttled Notion, each
+waiting out its own backoff. Both guards here are shared by every client:
+
+- CircuitBreaker opens after consecutive failures (network errors and 5xx)
+  so requests fail fast - and writes go to the offline queue - until a
+  single probe request succeeds after the reset timeout.
+- NotionRateLimiter is a token bucket that keeps requests under Notion's
+  average of ~3 requests/second. A 429 halves the rate and makes every
+  caller wait out Retry-After; each success raises the rate again
+  (additive increase, multiplicative decrease).
+
+Both expose get_stats() counters so throttling is visible.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from assistant.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fraction of the current rate kept after a 429
+RATE_BACKOFF_FACTOR = 0.5
+
+# Requests/second regained per successful request after a 429
+RATE_RECOVERY_STEP = 0.05
+
+# Lowest rate a run of 429s can push the limiter to
+MIN_RATE = 0.25
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the Notion circuit is open."""
+
+
+class CircuitBreaker:
+    """Three-state circuit breaker (closed, open, half-open).
+
+    closed: requests flow; consecutive failures are counted.
+    open: requests are refused until reset_timeout has passed.
+    half-open: one probe request is let through; success closes the
+        circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.opened = 0  # times the circuit opened
+        self.rejected = 0  # requests refused while open
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout passes."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now (claims the probe when half-open)."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record that Notion answered; closes the circuit."""
+        if self._state != self.CLOSED:
+            logger.info("Notion circuit closed")
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give up a claimed probe that ended without an outcome (e.g. cancelled).
+
+        Without this a cancelled probe would hold the half-open circuit
+        shut forever. A no-op once the probe's success or failure is recorded.
+        """
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request; opens the circuit at the threshold or on a failed probe."""
+        self._failures += 1
+        if self._state == self.HALF_OPEN or (
+            self._state == self.CLOSED and self._failures >= self.failure_threshold
+        ):
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+            self.opened += 1
+            logger.warning(
+                "Notion circuit opened after %d failures; failing fast for %.0fs",
+                self._failures,
+                self.reset_timeout,
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """State and counters."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class NotionRateLimiter:
+    """Token bucket shared by all Notion requests, adapting to 429 responses.
+
+    Tokens may go negative: each acquire() reserves a token and sleeps for
+    the debt, so concurrent callers are spaced out without a lock.
+    """
+
+    def __init__(self, rate: float = 3.0, burst: int = 3):
+        """Initialize the limiter.
+
+        Args:
+            rate: Target requests per second
+            burst: Requests allowed back to back when the bucket is full
+        """
+        self.max_rate = rate
+        self.burst = max(1, burst)
+        self._rate = rate
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+        self.requests = 0  # tokens handed out
+        self.delayed = 0  # requests that had to wait
+        self.wait_seconds = 0.0  # total time spent waiting
+        self.throttled = 0  # 429 responses seen
+
+    @property
+    def rate(self) -> float:
+        """Current requests per second."""
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        self._refill()
+        self._tokens -= 1
+        self.requests += 1
+        if self._tokens >= 0:
+            return 0.0
+        wait = -self._tokens / self._rate
+        self.delayed += 1
+        self.wait_seconds += wait
+        return wait
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_throttle(self, retry_after: float) -> None:
+        """Slow down after a 429: halve the rate and hold every caller for retry_after."""
+        self._refill()
+        self.throttled += 1
+        self._rate = max(MIN_RATE, self._rate * RATE_BACKOFF_FACTOR)
+        self._tokens = min(self._tokens, 0.0) - retry_after * self._rate
+        logger.info(
+            "Notion rate limited; waiting %.1fs, rate now %.2f req/s", retry_after, self._rate
+        )
+
+    def record_success(self) -> None:
+        """Creep back towards the configured rate after throttling."""
+        if self._rate < self.max_rate:
+            self._refill()
+            self._rate = min(self.max_rate, self._rate + RATE_RECOVERY_STEP)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Current rate and counters."""
+        return {
+            "rate": round(self._rate, 3),
+            "max_rate": self.max_rate,
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "throttled": self.throttled,
+        }
+
+
+# Module-level singletons shared by every NotionClient
+_breaker: CircuitBreaker | None = None
+_limiter: NotionRateLimiter | None = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the shared Notion circuit breaker."""
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker(
+            failure_threshold=settings.notion_circuit_failure_threshold,
+            reset_timeout=settings.notion_circuit_reset_timeout,
+        )
+    return _breaker
+
+
+def get_rate_limiter() -> NotionRateLimiter:
+    """Get the shared Notion rate limiter."""
+    global _limiter
+    if _limiter is None:
+        _limiter = NotionRateLimiter(rate=settings.notion_rate_limit)
+    return _limiter
+
+
+def get_throttle_stats() -> dict[str, Any]:
+    """Counters of the shared circuit breaker and rate limiter."""
+    return {
+        "circuit": get_circuit_breaker().get_stats(),
+        "rate_limiter": get_rate_limiter().get_stats(),
+    }
@@ -14,6 +14,9 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     # Briefing
     "BriefingGenerator": ("assistant.services.briefing", "BriefingGenerator"),
     "generate_briefing": ("assistant.services.briefing", "generate_briefing"),
+    "BriefingSnapshot": ("assistant.services.briefing", "BriefingSnapshot"),
+    "BriefingSnapshotStore": ("assistant.services.briefing", "BriefingSnapshotStore"),
+    "precompute_briefing": ("assistant.services.briefing", "precompute_briefing"),
     # Clarification
     "ClarificationService": ("assistant.services.clarification", "ClarificationService"),
     # Confidence
@@ -27,6 +30,13 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "get_offline_response": ("assistant.services.offline_queue", "get_offline_response"),
     "process_offline_queue": ("assistant.services.offline_queue", "process_offline_queue"),
     "queue_for_offline_sync": ("assistant.services.offline_queue", "queue_for_offline_sync"),
+    # Audit log writer
+    "AuditFlushResult": ("assistant.services.audit_writer", "AuditFlushResult"),
+    "AuditLogWriter": ("assistant.services.audit_writer", "AuditLogWriter"),
+    "flush_audit_log": ("assistant.services.audit_writer", "flush_audit_log"),
+    "get_audit_writer": ("assistant.services.audit_writer", "get_audit_writer"),
+    "start_audit_writer": ("assistant.services.audit_writer", "start_audit_writer"),
+    "stop_audit_writer": ("assistant.services.audit_writer", "stop_audit_writer"),
     # Corrections
     "CorrectionHandler": ("assistant.services.corrections", "CorrectionHandler"),
     "CorrectionResult": ("assistant.services.corrections", "CorrectionResult"),
@@ -46,6 +56,7 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     # Patterns (application - T-093)
     "AppliedPattern": ("assistant.services.pattern_applicator", "AppliedPattern"),
     "PatternApplicator": ("assistant.services.pattern_applicator", "PatternApplicator"),
+    "PatternIndex": ("assistant.services.pattern_applicator", "PatternIndex"),
     "PatternApplicationResult": (
         "assistant.services.pattern_applicator",
         "PatternApplicationResult",
@@ -171,11 +182,19 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "send_heartbeat": ("assistant.services.heartbeat", "send_heartbeat"),
     "start_heartbeat": ("assistant.services.heartbeat", "start_heartbeat"),
     "stop_heartbeat": ("assistant.services.heartbeat", "stop_heartbeat"),
+    # Notion Replica Sync
+    "ReplicaSyncResult": ("assistant.services.replica_sync", "ReplicaSyncResult"),
+    "ReplicaSyncService": ("assistant.services.replica_sync", "ReplicaSyncService"),
+    "get_replica_sync_service": ("assistant.services.replica_sync", "get_replica_sync_service"),
+    "start_replica_sync": ("assistant.services.replica_sync", "start_replica_sync"),
+    "stop_replica_sync": ("assistant.services.replica_sync", "stop_replica_sync"),
+    "sync_replica_now": ("assistant.services.replica_sync", "sync_replica_now"),
     # LLM Provider Abstraction Layer (T-213)
     "AnthropicProvider": ("assistant.services.llm_client", "AnthropicProvider"),
     "BaseLLMProvider": ("assistant.services.llm_client", "BaseLLMProvider"),
     "GeminiProvider": ("assistant.services.llm_client", "GeminiProvider"),
     "LLMClient": ("assistant.services.llm_client", "LLMClient"),
+    "LatencyHistogram": ("assistant.services.llm_client", "LatencyHistogram"),
     "LLMProvider": ("assistant.services.llm_client", "LLMProvider"),
     "LLMResponse": ("assistant.services.llm_client", "LLMResponse"),
     "LLMUsageStats": ("assistant.services.llm_client", "LLMUsageStats"),
@@ -184,7 +203,12 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "estimate_cost": ("assistant.services.llm_client", "estimate_cost"),
     "get_llm_client": ("assistant.services.llm_client", "get_llm_client"),
     "is_llm_available": ("assistant.services.llm_client", "is_llm_available"),
+    "llm_acomplete": ("assistant.services.llm_client", "llm_acomplete"),
     "llm_complete": ("assistant.services.llm_client", "llm_complete"),
+    # LLM Response Cache
+    "LLMCache": ("assistant.services.llm_cache", "LLMCache"),
+    "get_llm_cache": ("assistant.services.llm_cache", "get_llm_cache"),
+    "make_cache_key": ("assistant.services.llm_cache", "make_cache_key"),
     # Schedule Conflict Detection (T-156)
     "ConflictCheckResult": ("assistant.services.schedule_conflict", "ConflictCheckResult"),
     "ScheduleConflict": ("assistant.services.schedule_conflict", "ScheduleConflict"),
@@ -217,6 +241,18 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "handle_proximity_query": ("assistant.services.proximity", "handle_proximity_query"),
     "haversine_distance": ("assistant.services.proximity", "haversine_distance"),
     "is_proximity_query": ("assistant.services.proximity", "is_proximity_query"),
+    "IndexedPlace": ("assistant.services.spatial_index", "IndexedPlace"),
+    "PlaceSpatialIndex": ("assistant.services.spatial_index", "PlaceSpatialIndex"),
+    "get_place_index": ("assistant.services.spatial_index", "get_place_index"),
+    "PlaceGeocodeResult": ("assistant.services.place_geocoder", "PlaceGeocodeResult"),
+    "PlaceGeocodingService": ("assistant.services.place_geocoder", "PlaceGeocodingService"),
+    "geocode_places_now": ("assistant.services.place_geocoder", "geocode_places_now"),
+    "get_place_geocoding_service": (
+        "assistant.services.place_geocoder",
+        "get_place_geocoding_service",
+    ),
+    "start_place_geocoding": ("assistant.services.place_geocoder", "start_place_geocoding"),
+    "stop_place_geocoding": ("assistant.services.place_geocoder", "stop_place_geocoding"),
     # Meeting Notes (T-165)
     "MeetingNotesResult": ("assistant.services.meeting_notes", "MeetingNotesResult"),
     "MeetingNotesService": ("assistant.services.meeting_notes", "MeetingNotesService"),
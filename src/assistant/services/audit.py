@@ -13,8 +13,12 @@ Deduplication process:
 2. If found and not error, skip action
 3. If found with error, may retry based on error type
 4. If not found, proceed and log with key
+
+While the audit log writer is running, log entries are buffered and
+written to Notion in the background (see audit_writer).
 """
 
+import json
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -22,7 +26,10 @@ from enum import Enum
 from typing import Any
 
 from assistant.config import settings
+from assistant.notion.client import iter_query_results
+from assistant.notion.idempotency import IdempotencyIndex, get_idempotency_index
 from assistant.notion.schemas import ActionType, LogEntry
+from assistant.services.audit_writer import get_audit_writer
 
 logger = logging.getLogger(__name__)
 
@@ -75,14 +82,19 @@ class AuditLogger:
     - Correction tracking for pattern learning
     """
 
-    def __init__(self, notion_client: Any | None = None):
+    def __init__(
+        self,
+        notion_client: Any | None = None,
+        idempotency_index: IdempotencyIndex | None = None,
+    ):
         """Initialize audit logger.
 
         Args:
             notion_client: NotionClient instance (lazy import to avoid circular deps)
+            idempotency_index: Index of logged keys (defaults to the shared index)
         """
         self._notion = notion_client
-        self._checked_keys: dict[str, AuditEntry] = {}  # In-memory cache
+        self._index = idempotency_index
 
     @property
     def notion(self) -> Any:
@@ -93,6 +105,13 @@ class AuditLogger:
             self._notion = NotionClient() if settings.has_notion else None
         return self._notion
 
+    @property
+    def index(self) -> IdempotencyIndex | None:
+        """Get the idempotency index (None if disabled)."""
+        if self._index is None:
+            self._index = get_idempotency_index()
+        return self._index
+
     def generate_idempotency_key(
         self,
         key_type: str,
@@ -129,31 +148,35 @@ class AuditLogger:
         Returns:
             Tuple of (DedupeResult, existing entry if found)
         """
-        # Check memory cache first
-        if idempotency_key in self._checked_keys:
-            entry = self._checked_keys[idempotency_key]
-            if entry.error_code:
-                return DedupeResult.RETRY, entry
-            return DedupeResult.DUPLICATE, entry
-
-        if not self.notion:
+        # Entries still buffered by the audit log writer, then the local index
+        log_id: str | None = None
+        error_code: str | None = None
+        pending = get_audit_writer().pending_entry(idempotency_key)
+        index = self.index
+        record = index.get("log", idempotency_key) if index is not None and not pending else None
+        if pending is not None:
+            error_code = pending.error_code
+        elif record is not None:
+            log_id, error_code = record.page_id, record.error_code
+        elif self.notion:
+            try:
+                log_id = await self.notion._check_dedupe("log", idempotency_key)
+            except Exception as e:
+                logger.warning(f"Idempotency check failed: {e}")
+            if log_id and index is not None:
+                index.record("log", idempotency_key, log_id)
+
+        if pending is None and log_id is None:
             return DedupeResult.NEW, None
 
-        try:
-            existing = await self.notion._check_dedupe("log", idempotency_key)
-            if existing:
-                # Fetch full entry details
-                entry = AuditEntry(
-                    log_id=existing,
-                    idempotency_key=idempotency_key,
-                    dedupe_result=DedupeResult.DUPLICATE,
-                )
-                self._checked_keys[idempotency_key] = entry
-                return DedupeResult.DUPLICATE, entry
-        except Exception as e:
-            logger.warning(f"Idempotency check failed: {e}")
-
-        return DedupeResult.NEW, None
+        result = DedupeResult.RETRY if error_code else DedupeResult.DUPLICATE
+        entry = AuditEntry(
+            log_id=log_id,
+            idempotency_key=idempotency_key,
+            error_code=error_code,
+            dedupe_result=result,
+        )
+        return result, entry
 
     async def log_action(
         self,
@@ -193,7 +216,8 @@ class AuditLogger:
             include_undo_window: Whether to include undo_available_until
 
         Returns:
-            AuditEntry with log_id populated if successful
+            AuditEntry with log_id populated if written directly; entries
+            handed to the running audit log writer are acknowledged without one
         """
         entry = AuditEntry(
             action_type=action_type,
@@ -238,12 +262,14 @@ class AuditLogger:
                 correction=correction,
                 corrected_at=entry.corrected_at,
                 undo_available_until=entry.undo_available_until,
+                timestamp=entry.timestamp,
             )
-            entry.log_id = await self.notion.create_log_entry(log_entry)
+            # Buffered entries are written in the background and have no log_id yet
+            if not await get_audit_writer().submit(log_entry):
+                entry.log_id = await self.notion.create_log_entry(log_entry)
 
-            # Update memory cache
-            if idempotency_key:
-                self._checked_keys[idempotency_key] = entry
+            if idempotency_key and entry.log_id and self.index is not None:
+                self.index.record("log", idempotency_key, entry.log_id, error_code)
 
         except Exception as e:
             logger.exception(f"Failed to create log entry: {e}")
@@ -508,6 +534,40 @@ class AuditLogger:
             external_api="telegram",
         )
 
+    async def log_briefing_timings(
+        self,
+        section_seconds: dict[str, float],
+        total_seconds: float,
+        timed_out: list[str] | None = None,
+        failed: list[str] | None = None,
+    ) -> AuditEntry:
+        """Log how long each briefing data source took.
+
+        Args:
+            section_seconds: Seconds per data source
+            total_seconds: Wall time for all sources together
+            timed_out: Sources shown as "still loading"
+            failed: Sources that raised an error
+
+        Returns:
+            AuditEntry for the timings
+        """
+        slowest = sorted(section_seconds.items(), key=lambda item: item[1], reverse=True)
+        summary = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in slowest)
+        action_taken = f"Generated morning briefing in {total_seconds:.2f}s ({summary})"
+        if timed_out:
+            action_taken += f"; timed out: {', '.join(timed_out)}"
+        if failed:
+            action_taken += f"; failed: {', '.join(failed)}"
+
+        return await self.log_action(
+            action_type=ActionType.SEND,
+            action_taken=action_taken,
+            interpretation=json.dumps(
+                {name: round(seconds, 3) for name, seconds in section_seconds.items()}
+            ),
+        )
+
     async def log_error(
         self,
         error_code: str,
@@ -615,22 +675,21 @@ class AuditLogger:
         query_filter = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
 
         try:
-            result = await self.notion._request(
-                "POST",
-                f"/databases/{settings.notion_log_db_id}/query",
-                {
-                    "filter": query_filter,
-                    "page_size": limit,
-                    "sorts": [{"property": "timestamp", "direction": "descending"}],
-                }
-                if query_filter
-                else {
-                    "page_size": limit,
-                    "sorts": [{"property": "timestamp", "direction": "descending"}],
-                },
-            )
-            results: list[dict[str, Any]] = result.get("results", [])
-            return results
+            body: dict[str, Any] = {
+                "sorts": [{"property": "timestamp", "direction": "descending"}],
+            }
+            if query_filter:
+                body["filter"] = query_filter
+
+            return [
+                page
+                async for page in iter_query_results(
+                    self.notion._request,
+                    f"/databases/{settings.notion_log_db_id}/query",
+                    body,
+                    limit=limit,
+                )
+            ]
         except Exception as e:
             logger.exception(f"Failed to query log: {e}")
             return []
@@ -0,0 +1,444 @@
+"""Buffered background writer for audit log entries.
+
+Every logged action used to create its Log page inline - a dedupe query
+plus a page create before the user got a reply. While this writer is
+running, AuditLogger.log_action and NotionClient.log_action hand it the
+entry instead and return immediately:
+- submit() appends the entry to a local spool file (fsynced in a worker
+  thread, off the event loop) and buffers it
+- A background loop flushes the buffer when it reaches batch_size entries
+  or flush_interval seconds after the first buffered entry
+- A flush coalesces entries sharing an idempotency key and writes the rest
+  with bounded concurrency; entries that fail stay buffered for the next
+  flush, and after max_attempts failures move to a dead-letter file
+- stop() flushes whatever is left; the spool is rewritten after each flush
+  so it only ever holds unwritten entries, and start() reloads them
+
+When the writer is not running (CLI commands, tests) callers fall back to
+writing the entry directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from assistant.config import settings
+from assistant.notion.client import NotionClient
+from assistant.notion.schemas import LogEntry
+from assistant.notion.throttle import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# Default seconds an entry may wait in the buffer before a flush
+DEFAULT_AUDIT_FLUSH_INTERVAL = 2.0
+
+# Default buffered entries that trigger an immediate flush
+DEFAULT_AUDIT_BATCH_SIZE = 20
+
+# Log pages created at once during a flush
+AUDIT_FLUSH_CONCURRENCY = 3
+
+# Failed writes before an entry is moved to the dead-letter file
+AUDIT_MAX_ATTEMPTS = 5
+
+
+def _default_spool_path() -> Path:
+    return Path(settings.data_dir).expanduser() / "queue" / "audit.jsonl"
+
+
+@dataclass
+class AuditFlushResult:
+    """Result of flushing the audit buffer."""
+
+    timestamp: datetime
+    written: int = 0
+    coalesced: int = 0  # entries dropped as repeats of a buffered idempotency key
+    failed: int = 0  # entries kept for the next flush
+    dead_lettered: int = 0  # entries moved to the dead-letter file after max_attempts
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """True if every buffered entry was written."""
+        return self.failed == 0 and self.dead_lettered == 0
+
+
+class AuditLogWriter:
+    """Background service that batches audit log writes to Notion.
+
+    Follows the same lifecycle pattern as PlaceGeocodingService:
+    - start() reloads spooled entries and begins the background loop
+    - stop() flushes the buffer and shuts down
+    """
+
+    def __init__(
+        self,
+        notion_client: NotionClient | None = None,
+        spool_path: Path | None = None,
+        batch_size: int = DEFAULT_AUDIT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_AUDIT_FLUSH_INTERVAL,
+        concurrency: int = AUDIT_FLUSH_CONCURRENCY,
+        max_attempts: int = AUDIT_MAX_ATTEMPTS,
+    ):
+        """Initialize the writer.
+
+        Args:
+            notion_client: Client used to create Log pages (created if not provided)
+            spool_path: File holding unwritten entries (defaults to data_dir/queue/audit.jsonl)
+            batch_size: Buffered entries that trigger an immediate flush
+            flush_interval: Seconds an entry may wait before a flush
+            concurrency: Log pages created at once during a flush
+            max_attempts: Failed writes before an entry is moved to the
+                dead-letter file (audit.failed.jsonl next to the spool)
+        """
+        self._notion = notion_client
+        self._owns_client = notion_client is None
+        self.spool_path = spool_path or _default_spool_path()
+        self.failed_path = self.spool_path.with_name(f"{self.spool_path.stem}.failed.jsonl")
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._concurrency = max(1, concurrency)
+        self._max_attempts = max(1, max_attempts)
+        self._buffer: list[LogEntry] = []
+        self._attempts: dict[str, int] = {}  # failed writes per entry id
+        self._spool_lock = threading.Lock()
+        # Held across a spool write and the matching buffer change so a
+        # rewrite never drops an entry that is spooled but not yet buffered
+        self._spool_order = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+        self._last_result: AuditFlushResult | None = None
+
+    @property
+    def is_configured(self) -> bool:
+        """Check if buffering is enabled and Notion is configured."""
+        return bool(settings.audit_buffer_enabled and settings.has_notion)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the writer is accepting entries."""
+        return self._running
+
+    @property
+    def pending_count(self) -> int:
+        """Number of entries not yet written to Notion."""
+        return len(self._buffer)
+
+    @property
+    def last_result(self) -> AuditFlushResult | None:
+        """Get the last flush result."""
+        return self._last_result
+
+    def pending_entry(self, idempotency_key: str) -> LogEntry | None:
+        """Latest buffered entry with an idempotency key, if it is not yet written."""
+        for entry in reversed(self._buffer):
+            if entry.idempotency_key == idempotency_key:
+                return entry
+        return None
+
+    def _get_notion(self) -> NotionClient:
+        if self._notion is None:
+            self._notion = NotionClient()
+        return self._notion
+
+    def _append_spool(self, entry: LogEntry) -> None:
+        """Durably append one entry to the spool."""
+        self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+        data = (json.dumps(entry.model_dump(mode="json")) + "\n").encode()
+        with self._spool_lock, open(self.spool_path, "a+b") as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Terminate a line torn by a crash mid-write
+                    data = b"\n" + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite_spool(self, entries: list[LogEntry]) -> None:
+        """Atomically replace the spool with the given entries."""
+        with self._spool_lock:
+            if not entries:
+                self.spool_path.unlink(missing_ok=True)
+                return
+
+            tmp_path = self.spool_path.with_name(f"{self.spool_path.name}.tmp")
+            with open(tmp_path, "w") as f:
+                for entry in entries:
+                    record = entry.model_dump(mode="json")
+                    if self._attempts.get(entry.id):
+                        record["attempts"] = self._attempts[entry.id]
+                    f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.spool_path)
+
+    def _load_spool(self) -> list[LogEntry]:
+        """Read entries left in the spool by a previous run."""
+        if not self.spool_path.exists():
+            return []
+
+        entries = []
+        with self._spool_lock, open(self.spool_path) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    attempts = record.pop("attempts", 0)
+                    entry = LogEntry.model_validate(record)
+                except (json.JSONDecodeError, ValidationError) as e:
+                    logger.warning("Skipping unreadable audit spool line %d: %s", line_number, e)
+                    continue
+                if attempts:
+                    self._attempts[entry.id] = attempts
+                entries.append(entry)
+        return entries
+
+    def _dead_letter(self, entries: list[tuple[LogEntry, str]]) -> None:
+        """Move entries that exhausted their attempts to the dead-letter file."""
+        with self._spool_lock, open(self.failed_path, "a") as f:
+            for entry, error in entries:
+                record = {**entry.model_dump(mode="json"), "error": error}
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def submit(self, entry: LogEntry) -> bool:
+        """Buffer an entry for the next flush.
+
+        Args:
+            entry: Log entry to write
+
+        Returns:
+            True if the entry was accepted; False if the writer is not running
+            or the spool could not be written, in which case the caller
+            should write the entry itself
+        """
+        if not self._running:
+            return False
+
+        async with self._spool_order:
+            try:
+                # The fsync can take milliseconds; keep it off the event loop
+                await asyncio.to_thread(self._append_spool, entry)
+            except OSError as e:
+                logger.warning("Could not spool audit entry: %s", e)
+                return False
+            self._buffer.append(entry)
+
+        if len(self._buffer) == 1 or len(self._buffer) >= self._batch_size:
+            # Start the flush timer, or flush now if the batch is full
+            self._wakeup.set()
+        return True
+
+    async def _write(self, entry: LogEntry, semaphore: asyncio.Semaphore) -> Exception | None:
+        async with semaphore:
+            try:
+                # The spool already keeps the entry, so skip the offline queue
+                await self._get_notion().create_log_entry(entry, queue_offline=False)
+            except Exception as e:
+                return e
+        return None
+
+    def _record_failure(self, entry: LogEntry, error: Exception) -> bool:
+        """Count a failed write; True if the entry should be retried."""
+        if isinstance(error, CircuitOpenError):
+            # Notion is down; not the entry's fault, so no attempt is spent
+            return True
+        attempts = self._attempts.get(entry.id, 0) + 1
+        if attempts < self._max_attempts:
+            self._attempts[entry.id] = attempts
+            return True
+        self._attempts.pop(entry.id, None)
+        return False
+
+    async def flush(self) -> AuditFlushResult:
+        """Write every buffered entry to Notion."""
+        async with self._flush_lock:
+            result = AuditFlushResult(timestamp=datetime.now(UTC))
+            batch = self._buffer[:]
+            if not batch:
+                return result
+
+            unique: list[LogEntry] = []
+            seen_keys: set[str] = set()
+            for entry in batch:
+                if entry.idempotency_key:
+                    if entry.idempotency_key in seen_keys:
+                        result.coalesced += 1
+                        self._attempts.pop(entry.id, None)
+                        continue
+                    seen_keys.add(entry.idempotency_key)
+                unique.append(entry)
+
+            semaphore = asyncio.Semaphore(self._concurrency)
+            errors = await asyncio.gather(*(self._write(entry, semaphore) for entry in unique))
+
+            failed = []
+            exhausted: list[tuple[LogEntry, str]] = []
+            for entry, error in zip(unique, errors, strict=True):
+                if error is None:
+                    result.written += 1
+                    self._attempts.pop(entry.id, None)
+                    continue
+                result.errors.append(f"{entry.id}: {error}")
+                if self._record_failure(entry, error):
+                    failed.append(entry)
+                else:
+                    exhausted.append((entry, str(error)))
+            result.failed = len(failed)
+            result.dead_lettered = len(exhausted)
+
+            if exhausted:
+                try:
+                    await asyncio.to_thread(self._dead_letter, exhausted)
+                except OSError as e:
+                    # Keep them spooled rather than lose them
+                    logger.warning("Could not write audit dead-letter file: %s", e)
+                    failed.extend(entry for entry, _ in exhausted)
+                    result.failed = len(failed)
+                    result.dead_lettered = 0
+                else:
+                    logger.error(
+                        "Gave up on %d audit entries after %d attempts, moved to %s",
+                        len(exhausted),
+                        self._max_attempts,
+                        self.failed_path,
+                    )
+
+            async with self._spool_order:
+                # Entries submitted during the flush stay queued behind the failures
+                self._buffer = failed + self._buffer[len(batch) :]
+                try:
+                    await asyncio.to_thread(self._rewrite_spool, self._buffer[:])
+                except OSError as e:
+                    logger.warning("Could not rewrite audit spool: %s", e)
+
+            if failed:
+                logger.warning(
+                    "Audit flush: %d written, %d kept for retry (%s)",
+                    result.written,
+                    result.failed,
+                    result.errors[0],
+                )
+            else:
+                logger.debug("Audit flush: %d written", result.written)
+
+            self._last_result = result
+            return result
+
+    async def start(self) -> None:
+        """Reload spooled entries and start the flush loop."""
+        if not self.is_configured:
+            logger.info("Audit log buffering not configured (needs Notion)")
+            return
+
+        if self._running:
+            logger.warning("Audit log writer already running")
+            return
+
+        self._buffer = self._load_spool() + self._buffer
+        if self._buffer:
+            logger.info("Recovered %d unwritten audit entries", len(self._buffer))
+            self._wakeup.set()
+
+        self._running = True
+        logger.info(
+            "Starting audit log writer (batch: %d, interval: %.1fs)",
+            self._batch_size,
+            self._flush_interval,
+        )
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop accepting entries and flush the buffer."""
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._buffer:
+            result = await self.flush()
+            if result.failed:
+                logger.warning(
+                    "%d audit entries left in %s for the next start",
+                    result.failed,
+                    self.spool_path,
+                )
+
+        if self._owns_client and self._notion:
+            await self._notion.close()
+            self._notion = None
+
+        logger.info("Audit log writer stopped")
+
+    async def _flush_loop(self) -> None:
+        """Background loop that flushes on size or age of the buffer."""
+        while self._running:
+            try:
+                if not self._buffer:
+                    await self._wakeup.wait()
+                self._wakeup.clear()
+                # Let more entries arrive unless the batch is already full
+                if len(self._buffer) < self._batch_size:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+                    self._wakeup.clear()
+                result = await self.flush()
+                if result.failed:
+                    # Back off before retrying entries Notion refused
+                    await asyncio.sleep(self._flush_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception("Error in audit log writer loop: %s", e)
+                await asyncio.sleep(self._flush_interval)
+
+
+# Module-level singleton
+_audit_writer: AuditLogWriter | None = None
+
+
+def get_audit_writer() -> AuditLogWriter:
+    """Get or create the audit log writer singleton."""
+    global _audit_writer
+    if _audit_writer is None:
+        _audit_writer = AuditLogWriter(
+            batch_size=settings.audit_batch_size,
+            flush_interval=settings.audit_flush_interval,
+        )
+    return _audit_writer
+
+
+async def start_audit_writer() -> None:
+    """Start the audit log writer (convenience function)."""
+    await get_audit_writer().start()
+
+
+async def stop_audit_writer() -> None:
+    """Stop the audit log writer, flushing buffered entries (convenience function)."""
+    await get_audit_writer().stop()
+
+
+async def flush_audit_log() -> AuditFlushResult:
+    """Flush buffered audit entries now (convenience function)."""
+    return await get_audit_writer().flush()
@@ -6,22 +6,200 @@ Generates a comprehensive morning briefing including:
 - Tasks due today with departure time suggestions
 - Items needing clarification
 - This week's upcoming tasks and deadlines
+
+Data sources are fetched concurrently as a small dependency graph (travel
+times wait for the tasks they belong to). Each source has its own timeout and
+the briefing as a whole has a deadline; a source that misses it is shown as
+"still loading" instead of holding back the rest.
+
+Briefings can be pre-computed: `python -m assistant briefing-precompute` runs
+ahead of the scheduled send and saves a snapshot under data_dir. The send then
+re-fetches only the volatile sources (calendar, travel times) plus anything
+that failed during pre-compute. /today reuses a fresh snapshot's due-today
+tasks the same way, fetching the calendar live.
 """
 
+import asyncio
+import json
 import logging
-from dataclasses import dataclass
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import pytz
 from assistant.config import settings
 from assistant.google.calendar import CalendarClient, CalendarEvent, get_calendar_client
 from assistant.google.gmail import EmailMessage, GmailClient, get_gmail_client
-from assistant.google.maps import MapsClient, TravelTime
+from assistant.google.maps import MapsClient, TravelTime, TravelTimeBatcher
 from assistant.notion import NotionClient
+from assistant.services.audit import AuditLogger, get_audit_logger
 
 logger = logging.getLogger(__name__)
 
+# Seconds each data source may take, and the whole briefing before any
+# unfinished sections are shown as "still loading"
+DEFAULT_SECTION_TIMEOUT = 8.0
+DEFAULT_BRIEFING_DEADLINE = 15.0
+
+# Sources re-fetched when sending from a snapshot: they change by the minute
+VOLATILE_SECTIONS = frozenset({"calendar", "task_travel"})
+
+# How old a snapshot may be and still be used for the scheduled send, and for
+# the due-today tasks in /today
+SNAPSHOT_MAX_AGE_SECONDS = 3 * 3600
+TODAY_SNAPSHOT_MAX_AGE_SECONDS = 30 * 60
+
+# Section header shown in the "still loading" placeholder, by data source
+SECTION_TITLES = {
+    "calendar": "📅 **TODAY**",
+    "email": "📧 **EMAIL**",
+    "analyzed_email": "🎯 **FLAGGED EMAIL**",
+    "tasks_today": "✅ **DUE TODAY**",
+    "flagged": "⚠️ **NEEDS CLARIFICATION**",
+    "this_week": "📊 **THIS WEEK**",
+    "til": "🧠 **TODAY I LEARNED**",
+}
+
+# Service named in a section's "Could not fetch data" error, by data source
+SECTION_SOURCES = {
+    "calendar": "Google Calendar",
+    "email": "Gmail",
+    "analyzed_email": "Notion",
+    "tasks_today": "Notion",
+    "task_travel": "Google Maps",
+    "flagged": "Notion",
+    "this_week": "Notion",
+    "til": "Notion",
+}
+
+
+@dataclass
+class SectionResult:
+    """Outcome of fetching one briefing data source."""
+
+    name: str
+    value: Any = None
+    status: str = "ok"  # ok, timeout, error, skipped
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+@dataclass
+class BriefingSnapshot:
+    """A generated briefing plus the source data it was built from."""
+
+    date: str  # YYYY-MM-DD in the user's timezone
+    generated_at: datetime
+    text: str
+    # Non-volatile source results, reused when the briefing is refreshed,
+    # and when they were fetched (refreshing keeps the original time)
+    results: dict[str, SectionResult] = field(default_factory=dict)
+    fetched_at: datetime | None = None
+
+    def __post_init__(self) -> None:
+        if self.fetched_at is None:
+            self.fetched_at = self.generated_at
+
+    def is_fresh(self, now: datetime, max_age: float) -> bool:
+        """True if the snapshot is for now's date and at most max_age seconds old."""
+        return (
+            self.date == now.date().isoformat()
+            and (now - self.generated_at).total_seconds() <= max_age
+        )
+
+    def section_value(self, name: str) -> Any | None:
+        """Cached value of a non-volatile source, or None if it was not fetched cleanly.
+
+        Sources that timed out or failed when the snapshot was built return
+        None, so callers fetch them again instead of showing a placeholder.
+        """
+        result = self.results.get(name)
+        if name in VOLATILE_SECTIONS or result is None or not result.ok:
+            return None
+        return result.value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "date": self.date,
+            "generated_at": self.generated_at.isoformat(),
+            "text": self.text,
+            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
+            "results": {
+                name: {"value": r.value, "status": r.status, "error": r.error}
+                for name, r in self.results.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BriefingSnapshot":
+        return cls(
+            date=data["date"],
+            generated_at=datetime.fromisoformat(data["generated_at"]),
+            text=data["text"],
+            fetched_at=(
+                datetime.fromisoformat(data["fetched_at"]) if data.get("fetched_at") else None
+            ),
+            results={
+                name: SectionResult(
+                    name, value=r.get("value"), status=r.get("status", "ok"), error=r.get("error")
+                )
+                for name, r in data.get("results", {}).items()
+            },
+        )
+
+
+def get_snapshot_path() -> Path:
+    """Get path to the saved briefing snapshot."""
+    return Path(settings.data_dir).expanduser() / "briefing" / "snapshot.json"
+
+
+class BriefingSnapshotStore:
+    """Saves the latest briefing snapshot to disk.
+
+    A file rather than memory, because the scheduled send and the bot's
+    /today command run in different processes.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the store.
+
+        Args:
+            path: Snapshot file (defaults to data_dir/briefing/snapshot.json)
+        """
+        self.path = path or get_snapshot_path()
+
+    def load(self) -> BriefingSnapshot | None:
+        """Load the saved snapshot, or None if missing or unreadable."""
+        if not self.path.exists():
+            return None
+        try:
+            return BriefingSnapshot.from_dict(json.loads(self.path.read_text()))
+        except Exception as e:
+            logger.warning(f"Failed to load briefing snapshot: {e}")
+            return None
+
+    def save(self, snapshot: BriefingSnapshot) -> None:
+        """Replace the saved snapshot."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(snapshot.to_dict()))
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save briefing snapshot: {e}")
+
+
+# A graph node: names of the nodes it depends on, and a factory that receives
+# their values and returns the coroutine producing this node's value
+SectionNode = tuple[tuple[str, ...], Callable[..., Awaitable[Any]]]
+
 
 @dataclass
 class TravelInfo:
@@ -56,6 +234,10 @@ class BriefingGenerator:
         calendar_client: CalendarClient | None = None,
         gmail_client: GmailClient | None = None,
         maps_client: MapsClient | None = None,
+        audit_logger: AuditLogger | None = None,
+        snapshot_store: BriefingSnapshotStore | None = None,
+        section_timeout: float = DEFAULT_SECTION_TIMEOUT,
+        deadline: float = DEFAULT_BRIEFING_DEADLINE,
     ):
         """Initialize briefing generator.
 
@@ -68,6 +250,14 @@ class BriefingGenerator:
                           uses the global singleton if Google OAuth is configured.
             maps_client: Optional MapsClient instance for travel time calculations.
                          If not provided, creates one if Maps API is configured.
+            audit_logger: Optional AuditLogger for section timings. If not provided,
+                          uses the global singleton.
+            snapshot_store: Optional BriefingSnapshotStore. If provided, each
+                            briefing is saved as a snapshot and a recent
+                            snapshot is refreshed instead of rebuilt.
+            section_timeout: Seconds each data source may take.
+            deadline: Seconds the whole briefing may take before unfinished
+                      sections are shown as placeholders.
         """
         self.notion = (
             notion_client
@@ -81,12 +271,24 @@ class BriefingGenerator:
             if maps_client is not None
             else (MapsClient() if settings.google_maps_api_key else None)
         )
+        self.audit = audit_logger
+        self.snapshot_store = snapshot_store
+        self.section_timeout = section_timeout
+        self.deadline = deadline
         self.timezone = pytz.timezone(settings.user_timezone)
         self.home_address = settings.user_home_address
 
-    async def generate_morning_briefing(self) -> str:
+    async def generate_morning_briefing(self, use_snapshot: bool = True) -> str:
         """Generate the complete morning briefing.
 
+        With a snapshot store, a snapshot from earlier today is refreshed
+        (only volatile or previously failed sources are fetched) and the
+        result is saved as the new snapshot.
+
+        Args:
+            use_snapshot: Reuse a recent snapshot if one exists; False forces
+                          every source to be fetched (used to pre-compute)
+
         Returns:
             Formatted briefing string ready to send via Telegram
         """
@@ -97,49 +299,32 @@ class BriefingGenerator:
 
         sections = []
         sections.append(f"Good morning! Here's your day for {now.strftime('%A, %B %d')}:\n")
+        results: dict[str, SectionResult] | None = None
+        snapshot: BriefingSnapshot | None = None
 
         if self.notion:
             try:
-                # 📅 TODAY section (calendar - placeholder)
-                calendar_section = await self._generate_calendar_section()
-                if calendar_section:
-                    sections.append(calendar_section)
-
-                # 📧 EMAIL section (from Gmail - needs response)
-                email_section = await self._generate_email_section()
-                if email_section:
-                    sections.append(email_section)
-
-                # 🎯 FLAGGED EMAIL section (from Notion - LLM-analyzed important emails)
-                analyzed_email_section = await self._generate_analyzed_email_section()
-                if analyzed_email_section:
-                    sections.append(analyzed_email_section)
-
-                # ✅ DUE TODAY section (with travel times for tasks with places)
-                tasks_today = await self._get_tasks_due_today(today_start, today_end)
-                task_travel_info: dict[str, TravelInfo] = {}
-                if self.maps and self.home_address and tasks_today:
-                    task_travel_info = await self._calculate_travel_times_for_tasks(tasks_today)
-                tasks_section = self._format_tasks_due_today(tasks_today, task_travel_info)
-                if tasks_section:
-                    sections.append(tasks_section)
-
-                # ⚠️ NEEDS CLARIFICATION section
-                flagged = await self._get_flagged_items()
-                flagged_section = self._format_flagged_items(flagged)
-                if flagged_section:
-                    sections.append(flagged_section)
-
-                # 📊 THIS WEEK section
-                upcoming_tasks = await self._get_tasks_this_week(today_end, week_end)
-                week_section = self._format_this_week(upcoming_tasks, now)
-                if week_section:
-                    sections.append(week_section)
-
-                # 🧠 TODAY I LEARNED section (patterns learned in last 24 hours)
-                til_section = await self._generate_til_section(today_start)
-                if til_section:
-                    sections.append(til_section)
+                nodes: dict[str, SectionNode] = {
+                    "calendar": ((), self._generate_calendar_section),
+                    "email": ((), self._generate_email_section),
+                    "analyzed_email": ((), self._generate_analyzed_email_section),
+                    "tasks_today": (
+                        (),
+                        lambda: self._get_tasks_due_today(today_start, today_end),
+                    ),
+                    "task_travel": (("tasks_today",), self._travel_for_tasks),
+                    "flagged": ((), self._get_flagged_items),
+                    "this_week": ((), lambda: self._get_tasks_this_week(today_end, week_end)),
+                    "til": ((), lambda: self._generate_til_section(today_start)),
+                }
+                snapshot = self._load_snapshot(now) if use_snapshot else None
+                if snapshot:
+                    nodes = self._reuse_snapshot(nodes, snapshot)
+
+                started = time.monotonic()
+                results = await self._run_section_graph(nodes)
+                sections.extend(self._assemble_sections(results, now))
+                await self._audit_section_timings(results, time.monotonic() - started)
 
             except Exception as e:
                 sections.append(f"*Could not fetch data from Notion: {str(e)}*\n")
@@ -151,7 +336,192 @@ class BriefingGenerator:
 
         sections.append("Reply /debrief anytime to review together.")
 
-        return "\n".join(sections)
+        text = "\n".join(sections)
+        if self.snapshot_store and results is not None:
+            self.snapshot_store.save(
+                BriefingSnapshot(
+                    date=now.date().isoformat(),
+                    generated_at=now,
+                    text=text,
+                    results={
+                        name: result
+                        for name, result in results.items()
+                        if name not in VOLATILE_SECTIONS
+                    },
+                    fetched_at=snapshot.fetched_at if snapshot else now,
+                )
+            )
+        return text
+
+    def _load_snapshot(self, now: datetime) -> BriefingSnapshot | None:
+        """Load today's snapshot if its data is recent enough to refresh."""
+        if not self.snapshot_store:
+            return None
+        snapshot = self.snapshot_store.load()
+        if (
+            snapshot
+            and snapshot.fetched_at
+            and snapshot.date == now.date().isoformat()
+            and (now - snapshot.fetched_at).total_seconds() <= SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            return snapshot
+        return None
+
+    def _reuse_snapshot(
+        self, nodes: dict[str, SectionNode], snapshot: BriefingSnapshot
+    ) -> dict[str, SectionNode]:
+        """Replace nodes that the snapshot already answered with cached values.
+
+        Volatile sources and sources that failed or timed out when the
+        snapshot was built are fetched again.
+        """
+
+        def cached(value: Any) -> Callable[[], Awaitable[Any]]:
+            async def factory() -> Any:
+                return value
+
+            return factory
+
+        reused = dict(nodes)
+        for name in nodes:
+            result = snapshot.results.get(name)
+            if name not in VOLATILE_SECTIONS and result is not None and result.ok:
+                reused[name] = ((), cached(result.value))
+        logger.info(
+            "Refreshing briefing snapshot from %s (re-fetching: %s)",
+            snapshot.generated_at.isoformat(),
+            ", ".join(name for name in nodes if reused[name] is nodes[name]),
+        )
+        return reused
+
+    async def _run_section_graph(self, nodes: dict[str, SectionNode]) -> dict[str, SectionResult]:
+        """Run briefing data sources concurrently, respecting dependencies.
+
+        Each node starts as soon as the nodes it depends on have finished, and
+        is skipped if any of them failed. Nodes get self.section_timeout each;
+        whatever is still running at self.deadline is cancelled and reported
+        as timed out.
+
+        Args:
+            nodes: Node name -> (dependency names, factory)
+
+        Returns:
+            SectionResult per node name
+        """
+        tasks: dict[str, asyncio.Task[SectionResult]] = {}
+
+        async def run(
+            name: str, deps: tuple[str, ...], factory: Callable[..., Awaitable[Any]]
+        ) -> SectionResult:
+            # shield: cancelling this node must not cancel a shared dependency
+            dep_results = [await asyncio.shield(tasks[dep]) for dep in deps]
+            if not all(dep.ok for dep in dep_results):
+                return SectionResult(name, status="skipped")
+
+            started = time.monotonic()
+            try:
+                value = await asyncio.wait_for(
+                    factory(*(dep.value for dep in dep_results)), timeout=self.section_timeout
+                )
+                return SectionResult(name, value=value, seconds=time.monotonic() - started)
+            except TimeoutError:
+                logger.warning(f"Briefing section {name} timed out after {self.section_timeout}s")
+                return SectionResult(name, status="timeout", seconds=time.monotonic() - started)
+            except Exception as e:
+                logger.warning(f"Briefing section {name} failed: {e}")
+                return SectionResult(
+                    name, status="error", seconds=time.monotonic() - started, error=str(e)
+                )
+
+        # Tasks start in insertion order, so dependencies are created first
+        for name, (deps, factory) in nodes.items():
+            tasks[name] = asyncio.create_task(run(name, deps, factory))
+
+        started = time.monotonic()
+        _, pending = await asyncio.wait(tasks.values(), timeout=self.deadline)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results: dict[str, SectionResult] = {}
+        for name, task in tasks.items():
+            if task in pending:
+                logger.warning(f"Briefing section {name} missed the {self.deadline}s deadline")
+                results[name] = SectionResult(
+                    name, status="timeout", seconds=time.monotonic() - started
+                )
+            else:
+                results[name] = task.result()
+        return results
+
+    def _assemble_sections(self, results: dict[str, SectionResult], now: datetime) -> list[str]:
+        """Format fetched data into briefing sections, in display order.
+
+        Sources that timed out become "still loading" placeholders. Failed
+        sources are reported after the sections, once per service
+        (SECTION_SOURCES) with that service's first error.
+
+        Args:
+            results: Output of _run_section_graph
+            now: Current time in the user's timezone
+
+        Returns:
+            Section strings (empty sections omitted)
+        """
+        formatters: dict[str, Callable[[Any], str | None]] = {
+            "calendar": lambda value: value,
+            "email": lambda value: value,
+            "analyzed_email": lambda value: value,
+            "tasks_today": lambda value: self._format_tasks_due_today(
+                value,
+                results["task_travel"].value if results["task_travel"].ok else {},
+            ),
+            "flagged": self._format_flagged_items,
+            "this_week": lambda value: self._format_this_week(value, now),
+            "til": lambda value: value,
+        }
+
+        sections: list[str] = []
+        errors: dict[str, str] = {}
+        for name, format_section in formatters.items():
+            result = results[name]
+            if result.status == "timeout":
+                sections.append(self._format_still_loading(name))
+            elif result.status == "error" and result.error:
+                errors.setdefault(SECTION_SOURCES[name], result.error)
+            elif result.ok:
+                section = format_section(result.value)
+                if section:
+                    sections.append(section)
+
+        for source, error in errors.items():
+            sections.append(f"*Could not fetch data from {source}: {error}*\n")
+        return sections
+
+    def _format_still_loading(self, name: str) -> str:
+        """Placeholder for a section that missed its deadline."""
+        return f"{SECTION_TITLES[name]}\n_Still loading - try /today again in a minute._\n"
+
+    async def _travel_for_tasks(self, tasks: list[dict[str, Any]]) -> dict[str, TravelInfo]:
+        """Travel times for today's tasks (empty without Maps or a home address)."""
+        if self.maps and self.home_address and tasks:
+            return await self._calculate_travel_times_for_tasks(tasks)
+        return {}
+
+    async def _audit_section_timings(
+        self, results: dict[str, SectionResult], total_seconds: float
+    ) -> None:
+        """Record how long each data source took in the audit log."""
+        try:
+            audit = self.audit or get_audit_logger()
+            await audit.log_briefing_timings(
+                {name: result.seconds for name, result in results.items()},
+                total_seconds,
+                timed_out=[name for name, r in results.items() if r.status == "timeout"],
+                failed=[name for name, r in results.items() if r.status == "error"],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to audit briefing timings: {e}")
 
     async def _generate_calendar_section(self) -> str | None:
         """Generate calendar section with today's events from Google Calendar.
@@ -200,6 +570,7 @@ class BriefingGenerator:
 
         For the first event with a location, calculates from home.
         For subsequent events, calculates from the previous event's location.
+        Every leg is resolved through one batched Distance Matrix lookup.
 
         Args:
             events: List of calendar events to analyze
@@ -210,9 +581,7 @@ class BriefingGenerator:
         if not self.maps or not self.home_address:
             return {}
 
-        travel_info: dict[str, TravelInfo] = {}
-        previous_location = self.home_address
-
+        routed: list[CalendarEvent] = []
         for event in events:
             if not event.location or not event.event_id:
                 continue
@@ -231,17 +600,30 @@ class BriefingGenerator:
                 and event.end_time.hour == 0
                 and event.end_time.minute == 0
             )
-            if is_all_day:
-                continue
+            if not is_all_day:
+                routed.append(event)
 
+        # Queue the legs assuming every route is found
+        batcher = TravelTimeBatcher(self.maps)
+        previous_location = self.home_address
+        for event in routed:
+            batcher.add(previous_location, event.location or "")
+            previous_location = event.location or ""
+        await batcher.resolve()
+
+        travel_info: dict[str, TravelInfo] = {}
+        previous_location = self.home_address
+
+        for event in routed:
+            location = event.location or ""
             try:
-                travel_time = await self.maps.get_travel_time(
-                    origin=previous_location,
-                    destination=event.location,
-                    mode="driving",
-                )
+                if not batcher.has(previous_location, location):
+                    # An earlier leg had no route, so this one starts elsewhere
+                    batcher.add(previous_location, location)
+                    await batcher.resolve()
+                travel_time = batcher.get(previous_location, location)
 
-                if travel_time:
+                if travel_time and event.event_id:
                     # Use traffic-aware duration if available
                     duration_seconds = (
                         travel_time.duration_in_traffic_seconds
@@ -255,11 +637,11 @@ class BriefingGenerator:
                         leave_by=leave_by,
                         travel_time=travel_time,
                         from_location=previous_location,
-                        to_location=event.location,
+                        to_location=location,
                     )
 
                     # Update previous location for chained travel calculations
-                    previous_location = event.location
+                    previous_location = location
 
             except Exception as e:
                 logger.debug(f"Failed to get travel time for event {event.title}: {e}")
@@ -273,7 +655,8 @@ class BriefingGenerator:
         """Calculate travel times for tasks with places and specific due times.
 
         Per AT-122: Tasks like 'Dentist at 2pm' with a place should show
-        'Leave by X' departure time calculated from home.
+        'Leave by X' departure time calculated from home. All destinations
+        are resolved together in one batched Distance Matrix lookup.
 
         Args:
             tasks: List of task results from Notion
@@ -284,7 +667,7 @@ class BriefingGenerator:
         if not self.maps or not self.home_address or not self.notion:
             return {}
 
-        travel_info: dict[str, TravelInfo] = {}
+        destinations: list[tuple[str, datetime, str]] = []
 
         for task in tasks:
             task_id = task.get("id")
@@ -317,36 +700,40 @@ class BriefingGenerator:
                     # Try to use the place name as address
                     address = self._extract_title(place)
 
-                if not address:
-                    continue
+                if address:
+                    destinations.append((task_id, due_date, address))
 
-                # Calculate travel time from home to place
-                travel_time = await self.maps.get_travel_time(
-                    origin=self.home_address,
-                    destination=address,
-                    mode="driving",
-                )
+            except Exception as e:
+                title = self._extract_title(task)
+                logger.debug(f"Failed to get place for task '{title}': {e}")
 
-                if travel_time:
-                    # Use traffic-aware duration if available
-                    duration_seconds = (
-                        travel_time.duration_in_traffic_seconds
-                        if travel_time.duration_in_traffic_seconds
-                        else travel_time.duration_seconds
-                    )
-                    # Calculate when to leave (task time - travel time)
-                    leave_by = due_date - timedelta(seconds=duration_seconds)
+        # Calculate travel time from home to every place at once
+        batcher = TravelTimeBatcher(self.maps)
+        for _, _, address in destinations:
+            batcher.add(self.home_address, address)
+        await batcher.resolve()
 
-                    travel_info[task_id] = TravelInfo(
-                        leave_by=leave_by,
-                        travel_time=travel_time,
-                        from_location=self.home_address,
-                        to_location=address,
-                    )
+        travel_info: dict[str, TravelInfo] = {}
+        for task_id, due_date, address in destinations:
+            travel_time = batcher.get(self.home_address, address)
+            if not travel_time:
+                continue
 
-            except Exception as e:
-                title = self._extract_title(task)
-                logger.debug(f"Failed to get travel time for task '{title}': {e}")
+            # Use traffic-aware duration if available
+            duration_seconds = (
+                travel_time.duration_in_traffic_seconds
+                if travel_time.duration_in_traffic_seconds
+                else travel_time.duration_seconds
+            )
+            # Calculate when to leave (task time - travel time)
+            leave_by = due_date - timedelta(seconds=duration_seconds)
+
+            travel_info[task_id] = TravelInfo(
+                leave_by=leave_by,
+                travel_time=travel_time,
+                from_location=self.home_address,
+                to_location=address,
+            )
 
         return travel_info
 
@@ -1052,6 +1439,36 @@ class BriefingGenerator:
             return f"In {delta} days"
 
 
+def get_briefing_snapshot_store() -> BriefingSnapshotStore:
+    """Get the snapshot store at the default location."""
+    return BriefingSnapshotStore()
+
+
+def load_fresh_snapshot(max_age: float = TODAY_SNAPSHOT_MAX_AGE_SECONDS) -> BriefingSnapshot | None:
+    """Load today's briefing snapshot if it is at most max_age seconds old.
+
+    Returns:
+        The snapshot, or None if there is no recent one
+    """
+    snapshot = get_briefing_snapshot_store().load()
+    now = datetime.now(pytz.timezone(settings.user_timezone))
+    if snapshot and snapshot.is_fresh(now, max_age):
+        return snapshot
+    return None
+
+
+async def precompute_briefing() -> BriefingSnapshot | None:
+    """Build and save a briefing snapshot ahead of the scheduled send.
+
+    Returns:
+        The saved snapshot, or None if nothing could be saved
+    """
+    store = get_briefing_snapshot_store()
+    generator = BriefingGenerator(snapshot_store=store)
+    await generator.generate_morning_briefing(use_snapshot=False)
+    return store.load()
+
+
 async def generate_briefing() -> str:
     """Convenience function to generate a morning briefing.
 
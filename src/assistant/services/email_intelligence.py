@@ -1,6 +1,7 @@
 """Email intelligence service using LLM for analysis.
 
-Uses Gemini 3 Flash via OpenRouter to analyze emails for:
+Uses Gemini 3 Flash via OpenRouter (through the shared, hedged LLM client)
+to analyze emails for:
 - Importance scoring (0-100)
 - Urgency classification
 - Action item extraction
@@ -13,10 +14,17 @@ import json
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import Any
 
 from assistant.config import settings
 from assistant.google.gmail import EmailMessage
-from assistant.services.llm_client import OpenRouterProvider
+from assistant.services.llm_cache import (
+    EMAIL_ANALYSIS_CACHE_TTL,
+    LLMCache,
+    get_llm_cache,
+    make_cache_key,
+)
+from assistant.services.llm_client import LLMClient, LLMProvider, LLMResponse, get_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -39,11 +47,7 @@ class EmailAnalysis:
     analyzed_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-ANALYSIS_SYSTEM_PROMPT = """You are an email analysis assistant. Analyze emails to determine \
-their importance and extract actionable information.
-
-Respond ONLY with valid JSON matching this schema:
-{
+ANALYSIS_SCHEMA = """{
   "importance_score": <0-100>,
   "urgency": "<urgent|high|normal|low>",
   "category": "<work|personal|newsletter|notification|transactional|spam|social>",
@@ -70,6 +74,35 @@ Category definitions:
 - spam: Unsolicited marketing, scams
 - social: Social media notifications"""
 
+ANALYSIS_SYSTEM_PROMPT = (
+    "You are an email analysis assistant. Analyze emails to determine "
+    "their importance and extract actionable information.\n\n"
+    "Respond ONLY with valid JSON matching this schema:\n" + ANALYSIS_SCHEMA
+)
+
+# Batch mode: several emails per request, one result object per email.
+# JSON mode requires a top-level object, so the array is wrapped in "results".
+BATCH_ANALYSIS_SYSTEM_PROMPT = (
+    "You are an email analysis assistant. You will receive several emails, each "
+    'starting with a line "=== EMAIL <id> ===". Analyze each email independently '
+    "to determine its importance and extract actionable information.\n\n"
+    'Respond ONLY with valid JSON of the form {"results": [...]} containing exactly '
+    'one object per email. Each object must include "id" (the number from the email\'s '
+    "header line) plus the fields of this schema:\n" + ANALYSIS_SCHEMA
+)
+
+# Default emails per batch request (1 disables batching)
+DEFAULT_BATCH_SIZE = 10
+
+# Input token budget for one batch request (prompt text, excluding system prompt)
+DEFAULT_BATCH_TOKEN_BUDGET = 6000
+
+# Output tokens reserved per email in a batch, and the cap for one request
+BATCH_OUTPUT_TOKENS_PER_EMAIL = 400
+MAX_BATCH_OUTPUT_TOKENS = 8192
+
+VALID_URGENCIES = {"urgent", "high", "normal", "low"}
+
 
 class EmailIntelligenceService:
     """Service for analyzing emails using LLM."""
@@ -78,30 +111,55 @@ class EmailIntelligenceService:
         self,
         model: str = DEFAULT_EMAIL_MODEL,
         importance_threshold: int = 50,
+        cache: LLMCache | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
+        llm_client: LLMClient | None = None,
     ):
         """Initialize the email intelligence service.
 
         Args:
             model: OpenRouter model ID to use for analysis
             importance_threshold: Minimum score to flag as important
+            cache: Optional LLM response cache (re-analysis of the same email is free)
+            batch_size: Maximum emails packed into one batch request
+            batch_token_budget: Maximum estimated prompt tokens per batch request
+            llm_client: LLM client to call (defaults to the shared client)
         """
         self.model = model
         self.importance_threshold = importance_threshold
-        self._provider: OpenRouterProvider | None = None
-
-    def _get_provider(self) -> OpenRouterProvider:
-        """Get or create the OpenRouter provider."""
-        if self._provider is None:
-            if not settings.openrouter_api_key:
-                raise RuntimeError(
-                    "OpenRouter API key not configured. Set OPENROUTER_API_KEY in .env"
-                )
-            self._provider = OpenRouterProvider(
-                api_key=settings.openrouter_api_key,
-                model=self.model,
-                timeout=60.0,  # Longer timeout for email analysis
-            )
-        return self._provider
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+        self.batch_token_budget = batch_token_budget
+        self._llm_client = llm_client
+        # Request counters (batch requests vs. single-email requests)
+        self.batch_requests = 0
+        self.single_requests = 0
+
+    def _get_llm_client(self) -> LLMClient:
+        """Get the LLM client, defaulting to the shared one.
+
+        Raises:
+            RuntimeError: If the client has no OpenRouter provider configured
+        """
+        client = self._llm_client if self._llm_client is not None else get_llm_client()
+        if LLMProvider.OPENROUTER not in client.available_providers:
+            raise RuntimeError("OpenRouter API key not configured. Set OPENROUTER_API_KEY in .env")
+        return client
+
+    def _llm_options(self) -> dict[str, Any]:
+        """Options pinning a request to OpenRouter and the configured model.
+
+        Analyses are cached under OpenRouter and self.model, so the request
+        must not fall back to the client's primary provider (e.g. Gemini).
+        The service caches validated analyses itself, so the client's own
+        cache is bypassed.
+        """
+        return {
+            "provider": LLMProvider.OPENROUTER,
+            "models": {LLMProvider.OPENROUTER: self.model},
+            "cache_ttl": 0,
+        }
 
     def analyze_email(self, email: EmailMessage) -> EmailAnalysis:
         """Analyze an email using LLM.
@@ -112,48 +170,251 @@ class EmailIntelligenceService:
         Returns:
             EmailAnalysis with importance score, urgency, action items, etc.
         """
-        provider = self._get_provider()
-
-        # Build the analysis prompt
-        prompt = self._build_analysis_prompt(email)
+        prompt, request, cache_key = self._build_request(email)
+        response = self.cache.get(cache_key) if self.cache else None
 
         try:
-            response = provider.complete(
-                prompt,
-                system_prompt=ANALYSIS_SYSTEM_PROMPT,
-                temperature=0.1,  # Low temperature for consistent analysis
-                max_tokens=1024,
-                json_mode=True,
-            )
-
-            # Parse the JSON response
-            analysis_data = json.loads(response.text)
-
-            return EmailAnalysis(
-                importance_score=int(analysis_data.get("importance_score", 50)),
-                urgency=analysis_data.get("urgency", "normal"),
-                category=analysis_data.get("category", "work"),
-                needs_response=bool(analysis_data.get("needs_response", False)),
-                action_items=analysis_data.get("action_items", []),
-                people_mentioned=analysis_data.get("people_mentioned", []),
-                suggested_response=analysis_data.get("suggested_response"),
-                summary=analysis_data.get("summary"),
-            )
+            if response is None:
+                response = self._get_llm_client().complete(prompt, **request, **self._llm_options())
+                self.single_requests += 1
+            analysis = self._parse_response(response)
+            if self.cache and not response.cached:
+                self.cache.set(cache_key, response, ttl=EMAIL_ANALYSIS_CACHE_TTL)
+            return analysis
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse LLM response as JSON: %s", e)
+            return self._fallback_analysis()
+        except Exception as e:
+            logger.exception("Email analysis failed: %s", e)
+            raise
+
+    async def analyze_email_async(self, email: EmailMessage) -> EmailAnalysis:
+        """Analyze an email using LLM without blocking the event loop.
+
+        Same behavior as analyze_email, but the request goes through the LLM
+        client's hedged async path, so a slow provider is raced by the next.
+
+        Args:
+            email: EmailMessage from Gmail client
+
+        Returns:
+            EmailAnalysis with importance score, urgency, action items, etc.
+        """
+        prompt, request, cache_key = self._build_request(email)
+        response = await self.cache.aget(cache_key) if self.cache else None
 
+        try:
+            if response is None:
+                response = await self._get_llm_client().acomplete(
+                    prompt, **request, **self._llm_options()
+                )
+                self.single_requests += 1
+            analysis = self._parse_response(response)
+            if self.cache and not response.cached:
+                await self.cache.aset(cache_key, response, ttl=EMAIL_ANALYSIS_CACHE_TTL)
+            return analysis
         except json.JSONDecodeError as e:
             logger.error("Failed to parse LLM response as JSON: %s", e)
-            # Return a default analysis on parse failure
-            return EmailAnalysis(
-                importance_score=50,
-                urgency="normal",
-                category="work",
-                needs_response=False,
-                summary="Analysis failed - could not parse response",
-            )
+            return self._fallback_analysis()
         except Exception as e:
             logger.exception("Email analysis failed: %s", e)
             raise
 
+    def plan_batches(self, emails: list[EmailMessage]) -> list[list[EmailMessage]]:
+        """Split emails into batches bounded by batch_size and the token budget.
+
+        An email larger than the budget on its own still gets a batch of one.
+        """
+        batches: list[list[EmailMessage]] = []
+        current: list[EmailMessage] = []
+        current_tokens = 0
+        for email in emails:
+            tokens = self._estimate_tokens(email)
+            if current and (
+                len(current) >= self.batch_size or current_tokens + tokens > self.batch_token_budget
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(email)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def analyze_emails_batch_async(
+        self, emails: list[EmailMessage]
+    ) -> dict[str, EmailAnalysis]:
+        """Analyze many emails with as few LLM requests as possible.
+
+        Emails with a cached analysis are answered from the cache. The rest
+        are packed into token-budgeted batch requests (see plan_batches).
+        Results are validated per email; any email missing from a batch
+        response, or with an invalid result, falls back to a single-email
+        request.
+
+        Args:
+            emails: EmailMessages from Gmail client
+
+        Returns:
+            Dict of message_id -> EmailAnalysis. Emails whose analysis failed
+            even on the single-email fallback are omitted.
+        """
+        results: dict[str, EmailAnalysis] = {}
+        remaining: list[EmailMessage] = []
+        for email in emails:
+            cached = await self._cached_analysis(email)
+            if cached is not None:
+                results[email.message_id] = cached
+            else:
+                remaining.append(email)
+
+        fallback: list[EmailMessage] = []
+        for batch in self.plan_batches(remaining):
+            if len(batch) == 1:
+                fallback.extend(batch)
+                continue
+            try:
+                analyses = await self._analyze_batch(batch)
+            except Exception as e:
+                logger.warning("Batch analysis of %d emails failed: %s", len(batch), e)
+                analyses = {}
+            for email in batch:
+                if email.message_id in analyses:
+                    results[email.message_id] = analyses[email.message_id]
+                else:
+                    fallback.append(email)
+
+        for email in fallback:
+            try:
+                results[email.message_id] = await self.analyze_email_async(email)
+            except Exception as e:
+                logger.error("Failed to analyze email %s: %s", email.message_id, e)
+
+        return results
+
+    async def _analyze_batch(self, batch: list[EmailMessage]) -> dict[str, EmailAnalysis]:
+        """Send one batch request and return the valid per-email results."""
+        prompt = "\n\n".join(
+            f"=== EMAIL {index} ===\n{self._build_analysis_prompt(email)}"
+            for index, email in enumerate(batch, start=1)
+        )
+        response = await self._get_llm_client().acomplete(
+            prompt,
+            system_prompt=BATCH_ANALYSIS_SYSTEM_PROMPT,
+            temperature=0.1,
+            max_tokens=min(BATCH_OUTPUT_TOKENS_PER_EMAIL * len(batch), MAX_BATCH_OUTPUT_TOKENS),
+            json_mode=True,
+            **self._llm_options(),
+        )
+        self.batch_requests += 1
+
+        data = json.loads(response.text)
+        items = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            raise ValueError("Batch response has no results list")
+
+        analyses: dict[str, EmailAnalysis] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("id", 0))
+            except (TypeError, ValueError):
+                continue
+            if not 1 <= index <= len(batch):
+                continue
+            email = batch[index - 1]
+            analysis = self._validated_analysis(item)
+            if analysis is None:
+                logger.debug("Invalid batch result for email %s", email.message_id)
+                continue
+            analyses[email.message_id] = analysis
+            await self._cache_batch_item(email, item)
+        return analyses
+
+    def _validated_analysis(self, item: dict[str, Any]) -> EmailAnalysis | None:
+        """Build an EmailAnalysis from a batch item, or None if it is invalid."""
+        try:
+            score = int(item["importance_score"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not 0 <= score <= 100 or item.get("urgency") not in VALID_URGENCIES:
+            return None
+        if not isinstance(item.get("category"), str):
+            return None
+        return self._analysis_from_data(item)
+
+    async def _cached_analysis(self, email: EmailMessage) -> EmailAnalysis | None:
+        """Return a cached single-email analysis, if any."""
+        if self.cache is None:
+            return None
+        _, _, cache_key = self._build_request(email)
+        response = await self.cache.aget(cache_key)
+        if response is None:
+            return None
+        try:
+            return self._parse_response(response)
+        except json.JSONDecodeError:
+            return None
+
+    async def _cache_batch_item(self, email: EmailMessage, item: dict[str, Any]) -> None:
+        """Cache a batch result under the single-email key for later reuse."""
+        if self.cache is None:
+            return
+        _, _, cache_key = self._build_request(email)
+        data = {k: v for k, v in item.items() if k != "id"}
+        response = LLMResponse(
+            text=json.dumps(data), provider=LLMProvider.OPENROUTER, model=self.model
+        )
+        await self.cache.aset(cache_key, response, ttl=EMAIL_ANALYSIS_CACHE_TTL)
+
+    def _estimate_tokens(self, email: EmailMessage) -> int:
+        """Rough token estimate (4 chars per token) for an email's prompt."""
+        return max(1, len(self._build_analysis_prompt(email)) // 4)
+
+    def _build_request(self, email: EmailMessage) -> tuple[str, dict[str, Any], str]:
+        """Build the prompt, request options and cache key for an email."""
+        prompt = self._build_analysis_prompt(email)
+        request: dict[str, Any] = {
+            "system_prompt": ANALYSIS_SYSTEM_PROMPT,
+            "temperature": 0.1,  # Low temperature for consistent analysis
+            "max_tokens": 1024,
+            "json_mode": True,
+        }
+        cache_key = make_cache_key(LLMProvider.OPENROUTER, self.model, prompt, **request)
+        return prompt, request, cache_key
+
+    def _parse_response(self, response: LLMResponse) -> EmailAnalysis:
+        """Parse the JSON analysis; callers cache the response once it parses.
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+        """
+        return self._analysis_from_data(json.loads(response.text))
+
+    def _analysis_from_data(self, analysis_data: dict[str, Any]) -> EmailAnalysis:
+        """Build an EmailAnalysis from the LLM's JSON object."""
+        return EmailAnalysis(
+            importance_score=int(analysis_data.get("importance_score", 50)),
+            urgency=analysis_data.get("urgency", "normal"),
+            category=analysis_data.get("category", "work"),
+            needs_response=bool(analysis_data.get("needs_response", False)),
+            action_items=analysis_data.get("action_items", []),
+            people_mentioned=analysis_data.get("people_mentioned", []),
+            suggested_response=analysis_data.get("suggested_response"),
+            summary=analysis_data.get("summary"),
+        )
+
+    def _fallback_analysis(self) -> EmailAnalysis:
+        """Default analysis returned when the LLM response cannot be parsed."""
+        return EmailAnalysis(
+            importance_score=50,
+            urgency="normal",
+            category="work",
+            needs_response=False,
+            summary="Analysis failed - could not parse response",
+        )
+
     def _build_analysis_prompt(self, email: EmailMessage) -> str:
         """Build the prompt for email analysis."""
         # Use snippet as body (EmailMessage only has snippet, not full body)
@@ -180,10 +441,7 @@ class EmailIntelligenceService:
         return analysis.importance_score >= self.importance_threshold
 
     def close(self) -> None:
-        """Close the provider client."""
-        if self._provider:
-            self._provider.close()
-            self._provider = None
+        """Nothing to close: requests go through the shared LLM client."""
 
 
 # Module-level singleton
@@ -200,6 +458,8 @@ def get_email_intelligence_service() -> EmailIntelligenceService:
         _service = EmailIntelligenceService(
             model=model,
             importance_threshold=threshold,
+            cache=get_llm_cache(),
+            batch_size=settings.email_analysis_batch_size,
         )
     return _service
 
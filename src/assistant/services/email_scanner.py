@@ -2,6 +2,21 @@
 
 Periodically scans Gmail inbox, analyzes emails with LLM,
 and stores important ones in Notion for tracking.
+
+Each scan runs as a three-stage async pipeline:
+    fetch (Gmail) -> analyze (LLM worker pool) -> store (Notion)
+Stages are connected by bounded queues so a slow stage applies backpressure
+to the one before it, and LLM calls are capped by a semaphore sized to the
+OpenRouter rate limit. Processed IDs are checkpointed as emails complete, so
+an interrupted scan does not re-analyze finished emails.
+
+Fetching is incremental: after a full listing of unread inbox mail, the
+mailbox historyId is saved and later scans ask Gmail only for messages added
+since that checkpoint (users.history.list). An expired checkpoint (404) or
+an oversized delta falls back to a full resync. The checkpoint only moves
+once every fetched email is either done or has failed MAX_EMAIL_ATTEMPTS
+times; emails that keep failing are recorded as failed and skipped, so one
+bad message cannot pin the checkpoint forever.
 """
 
 from __future__ import annotations
@@ -9,6 +24,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -16,7 +33,7 @@ from typing import Any
 
 from assistant.config import settings
 from assistant.google.auth import google_auth
-from assistant.google.gmail import GmailClient
+from assistant.google.gmail import EmailListResult, EmailMessage, GmailClient
 from assistant.notion.client import NotionClient
 from assistant.notion.schemas import Email
 from assistant.services.email_intelligence import (
@@ -29,9 +46,26 @@ logger = logging.getLogger(__name__)
 # Default scan interval in seconds (5 minutes)
 DEFAULT_SCAN_INTERVAL = 300
 
+# Default number of concurrent LLM analyses per scan
+DEFAULT_ANALYSIS_CONCURRENCY = 4
+
+# Notion writers draining the store stage
+STORE_WORKERS = 2
+
+# Save processed IDs after this many emails complete
+CHECKPOINT_EVERY = 10
+
 # Path for tracking processed emails
 PROCESSED_EMAILS_PATH = Path.home() / ".second-brain" / "email-scanner" / "processed.json"
 
+# Processed-ID retention: IDs older than this are forgotten, and at most
+# PROCESSED_MAX_ENTRIES are kept (oldest dropped first)
+PROCESSED_MAX_AGE_DAYS = 30
+PROCESSED_MAX_ENTRIES = 5000
+
+# Scans an email may fail in before it is recorded as failed and skipped
+MAX_EMAIL_ATTEMPTS = 3
+
 
 @dataclass
 class ScanResult:
@@ -42,7 +76,13 @@ class ScanResult:
     emails_analyzed: int = 0
     emails_stored: int = 0
     emails_skipped: int = 0
+    emails_retrying: int = 0  # failed this scan, retried by the next one
+    emails_failed: int = 0  # failed MAX_EMAIL_ATTEMPTS times, now skipped
     errors: list[str] = field(default_factory=list)
+    # Seconds per stage: wall time for "fetch" and "total", summed worker
+    # busy time for "analyze" and "store"
+    stage_timings: dict[str, float] = field(default_factory=dict)
+    sync_mode: str = "full"  # "full" or "incremental"
 
     @property
     def success(self) -> bool:
@@ -50,6 +90,169 @@ class ScanResult:
         return len(self.errors) == 0
 
 
+class ProcessedEmailStore:
+    """Bounded record of processed message IDs plus the Gmail sync checkpoint.
+
+    Each ID maps to the unix time it was processed. IDs older than
+    max_age_days are evicted, the store never holds more than max_entries,
+    and the file is only rewritten when something changed.
+
+    Failed attempts are counted per ID; once an email has failed
+    max_attempts times it is recorded as processed with a failure marker
+    so it stops holding back the history checkpoint.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = PROCESSED_MAX_ENTRIES,
+        max_age_days: int = PROCESSED_MAX_AGE_DAYS,
+        max_attempts: int = MAX_EMAIL_ATTEMPTS,
+    ):
+        """Initialize an empty store.
+
+        Args:
+            max_entries: Maximum IDs kept (oldest evicted first)
+            max_age_days: Days an ID is remembered
+            max_attempts: Failed attempts before an email is given up on
+        """
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.max_attempts = max(1, max_attempts)
+        self.history_id: str | None = None
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._failures: dict[str, int] = {}
+        self._dirty = False
+
+    def __contains__(self, message_id: object) -> bool:
+        return message_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, message_id: str) -> None:
+        """Record a message as processed."""
+        if message_id in self._entries:
+            return
+        self._entries[message_id] = int(time.time())
+        self._dirty = True
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._failures.pop(evicted, None)
+
+    def record_failure(self, message_id: str) -> bool:
+        """Count a failed attempt at processing a message.
+
+        Returns:
+            True if the message has now failed max_attempts times; it is then
+            recorded as processed (with a failure marker) and skipped from
+            here on
+        """
+        attempts = self._failures.get(message_id, 0) + 1
+        self._failures[message_id] = attempts
+        self._dirty = True
+        if attempts < self.max_attempts:
+            return False
+        self.add(message_id)
+        return True
+
+    def failed_attempts(self, message_id: str) -> int:
+        """Number of failed attempts recorded for a message."""
+        return self._failures.get(message_id, 0)
+
+    def is_failed(self, message_id: str) -> bool:
+        """True if the message was given up on after max_attempts failures."""
+        attempts = self.failed_attempts(message_id)
+        return message_id in self._entries and attempts >= self.max_attempts
+
+    def set_history_id(self, history_id: str) -> None:
+        """Advance the Gmail history checkpoint."""
+        if history_id != self.history_id:
+            self.history_id = history_id
+            self._dirty = True
+
+    def evict(self) -> int:
+        """Drop IDs older than max_age_days.
+
+        Returns:
+            Number of IDs evicted
+        """
+        cutoff = time.time() - self.max_age_days * 86400
+        expired = [mid for mid, processed_at in self._entries.items() if processed_at < cutoff]
+        for mid in expired:
+            del self._entries[mid]
+            self._failures.pop(mid, None)
+        if expired:
+            self._dirty = True
+        if len(self._failures) > self.max_entries:
+            # Keep the most recently failed IDs (dicts preserve insertion order)
+            for mid in list(self._failures)[: len(self._failures) - self.max_entries]:
+                del self._failures[mid]
+            self._dirty = True
+        return len(expired)
+
+    def load(self, path: Path) -> None:
+        """Load the store from disk.
+
+        Also reads the old unbounded {"processed_ids": [...]} format; those
+        IDs are timestamped now and age out normally.
+        """
+        self._entries.clear()
+        self._failures.clear()
+        self.history_id = None
+        self._dirty = False
+        if not path.exists():
+            return
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if "processed" in data:
+                entries = sorted(data["processed"].items(), key=lambda item: item[1])
+                self._entries.update((mid, int(ts)) for mid, ts in entries)
+                self.history_id = data.get("history_id")
+                self._failures.update(
+                    (mid, int(attempts)) for mid, attempts in data.get("failures", {}).items()
+                )
+            else:
+                now = int(time.time())
+                self._entries.update((mid, now) for mid in data.get("processed_ids", []))
+                self._dirty = True
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.evict()
+            logger.debug("Loaded %d processed email IDs", len(self._entries))
+        except Exception as e:
+            logger.warning("Failed to load processed IDs: %s", e)
+            self._entries.clear()
+            self._failures.clear()
+            self.history_id = None
+
+    def save(self, path: Path) -> None:
+        """Write the store to disk if it changed since the last save."""
+        self.evict()
+        if not self._dirty:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "version": 2,
+                        "history_id": self.history_id,
+                        "processed": dict(self._entries),
+                        "failures": self._failures,
+                        "last_updated": datetime.now(UTC).isoformat(),
+                    },
+                    f,
+                    separators=(",", ":"),
+                )
+            tmp_path.replace(path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning("Failed to save processed IDs: %s", e)
+
+
 class EmailScannerService:
     """Background service for scanning and analyzing emails.
 
@@ -64,6 +267,7 @@ class EmailScannerService:
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
         importance_threshold: int = 50,
         max_emails_per_scan: int = 50,
+        analysis_concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY,
     ):
         """Initialize the email scanner.
 
@@ -71,14 +275,18 @@ class EmailScannerService:
             scan_interval: Seconds between scans
             importance_threshold: Minimum score to store in Notion
             max_emails_per_scan: Maximum emails to process per cycle
+            analysis_concurrency: Maximum concurrent LLM analyses
         """
         self._interval = scan_interval
         self._importance_threshold = importance_threshold
         self._max_emails = max_emails_per_scan
+        self._concurrency = max(1, analysis_concurrency)
+        self._analysis_semaphore = asyncio.Semaphore(self._concurrency)
+        self._scan_lock = asyncio.Lock()
         self._running = False
         self._task: asyncio.Task[None] | None = None
         self._last_result: ScanResult | None = None
-        self._processed_ids: set[str] = set()
+        self._processed_ids = ProcessedEmailStore()
         self._gmail_client: GmailClient | None = None
         self._notion_client: NotionClient | None = None
 
@@ -108,33 +316,12 @@ class EmailScannerService:
         return self._interval
 
     def _load_processed_ids(self) -> None:
-        """Load set of already processed email IDs from disk."""
-        if PROCESSED_EMAILS_PATH.exists():
-            try:
-                with open(PROCESSED_EMAILS_PATH) as f:
-                    data = json.load(f)
-                    self._processed_ids = set(data.get("processed_ids", []))
-                    logger.debug("Loaded %d processed email IDs", len(self._processed_ids))
-            except Exception as e:
-                logger.warning("Failed to load processed IDs: %s", e)
-                self._processed_ids = set()
-        else:
-            self._processed_ids = set()
+        """Load processed email IDs and the sync checkpoint from disk."""
+        self._processed_ids.load(PROCESSED_EMAILS_PATH)
 
     def _save_processed_ids(self) -> None:
-        """Save processed email IDs to disk."""
-        try:
-            PROCESSED_EMAILS_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(PROCESSED_EMAILS_PATH, "w") as f:
-                json.dump(
-                    {
-                        "processed_ids": list(self._processed_ids),
-                        "last_updated": datetime.now(UTC).isoformat(),
-                    },
-                    f,
-                )
-        except Exception as e:
-            logger.warning("Failed to save processed IDs: %s", e)
+        """Save processed email IDs and the sync checkpoint to disk."""
+        self._processed_ids.save(PROCESSED_EMAILS_PATH)
 
     async def start(self) -> None:
         """Start the email scanner loop."""
@@ -166,10 +353,7 @@ class EmailScannerService:
         self._gmail_client = GmailClient()
         self._notion_client = NotionClient()
 
-        # Run initial scan
-        await self._scan_emails()
-
-        # Start background loop
+        # Start background loop (runs the initial scan without delaying startup)
         self._task = asyncio.create_task(self._scan_loop())
 
     async def stop(self) -> None:
@@ -203,81 +387,233 @@ class EmailScannerService:
         """Background loop that scans emails periodically."""
         while self._running:
             try:
+                await self._scan_emails()
                 await asyncio.sleep(self._interval)
-                if self._running:
-                    await self._scan_emails()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.exception("Error in email scan loop: %s", e)
+                await asyncio.sleep(self._interval)
 
     async def _scan_emails(self) -> ScanResult:
-        """Perform a single email scan cycle."""
+        """Perform a single email scan cycle.
+
+        Scans never overlap; a manual scan_now() waits for a running one.
+        """
+        async with self._scan_lock:
+            return await self._run_scan()
+
+    async def _run_scan(self) -> ScanResult:
         result = ScanResult(timestamp=datetime.now(UTC))
+        scan_started = time.monotonic()
 
         try:
             if not self._gmail_client:
                 self._gmail_client = GmailClient()
 
-            # Fetch recent unread emails
-            email_result = await self._gmail_client.list_emails(
-                max_results=self._max_emails,
-                label_ids=["INBOX"],
-                query="is:unread",
-            )
-            emails = email_result.emails
+            # Fetch new unread emails
+            fetch_started = time.monotonic()
+            emails, history_id = await self._fetch_emails(self._gmail_client, result)
+            result.stage_timings["fetch"] = time.monotonic() - fetch_started
             result.emails_fetched = len(emails)
-            logger.info("Fetched %d emails for analysis", len(emails))
-
-            # Get intelligence service
-            intelligence = get_email_intelligence_service()
+            logger.info("Fetched %d emails for analysis (%s sync)", len(emails), result.sync_mode)
 
+            pending = []
             for email in emails:
                 # Skip if already processed
                 if email.message_id in self._processed_ids:
                     result.emails_skipped += 1
-                    continue
-
-                try:
-                    # Analyze with LLM
-                    analysis = intelligence.analyze_email(email)
-                    result.emails_analyzed += 1
-
-                    # Store if important enough
-                    if analysis.importance_score >= self._importance_threshold:
-                        await self._store_email(email, analysis)
-                        result.emails_stored += 1
-                        logger.info(
-                            "Stored important email: %s (score=%d)",
-                            email.subject[:50],
-                            analysis.importance_score,
-                        )
+                else:
+                    pending.append(email)
 
-                    # Mark as processed
-                    self._processed_ids.add(email.message_id)
+            if pending:
+                await self._run_pipeline(pending, result)
 
-                except Exception as e:
-                    logger.error("Failed to process email %s: %s", email.message_id, e)
-                    result.errors.append(f"{email.message_id}: {e}")
+            # Only move the checkpoint once every fetched email is done or
+            # given up on, so emails still being retried are delivered again
+            # by the next delta
+            if history_id and result.emails_retrying == 0:
+                self._processed_ids.set_history_id(history_id)
 
-            # Periodically save processed IDs
             self._save_processed_ids()
 
         except Exception as e:
             logger.exception("Email scan failed: %s", e)
             result.errors.append(str(e))
 
+        result.stage_timings["total"] = time.monotonic() - scan_started
         self._last_result = result
         logger.info(
-            "Scan complete: fetched=%d, analyzed=%d, stored=%d, skipped=%d, errors=%d",
+            "Scan complete (%s): fetched=%d, analyzed=%d, stored=%d, skipped=%d, failed=%d, "
+            "errors=%d, timings=%s",
+            result.sync_mode,
             result.emails_fetched,
             result.emails_analyzed,
             result.emails_stored,
             result.emails_skipped,
+            result.emails_failed,
             len(result.errors),
+            {stage: round(seconds, 2) for stage, seconds in result.stage_timings.items()},
         )
         return result
 
+    async def _fetch_emails(
+        self, gmail: GmailClient, result: ScanResult
+    ) -> tuple[list[EmailMessage], str | None]:
+        """Fetch unread inbox emails, incrementally when a checkpoint exists.
+
+        Args:
+            gmail: Gmail client
+            result: Scan result (sync_mode and emails_skipped are updated)
+
+        Returns:
+            Emails to consider and the history checkpoint to save once they
+            are processed (None if no checkpoint should be saved)
+        """
+        if not settings.email_incremental_sync:
+            email_result = await gmail.list_emails(
+                max_results=self._max_emails,
+                label_ids=["INBOX"],
+                query="is:unread",
+            )
+            return email_result.emails, None
+
+        start_history_id = self._processed_ids.history_id
+        if start_history_id:
+            history = await gmail.list_history(start_history_id)
+            if history.success:
+                new_ids = [mid for mid in history.message_ids if mid not in self._processed_ids]
+                result.emails_skipped += len(history.message_ids) - len(new_ids)
+                if len(new_ids) <= self._max_emails:
+                    result.sync_mode = "incremental"
+                    fetched = (
+                        await gmail.get_emails(new_ids)
+                        if new_ids
+                        else EmailListResult(success=True)
+                    )
+                    if fetched.success:
+                        return [e for e in fetched.emails if not e.is_read], history.history_id
+                    return [], None
+                logger.info("%d emails since last sync, running full resync", len(new_ids))
+            elif history.expired:
+                logger.info("Gmail history checkpoint expired, running full resync")
+            else:
+                logger.warning("Incremental sync failed (%s), running full resync", history.error)
+
+        # Take the checkpoint before listing so mail arriving meanwhile is
+        # picked up by the next delta
+        history_id = await gmail.get_history_id()
+        email_result = await gmail.list_emails(
+            max_results=self._max_emails,
+            label_ids=["INBOX"],
+            query="is:unread",
+        )
+        return email_result.emails, history_id if email_result.success else None
+
+    async def _run_pipeline(self, emails: list[EmailMessage], result: ScanResult) -> None:
+        """Analyze and store emails through bounded worker pools.
+
+        Emails are grouped into token-budgeted batches (one LLM request per
+        batch); each analyze worker handles one batch at a time.
+
+        Args:
+            emails: Unprocessed emails to analyze
+            result: Scan result updated in place
+        """
+        intelligence = get_email_intelligence_service()
+        analyze_queue: asyncio.Queue[list[EmailMessage] | None] = asyncio.Queue(
+            maxsize=self._concurrency * 2
+        )
+        store_queue: asyncio.Queue[tuple[EmailMessage, EmailAnalysis] | None] = asyncio.Queue(
+            maxsize=self._concurrency * 2
+        )
+        result.stage_timings.setdefault("analyze", 0.0)
+        result.stage_timings.setdefault("store", 0.0)
+        completed = 0
+
+        def mark_processed(email: EmailMessage) -> None:
+            nonlocal completed
+            self._processed_ids.add(email.message_id)
+            completed += 1
+            if completed % CHECKPOINT_EVERY == 0:
+                self._save_processed_ids()
+
+        def mark_failed(email: EmailMessage, error: object) -> None:
+            result.errors.append(f"{email.message_id}: {error}")
+            if self._processed_ids.record_failure(email.message_id):
+                result.emails_failed += 1
+                logger.warning(
+                    "Giving up on email %s after %d failed attempts",
+                    email.message_id,
+                    self._processed_ids.max_attempts,
+                )
+            else:
+                result.emails_retrying += 1
+
+        async def analyze_worker() -> None:
+            while (batch := await analyze_queue.get()) is not None:
+                started = time.monotonic()
+                try:
+                    async with self._analysis_semaphore:
+                        analyses = await intelligence.analyze_emails_batch_async(batch)
+                except Exception as e:
+                    logger.error("Failed to analyze batch of %d emails: %s", len(batch), e)
+                    for email in batch:
+                        mark_failed(email, e)
+                    continue
+                finally:
+                    result.stage_timings["analyze"] += time.monotonic() - started
+
+                for email in batch:
+                    analysis = analyses.get(email.message_id)
+                    if analysis is None:
+                        mark_failed(email, "analysis failed")
+                        continue
+                    result.emails_analyzed += 1
+
+                    # Store if important enough
+                    if analysis.importance_score >= self._importance_threshold:
+                        await store_queue.put((email, analysis))
+                    else:
+                        mark_processed(email)
+
+        async def store_worker() -> None:
+            while (item := await store_queue.get()) is not None:
+                email, analysis = item
+                started = time.monotonic()
+                try:
+                    await self._store_email(email, analysis)
+                    result.emails_stored += 1
+                    logger.info(
+                        "Stored important email: %s (score=%d)",
+                        email.subject[:50],
+                        analysis.importance_score,
+                    )
+                    mark_processed(email)
+                except Exception as e:
+                    logger.error("Failed to store email %s: %s", email.message_id, e)
+                    mark_failed(email, e)
+                finally:
+                    result.stage_timings["store"] += time.monotonic() - started
+
+        analyzers = [asyncio.create_task(analyze_worker()) for _ in range(self._concurrency)]
+        storers = [asyncio.create_task(store_worker()) for _ in range(STORE_WORKERS)]
+        try:
+            # put() blocks while the queue is full (backpressure from the analyzers)
+            for batch in intelligence.plan_batches(emails):
+                await analyze_queue.put(batch)
+            for _ in analyzers:
+                await analyze_queue.put(None)
+            await asyncio.gather(*analyzers)
+
+            for _ in storers:
+                await store_queue.put(None)
+            await asyncio.gather(*storers)
+        finally:
+            for task in analyzers + storers:
+                task.cancel()
+            await asyncio.gather(*analyzers, *storers, return_exceptions=True)
+
     async def _store_email(
         self,
         gmail_email: Any,  # EmailMessage from gmail.py
@@ -330,6 +666,7 @@ def get_email_scanner_service() -> EmailScannerService:
         _scanner_service = EmailScannerService(
             scan_interval=settings.email_scan_interval,
             importance_threshold=settings.email_importance_threshold,
+            analysis_concurrency=settings.email_analysis_concurrency,
         )
     return _scanner_service
 
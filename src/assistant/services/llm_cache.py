@@ -0,0 +1,343 @@
+"""Content-addressed cache for LLM responses.
+
+Identical prompts reach the LLM providers repeatedly: the same email is
+re-analyzed after a restart, a failed step is retried, a forwarded message
+is parsed twice. Each of those costs a full round-trip and tokens.
+
+Responses are cached under a SHA-256 key over everything that determines the
+output (provider, model, system prompt, prompt, temperature, max_tokens,
+json_mode) in two tiers:
+    - an in-memory LRU of the most recently used entries
+    - an SQLite table under data_dir that survives restarts
+
+Each entry carries its own TTL so call sites choose how long an answer stays
+valid (email analysis for days, intent parsing for hours).
+
+Async callers use aget/aget_any/aset: the memory tier is answered inline and
+SQLite work runs in a worker thread so a slow disk never stalls the event
+loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any
+
+from assistant.config import settings
+from assistant.services.llm_client import LLMProvider, LLMResponse
+from assistant.sqlite_db import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+# Defaults used when settings do not override them
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 3600
+
+# Per-call-site TTLs (seconds)
+EMAIL_ANALYSIS_CACHE_TTL = 7 * 24 * 3600  # an email's content never changes
+INTENT_PARSE_CACHE_TTL = 6 * 3600  # relative dates ("tomorrow") go stale
+
+LLM_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+def get_cache_path() -> Path:
+    """Get path to the on-disk LLM cache."""
+    return Path(settings.data_dir).expanduser() / "cache" / "llm_responses.db"
+
+
+def make_cache_key(
+    provider: LLMProvider | str,
+    model: str,
+    prompt: str,
+    *,
+    system_prompt: str | None = None,
+    temperature: float = 0.2,
+    max_tokens: int = 1024,
+    json_mode: bool = False,
+) -> str:
+    """Build the content-addressed key for a completion request."""
+    material = json.dumps(
+        [
+            provider.value if isinstance(provider, LLMProvider) else provider,
+            model,
+            system_prompt,
+            prompt,
+            round(temperature, 4),
+            max_tokens,
+            json_mode,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _serialize(response: LLMResponse) -> str:
+    data = asdict(response)
+    data["provider"] = response.provider.value
+    return json.dumps(data)
+
+
+def _deserialize(raw: str) -> LLMResponse:
+    data = json.loads(raw)
+    data["provider"] = LLMProvider(data["provider"])
+    return LLMResponse(**data)
+
+
+class LLMCache:
+    """Two-tier (memory LRU + SQLite) cache of LLM responses."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: float = DEFAULT_TTL_SECONDS,
+        persist: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite path for the disk tier (defaults to data_dir/cache/llm_responses.db)
+            max_entries: Maximum entries held in the memory tier
+            default_ttl: TTL in seconds when a call site does not pass one
+            persist: Keep a disk tier; False for a memory-only cache
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._memory: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.path: Path | None = (path or get_cache_path()) if persist else None
+        self._conn: sqlite3.Connection | None = None
+        # Serializes disk access between the event loop and worker threads
+        self._db_lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection | None:
+        """Open the disk tier on first use (None for a memory-only cache)."""
+        if self._conn is None and self.path is not None:
+            conn = open_sqlite(self.path, LLM_CACHE_SCHEMA)
+            if conn is None:
+                self.path = None
+                return None
+            try:
+                conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("LLM cache cleanup failed: %s", e)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response.
+
+        Returns:
+            The cached LLMResponse (with cached=True), or None on miss/expiry
+        """
+        return self.get_any([key])
+
+    def get_any(self, keys: Iterable[str]) -> LLMResponse | None:
+        """Return the first cached response among several keys.
+
+        Used when any of several providers could have answered the same
+        request. Counts as one lookup for the hit/miss counters.
+        """
+        for key in keys:
+            response = self._memory_lookup(key) or self._disk_lookup(key)
+            if response is not None:
+                return replace(response, cached=True)
+        self.misses += 1
+        return None
+
+    async def aget(self, key: str) -> LLMResponse | None:
+        """Async get: the disk tier is read in a worker thread."""
+        return await self.aget_any([key])
+
+    async def aget_any(self, keys: Iterable[str]) -> LLMResponse | None:
+        """Async get_any: the disk tier is read in a worker thread."""
+        keys = list(keys)
+        for key in keys:
+            response = self._memory_lookup(key)
+            if response is not None:
+                return replace(response, cached=True)
+
+        if self.path is not None:
+            found = await asyncio.to_thread(self._disk_read_any, keys)
+            response = self._promote(found)
+            if response is not None:
+                return replace(response, cached=True)
+        self.misses += 1
+        return None
+
+    def _memory_lookup(self, key: str) -> LLMResponse | None:
+        """Check the memory tier for a live entry."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at > time.time():
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return response
+        del self._memory[key]
+        return None
+
+    def _disk_lookup(self, key: str) -> LLMResponse | None:
+        """Check the disk tier for a live entry and promote it to memory."""
+        found = self._disk_read_any([key])
+        return self._promote(found)
+
+    def _promote(self, found: tuple[str, float, LLMResponse] | None) -> LLMResponse | None:
+        if found is None:
+            return None
+        key, expires_at, response = found
+        self._remember(key, expires_at, response)
+        self.disk_hits += 1
+        return response
+
+    def _disk_read_any(self, keys: list[str]) -> tuple[str, float, LLMResponse] | None:
+        """Read the first live entry among keys from the disk tier.
+
+        Only touches SQLite, so it is safe to run in a worker thread.
+        """
+        now = time.time()
+        for key in keys:
+            try:
+                with self._db_lock:
+                    conn = self._db()
+                    if conn is None:
+                        return None
+                    row = conn.execute(
+                        "SELECT expires_at, data FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row and row[0] <= now:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        conn.commit()
+                        continue
+                if row:
+                    return key, row[0], _deserialize(row[1])
+            except (sqlite3.Error, json.JSONDecodeError, TypeError, ValueError) as e:
+                logger.warning("LLM cache read failed for %s: %s", key[:12], e)
+        return None
+
+    def set(self, key: str, response: LLMResponse, ttl: float | None = None) -> None:
+        """Store a response in both tiers.
+
+        Args:
+            key: Key from make_cache_key
+            response: Response to cache
+            ttl: Seconds the entry stays valid (default_ttl when None)
+        """
+        entry = self._remember_new(key, response, ttl)
+        if entry is not None:
+            self._disk_store(key, *entry)
+
+    async def aset(self, key: str, response: LLMResponse, ttl: float | None = None) -> None:
+        """Async set: the disk tier is written in a worker thread."""
+        entry = self._remember_new(key, response, ttl)
+        if entry is not None and self.path is not None:
+            await asyncio.to_thread(self._disk_store, key, *entry)
+
+    def _remember_new(
+        self, key: str, response: LLMResponse, ttl: float | None
+    ) -> tuple[float, LLMResponse] | None:
+        """Put a fresh response in the memory tier; None if it is not cacheable."""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return None
+        expires_at = time.time() + ttl
+        response = replace(response, cached=False)
+        self._remember(key, expires_at, response)
+        return expires_at, response
+
+    def _disk_store(self, key: str, expires_at: float, response: LLMResponse) -> None:
+        try:
+            with self._db_lock:
+                conn = self._db()
+                if conn is not None:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, expires_at, data) VALUES (?, ?, ?)",
+                        (key, expires_at, _serialize(response)),
+                    )
+                    conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("LLM cache write failed for %s: %s", key[:12], e)
+
+    def _remember(self, key: str, expires_at: float, response: LLMResponse) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = (expires_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._memory.clear()
+        with self._db_lock:
+            conn = self._db()
+            if conn is not None:
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters and tier sizes."""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        disk_entries = 0
+        with self._db_lock:
+            conn = self._db()
+            if conn is not None:
+                row = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+                disk_entries = row[0] if row else 0
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": disk_entries,
+            "evictions": self.evictions,
+        }
+
+
+# Module-level singleton
+_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache | None:
+    """Get the shared LLM cache, or None if caching is disabled."""
+    global _cache
+    if not settings.llm_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = LLMCache(
+            max_entries=settings.llm_cache_max_entries,
+            default_ttl=settings.llm_cache_ttl,
+        )
+    return _cache
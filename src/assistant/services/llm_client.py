@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -14,6 +17,8 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     import httpx
 
+    from assistant.services.llm_cache import LLMCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +43,7 @@ class LLMResponse:
     latency_ms: int = 0
     cost_usd: float = 0.0
     raw_response: dict[str, Any] = field(default_factory=dict)
+    cached: bool = False  # served from LLMCache without a provider call
 
     @property
     def total_tokens(self) -> int:
@@ -55,6 +61,7 @@ class LLMUsageStats:
     total_cost_usd: float = 0.0
     total_latency_ms: int = 0
     errors: int = 0
+    hedges_won: int = 0  # responses that arrived as a hedge ahead of the primary
     last_request_at: datetime | None = None
     requests_in_window: list[datetime] = field(default_factory=list)
 
@@ -115,7 +122,12 @@ def estimate_cost(model: str, tokens_input: int, tokens_output: int) -> float:
 
 
 class BaseLLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+    """Abstract base class for LLM providers.
+
+    Subclasses describe the HTTP request and how to read the response; the
+    base class sends it either synchronously (complete) or asynchronously
+    (acomplete).
+    """
 
     provider: LLMProvider
     default_model: str
@@ -126,6 +138,7 @@ class BaseLLMProvider(ABC):
         model: str | None = None,
         client: httpx.Client | None = None,
         timeout: float = 30.0,
+        async_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.api_key = api_key
         self.model = model or self.default_model
@@ -138,13 +151,58 @@ class BaseLLMProvider(ABC):
         else:
             self._client = client
             self._owns_client = False
+        self._async_client = async_client
+        self._owns_async_client = False
 
     def close(self) -> None:
         """Close the HTTP client if we own it."""
         if self._owns_client and self._client is not None:
             self._client.close()
 
+    async def aclose(self) -> None:
+        """Close the async HTTP client if we own it (the shared pool stays open)."""
+        if self._owns_async_client and self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._owns_async_client = False
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the async HTTP client, preferring the application's shared pool."""
+        if self._async_client is not None and not (
+            self._owns_async_client and self._async_client.is_closed
+        ):
+            return self._async_client
+
+        from assistant.http_pool import get_shared_client
+
+        shared = get_shared_client()
+        if shared is not None:
+            return shared
+
+        import httpx
+
+        self._async_client = httpx.AsyncClient(timeout=self.timeout)
+        self._owns_async_client = True
+        return self._async_client
+
+    @abstractmethod
+    def _build_request(
+        self,
+        prompt: str,
+        *,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """Return the endpoint and keyword arguments for the POST request."""
+        ...
+
     @abstractmethod
+    def _parse_response(self, data: dict[str, Any], prompt: str, latency_ms: int) -> LLMResponse:
+        """Convert the provider's JSON response into an LLMResponse."""
+        ...
+
     def complete(
         self,
         prompt: str,
@@ -155,7 +213,49 @@ class BaseLLMProvider(ABC):
         json_mode: bool = False,
     ) -> LLMResponse:
         """Send a completion request and return standardized response."""
-        ...
+        start_time = time.time()
+        endpoint, request_kwargs = self._build_request(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            json_mode=json_mode,
+        )
+
+        response = self._client.post(endpoint, **request_kwargs)
+        response.raise_for_status()
+        data = response.json()
+
+        latency_ms = int((time.time() - start_time) * 1000)
+        return self._parse_response(data, prompt, latency_ms)
+
+    async def acomplete(
+        self,
+        prompt: str,
+        *,
+        system_prompt: str | None = None,
+        temperature: float = 0.2,
+        max_tokens: int = 1024,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """Send a completion request without blocking the event loop."""
+        start_time = time.time()
+        endpoint, request_kwargs = self._build_request(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            json_mode=json_mode,
+        )
+
+        response = await self._get_async_client().post(
+            endpoint, timeout=self.timeout, **request_kwargs
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        latency_ms = int((time.time() - start_time) * 1000)
+        return self._parse_response(data, prompt, latency_ms)
 
     def _estimate_tokens(self, text: str) -> int:
         """Rough token estimate (4 chars per token)."""
@@ -168,17 +268,16 @@ class GeminiProvider(BaseLLMProvider):
     provider = LLMProvider.GEMINI
     default_model = "gemini-2.0-flash"  # 200+ tokens/sec throughput
 
-    def complete(
+    def _build_request(
         self,
         prompt: str,
         *,
-        system_prompt: str | None = None,
-        temperature: float = 0.2,
-        max_tokens: int = 1024,
-        json_mode: bool = False,
-    ) -> LLMResponse:
-        """Send completion to Gemini API."""
-        start_time = time.time()
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build a Gemini generateContent request."""
         endpoint = (
             f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
         )
@@ -198,16 +297,13 @@ class GeminiProvider(BaseLLMProvider):
         if json_mode:
             generation_config["response_mime_type"] = "application/json"
 
-        response = self._client.post(
-            endpoint,
-            params={"key": self.api_key},
-            json={"contents": contents, "generationConfig": generation_config},
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        latency_ms = int((time.time() - start_time) * 1000)
+        return endpoint, {
+            "params": {"key": self.api_key},
+            "json": {"contents": contents, "generationConfig": generation_config},
+        }
 
+    def _parse_response(self, data: dict[str, Any], prompt: str, latency_ms: int) -> LLMResponse:
+        """Parse a Gemini generateContent response."""
         # Extract text
         text = ""
         candidates = data.get("candidates", [])
@@ -241,17 +337,16 @@ class OpenAIProvider(BaseLLMProvider):
     provider = LLMProvider.OPENAI
     default_model = "gpt-4o"  # Best multimodal, strong reasoning
 
-    def complete(
+    def _build_request(
         self,
         prompt: str,
         *,
-        system_prompt: str | None = None,
-        temperature: float = 0.2,
-        max_tokens: int = 1024,
-        json_mode: bool = False,
-    ) -> LLMResponse:
-        """Send completion to OpenAI API."""
-        start_time = time.time()
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build an OpenAI chat completions request."""
         endpoint = "https://api.openai.com/v1/chat/completions"
 
         messages = []
@@ -268,16 +363,13 @@ class OpenAIProvider(BaseLLMProvider):
         if json_mode:
             request_body["response_format"] = {"type": "json_object"}
 
-        response = self._client.post(
-            endpoint,
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json=request_body,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        latency_ms = int((time.time() - start_time) * 1000)
+        return endpoint, {
+            "headers": {"Authorization": f"Bearer {self.api_key}"},
+            "json": request_body,
+        }
 
+    def _parse_response(self, data: dict[str, Any], prompt: str, latency_ms: int) -> LLMResponse:
+        """Parse an OpenAI chat completions response."""
         # Extract text
         text = ""
         choices = data.get("choices", [])
@@ -307,17 +399,16 @@ class AnthropicProvider(BaseLLMProvider):
     provider = LLMProvider.ANTHROPIC
     default_model = "claude-sonnet-4-5-20250514"  # Claude 4.5 Sonnet - latest, fast + capable
 
-    def complete(
+    def _build_request(
         self,
         prompt: str,
         *,
-        system_prompt: str | None = None,
-        temperature: float = 0.2,
-        max_tokens: int = 1024,
-        json_mode: bool = False,
-    ) -> LLMResponse:
-        """Send completion to Anthropic API."""
-        start_time = time.time()
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build an Anthropic messages request."""
         endpoint = "https://api.anthropic.com/v1/messages"
 
         messages = [{"role": "user", "content": prompt}]
@@ -333,20 +424,17 @@ class AnthropicProvider(BaseLLMProvider):
         if system_prompt:
             request_body["system"] = system_prompt
 
-        response = self._client.post(
-            endpoint,
-            headers={
+        return endpoint, {
+            "headers": {
                 "x-api-key": self.api_key,
                 "anthropic-version": "2023-06-01",
                 "content-type": "application/json",
             },
-            json=request_body,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        latency_ms = int((time.time() - start_time) * 1000)
+            "json": request_body,
+        }
 
+    def _parse_response(self, data: dict[str, Any], prompt: str, latency_ms: int) -> LLMResponse:
+        """Parse an Anthropic messages response."""
         # Extract text
         text = ""
         content = data.get("content", [])
@@ -379,17 +467,16 @@ class OpenRouterProvider(BaseLLMProvider):
     provider = LLMProvider.OPENROUTER
     default_model = "openai/gpt-4o"  # High performance via OpenRouter
 
-    def complete(
+    def _build_request(
         self,
         prompt: str,
         *,
-        system_prompt: str | None = None,
-        temperature: float = 0.2,
-        max_tokens: int = 1024,
-        json_mode: bool = False,
-    ) -> LLMResponse:
-        """Send completion to OpenRouter API."""
-        start_time = time.time()
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build an OpenRouter chat completions request."""
         endpoint = "https://openrouter.ai/api/v1/chat/completions"
 
         messages = []
@@ -406,19 +493,16 @@ class OpenRouterProvider(BaseLLMProvider):
         if json_mode:
             request_body["response_format"] = {"type": "json_object"}
 
-        response = self._client.post(
-            endpoint,
-            headers={
+        return endpoint, {
+            "headers": {
                 "Authorization": f"Bearer {self.api_key}",
                 "X-Title": "Second Brain Assistant",
             },
-            json=request_body,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        latency_ms = int((time.time() - start_time) * 1000)
+            "json": request_body,
+        }
 
+    def _parse_response(self, data: dict[str, Any], prompt: str, latency_ms: int) -> LLMResponse:
+        """Parse an OpenRouter (OpenAI-compatible) response."""
         # Extract text (OpenAI-compatible format)
         text = ""
         choices = data.get("choices", [])
@@ -499,6 +583,72 @@ class RateLimiter:
         return max(0.0, wait)
 
 
+# Latency histogram bucket upper bounds (ms), roughly log-spaced
+LATENCY_BUCKETS_MS: tuple[int, ...] = (
+    50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 7500, 10000, 15000, 30000, 60000,
+)  # fmt: skip
+
+# Hedging defaults: delay before racing the next provider until enough samples exist
+DEFAULT_HEDGE_DELAY_SECONDS = 2.0
+DEFAULT_HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+
+
+class LatencyHistogram:
+    """Bucketed latency histogram over a sliding window of recent requests."""
+
+    def __init__(
+        self,
+        buckets_ms: tuple[int, ...] = LATENCY_BUCKETS_MS,
+        window: int = 200,
+    ) -> None:
+        self.buckets_ms = buckets_ms
+        # One extra bucket for samples above the last bound
+        self._counts = [0] * (len(buckets_ms) + 1)
+        self._recent: deque[int] = deque(maxlen=window)
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return len(self._recent)
+
+    def _bucket_index(self, latency_ms: float) -> int:
+        for index, bound in enumerate(self.buckets_ms):
+            if latency_ms <= bound:
+                return index
+        return len(self.buckets_ms)
+
+    def record(self, latency_ms: float) -> None:
+        """Record a request latency, evicting the oldest sample when full."""
+        if len(self._recent) == self._recent.maxlen:
+            self._counts[self._recent[0]] -= 1
+        index = self._bucket_index(latency_ms)
+        self._recent.append(index)
+        self._counts[index] += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Estimate the q-quantile (0-1) as the matching bucket's upper bound.
+
+        Returns:
+            Latency in ms, or None if no samples have been recorded
+        """
+        if not self._recent:
+            return None
+        target = max(1, math.ceil(q * len(self._recent)))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                # The overflow bucket has no upper bound; report the last one
+                return float(self.buckets_ms[min(index, len(self.buckets_ms) - 1)])
+        return float(self.buckets_ms[-1])
+
+    def to_dict(self) -> dict[str, int]:
+        """Bucket counts keyed by upper bound (``"inf"`` for the overflow bucket)."""
+        labels = [str(b) for b in self.buckets_ms] + ["inf"]
+        return dict(zip(labels, self._counts, strict=True))
+
+
 class LLMClient:
     """Provider-agnostic LLM client with fallback and cost tracking."""
 
@@ -515,9 +665,17 @@ class LLMClient:
         rate_limit_tokens_per_minute: int = 100_000,
         daily_budget_usd: float = 100.0,  # High budget for performance-first usage
         timeout: float = 30.0,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY_SECONDS,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        cache: LLMCache | None = None,
     ) -> None:
         self._providers: dict[LLMProvider, BaseLLMProvider] = {}
+        self._model_variants: dict[tuple[LLMProvider, str], BaseLLMProvider] = {}
         self._stats: dict[LLMProvider, LLMUsageStats] = defaultdict(LLMUsageStats)
+        self._latency: dict[LLMProvider, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.cache = cache
         self._rate_limiters: dict[LLMProvider, RateLimiter] = {}
         self.daily_budget_usd = daily_budget_usd
         self._daily_cost_usd = 0.0
@@ -624,6 +782,8 @@ class LLMClient:
         max_tokens: int = 1024,
         json_mode: bool = False,
         provider: LLMProvider | None = None,
+        cache_ttl: float | None = None,
+        models: dict[LLMProvider, str] | None = None,
     ) -> LLMResponse:
         """Send completion request with automatic fallback.
 
@@ -634,6 +794,9 @@ class LLMClient:
             max_tokens: Maximum response tokens
             json_mode: Request JSON-formatted response
             provider: Force specific provider (skips fallback)
+            cache_ttl: Seconds to cache the response (cache default when None,
+                0 bypasses the cache)
+            models: Model to request per provider instead of its default
 
         Returns:
             LLMResponse with text and metadata
@@ -644,53 +807,39 @@ class LLMClient:
         if not self.is_available:
             raise RuntimeError("No LLM providers configured")
 
+        providers_to_try = (
+            [provider] if provider and provider in self._providers else self._get_provider_order()
+        )
+        request: dict[str, Any] = {
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "json_mode": json_mode,
+        }
+
+        cached = self._cache_get(providers_to_try, prompt, request, cache_ttl, models)
+        if cached is not None:
+            return cached
+
         if not self._check_daily_budget():
             raise RuntimeError(
                 f"Daily budget exhausted (${self._daily_cost_usd:.2f}/${self.daily_budget_usd:.2f})"
             )
 
-        providers_to_try = (
-            [provider] if provider and provider in self._providers else self._get_provider_order()
-        )
-
         errors: list[tuple[LLMProvider, Exception]] = []
 
         for p in providers_to_try:
             rate_limiter = self._rate_limiters.get(p)
             if rate_limiter and not rate_limiter.can_request():
-                logger.warning(
-                    "Rate limit reached for %s, wait %.1fs",
-                    p.value,
-                    rate_limiter.wait_time_seconds(),
-                )
+                errors.append((p, self._rate_limited(p, rate_limiter)))
                 continue
 
             try:
-                provider_impl = self._providers[p]
-                response = provider_impl.complete(
-                    prompt,
-                    system_prompt=system_prompt,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    json_mode=json_mode,
-                )
-
-                # Update stats
-                stats = self._stats[p]
-                stats.total_requests += 1
-                stats.total_tokens_input += response.tokens_input
-                stats.total_tokens_output += response.tokens_output
-                stats.total_cost_usd += response.cost_usd
-                stats.total_latency_ms += response.latency_ms
-                stats.last_request_at = datetime.now()
-
-                # Update rate limiter
-                if rate_limiter:
-                    rate_limiter.record_request(response.total_tokens)
-
-                # Track daily cost
-                self._daily_cost_usd += response.cost_usd
+                provider_impl = self._provider_for(p, models)
+                response = provider_impl.complete(prompt, **request)
 
+                self._record_success(p, response)
+                self._cache_set(p, prompt, request, response, cache_ttl, models)
                 return response
 
             except Exception as e:
@@ -702,6 +851,264 @@ class LLMClient:
         error_summary = "; ".join(f"{p.value}: {e}" for p, e in errors)
         raise RuntimeError(f"All LLM providers failed: {error_summary}")
 
+    def _record_success(self, p: LLMProvider, response: LLMResponse) -> None:
+        """Update stats, latency histogram, rate limiter and daily cost."""
+        stats = self._stats[p]
+        stats.total_requests += 1
+        stats.total_tokens_input += response.tokens_input
+        stats.total_tokens_output += response.tokens_output
+        stats.total_cost_usd += response.cost_usd
+        stats.total_latency_ms += response.latency_ms
+        stats.last_request_at = datetime.now()
+        self._latency[p].record(response.latency_ms)
+
+        rate_limiter = self._rate_limiters.get(p)
+        if rate_limiter:
+            rate_limiter.record_request(response.total_tokens)
+
+        self._daily_cost_usd += response.cost_usd
+
+    def _rate_limited(self, p: LLMProvider, rate_limiter: RateLimiter) -> RuntimeError:
+        """Describe a provider skipped by its rate limiter."""
+        wait = rate_limiter.wait_time_seconds()
+        logger.warning("Rate limit reached for %s, wait %.1fs", p.value, wait)
+        return RuntimeError(f"rate limited, retry in {wait:.1f}s")
+
+    def _provider_for(
+        self, p: LLMProvider, models: dict[LLMProvider, str] | None
+    ) -> BaseLLMProvider:
+        """Get the provider, switched to the requested model if one is given."""
+        provider_impl = self._providers[p]
+        model = models.get(p) if models else None
+        if not model or model == provider_impl.model:
+            return provider_impl
+
+        variant = self._model_variants.get((p, model))
+        if variant is None:
+            # Shares the provider's injected HTTP clients; only the model differs
+            variant = copy.copy(provider_impl)
+            variant.model = model
+            variant._owns_client = False
+            if variant._owns_async_client:
+                variant._async_client = None
+                variant._owns_async_client = False
+            self._model_variants[(p, model)] = variant
+        return variant
+
+    def _cache_key(
+        self,
+        p: LLMProvider,
+        prompt: str,
+        request: dict[str, Any],
+        models: dict[LLMProvider, str] | None = None,
+    ) -> str:
+        from assistant.services.llm_cache import make_cache_key
+
+        return make_cache_key(p, self._provider_for(p, models).model, prompt, **request)
+
+    def _cache_get(
+        self,
+        providers: list[LLMProvider],
+        prompt: str,
+        request: dict[str, Any],
+        cache_ttl: float | None,
+        models: dict[LLMProvider, str] | None = None,
+    ) -> LLMResponse | None:
+        """Return a cached response from any of the candidate providers."""
+        if self.cache is None or cache_ttl == 0:
+            return None
+        return self.cache.get_any(self._cache_key(p, prompt, request, models) for p in providers)
+
+    def _cache_set(
+        self,
+        p: LLMProvider,
+        prompt: str,
+        request: dict[str, Any],
+        response: LLMResponse,
+        cache_ttl: float | None,
+        models: dict[LLMProvider, str] | None = None,
+    ) -> None:
+        """Store a fresh provider response in the cache."""
+        if self.cache is None or cache_ttl == 0:
+            return
+        self.cache.set(self._cache_key(p, prompt, request, models), response, ttl=cache_ttl)
+
+    async def _acache_get(
+        self,
+        providers: list[LLMProvider],
+        prompt: str,
+        request: dict[str, Any],
+        cache_ttl: float | None,
+        models: dict[LLMProvider, str] | None = None,
+    ) -> LLMResponse | None:
+        """Async _cache_get; the cache reads its disk tier off the event loop."""
+        if self.cache is None or cache_ttl == 0:
+            return None
+        return await self.cache.aget_any(
+            [self._cache_key(p, prompt, request, models) for p in providers]
+        )
+
+    async def _acache_set(
+        self,
+        p: LLMProvider,
+        prompt: str,
+        request: dict[str, Any],
+        response: LLMResponse,
+        cache_ttl: float | None,
+        models: dict[LLMProvider, str] | None = None,
+    ) -> None:
+        """Async _cache_set; the cache writes its disk tier off the event loop."""
+        if self.cache is None or cache_ttl == 0:
+            return
+        await self.cache.aset(self._cache_key(p, prompt, request, models), response, ttl=cache_ttl)
+
+    def hedge_delay_for(self, provider: LLMProvider) -> float:
+        """Seconds to wait on a provider before hedging with the next one.
+
+        Uses the provider's observed latency percentile once enough samples
+        exist, otherwise the configured default delay.
+        """
+        histogram = self._latency[provider]
+        if histogram.count >= HEDGE_MIN_SAMPLES:
+            estimate = histogram.percentile(self.hedge_percentile)
+            if estimate is not None:
+                return estimate / 1000
+        return self.hedge_delay
+
+    async def acomplete(
+        self,
+        prompt: str,
+        *,
+        system_prompt: str | None = None,
+        temperature: float = 0.2,
+        max_tokens: int = 1024,
+        json_mode: bool = False,
+        provider: LLMProvider | None = None,
+        hedge: bool = True,
+        cache_ttl: float | None = None,
+        models: dict[LLMProvider, str] | None = None,
+    ) -> LLMResponse:
+        """Send completion request asynchronously with hedged fallback.
+
+        The primary provider is called first. If it has not answered within
+        its hedge delay (see hedge_delay_for) the next provider in the
+        fallback order is started as well; the first non-empty response wins
+        and the remaining requests are cancelled. A failed provider
+        immediately hands over to the next one.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system instructions
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum response tokens
+            json_mode: Request JSON-formatted response
+            provider: Force specific provider (skips fallback)
+            hedge: Race the next provider when the current one is slow.
+                When False, providers are tried strictly one after another.
+            cache_ttl: Seconds to cache the response (cache default when None,
+                0 bypasses the cache)
+            models: Model to request per provider instead of its default
+
+        Returns:
+            LLMResponse with text and metadata
+
+        Raises:
+            RuntimeError: If no providers available or all fail
+        """
+        if not self.is_available:
+            raise RuntimeError("No LLM providers configured")
+
+        queue = (
+            [provider] if provider and provider in self._providers else self._get_provider_order()
+        )
+        request: dict[str, Any] = {
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "json_mode": json_mode,
+        }
+
+        cached = await self._acache_get(queue, prompt, request, cache_ttl, models)
+        if cached is not None:
+            return cached
+
+        if not self._check_daily_budget():
+            raise RuntimeError(
+                f"Daily budget exhausted (${self._daily_cost_usd:.2f}/${self.daily_budget_usd:.2f})"
+            )
+        loop = asyncio.get_running_loop()
+        pending: dict[asyncio.Task[LLMResponse], LLMProvider] = {}
+        launched: dict[asyncio.Task[LLMResponse], int] = {}
+        errors: list[tuple[LLMProvider, Exception]] = []
+        hedge_at: float | None = None
+
+        def launch_next() -> None:
+            nonlocal hedge_at
+            while queue:
+                p = queue.pop(0)
+                rate_limiter = self._rate_limiters.get(p)
+                if rate_limiter and not rate_limiter.can_request():
+                    errors.append((p, self._rate_limited(p, rate_limiter)))
+                    continue
+                task = asyncio.create_task(
+                    self._provider_for(p, models).acomplete(prompt, **request)
+                )
+                pending[task] = p
+                launched[task] = len(launched)
+                hedge_at = loop.time() + self.hedge_delay_for(p)
+                return
+
+        try:
+            launch_next()
+            while pending:
+                timeout = None
+                if hedge and queue and hedge_at is not None:
+                    timeout = max(0.0, hedge_at - loop.time())
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    logger.info(
+                        "Hedging slow %s request with %s",
+                        ", ".join(p.value for p in pending.values()),
+                        queue[0].value,
+                    )
+                    launch_next()
+                    continue
+
+                for task in done:
+                    p = pending.pop(task)
+                    try:
+                        response = task.result()
+                        if not response.text:
+                            raise ValueError("Empty response")
+                    except Exception as e:
+                        logger.warning("Provider %s failed: %s", p.value, e)
+                        errors.append((p, e))
+                        self._stats[p].errors += 1
+                        continue
+
+                    if any(launched[t] < launched[task] for t in pending):
+                        # Beat an earlier, still running request
+                        self._stats[p].hedges_won += 1
+                    self._record_success(p, response)
+                    await self._acache_set(p, prompt, request, response, cache_ttl, models)
+                    return response
+
+                if not pending:
+                    launch_next()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # All providers failed
+        error_summary = "; ".join(f"{p.value}: {e}" for p, e in errors)
+        raise RuntimeError(f"All LLM providers failed: {error_summary}")
+
     def get_stats(self, provider: LLMProvider | None = None) -> dict[str, Any]:
         """Get usage statistics.
 
@@ -720,6 +1127,11 @@ class LLMClient:
                 "tokens_output": s.total_tokens_output,
                 "cost_usd": round(s.total_cost_usd, 4),
                 "avg_latency_ms": round(s.avg_latency_ms, 1),
+                "p50_latency_ms": self._latency[provider].percentile(0.5),
+                "p95_latency_ms": self._latency[provider].percentile(0.95),
+                "latency_histogram": self._latency[provider].to_dict(),
+                "hedge_delay_ms": round(self.hedge_delay_for(provider) * 1000),
+                "hedges_won": s.hedges_won,
                 "errors": s.errors,
             }
 
@@ -727,6 +1139,7 @@ class LLMClient:
             "daily_cost_usd": round(self._daily_cost_usd, 4),
             "daily_budget_usd": self.daily_budget_usd,
             "providers": {p.value: self.get_stats(p) for p in self._providers.keys()},
+            "cache": self.cache.get_stats() if self.cache else None,
         }
 
     def close(self) -> None:
@@ -734,6 +1147,11 @@ class LLMClient:
         for provider in self._providers.values():
             provider.close()
 
+    async def aclose(self) -> None:
+        """Close all provider async clients."""
+        for provider in [*self._providers.values(), *self._model_variants.values()]:
+            await provider.aclose()
+
 
 # Module-level singleton
 _client: LLMClient | None = None
@@ -744,12 +1162,16 @@ def get_llm_client() -> LLMClient:
     global _client
     if _client is None:
         from assistant.config import settings
+        from assistant.services.llm_cache import get_llm_cache
 
         _client = LLMClient(
             gemini_api_key=settings.gemini_api_key,
             openai_api_key=settings.openai_api_key,
             anthropic_api_key=getattr(settings, "anthropic_api_key", ""),
             openrouter_api_key=getattr(settings, "openrouter_api_key", ""),
+            hedge_delay=settings.llm_hedge_delay,
+            hedge_percentile=settings.llm_hedge_percentile,
+            cache=get_llm_cache(),
         )
     return _client
 
@@ -775,3 +1197,21 @@ def llm_complete(
         max_tokens=max_tokens,
         json_mode=json_mode,
     )
+
+
+async def llm_acomplete(
+    prompt: str,
+    *,
+    system_prompt: str | None = None,
+    temperature: float = 0.2,
+    max_tokens: int = 1024,
+    json_mode: bool = False,
+) -> LLMResponse:
+    """Convenience function for async, hedged completions."""
+    return await get_llm_client().acomplete(
+        prompt,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        json_mode=json_mode,
+    )
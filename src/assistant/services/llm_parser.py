@@ -2,81 +2,126 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
 from assistant.services.intent import ParsedIntent
 
 if TYPE_CHECKING:
-    import httpx
-
+    from assistant.services.llm_cache import LLMCache
+    from assistant.services.llm_client import LLMClient, LLMResponse
     from assistant.services.parser import Parser
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL = "gemini-2.0-flash"  # 200+ tokens/sec throughput
-DEFAULT_TIMEOUT_SECONDS = 15.0
 
 
 class LLMIntentParser:
-    """Parse intents with an LLM, falling back to the regex parser on failure."""
+    """Parse intents with an LLM, falling back to the regex parser on failure.
+
+    Parsing is fully async so a slow model call never blocks the event loop.
+    Requests go through the shared LLM client, so a slow or rate-limited
+    Gemini call is hedged with the next configured provider. If no answer
+    arrives within ``latency_budget`` seconds the regex result is returned
+    instead.
+    """
 
     def __init__(
         self,
         *,
-        api_key: str | None = None,
         model: str | None = None,
         base_parser: Parser | None = None,
-        client: httpx.Client | None = None,
-        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        llm_client: LLMClient | None = None,
+        latency_budget: float | None = None,
+        cache: LLMCache | None = None,
     ) -> None:
-        resolved_api_key = api_key
-        resolved_model = model
-
-        if resolved_api_key is None:
+        if model is None or latency_budget is None:
             from assistant.config import settings
 
-            resolved_api_key = settings.gemini_api_key
-            if resolved_model is None:
-                resolved_model = settings.gemini_model or DEFAULT_MODEL
-        elif resolved_model is None:
-            resolved_model = DEFAULT_MODEL
+            if model is None:
+                model = settings.gemini_model or DEFAULT_MODEL
+            if latency_budget is None:
+                latency_budget = settings.llm_parser_latency_budget
 
-        self.api_key = resolved_api_key
-        self.model = resolved_model
+        self.model = model
         if base_parser is None:
             from assistant.services.parser import Parser
 
             self.base_parser = Parser()
         else:
             self.base_parser = base_parser
-        if client is None:
-            import httpx
+        self._llm_client = llm_client
+        self.latency_budget = latency_budget
+        self.cache = cache
 
-            self.client = httpx.Client(timeout=timeout)
-        else:
-            self.client = client
-        self.timeout = timeout
+    def _get_llm_client(self) -> LLMClient:
+        """Get the LLM client, defaulting to the shared one."""
+        if self._llm_client is not None:
+            return self._llm_client
+        from assistant.services.llm_client import get_llm_client
 
-    def parse(self, text: str) -> ParsedIntent:
+        return get_llm_client()
+
+    async def parse(self, text: str) -> ParsedIntent:
         base_result = self.base_parser.parse(text)
-        if not self.api_key:
+        if not self._get_llm_client().is_available:
             return base_result
 
         try:
-            payload = self._request_llm(text)
-            llm_data = self._extract_llm_payload(payload)
+            llm_data = await self._cached_llm_data(text)
+            if llm_data is None:
+                response = await asyncio.wait_for(
+                    self._request_llm(text), timeout=self.latency_budget
+                )
+                llm_data = self._extract_llm_payload(response)
+                await self._cache_llm_data(text, llm_data)
             return self._merge_with_base(text, base_result, llm_data)
+        except TimeoutError:
+            logger.info(
+                "LLM parser exceeded %.1fs latency budget; using regex parser",
+                self.latency_budget,
+            )
+            return base_result
         except Exception as exc:
             logger.warning("LLM parser failed; falling back to regex parser: %s", exc)
             return base_result
 
-    def _request_llm(self, text: str) -> dict[str, Any]:
-        endpoint = (
-            f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
+    def _cache_key(self, text: str) -> str:
+        from assistant.services.llm_cache import make_cache_key
+        from assistant.services.llm_client import LLMProvider
+
+        # Keyed per day so relative dates ("tomorrow") are re-parsed after midnight
+        return make_cache_key(
+            LLMProvider.GEMINI,
+            self.model,
+            f"{date.today().isoformat()}\n{text}",
+            json_mode=True,
+        )
+
+    async def _cached_llm_data(self, text: str) -> dict[str, Any] | None:
+        if self.cache is None:
+            return None
+        response = await self.cache.aget(self._cache_key(text))
+        return json.loads(response.text) if response else None
+
+    async def _cache_llm_data(self, text: str, llm_data: dict[str, Any]) -> None:
+        if self.cache is None:
+            return
+        from assistant.services.llm_cache import INTENT_PARSE_CACHE_TTL
+        from assistant.services.llm_client import LLMProvider, LLMResponse
+
+        response = LLMResponse(
+            text=json.dumps(llm_data), provider=LLMProvider.GEMINI, model=self.model
         )
+        await self.cache.aset(self._cache_key(text), response, ttl=INTENT_PARSE_CACHE_TTL)
+
+    async def _request_llm(self, text: str) -> LLMResponse:
+        from assistant.services.llm_client import LLMProvider
+
         prompt = (
             "You are an intent parser for a personal assistant. "
             "Return only JSON with keys: intent_type, title, confidence, due_date, "
@@ -87,42 +132,23 @@ class LLMIntentParser:
             "people and places are lists of strings. "
             f"Input: {text}"
         )
-        response = self.client.post(
-            endpoint,
-            params={"key": self.api_key},
-            json={
-                "contents": [
-                    {
-                        "role": "user",
-                        "parts": [{"text": prompt}],
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": 0.2,
-                    "response_mime_type": "application/json",
-                },
-            },
+        # Parsed results are cached per day above, so skip the client's cache
+        return await self._get_llm_client().acomplete(
+            prompt,
+            temperature=0.2,
+            json_mode=True,
+            models={LLMProvider.GEMINI: self.model},
+            cache_ttl=0,
         )
-        response.raise_for_status()
-        return response.json()
-
-    def _extract_llm_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
-        candidates = payload.get("candidates", [])
-        if not candidates:
-            raise ValueError("No LLM candidates returned")
-
-        content = candidates[0].get("content", {})
-        parts = content.get("parts", [])
-        text = None
-        for part in parts:
-            if "text" in part:
-                text = part["text"]
-                break
-
-        if not text:
+
+    def _extract_llm_payload(self, response: LLMResponse) -> dict[str, Any]:
+        if not response.text:
             raise ValueError("No text payload returned from LLM")
 
-        return json.loads(text)
+        data = json.loads(response.text)
+        if not isinstance(data, dict):
+            raise ValueError("LLM payload is not a JSON object")
+        return data
 
     def _merge_with_base(
         self, text: str, base: ParsedIntent, llm_data: dict[str, Any]
@@ -181,5 +207,7 @@ _parser: LLMIntentParser | None = None
 def get_intent_parser() -> LLMIntentParser:
     global _parser
     if _parser is None:
-        _parser = LLMIntentParser()
+        from assistant.services.llm_cache import get_llm_cache
+
+        _parser = LLMIntentParser(cache=get_llm_cache())
     return _parser
@@ -7,23 +7,88 @@ Implements PRD Section 4.8 (Failure Handling):
 
 AT-114: User receives immediate response when Notion is down
 AT-115: Queued items sync to Notion in order on recovery
+
+The queue file is an append-only log shared by every writer (the typed
+queue_* helpers, NotionClient when its retries are exhausted, and the CLI
+sync command). Each change - enqueue, claim, ack, retry, drop - is appended
+as one JSON line and fsynced under a file lock; the queue state is the
+replay of the log. Drains claim entries atomically, replay them with bounded
+concurrency (serially per Notion entity) and then compact the log with an
+atomic rename. Idempotency keys of processed actions are kept in the log, so
+deduplication survives restarts.
+
+Actions can reference pages created by other queued actions: pending_ref(key)
+stands in for the page ID of the action with that idempotency key. Replay
+runs such an action only after its dependency has synced, substituting the
+real page ID.
+
+A replayed write that fails again stays on its own entry (retry, then
+dead-letter); while a drain runs, NotionClient does not queue the failed
+request a second time.
 """
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel, TypeAdapter
+
 from assistant.config import settings
+from assistant.notion.throttle import CircuitOpenError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Actions replayed at once during a drain (actions on one entity stay serial)
+REPLAY_CONCURRENCY = 4
+
+# Seconds a drain's claim on entries is honored (covers drains that crashed)
+CLAIM_TTL = 600
+
+# Processed idempotency keys retained for deduplication when compacting
+MAX_PROCESSED_KEYS = 10_000
+
+# Prefix marking a reference to the page created by another queued action
+PENDING_REF_PREFIX = "queued:"
+
+# Set while a drain replays actions (in the drain's task and its children only)
+_replaying: ContextVar[bool] = ContextVar("offline_queue_replaying", default=False)
+
+
+def is_replaying() -> bool:
+    """Check if the current task is replaying queued actions."""
+    return _replaying.get()
+
 
 class QueuedActionType(str, Enum):
-    """Types of actions that can be queued."""
+    """Types of actions that can be queued.
+
+    Data expected by each type:
+    - CREATE_*: fields of the matching schema model (InboxItem, Task, Person,
+      Place, Project, LogEntry), as from model_dump(mode="json")
+    - UPDATE_TASK / UPDATE_PERSON: {"page_id": ..., "values": {field: value}}
+    - SOFT_DELETE: {"page_id": ...}
+    - NOTION_REQUEST: {"method": ..., "path": ..., "body": ...}
+
+    Any page ID may be a pending_ref() to a page created by another action.
+    """
 
     CREATE_INBOX = "create_inbox"
     CREATE_TASK = "create_task"
@@ -34,6 +99,7 @@ class QueuedActionType(str, Enum):
     UPDATE_TASK = "update_task"
     UPDATE_PERSON = "update_person"
     SOFT_DELETE = "soft_delete"
+    NOTION_REQUEST = "notion_request"  # raw API write recorded by NotionClient
 
 
 @dataclass
@@ -71,6 +137,104 @@ class QueuedAction:
             retry_count=d.get("retry_count", 0),
         )
 
+    @property
+    def entity_key(self) -> str:
+        """Key of the Notion entity this action touches.
+
+        Actions sharing an entity key are replayed in queue order; actions on
+        different entities may be replayed concurrently.
+        """
+        if self.action_type == QueuedActionType.NOTION_REQUEST:
+            parts = str(self.data.get("path", "")).strip("/").split("/")
+            if len(parts) >= 2 and parts[0] in ("pages", "blocks"):
+                return parts[1]
+        page_id = self.data.get("page_id")
+        if not page_id:
+            return self.idempotency_key
+        # Updates to a page created offline queue behind its creation
+        return str(page_id).removeprefix(PENDING_REF_PREFIX)
+
+    @property
+    def references(self) -> list[str]:
+        """Idempotency keys of queued actions whose page IDs this action needs."""
+        return sorted(set(_find_refs(self.data)))
+
+
+def pending_ref(idempotency_key: str) -> str:
+    """Reference the page a queued action will create, for use in other actions."""
+    return f"{PENDING_REF_PREFIX}{idempotency_key}"
+
+
+def _find_refs(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if value.startswith(PENDING_REF_PREFIX):
+            yield value.removeprefix(PENDING_REF_PREFIX)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _find_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _find_refs(item)
+
+
+def _resolve_refs(value: Any, page_ids: dict[str, str | None]) -> Any:
+    """Replace pending references with the page IDs they were synced to."""
+    if isinstance(value, str) and value.startswith(PENDING_REF_PREFIX):
+        page_id = page_ids.get(value.removeprefix(PENDING_REF_PREFIX))
+        if not page_id:
+            raise ValueError(f"Unresolved queued reference: {value}")
+        return page_id
+    if isinstance(value, dict):
+        return {key: _resolve_refs(item, page_ids) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(item, page_ids) for item in value]
+    return value
+
+
+def _coerce_fields(model: type[BaseModel], values: dict[str, Any]) -> dict[str, Any]:
+    """Convert JSON-decoded field values to the types of the model's fields."""
+    return {
+        key: TypeAdapter(model.model_fields[key].annotation).validate_python(value)
+        if key in model.model_fields
+        else value
+        for key, value in values.items()
+    }
+
+
+def notion_request_action(
+    method: str,
+    path: str,
+    json_data: dict[str, Any] | None,
+    timestamp: datetime | None = None,
+) -> QueuedAction:
+    """Build a queued action that replays a raw Notion API request.
+
+    Args:
+        method: HTTP method
+        path: API path (e.g. "/pages")
+        json_data: Request body
+        timestamp: When the request was first attempted (defaults to now)
+
+    Returns:
+        QueuedAction keyed by a hash of the request
+    """
+    content = json.dumps([method, path, json_data], sort_keys=True, default=str)
+    return QueuedAction(
+        action_type=QueuedActionType.NOTION_REQUEST,
+        timestamp=timestamp or datetime.now(UTC),
+        idempotency_key=f"notion:{hashlib.sha256(content.encode()).hexdigest()[:16]}",
+        data={"method": method, "path": path, "body": json_data},
+    )
+
+
+@dataclass
+class _LogState:
+    """Queue state reconstructed by replaying the log."""
+
+    entries: dict[str, QueuedAction] = field(default_factory=dict)  # pending, in order
+    claims: dict[str, tuple[str, float]] = field(default_factory=dict)  # id -> (owner, until)
+    processed_keys: dict[str, str | None] = field(default_factory=dict)  # key -> page ID
+
 
 @dataclass
 class QueueProcessResult:
@@ -80,6 +244,7 @@ class QueueProcessResult:
     successful: int = 0
     failed: int = 0
     deduplicated: int = 0
+    deferred: int = 0  # left queued behind a failed action on the same entity
     errors: list[str] = field(default_factory=list)
 
     @property
@@ -95,29 +260,168 @@ class OfflineQueue:
     - After retries fail, queues to local file
     - User gets immediate feedback: "Saved locally, will sync when Notion is back"
     - On recovery, processes queue in order with deduplication
+
+    Actions on the same entity are replayed in queue order; independent
+    actions are replayed concurrently. An action that keeps failing is moved
+    to a dead-letter file after MAX_RETRIES drains instead of being discarded.
     """
 
     DEFAULT_QUEUE_PATH = Path.home() / ".second-brain" / "queue" / "pending.jsonl"
     MAX_RETRIES = 3
 
-    def __init__(self, queue_path: Path | None = None):
+    def __init__(self, queue_path: Path | None = None, concurrency: int = REPLAY_CONCURRENCY):
         self.queue_path = queue_path or self.DEFAULT_QUEUE_PATH
-        self._processed_keys: set[str] = set()  # In-memory dedupe cache
+        self.failed_path = self.queue_path.with_name(f"{self.queue_path.stem}.failed.jsonl")
+        self._lock_path = self.queue_path.with_name(f"{self.queue_path.name}.lock")
+        self._concurrency = max(1, concurrency)
+        self._thread_lock = threading.Lock()
 
     def _ensure_queue_dir(self) -> None:
         """Ensure queue directory exists."""
         self.queue_path.parent.mkdir(parents=True, exist_ok=True)
 
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the queue lock (shared with other processes using this file)."""
+        self._ensure_queue_dir()
+        with self._thread_lock, open(self._lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    def _append(self, *records: dict[str, Any]) -> None:
+        """Durably append records to the log. Caller must hold the lock."""
+        data = "".join(json.dumps(record) + "\n" for record in records).encode()
+        with open(self.queue_path, "a+b") as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Terminate a line torn by a crash mid-write
+                    data = b"\n" + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _record(self, *records: dict[str, Any]) -> None:
+        """Append records to the log under the lock."""
+        with self._locked():
+            self._append(*records)
+
+    def _rewrite(self, records: list[dict[str, Any]]) -> None:
+        """Atomically replace the log with records. Caller must hold the lock."""
+        if not records:
+            self.queue_path.unlink(missing_ok=True)
+            return
+
+        tmp_path = self.queue_path.with_name(f"{self.queue_path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.queue_path)
+
+        # Make the rename itself durable
+        with contextlib.suppress(OSError):
+            dir_fd = os.open(self.queue_path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def _read_log(self) -> _LogState:
+        """Replay the log into the current queue state."""
+        state = _LogState()
+        if not self.queue_path.exists():
+            return state
+
+        with open(self.queue_path) as f:
+            for line_number, line in enumerate(f):
+                line = line.strip()
+                if line:
+                    try:
+                        self._apply_record(state, json.loads(line), line_number)
+                    except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+                        logger.warning(f"Skipping malformed queue entry: {e}")
+
+        return state
+
+    def _apply_record(self, state: _LogState, record: dict[str, Any], line_number: int) -> None:
+        """Apply one log record to the state."""
+        op = record.get("op")
+
+        if op is None:
+            # Entries written before the log had IDs are identified by position
+            entry_id = record.get("id") or f"line-{line_number}"
+            if "action_type" in record:
+                action = QueuedAction.from_dict(record)
+            else:
+                # Raw request in the format NotionClient used to write
+                action = notion_request_action(
+                    record["method"],
+                    record["path"],
+                    record.get("data"),
+                    datetime.fromisoformat(record["timestamp"]),
+                )
+            state.entries[entry_id] = action
+        elif op == "claim":
+            for entry_id in record["ids"]:
+                state.claims[entry_id] = (record["owner"], record["until"])
+        elif op == "release":
+            for entry_id in record["ids"]:
+                state.claims.pop(entry_id, None)
+        elif op == "retry":
+            state.claims.pop(record["id"], None)
+            if record["id"] in state.entries:
+                state.entries[record["id"]].retry_count = record["retry_count"]
+        elif op in ("ack", "drop"):
+            state.claims.pop(record["id"], None)
+            state.entries.pop(record["id"], None)
+            if op == "ack":
+                self._mark_processed(state, record["key"], record.get("result"))
+        elif op == "done":
+            self._mark_processed(state, record["key"], record.get("result"))
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    @staticmethod
+    def _mark_processed(state: _LogState, key: str, page_id: str | None) -> None:
+        # Re-insert so the dict stays ordered oldest first
+        state.processed_keys.pop(key, None)
+        state.processed_keys[key] = page_id
+
+    def _snapshot(self, state: _LogState) -> list[dict[str, Any]]:
+        """Build the minimal records that reproduce the state."""
+        processed = list(state.processed_keys.items())[-MAX_PROCESSED_KEYS:]
+        records: list[dict[str, Any]] = [
+            {"op": "done", "key": key, "result": page_id} for key, page_id in processed
+        ]
+        records.extend(
+            {"id": entry_id, **action.to_dict()} for entry_id, action in state.entries.items()
+        )
+
+        now = time.time()
+        live_claims: dict[tuple[str, float], list[str]] = {}
+        for entry_id, claim in state.claims.items():
+            if claim[1] > now and entry_id in state.entries:
+                live_claims.setdefault(claim, []).append(entry_id)
+        records.extend(
+            {"op": "claim", "ids": ids, "owner": owner, "until": until}
+            for (owner, until), ids in live_claims.items()
+        )
+        return records
+
+    def compact(self) -> None:
+        """Rewrite the log with only pending entries, live claims and recent processed keys."""
+        with self._locked():
+            self._rewrite(self._snapshot(self._read_log()))
+
     def enqueue(self, action: QueuedAction) -> None:
         """Add an action to the offline queue.
 
         Args:
             action: Action to queue
         """
-        self._ensure_queue_dir()
-
-        with open(self.queue_path, "a") as f:
-            f.write(json.dumps(action.to_dict()) + "\n")
+        self._record({"id": uuid.uuid4().hex, **action.to_dict()})
 
         logger.info(f"Queued {action.action_type.value} action: {action.idempotency_key}")
 
@@ -220,11 +524,7 @@ class OfflineQueue:
         Returns:
             Number of queued actions
         """
-        if not self.queue_path.exists():
-            return 0
-
-        with open(self.queue_path) as f:
-            return sum(1 for _ in f)
+        return len(self._read_log().entries)
 
     def read_queue(self) -> list[QueuedAction]:
         """Read all actions from the queue.
@@ -232,42 +532,71 @@ class OfflineQueue:
         Returns:
             List of queued actions in order
         """
-        if not self.queue_path.exists():
-            return []
-
-        actions = []
-        with open(self.queue_path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        actions.append(QueuedAction.from_dict(json.loads(line)))
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        logger.warning(f"Skipping malformed queue entry: {e}")
-
-        return actions
+        return list(self._read_log().entries.values())
 
     def clear_queue(self) -> None:
-        """Clear all items from the queue."""
-        if self.queue_path.exists():
-            self.queue_path.unlink()
-        self._processed_keys.clear()
+        """Clear all items (and remembered idempotency keys) from the queue."""
+        with self._locked():
+            self.queue_path.unlink(missing_ok=True)
 
     def write_queue(self, actions: list[QueuedAction]) -> None:
-        """Write actions back to queue (for partial failure handling).
+        """Replace the queued actions (for partial failure handling).
+
+        Processed idempotency keys are kept, so deduplication still applies.
 
         Args:
             actions: Actions to write
         """
-        if not actions:
-            self.clear_queue()
-            return
+        with self._locked():
+            state = self._read_log()
+            state.entries = {uuid.uuid4().hex: action for action in actions}
+            state.claims.clear()
+            self._rewrite(self._snapshot(state))
 
-        self._ensure_queue_dir()
+    def _claim(self, owner: str) -> tuple[list[tuple[str, QueuedAction]], _LogState]:
+        """Atomically claim every pending entry not held by another drain.
 
-        with open(self.queue_path, "w") as f:
-            for action in actions:
-                f.write(json.dumps(action.to_dict()) + "\n")
+        Entities with a live claim are skipped entirely, so another drain can
+        never replay an action ahead of an earlier one on the same entity.
+
+        Returns:
+            Claimed (entry ID, action) pairs in queue order, and the queue
+            state they were claimed from
+        """
+        with self._locked():
+            state = self._read_log()
+            now = time.time()
+            held = {
+                entry_id
+                for entry_id, (_, until) in state.claims.items()
+                if until > now and entry_id in state.entries
+            }
+            busy = {state.entries[entry_id].entity_key for entry_id in held}
+            claimed = [
+                (entry_id, action)
+                for entry_id, action in state.entries.items()
+                if entry_id not in held and action.entity_key not in busy
+            ]
+            if claimed:
+                self._append(
+                    {
+                        "op": "claim",
+                        "ids": [entry_id for entry_id, _ in claimed],
+                        "owner": owner,
+                        "until": now + CLAIM_TTL,
+                    }
+                )
+            return claimed, state
+
+    def _dead_letter(self, entry_id: str, action: QueuedAction, error: str) -> None:
+        """Move an action that exhausted its retries to the dead-letter file."""
+        with self._locked():
+            with open(self.failed_path, "a") as f:
+                f.write(json.dumps({**action.to_dict(), "error": error}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._append({"op": "drop", "id": entry_id, "error": error})
+        logger.error(f"Gave up on {action.idempotency_key}, moved to {self.failed_path}")
 
     async def process_queue(
         self,
@@ -276,8 +605,10 @@ class OfflineQueue:
         """Process all queued actions.
 
         Per PRD AT-115:
-        - All items synced to Notion in order
-        - Deduplicated by idempotency_key
+        - All items synced to Notion in order (per entity; independent
+          actions are replayed concurrently)
+        - Deduplicated by idempotency_key, including keys processed by
+          earlier drains
         - Queue cleared after successful processing
 
         Args:
@@ -288,46 +619,35 @@ class OfflineQueue:
         """
         from assistant.notion import NotionClient
 
-        actions = self.read_queue()
-        if not actions:
+        pending = self.get_pending_count()
+        if not pending:
             return QueueProcessResult()
 
-        result = QueueProcessResult(total_processed=len(actions))
-
         # Use provided client or create new one
         client = notion_client or (NotionClient() if settings.has_notion else None)
         if not client:
-            result.failed = len(actions)
+            result = QueueProcessResult(total_processed=pending, failed=pending)
             result.errors.append("Notion not configured")
             return result
 
-        failed_actions: list[QueuedAction] = []
+        claimed, state = self._claim(owner=uuid.uuid4().hex)
+        result = QueueProcessResult(total_processed=len(claimed))
 
+        replay = _Replay(
+            queue=self,
+            client=client,
+            page_ids=dict(state.processed_keys),
+            pending_keys={action.idempotency_key for action in state.entries.values()},
+            semaphore=asyncio.Semaphore(self._concurrency),
+            result=result,
+        )
+        # Writes that fail during replay are retried through their own entry
+        replaying = _replaying.set(True)
         try:
-            for action in actions:
-                # Check for duplicates
-                if action.idempotency_key in self._processed_keys:
-                    result.deduplicated += 1
-                    logger.info(f"Deduplicated: {action.idempotency_key}")
-                    continue
-
-                try:
-                    await self._process_action(client, action)
-                    self._processed_keys.add(action.idempotency_key)
-                    result.successful += 1
-                    logger.info(f"Synced {action.action_type.value}: {action.idempotency_key}")
-
-                except Exception as e:
-                    action.retry_count += 1
-                    if action.retry_count < self.MAX_RETRIES:
-                        failed_actions.append(action)
-                    result.failed += 1
-                    result.errors.append(f"{action.idempotency_key}: {str(e)}")
-                    logger.error(f"Failed to sync {action.idempotency_key}: {e}")
-
+            await replay.run(claimed)
         finally:
-            # Write back any failed actions for retry
-            self.write_queue(failed_actions)
+            _replaying.reset(replaying)
+            self.compact()
 
             # Close client if we created it
             if notion_client is None and client:
@@ -335,6 +655,71 @@ class OfflineQueue:
 
         return result
 
+    async def _replay_action(
+        self, replay: "_Replay", entry_id: str, action: QueuedAction
+    ) -> bool | None:
+        """Replay one claimed action whose prerequisites have synced.
+
+        Returns:
+            True if the action is done (synced or deduplicated), False if it
+            failed, None if it was not attempted because a page it references
+            is still queued or the Notion circuit is open
+        """
+        result = replay.result
+
+        # Check for duplicates
+        if action.idempotency_key in replay.page_ids:
+            self._record(
+                {
+                    "op": "ack",
+                    "id": entry_id,
+                    "key": action.idempotency_key,
+                    "result": replay.page_ids[action.idempotency_key],
+                }
+            )
+            result.deduplicated += 1
+            logger.info(f"Deduplicated: {action.idempotency_key}")
+            return True
+
+        # Wait for referenced pages that are still queued (e.g. held by another drain)
+        unresolved = [key for key in action.references if key not in replay.page_ids]
+        if any(key in replay.pending_keys for key in unresolved):
+            return None
+
+        try:
+            resolved = replace(action, data=_resolve_refs(action.data, replay.page_ids))
+            async with replay.semaphore:
+                page_id = await self._process_action(replay.client, resolved)
+        except CircuitOpenError:
+            # Notion is down again; not the action's fault, so no retry is spent
+            return None
+        except Exception as e:
+            action.retry_count += 1
+            result.failed += 1
+            result.errors.append(f"{action.idempotency_key}: {str(e)}")
+            logger.error(f"Failed to sync {action.idempotency_key}: {e}")
+
+            if action.retry_count < self.MAX_RETRIES:
+                self._record(
+                    {
+                        "op": "retry",
+                        "id": entry_id,
+                        "retry_count": action.retry_count,
+                        "error": str(e),
+                    }
+                )
+            else:
+                self._dead_letter(entry_id, action, str(e))
+            return False
+
+        replay.page_ids[action.idempotency_key] = page_id or None
+        self._record(
+            {"op": "ack", "id": entry_id, "key": action.idempotency_key, "result": page_id or None}
+        )
+        result.successful += 1
+        logger.info(f"Synced {action.action_type.value}: {action.idempotency_key}")
+        return True
+
     async def _process_action(
         self,
         client: Any,
@@ -352,6 +737,10 @@ class OfflineQueue:
         from assistant.notion.schemas import (
             InboxItem,
             InboxSource,
+            LogEntry,
+            Person,
+            Place,
+            Project,
             Task,
             TaskPriority,
             TaskSource,
@@ -359,7 +748,19 @@ class OfflineQueue:
 
         data = action.data
 
-        if action.action_type == QueuedActionType.CREATE_INBOX:
+        if action.action_type == QueuedActionType.NOTION_REQUEST:
+            response: dict[str, Any] = await client._request(
+                data["method"], data["path"], data.get("body"), queue_offline=False
+            )
+            page_id = str(response.get("id", ""))
+            if data["method"] == "POST" and data["path"] == "/pages":
+                # Inbox items and log entries created by a replay must be deduplicated too
+                index = getattr(client, "_idempotency", None)
+                if index is not None:
+                    index.record_created_page(data.get("body"), page_id)
+            return page_id
+
+        elif action.action_type == QueuedActionType.CREATE_INBOX:
             # Parse source enum
             source_str = data.get("source", "telegram_text")
             try:
@@ -407,14 +808,119 @@ class OfflineQueue:
                 confidence=data.get("confidence", 80),
                 priority=priority,
                 created_by=data.get("created_by", "ai"),
+                people_ids=data.get("people_ids", []),
+                place_ids=data.get("place_ids", []),
+                project_id=data.get("project_id"),
             )
             task_id: str = await client.create_task(task)
             return task_id
 
+        elif action.action_type == QueuedActionType.CREATE_PERSON:
+            person_id: str = await client.create_person(Person.model_validate(data))
+            return person_id
+
+        elif action.action_type == QueuedActionType.CREATE_PLACE:
+            place_id: str = await client.create_place(Place.model_validate(data))
+            return place_id
+
+        elif action.action_type == QueuedActionType.CREATE_PROJECT:
+            project_id: str = await client.create_project(Project.model_validate(data))
+            return project_id
+
+        elif action.action_type == QueuedActionType.CREATE_LOG_ENTRY:
+            log_id: str = await client.create_log_entry(LogEntry.model_validate(data))
+            return log_id
+
+        elif action.action_type == QueuedActionType.UPDATE_TASK:
+            values = _coerce_fields(Task, dict(data.get("values", {})))
+            status = values.pop("status", None)
+            if status is not None:
+                # Also stamps completed_at when the task is done
+                await client.update_task_status(data["page_id"], getattr(status, "value", status))
+            if values:
+                await client.update_page(data["page_id"], "tasks", values)
+            return str(data["page_id"])
+
+        elif action.action_type == QueuedActionType.UPDATE_PERSON:
+            values = _coerce_fields(Person, data.get("values", {}))
+            await client.update_page(data["page_id"], "people", values)
+            return str(data["page_id"])
+
+        elif action.action_type == QueuedActionType.SOFT_DELETE:
+            await client.soft_delete(data["page_id"])
+            return str(data["page_id"])
+
         else:
             raise NotImplementedError(f"Action type {action.action_type.value} not implemented")
 
 
+class _Replay:
+    """One drain's replay of claimed actions as a dependency graph.
+
+    Each action waits for the previous action on its entity and for the
+    queued actions that create pages it references; everything else runs
+    concurrently, bounded by the semaphore. An action whose prerequisite did
+    not sync is left queued for the next drain.
+    """
+
+    def __init__(
+        self,
+        queue: OfflineQueue,
+        client: Any,
+        page_ids: dict[str, str | None],
+        pending_keys: set[str],
+        semaphore: asyncio.Semaphore,
+        result: QueueProcessResult,
+    ):
+        self.queue = queue
+        self.client = client
+        self.page_ids = page_ids  # idempotency key -> synced page ID
+        self.pending_keys = pending_keys
+        self.semaphore = semaphore
+        self.result = result
+
+    async def run(self, claimed: list[tuple[str, QueuedAction]]) -> None:
+        loop = asyncio.get_running_loop()
+        done: dict[str, asyncio.Future[bool]] = {}
+        last_on_entity: dict[str, str] = {}
+        creators: dict[str, str] = {}
+        entries = []
+
+        for entry_id, action in claimed:
+            prerequisites = [creators[key] for key in action.references if key in creators]
+            if action.entity_key in last_on_entity:
+                prerequisites.append(last_on_entity[action.entity_key])
+            last_on_entity[action.entity_key] = entry_id
+            creators.setdefault(action.idempotency_key, entry_id)
+
+            done[entry_id] = loop.create_future()
+            entries.append(self._run_entry(entry_id, action, prerequisites, done))
+
+        await asyncio.gather(*entries)
+
+    async def _run_entry(
+        self,
+        entry_id: str,
+        action: QueuedAction,
+        prerequisites: list[str],
+        done: dict[str, asyncio.Future[bool]],
+    ) -> None:
+        outcome: bool | None = None
+        try:
+            for prerequisite in prerequisites:
+                if not await done[prerequisite]:
+                    break
+            else:
+                outcome = await self.queue._replay_action(self, entry_id, action)
+        finally:
+            done[entry_id].set_result(bool(outcome))
+
+        if outcome is None:
+            # A prerequisite has not synced; keep this action queued behind it
+            self.queue._record({"op": "release", "ids": [entry_id]})
+            self.result.deferred += 1
+
+
 # Module-level singleton and convenience functions
 _offline_queue: OfflineQueue | None = None
 
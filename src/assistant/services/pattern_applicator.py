@@ -12,20 +12,157 @@ PRD Section 5.5 - Pattern Application:
 
 Pattern matching strategy:
 1. Query all applicable patterns from Notion (confidence >= 70%)
-2. Match triggers against extracted entities and text
-3. Apply corrections to people names, places, task titles
-4. Return modified values for use in message processing
+2. Compile their normalized triggers into a PatternIndex
+3. Match triggers against extracted entities and text
+4. Apply corrections to people names, places, task titles
+5. Return modified values for use in message processing
+
+The PatternIndex answers every match with one scan of the normalized value
+(an Aho-Corasick automaton over the triggers) plus dict lookups, so the cost
+of a message does not grow with the number of learned patterns.
+
+Cache freshness:
+- Once the cache is older than pattern_cache_ttl, the next apply_patterns
+  call uses it as-is and refreshes it in the background (stale-while-revalidate)
+- Refreshes fetch only patterns edited since the last one (last_edited_time);
+  a full reload every PATTERN_FULL_RELOAD_SECONDS drops deleted patterns
+- Failed loads keep the previous cache and are retried with exponential backoff
+- PatternDetector pushes newly stored patterns into the live cache
 """
 
+import asyncio
 import logging
 import re
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from typing import Any
 
+from assistant.config import settings
 from assistant.notion import NotionClient
 from assistant.services.patterns import PATTERN_CONFIDENCE_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# Punctuation ignored when matching triggers
+_PUNCTUATION_RE = re.compile(r"[.,!?;:'\"-]")
+
+# Shortest value that may match as part of a longer trigger
+MIN_PARTIAL_MATCH_LENGTH = 3
+
+# Seconds between full reloads (incremental refreshes cannot see deletions)
+PATTERN_FULL_RELOAD_SECONDS = 3600
+
+# Backoff after a failed load: doubles per failure, capped
+PATTERN_RETRY_BASE_SECONDS = 5.0
+PATTERN_RETRY_MAX_SECONDS = 300.0
+
+
+def normalize_trigger(text: str) -> str:
+    """Normalize text for pattern matching (lowercase, no punctuation)."""
+    return _PUNCTUATION_RE.sub("", text.lower().strip())
+
+
+class PatternIndex:
+    """Normalized trigger index compiled from the pattern cache.
+
+    A value matches a pattern when, after normalization, it equals the
+    trigger, contains the trigger, or (for values of at least
+    MIN_PARTIAL_MATCH_LENGTH characters) is contained in the trigger. The
+    first matching pattern in cache order wins. Lookups use:
+    - an Aho-Corasick automaton to find every trigger inside a value in one pass
+    - a dict of exact triggers
+    - a dict of trigger substrings for values contained in a trigger
+    """
+
+    def __init__(self, patterns: list[dict]):
+        """Compile the index.
+
+        Args:
+            patterns: Pattern dicts (with "trigger") in priority order
+        """
+        self.patterns = patterns
+        self._exact: dict[str, int] = {}
+        self._partial: dict[str, int] = {}
+        # Patterns whose trigger normalizes to "" are contained in every value
+        self._empty: list[int] = []
+
+        # Automaton: per state, its transitions, failure link and matched patterns
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+
+        for position, pattern in enumerate(patterns):
+            trigger = normalize_trigger(pattern["trigger"])
+            if not trigger:
+                self._empty.append(position)
+                continue
+            self._exact.setdefault(trigger, position)
+            for start in range(len(trigger)):
+                for end in range(start + MIN_PARTIAL_MATCH_LENGTH, len(trigger) + 1):
+                    self._partial.setdefault(trigger[start:end], position)
+            self._add(trigger, position)
+
+        self._link()
+
+    def _add(self, trigger: str, position: int) -> None:
+        state = 0
+        for char in trigger:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append(position)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def contained_in(self, normalized: str) -> set[int]:
+        """Positions of patterns whose trigger occurs in a normalized text."""
+        found = set(self._empty)
+        state = 0
+        for char in normalized:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.update(self._out[state])
+        return found
+
+    def match(self, value: str) -> dict | None:
+        """First pattern (in cache order) whose trigger matches a value."""
+        normalized = normalize_trigger(value)
+        candidates = self.contained_in(normalized)
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            candidates.add(exact)
+        if len(normalized) >= MIN_PARTIAL_MATCH_LENGTH:
+            partial = self._partial.get(normalized)
+            if partial is not None:
+                candidates.add(partial)
+        return self.patterns[min(candidates)] if candidates else None
+
+    def in_text(self, text: str) -> list[dict]:
+        """Patterns whose trigger occurs in a text, in cache order."""
+        return [self.patterns[i] for i in sorted(self.contained_in(normalize_trigger(text)))]
+
 
 @dataclass
 class AppliedPattern:
@@ -105,7 +242,17 @@ class PatternApplicator:
         """
         self._notion = notion_client
         self._pattern_cache: list[dict] = []
+        self._index: PatternIndex | None = None
         self._cache_loaded = False
+        self._min_confidence = PATTERN_CONFIDENCE_THRESHOLD
+
+        # Freshness state (monotonic clock)
+        self._refreshed_at: float | None = None
+        self._full_loaded_at: float | None = None
+        self._watermark: str | None = None  # newest last_edited_time seen
+        self._failures = 0
+        self._retry_at = 0.0
+        self._refresh_task: asyncio.Task[int] | None = None
 
     @property
     def notion(self) -> NotionClient:
@@ -115,7 +262,9 @@ class PatternApplicator:
         return self._notion
 
     async def load_patterns(self, min_confidence: int = PATTERN_CONFIDENCE_THRESHOLD) -> int:
-        """Load applicable patterns from Notion.
+        """Load applicable patterns from Notion, replacing the cache.
+
+        On failure the previous cache is kept and a retry is scheduled.
 
         Args:
             min_confidence: Minimum confidence for patterns to load
@@ -123,28 +272,146 @@ class PatternApplicator:
         Returns:
             Number of patterns loaded
         """
+        self._min_confidence = min_confidence
         try:
             results = await self.notion.query_patterns(
                 min_confidence=min_confidence,
                 limit=100,
             )
 
-            self._pattern_cache = []
+            pattern_cache = []
             for result in results:
                 pattern_data = self._extract_pattern_data(result)
                 if pattern_data:
-                    self._pattern_cache.append(pattern_data)
+                    pattern_cache.append(pattern_data)
 
+            self._set_cache(pattern_cache)
             self._cache_loaded = True
+            self._watermark = self._newest_edit(results, None)
+            self._mark_refreshed(full=True)
             logger.info(f"Loaded {len(self._pattern_cache)} applicable patterns")
             return len(self._pattern_cache)
 
         except Exception as e:
             logger.warning(f"Failed to load patterns from Notion: {e}")
-            self._pattern_cache = []
-            self._cache_loaded = True  # Mark as loaded to avoid repeated failures
+            self._cache_loaded = True  # Serve what we have; retry after backoff
+            self._record_failure()
             return 0
 
+    async def refresh(self) -> int:
+        """Bring the cache up to date.
+
+        Fetches only patterns edited since the last refresh, or does a full
+        reload when there is no watermark yet or one is due.
+
+        Returns:
+            Number of cached patterns after the refresh
+        """
+        now = time.monotonic()
+        if (
+            self._watermark is None
+            or self._full_loaded_at is None
+            or now - self._full_loaded_at >= PATTERN_FULL_RELOAD_SECONDS
+        ):
+            await self.load_patterns(self._min_confidence)
+            return len(self._pattern_cache)
+
+        try:
+            results = await self.notion.query_patterns(edited_after=self._watermark)
+        except Exception as e:
+            logger.warning(f"Failed to refresh patterns from Notion: {e}")
+            self._record_failure()
+            return len(self._pattern_cache)
+
+        patterns = {p["id"]: p for p in self._pattern_cache}
+        for result in results:
+            pattern_data = self._extract_pattern_data(result)
+            page_id = result.get("id", "")
+            if pattern_data and pattern_data["confidence"] >= self._min_confidence:
+                patterns[page_id] = pattern_data
+            else:
+                # Edited below the threshold (or made invalid): stop applying it
+                patterns.pop(page_id, None)
+
+        self._set_cache(list(patterns.values()))
+        self._watermark = self._newest_edit(results, self._watermark)
+        self._mark_refreshed(full=False)
+        if results:
+            logger.info(f"Refreshed {len(results)} changed pattern(s)")
+        return len(self._pattern_cache)
+
+    def add_pattern(
+        self,
+        pattern_id: str,
+        trigger: str,
+        meaning: str,
+        confidence: int,
+        pattern_type: str = "name",
+    ) -> None:
+        """Add or update a pattern in the live cache without a Notion round trip.
+
+        Patterns below the applicator's confidence threshold are removed
+        instead. Does nothing until the cache has been loaded, since the
+        first load will include the pattern anyway.
+        """
+        if not self._cache_loaded:
+            return
+        patterns = {p["id"]: p for p in self._pattern_cache}
+        if trigger and meaning and confidence >= self._min_confidence:
+            patterns[pattern_id] = {
+                "id": pattern_id,
+                "trigger": trigger,
+                "meaning": meaning,
+                "confidence": int(confidence),
+                "pattern_type": pattern_type,
+            }
+        else:
+            patterns.pop(pattern_id, None)
+        self._set_cache(list(patterns.values()))
+
+    def _set_cache(self, patterns: list[dict]) -> None:
+        """Replace the cache (highest confidence first) and recompile the index."""
+        patterns.sort(key=lambda p: p["confidence"], reverse=True)
+        self._pattern_cache = patterns
+        self._index = PatternIndex(patterns)
+
+    @staticmethod
+    def _newest_edit(results: list[dict[str, Any]], watermark: str | None) -> str | None:
+        edited = [r["last_edited_time"] for r in results if r.get("last_edited_time")]
+        if watermark:
+            edited.append(watermark)
+        return max(edited) if edited else None
+
+    def _mark_refreshed(self, full: bool) -> None:
+        now = time.monotonic()
+        self._refreshed_at = now
+        if full:
+            self._full_loaded_at = now
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        delay = min(
+            PATTERN_RETRY_BASE_SECONDS * 2 ** (self._failures - 1),
+            PATTERN_RETRY_MAX_SECONDS,
+        )
+        self._retry_at = time.monotonic() + delay
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the cache is past its TTL and a refresh may be attempted."""
+        now = time.monotonic()
+        if now < self._retry_at:
+            return False
+        return self._refreshed_at is None or now - self._refreshed_at >= settings.pattern_cache_ttl
+
+    def _schedule_refresh(self) -> None:
+        """Refresh in the background unless a refresh is already running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self.refresh())
+
     def _extract_pattern_data(self, notion_result: dict) -> dict | None:
         """Extract pattern data from Notion result.
 
@@ -204,10 +471,7 @@ class PatternApplicator:
         Returns:
             Normalized text
         """
-        text = text.lower().strip()
-        # Remove common punctuation
-        text = re.sub(r"[.,!?;:'\"-]", "", text)
-        return text
+        return normalize_trigger(text)
 
     def _matches_trigger(self, value: str, trigger: str) -> bool:
         """Check if a value matches a pattern trigger.
@@ -231,7 +495,7 @@ class PatternApplicator:
             return True
 
         # Trigger contains value (for short names)
-        if norm_value in norm_trigger and len(norm_value) >= 3:
+        if norm_value in norm_trigger and len(norm_value) >= MIN_PARTIAL_MATCH_LENGTH:
             return True
 
         return False
@@ -268,98 +532,101 @@ class PatternApplicator:
             corrected_title=title,
         )
 
-        # Load patterns if not cached
+        # Load patterns if not cached; past the TTL, serve the cache and refresh it
         if not self._cache_loaded:
             await self.load_patterns()
+        elif self.is_stale:
+            self._schedule_refresh()
 
         if not self._pattern_cache:
             return result
 
-        # Apply patterns to people names
+        index = self._compiled_index()
+
+        # Apply patterns to people names (one pattern per person)
         for i, person in enumerate(result.corrected_people):
-            for pattern in self._pattern_cache:
-                if self._matches_trigger(person, pattern["trigger"]):
-                    original = result.corrected_people[i]
-                    result.corrected_people[i] = pattern["meaning"]
-                    result.patterns_applied.append(
-                        AppliedPattern(
-                            pattern_id=pattern["id"],
-                            trigger=pattern["trigger"],
-                            meaning=pattern["meaning"],
-                            original_value=original,
-                            corrected_value=pattern["meaning"],
-                            pattern_type=pattern.get("pattern_type", "person"),
-                            confidence=pattern["confidence"],
-                        )
+            pattern = index.match(person)
+            if pattern is not None:
+                original = result.corrected_people[i]
+                result.corrected_people[i] = pattern["meaning"]
+                result.patterns_applied.append(
+                    AppliedPattern(
+                        pattern_id=pattern["id"],
+                        trigger=pattern["trigger"],
+                        meaning=pattern["meaning"],
+                        original_value=original,
+                        corrected_value=pattern["meaning"],
+                        pattern_type=pattern.get("pattern_type", "person"),
+                        confidence=pattern["confidence"],
                     )
-                    # Also update title if it contains the name
-                    if original.lower() in result.corrected_title.lower():
-                        result.corrected_title = re.sub(
-                            re.escape(original),
-                            pattern["meaning"],
-                            result.corrected_title,
-                            flags=re.IGNORECASE,
-                        )
-                    break  # Only apply one pattern per person
-
-        # Apply patterns to place names
+                )
+                # Also update title if it contains the name
+                if original.lower() in result.corrected_title.lower():
+                    result.corrected_title = re.sub(
+                        re.escape(original),
+                        pattern["meaning"],
+                        result.corrected_title,
+                        flags=re.IGNORECASE,
+                    )
+
+        # Apply patterns to place names (one pattern per place)
         for i, place in enumerate(result.corrected_places):
-            for pattern in self._pattern_cache:
-                if self._matches_trigger(place, pattern["trigger"]):
-                    original = result.corrected_places[i]
-                    result.corrected_places[i] = pattern["meaning"]
-                    result.patterns_applied.append(
-                        AppliedPattern(
-                            pattern_id=pattern["id"],
-                            trigger=pattern["trigger"],
-                            meaning=pattern["meaning"],
-                            original_value=original,
-                            corrected_value=pattern["meaning"],
-                            pattern_type=pattern.get("pattern_type", "place"),
-                            confidence=pattern["confidence"],
-                        )
+            pattern = index.match(place)
+            if pattern is not None:
+                original = result.corrected_places[i]
+                result.corrected_places[i] = pattern["meaning"]
+                result.patterns_applied.append(
+                    AppliedPattern(
+                        pattern_id=pattern["id"],
+                        trigger=pattern["trigger"],
+                        meaning=pattern["meaning"],
+                        original_value=original,
+                        corrected_value=pattern["meaning"],
+                        pattern_type=pattern.get("pattern_type", "place"),
+                        confidence=pattern["confidence"],
+                    )
+                )
+                # Also update title if it contains the place
+                if original.lower() in result.corrected_title.lower():
+                    result.corrected_title = re.sub(
+                        re.escape(original),
+                        pattern["meaning"],
+                        result.corrected_title,
+                        flags=re.IGNORECASE,
                     )
-                    # Also update title if it contains the place
-                    if original.lower() in result.corrected_title.lower():
-                        result.corrected_title = re.sub(
-                            re.escape(original),
-                            pattern["meaning"],
-                            result.corrected_title,
-                            flags=re.IGNORECASE,
-                        )
-                    break  # Only apply one pattern per place
 
         # Apply patterns to title directly (for patterns not caught by entity matching)
         # This handles cases like "shopping" → priority change context
-        for pattern in self._pattern_cache:
-            norm_trigger = self._normalize(pattern["trigger"])
-            norm_title = self._normalize(result.corrected_title)
-
-            if norm_trigger in norm_title:
-                # Check if this pattern was already applied
-                already_applied = any(
-                    p.pattern_id == pattern["id"] for p in result.patterns_applied
+        applied_ids = {p.pattern_id for p in result.patterns_applied}
+        for pattern in index.in_text(result.corrected_title):
+            if pattern["id"] in applied_ids:
+                continue
+            applied_ids.add(pattern["id"])
+            # For title-based patterns, we record but may not modify title
+            # (e.g., priority patterns affect priority, not title text)
+            result.patterns_applied.append(
+                AppliedPattern(
+                    pattern_id=pattern["id"],
+                    trigger=pattern["trigger"],
+                    meaning=pattern["meaning"],
+                    original_value=pattern["trigger"],
+                    corrected_value=pattern["meaning"],
+                    pattern_type=pattern.get("pattern_type", "name"),
+                    confidence=pattern["confidence"],
                 )
-                if not already_applied:
-                    # For title-based patterns, we record but may not modify title
-                    # (e.g., priority patterns affect priority, not title text)
-                    result.patterns_applied.append(
-                        AppliedPattern(
-                            pattern_id=pattern["id"],
-                            trigger=pattern["trigger"],
-                            meaning=pattern["meaning"],
-                            original_value=pattern["trigger"],
-                            corrected_value=pattern["meaning"],
-                            pattern_type=pattern.get("pattern_type", "name"),
-                            confidence=pattern["confidence"],
-                        )
-                    )
+            )
 
         if result.has_corrections:
             logger.info(f"Applied patterns: {result.summary()}")
 
         return result
 
+    def _compiled_index(self) -> PatternIndex:
+        """Get the trigger index, compiling it if the cache was set directly."""
+        if self._index is None or self._index.patterns is not self._pattern_cache:
+            self._index = PatternIndex(self._pattern_cache)
+        return self._index
+
     async def update_pattern_usage(self, pattern_id: str) -> None:
         """Update a pattern's last_used timestamp after application.
 
@@ -379,7 +646,13 @@ class PatternApplicator:
     def clear_cache(self) -> None:
         """Clear the pattern cache to force reload on next apply."""
         self._pattern_cache = []
+        self._index = None
         self._cache_loaded = False
+        self._refreshed_at = None
+        self._full_loaded_at = None
+        self._watermark = None
+        self._failures = 0
+        self._retry_at = 0.0
 
 
 # Module-level convenience functions
@@ -56,6 +56,72 @@ CONFIDENCE_BOOST_PER_CONFIRMATION = 10
 # Confidence penalty per wrong application
 CONFIDENCE_PENALTY_PER_WRONG = 20
 
+# Similarity above which two values count as variants of each other
+SIMILARITY_THRESHOLD = 0.8
+
+
+def levenshtein_distance(s1: str, s2: str, max_distance: int | None = None) -> int:
+    """Calculate the edit distance between two strings.
+
+    Args:
+        s1: First string
+        s2: Second string
+        max_distance: Optional bound; once the distance is known to exceed it
+            the computation stops early and max_distance + 1 is returned
+
+    Returns:
+        Number of single-character insertions, deletions and substitutions
+        needed to turn s1 into s2 (capped at max_distance + 1 when bounded)
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
+    if not s2:
+        return len(s1)
+
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(
+                min(
+                    previous[j] + 1,  # deletion
+                    current[j - 1] + 1,  # insertion
+                    previous[j - 1] + (c1 != c2),  # substitution
+                )
+            )
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def string_similarity(s1: str, s2: str, threshold: float | None = None) -> float:
+    """Calculate normalized edit similarity between two strings (0.0 to 1.0).
+
+    Args:
+        s1: First string
+        s2: Second string
+        threshold: Optional minimum similarity the caller cares about; the
+            edit distance is bounded accordingly, so clearly different strings
+            are rejected without computing their exact score
+
+    Returns:
+        1 - distance / longer length. When threshold is given, any value
+        returned for strings below it is only guaranteed to be <= threshold.
+    """
+    if not s1 or not s2:
+        return 0.0
+
+    if s1 == s2:
+        return 1.0
+
+    max_len = max(len(s1), len(s2))
+    max_distance = int(max_len * (1 - threshold)) if threshold is not None else None
+    distance = levenshtein_distance(s1, s2, max_distance)
+    return max(0.0, 1 - distance / max_len)
+
 
 @dataclass
 class CorrectionRecord:
@@ -119,6 +185,14 @@ class PatternDetector:
         # This will be populated from Notion's log on init
         self._correction_history: list[CorrectionRecord] = []
 
+        # Blocking index over the history: normalized original/corrected value
+        # -> (history position, record). Only records sharing one side can be
+        # similar corrections, so lookups replace a scan of the whole history.
+        self._by_original: dict[str, list[tuple[int, CorrectionRecord]]] = defaultdict(list)
+        self._by_corrected: dict[str, list[tuple[int, CorrectionRecord]]] = defaultdict(list)
+        self._indexed_history: list[CorrectionRecord] | None = None
+        self._indexed_count = 0
+
         # Detected patterns waiting to be stored
         self._pending_patterns: list[DetectedPattern] = []
 
@@ -256,6 +330,18 @@ class PatternDetector:
             times_confirmed=pattern.occurrences,
             confidence=pattern.confidence,
         )
+        self._publish_pattern(page_id, pattern)
+
+    def _publish_pattern(self, page_id: str, pattern: DetectedPattern) -> None:
+        """Push a stored pattern into the live PatternApplicator cache."""
+        from assistant.services.pattern_applicator import get_pattern_applicator
+
+        get_pattern_applicator().add_pattern(
+            pattern_id=page_id,
+            trigger=pattern.trigger,
+            meaning=pattern.meaning,
+            confidence=pattern.confidence,
+        )
 
     def _normalize(self, text: str) -> str:
         """Normalize text for pattern comparison.
@@ -281,9 +367,14 @@ class PatternDetector:
         """
         new_patterns = []
 
-        # Count similar corrections in history
+        # Count similar corrections in history. Similar corrections always
+        # share their original or corrected value, so only those are compared.
+        self._sync_index()
+        candidates = dict(self._by_original.get(normalized_original, []))
+        candidates.update(self._by_corrected.get(normalized_corrected, []))
+
         similar_corrections = []
-        for record in self._correction_history:
+        for _, record in sorted(candidates.items(), key=lambda item: item[0]):
             rec_orig = self._normalize(record.original_value)
             rec_corr = self._normalize(record.corrected_value)
 
@@ -307,6 +398,25 @@ class PatternDetector:
 
         return new_patterns
 
+    def _sync_index(self) -> None:
+        """Bring the blocking index up to date with the correction history.
+
+        Records appended since the last sync are indexed; if the history list
+        was replaced or shrunk, the index is rebuilt from scratch.
+        """
+        history = self._correction_history
+        if history is not self._indexed_history or self._indexed_count > len(history):
+            self._by_original.clear()
+            self._by_corrected.clear()
+            self._indexed_history = history
+            self._indexed_count = 0
+
+        for position in range(self._indexed_count, len(history)):
+            record = history[position]
+            self._by_original[self._normalize(record.original_value)].append((position, record))
+            self._by_corrected[self._normalize(record.corrected_value)].append((position, record))
+        self._indexed_count = len(history)
+
     def _is_similar_correction(
         self,
         orig1: str,
@@ -326,11 +436,15 @@ class PatternDetector:
             return True
 
         # Same original, similar corrected (e.g., typo variants)
-        if orig1 == orig2 and self._string_similarity(corr1, corr2) > 0.8:
+        if orig1 == orig2 and (
+            string_similarity(corr1, corr2, SIMILARITY_THRESHOLD) > SIMILARITY_THRESHOLD
+        ):
             return True
 
         # Similar original, same corrected (e.g., multiple misspellings of same name)
-        if self._string_similarity(orig1, orig2) > 0.8 and corr1 == corr2:
+        if corr1 == corr2 and (
+            string_similarity(orig1, orig2, SIMILARITY_THRESHOLD) > SIMILARITY_THRESHOLD
+        ):
             return True
 
         return False
@@ -338,23 +452,9 @@ class PatternDetector:
     def _string_similarity(self, s1: str, s2: str) -> float:
         """Calculate similarity between two strings (0.0 to 1.0).
 
-        Uses simple character-based similarity.
+        Uses normalized Levenshtein edit distance.
         """
-        if not s1 or not s2:
-            return 0.0
-
-        if s1 == s2:
-            return 1.0
-
-        # Count matching characters
-        len1, len2 = len(s1), len(s2)
-        max_len = max(len1, len2)
-
-        # Simple Levenshtein-like distance approximation
-        matching = sum(c1 == c2 for c1, c2 in zip(s1, s2))
-        extra_chars = abs(len1 - len2)
-
-        return (matching - extra_chars * 0.5) / max_len
+        return string_similarity(s1, s2)
 
     def _create_pattern_from_corrections(
         self, corrections: list[CorrectionRecord]
@@ -459,6 +559,7 @@ class PatternDetector:
         )
 
         page_id = await self.notion.create_pattern(notion_pattern)
+        self._publish_pattern(page_id, pattern)
 
         # Remove from pending
         self._pending_patterns = [
@@ -537,15 +638,12 @@ class PatternDetector:
             List of all detected patterns
         """
         # Group by normalized original value
-        by_original: dict[str, list[CorrectionRecord]] = defaultdict(list)
-
-        for record in self._correction_history:
-            normalized = self._normalize(record.original_value)
-            by_original[normalized].append(record)
+        self._sync_index()
 
         # Check each group for pattern potential
         detected = []
-        for normalized_orig, records in by_original.items():
+        for entries in self._by_original.values():
+            records = [record for _, record in entries]
             if len(records) >= MIN_PATTERN_OCCURRENCES:
                 # Group by corrected value too
                 by_corrected = defaultdict(list)
@@ -0,0 +1,313 @@
+"""Background geocoding of places that have no coordinates.
+
+Places created without Maps enrichment (or whose enrichment failed) have no
+lat/lng in Notion, so proximity queries used to geocode them while the user
+waited. This service back-fills them instead:
+- Each cycle queries the Places database for rows missing coordinates
+- Places still in their failure backoff are skipped
+- Up to batch_size places are geocoded, with a delay between Maps requests
+- Coordinates are written back via NotionClient.update_place and added to
+  the proximity place index
+
+Failures are recorded in the place index with an exponential backoff so a
+place Maps cannot find is not retried on every cycle (or every query).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from assistant.config import settings
+from assistant.google.maps import MapsClient, PlaceDetails
+from assistant.notion.client import NotionClient
+from assistant.services.spatial_index import PlaceSpatialIndex, get_place_index
+
+logger = logging.getLogger(__name__)
+
+# Default seconds between back-fill cycles
+DEFAULT_GEOCODE_INTERVAL = 900
+
+# Default places geocoded per cycle
+DEFAULT_GEOCODE_BATCH_SIZE = 20
+
+# Default seconds between Maps requests within a cycle
+DEFAULT_GEOCODE_DELAY = 0.2
+
+
+@dataclass
+class PlaceGeocodeResult:
+    """Result of a back-fill cycle."""
+
+    timestamp: datetime
+    geocoded: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    skipped: int = 0  # places still in their failure backoff
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """True if the cycle ran without errors (individual misses are not errors)."""
+        return len(self.errors) == 0
+
+
+def parse_place_page(page: dict[str, Any]) -> tuple[str, str | None, float | None, float | None]:
+    """Extract (name, address, lat, lng) from a Notion place page."""
+    props = page.get("properties", {})
+
+    name_list = props.get("name", {}).get("title", [])
+    name = name_list[0]["text"]["content"] if name_list else ""
+
+    address_text = props.get("address", {}).get("rich_text", [])
+    address = address_text[0]["text"]["content"] if address_text else None
+
+    lat = props.get("lat", {}).get("number")
+    lng = props.get("lng", {}).get("number")
+    return name, address, lat, lng
+
+
+class PlaceGeocodingService:
+    """Background service that back-fills coordinates for places.
+
+    Follows the same lifecycle pattern as ReplicaSyncService:
+    - start() runs an initial cycle and begins the background loop
+    - stop() gracefully shuts down
+    """
+
+    def __init__(
+        self,
+        notion_client: NotionClient | None = None,
+        maps_client: MapsClient | None = None,
+        place_index: PlaceSpatialIndex | None = None,
+        interval: int = DEFAULT_GEOCODE_INTERVAL,
+        batch_size: int = DEFAULT_GEOCODE_BATCH_SIZE,
+        delay: float = DEFAULT_GEOCODE_DELAY,
+    ):
+        """Initialize the geocoding service.
+
+        Args:
+            notion_client: Client used to read and update places (created if not provided)
+            maps_client: Client used to geocode (created if not provided)
+            place_index: Index to record coordinates and failures in
+                (defaults to the shared index, or memory if that is disabled)
+            interval: Seconds between back-fill cycles
+            batch_size: Maximum places geocoded per cycle
+            delay: Seconds between Maps requests
+        """
+        self._notion = notion_client
+        self._maps = maps_client
+        self._owns_clients = notion_client is None, maps_client is None
+        if place_index is None:
+            place_index = get_place_index() or PlaceSpatialIndex(persist=False)
+        self.place_index = place_index
+        self._interval = interval
+        self._batch_size = batch_size
+        self._delay = delay
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+        self._last_result: PlaceGeocodeResult | None = None
+
+    @property
+    def is_configured(self) -> bool:
+        """Check if back-filling is enabled and Notion and Maps are configured."""
+        return bool(
+            settings.place_geocode_enabled and settings.has_notion and settings.has_google_maps
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the back-fill loop is running."""
+        return self._running
+
+    @property
+    def last_result(self) -> PlaceGeocodeResult | None:
+        """Get the last back-fill result."""
+        return self._last_result
+
+    def _get_notion(self) -> NotionClient:
+        if self._notion is None:
+            self._notion = NotionClient()
+        return self._notion
+
+    def _get_maps(self) -> MapsClient:
+        if self._maps is None:
+            self._maps = MapsClient()
+        return self._maps
+
+    async def geocode_place(
+        self,
+        place_id: str,
+        name: str,
+        address: str | None = None,
+    ) -> PlaceDetails | None:
+        """Geocode one place and persist its coordinates.
+
+        The address is geocoded if present, otherwise the name is searched.
+        On success the coordinates are written to Notion and the place index;
+        on failure the place is put into backoff.
+
+        Args:
+            place_id: Notion page ID of the place
+            name: Place name
+            address: Place address, if known
+
+        Returns:
+            Geocoded place details, or None if the place could not be located
+            or is still in its failure backoff
+        """
+        if place_id in self.place_index.geocode_backoff([place_id]):
+            return None
+
+        maps = self._get_maps()
+        details: PlaceDetails | None = None
+        if address:
+            details = await maps.geocode(address)
+        elif name:
+            details = await maps.search_place(name)
+
+        if details is None:
+            self.place_index.record_geocode_failure(place_id, f"no result for {address or name!r}")
+            logger.info("Could not geocode place %s (%s)", place_id, address or name)
+            return None
+
+        try:
+            await self._get_notion().update_place(
+                place_id=place_id,
+                lat=details.lat,
+                lng=details.lng,
+                google_place_id=details.place_id or None,
+            )
+        except Exception as e:
+            # Still index the coordinates; the next cycle retries the write
+            logger.warning("Could not save coordinates for place %s: %s", place_id, e)
+
+        self.place_index.upsert(place_id, details.lat, details.lng, name, address)
+        return details
+
+    async def run_once(self) -> PlaceGeocodeResult:
+        """Run one back-fill cycle."""
+        result = PlaceGeocodeResult(timestamp=datetime.now(UTC))
+
+        try:
+            pages = await self._get_notion().query_places(missing_coordinates=True)
+        except Exception as e:
+            logger.warning("Could not query places missing coordinates: %s", e)
+            result.errors.append(str(e))
+            self._last_result = result
+            return result
+
+        blocked = self.place_index.geocode_backoff(page["id"] for page in pages)
+        due = [page for page in pages if page["id"] not in blocked]
+        result.skipped = len(pages) - len(due)
+
+        for i, page in enumerate(due[: self._batch_size]):
+            if i and self._delay:
+                await asyncio.sleep(self._delay)
+            name, address, _, _ = parse_place_page(page)
+            try:
+                details = await self.geocode_place(page["id"], name, address)
+            except Exception as e:
+                logger.warning("Geocoding place %s failed: %s", page["id"], e)
+                result.errors.append(f"{page['id']}: {e}")
+                continue
+            if details is None:
+                result.failed.append(page["id"])
+            else:
+                result.geocoded.append(page["id"])
+
+        if result.geocoded or result.failed:
+            logger.info(
+                "Place back-fill: %d geocoded, %d failed, %d in backoff",
+                len(result.geocoded),
+                len(result.failed),
+                result.skipped,
+            )
+        self._last_result = result
+        return result
+
+    async def start(self) -> None:
+        """Start the back-fill loop."""
+        if not self.is_configured:
+            logger.info("Place geocoding not configured (needs Notion and Google Maps)")
+            return
+
+        if self._running:
+            logger.warning("Place geocoding already running")
+            return
+
+        self._running = True
+        logger.info("Starting place geocoding (interval: %ds)", self._interval)
+
+        await self.run_once()
+
+        self._task = asyncio.create_task(self._geocode_loop())
+
+    async def stop(self) -> None:
+        """Stop the back-fill loop."""
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        owns_notion, owns_maps = self._owns_clients
+        if owns_notion and self._notion:
+            await self._notion.close()
+            self._notion = None
+        if owns_maps and self._maps:
+            await self._maps.close()
+            self._maps = None
+
+        logger.info("Place geocoding stopped")
+
+    async def _geocode_loop(self) -> None:
+        """Background loop that back-fills periodically."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._interval)
+                if self._running:
+                    await self.run_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception("Error in place geocoding loop: %s", e)
+
+
+# Module-level singleton
+_geocoding_service: PlaceGeocodingService | None = None
+
+
+def get_place_geocoding_service() -> PlaceGeocodingService:
+    """Get or create the place geocoding service singleton."""
+    global _geocoding_service
+    if _geocoding_service is None:
+        _geocoding_service = PlaceGeocodingService(
+            interval=settings.place_geocode_interval,
+            batch_size=settings.place_geocode_batch_size,
+        )
+    return _geocoding_service
+
+
+async def start_place_geocoding() -> None:
+    """Start the back-fill loop (convenience function)."""
+    await get_place_geocoding_service().start()
+
+
+async def stop_place_geocoding() -> None:
+    """Stop the back-fill loop (convenience function)."""
+    await get_place_geocoding_service().stop()
+
+
+async def geocode_places_now() -> PlaceGeocodeResult:
+    """Trigger an immediate back-fill cycle (convenience function)."""
+    return await get_place_geocoding_service().run_once()
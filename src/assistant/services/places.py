@@ -6,6 +6,7 @@ This service handles:
 - Matching places from extracted text to database entries
 - Ranking matches by recency and confidence
 - Geocoding places via Google Maps API (T-153)
+- Indexing geocoded places for proximity search
 """
 
 import logging
@@ -15,10 +16,12 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from assistant.notion.schemas import Place
+from assistant.services.spatial_index import get_place_index
 
 if TYPE_CHECKING:
     from assistant.google.maps import MapsClient
     from assistant.notion.client import NotionClient
+    from assistant.services.spatial_index import PlaceSpatialIndex
 
 logger = logging.getLogger(__name__)
 
@@ -116,9 +119,11 @@ class PlacesService:
         self,
         notion_client: "NotionClient | None" = None,
         maps_client: "MapsClient | None" = None,
+        place_index: "PlaceSpatialIndex | None" = None,
     ):
         self.notion = notion_client
         self.maps = maps_client
+        self.place_index = place_index if place_index is not None else get_place_index()
 
     async def lookup(
         self,
@@ -313,6 +318,20 @@ class PlacesService:
                 )
                 logger.info(f"Enriched place '{place.name}' with geocoding data")
 
+                # Keep the proximity index in step with the new coordinates
+                if (
+                    self.place_index is not None
+                    and result.lat is not None
+                    and result.lng is not None
+                ):
+                    self.place_index.upsert(
+                        place.id,
+                        result.lat,
+                        result.lng,
+                        place.name,
+                        result.address or place.address,
+                    )
+
             return result
 
         except Exception as e:
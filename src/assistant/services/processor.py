@@ -69,7 +69,7 @@ class MessageProcessor:
         Returns:
             ProcessResult with response and metadata
         """
-        parsed = self.parser.parse(text)
+        parsed = await self.parser.parse(text)
         idempotency_key = f"telegram:{chat_id}:{message_id}"
 
         # T-093: Apply stored patterns before further processing
@@ -207,8 +207,6 @@ class MessageProcessor:
                     needs_clarification=True,
                     patterns_applied=pattern_result.patterns_applied,
                 )
-            finally:
-                await self.notion.close()
 
         return ProcessResult(
             response=("Got it. I've added this to your inbox - we'll clarify in your next review."),
@@ -278,8 +276,6 @@ class MessageProcessor:
                     confidence=parsed.confidence,
                     patterns_applied=pattern_result.patterns_applied,
                 )
-            finally:
-                await self.notion.close()
 
         response = self._generate_response(parsed, people_linked, pattern_result)
 
@@ -3,18 +3,25 @@
 This service answers "What can I do near X?" queries by:
 1. Geocoding the query location
 2. Finding tasks that have associated places
-3. Calculating distances from query location to task places
-4. Returning tasks sorted by distance
+3. Looking up task places in the geohash place index (fetching and indexing
+   places it has not seen yet) and running a radius query against it
+4. Returning tasks sorted by distance, with travel times for the results
+   resolved in one batched Distance Matrix lookup
 
 Implements AT-127: Proximity Task Suggestions.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import math
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from assistant.services.spatial_index import IndexedPlace, PlaceSpatialIndex, get_place_index
+
+# Re-exported: distance helper used by callers of this module
+from assistant.services.spatial_index import haversine_distance as haversine_distance
 
 if TYPE_CHECKING:
     from assistant.google.maps import MapsClient
@@ -37,6 +44,9 @@ PROXIMITY_PATTERNS = [
 # Maximum distance in meters to consider "nearby" (5km default)
 MAX_NEARBY_DISTANCE_METERS = 5000
 
+# Concurrent Notion fetches when indexing places not yet in the index
+PLACE_FETCH_CONCURRENCY = 4
+
 
 @dataclass
 class NearbyTask:
@@ -171,34 +181,6 @@ def extract_location_from_query(text: str) -> str | None:
     return None
 
 
-def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Calculate the great-circle distance between two points in meters.
-
-    Uses the Haversine formula for accuracy on Earth's surface.
-
-    Args:
-        lat1, lng1: First point coordinates
-        lat2, lng2: Second point coordinates
-
-    Returns:
-        Distance in meters
-    """
-    earth_radius = 6371000  # Earth's radius in meters
-
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    delta_phi = math.radians(lat2 - lat1)
-    delta_lambda = math.radians(lng2 - lng1)
-
-    a = (
-        math.sin(delta_phi / 2) ** 2
-        + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    return earth_radius * c
-
-
 class ProximityTaskService:
     """Service for finding tasks near a location."""
 
@@ -207,10 +189,17 @@ class ProximityTaskService:
         notion_client: NotionClient | None = None,
         maps_client: MapsClient | None = None,
         max_distance_meters: int = MAX_NEARBY_DISTANCE_METERS,
+        place_index: PlaceSpatialIndex | None = None,
     ):
         self.notion = notion_client
         self.maps = maps_client
         self.max_distance = max_distance_meters
+        if place_index is None:
+            place_index = get_place_index()
+        if place_index is None:
+            # Index disabled: still answer radius queries, just without persistence
+            place_index = PlaceSpatialIndex(persist=False)
+        self.place_index = place_index
 
     async def find_tasks_near(
         self,
@@ -255,16 +244,56 @@ class ProximityTaskService:
         query_lng = query_place.lng
         logger.info(f"Geocoded '{location}' to ({query_lat}, {query_lng})")
 
-        # Step 2: Query all active tasks
+        # Step 2: Query all active tasks and keep those with a place
         tasks = await self.notion.query_tasks(
             exclude_statuses=["done", "cancelled", "deleted"],
             include_deleted=False,
         )
 
-        # Step 3: Find tasks with places and calculate distances
+        task_places: list[tuple[dict[str, Any], str]] = []
+        for task_data in tasks:
+            props = task_data.get("properties", {})
+            place_ids_prop = props.get("place_ids", {})
+            place_relations = place_ids_prop.get("relation", [])
+            place_ids = [rel["id"] for rel in place_relations if "id" in rel]
+            if not place_ids:
+                # Task has no associated place
+                continue
+            # The first place is the task's primary location
+            # TODO: Handle multiple places per task
+            task_places.append((task_data, place_ids[0]))
+
+        if not task_places:
+            return ProximityResult(
+                success=True,
+                query_location=location,
+                query_lat=query_lat,
+                query_lng=query_lng,
+            )
+
+        # Step 3: Make sure every task place is indexed, then radius-query the index
+        wanted = {place_id for _, place_id in task_places}
+        known = self.place_index.get_many(wanted)
+        missing = [place_id for place_id in wanted if place_id not in known]
+        if missing:
+            await self._index_places(missing)
+
+        in_range = {
+            place.place_id: (place, distance)
+            for place, distance in self.place_index.query_radius(
+                query_lat, query_lng, self.max_distance, place_ids=wanted
+            )
+        }
+
         nearby_tasks: list[NearbyTask] = []
+        coordinates: dict[str, tuple[float, float]] = {}
+
+        for task_data, place_id in task_places:
+            hit = in_range.get(place_id)
+            if hit is None:
+                continue
+            place, distance = hit
 
-        for task_data in tasks:
             props = task_data.get("properties", {})
             task_id = task_data.get("id", "")
 
@@ -285,77 +314,6 @@ class ProximityTaskService:
             due_date_data = due_date_prop.get("date")
             due_date = due_date_data.get("start") if due_date_data else None
 
-            # Extract place_ids (relation property)
-            place_ids_prop = props.get("place_ids", {})
-            place_relations = place_ids_prop.get("relation", [])
-            place_ids = [rel["id"] for rel in place_relations if "id" in rel]
-
-            if not place_ids:
-                # Task has no associated place
-                continue
-
-            # Get place details for the first place (primary location)
-            # TODO: Handle multiple places per task
-            place_id = place_ids[0]
-            place_data = await self.notion.get_place(place_id)
-
-            if not place_data:
-                logger.warning(f"Could not fetch place {place_id} for task {task_id}")
-                continue
-
-            place_props = place_data.get("properties", {})
-
-            # Extract place name
-            place_name_prop = place_props.get("name", {})
-            place_name_list = place_name_prop.get("title", [])
-            place_name = place_name_list[0]["text"]["content"] if place_name_list else ""
-
-            # Extract place address
-            place_address_prop = place_props.get("address", {})
-            place_address_text = place_address_prop.get("rich_text", [])
-            place_address = place_address_text[0]["text"]["content"] if place_address_text else None
-
-            # Extract place coordinates
-            lat_prop = place_props.get("lat", {})
-            place_lat = lat_prop.get("number")
-
-            lng_prop = place_props.get("lng", {})
-            place_lng = lng_prop.get("number")
-
-            if place_lat is None or place_lng is None:
-                # Place not geocoded - try to geocode it now
-                if place_address:
-                    place_details = await self.maps.geocode(place_address)
-                    if place_details:
-                        place_lat = place_details.lat
-                        place_lng = place_details.lng
-                elif place_name:
-                    place_details = await self.maps.search_place(place_name)
-                    if place_details:
-                        place_lat = place_details.lat
-                        place_lng = place_details.lng
-
-            if place_lat is None or place_lng is None:
-                logger.warning(f"Place {place_name} has no coordinates and could not be geocoded")
-                continue
-
-            # Calculate distance using Haversine (fast, no API call)
-            distance_meters = int(haversine_distance(query_lat, query_lng, place_lat, place_lng))
-
-            # Skip if too far
-            if distance_meters > self.max_distance:
-                continue
-
-            # Optionally get travel time via Maps API
-            duration_seconds = None
-            if include_travel_time:
-                travel_time = await self.maps.get_travel_time(
-                    origin=(query_lat, query_lng),
-                    destination=(place_lat, place_lng),
-                )
-                if travel_time:
-                    duration_seconds = travel_time.duration_seconds
-
             nearby_tasks.append(
                 NearbyTask(
                     task_id=task_id,
@@ -364,17 +322,31 @@ class ProximityTaskService:
                     priority=priority,
                     due_date=due_date,
                     place_id=place_id,
-                    place_name=place_name,
-                    place_address=place_address,
-                    distance_meters=distance_meters,
-                    duration_seconds=duration_seconds,
+                    place_name=place.name,
+                    place_address=place.address,
+                    distance_meters=int(distance),
                 )
             )
+            coordinates[task_id] = (place.lat, place.lng)
 
         # Step 4: Sort by distance and limit results
         nearby_tasks.sort(key=lambda t: t.distance_meters)
         nearby_tasks = nearby_tasks[:max_results]
 
+        # Step 5: Optionally get travel times for the results in one Maps lookup
+        if include_travel_time and nearby_tasks:
+            from assistant.google.maps import TravelTimeBatcher
+
+            origin = (query_lat, query_lng)
+            batcher = TravelTimeBatcher(self.maps)
+            for task in nearby_tasks:
+                batcher.add(origin, coordinates[task.task_id])
+            await batcher.resolve()
+            for task in nearby_tasks:
+                travel_time = batcher.get(origin, coordinates[task.task_id])
+                if travel_time:
+                    task.duration_seconds = travel_time.duration_seconds
+
         return ProximityResult(
             success=True,
             query_location=location,
@@ -383,6 +355,68 @@ class ProximityTaskService:
             tasks=nearby_tasks,
         )
 
+    async def _index_places(self, place_ids: list[str]) -> None:
+        """Fetch places missing from the index and add those with coordinates.
+
+        Places the background geocoder has not reached yet are geocoded from
+        their address or name; places that cannot be located are left out of
+        the index.
+        """
+        assert self.notion is not None
+        semaphore = asyncio.Semaphore(PLACE_FETCH_CONCURRENCY)
+
+        async def index_one(place_id: str) -> None:
+            async with semaphore:
+                place = await self._locate_place(place_id)
+            if place is not None:
+                self.place_index.upsert(
+                    place.place_id, place.lat, place.lng, place.name, place.address
+                )
+
+        await asyncio.gather(*(index_one(place_id) for place_id in place_ids))
+
+    async def _locate_place(self, place_id: str) -> IndexedPlace | None:
+        """Read a place from Notion and resolve its coordinates."""
+        from assistant.services.place_geocoder import PlaceGeocodingService, parse_place_page
+
+        assert self.notion is not None
+        try:
+            place_data = await self.notion.get_place(place_id)
+        except Exception as e:
+            logger.warning(f"Could not fetch place {place_id}: {e}")
+            return None
+
+        if not place_data:
+            logger.warning(f"Could not fetch place {place_id}")
+            return None
+
+        place_name, place_address, place_lat, place_lng = parse_place_page(place_data)
+
+        if (place_lat is None or place_lng is None) and self.maps:
+            # Not back-filled yet: geocode now, persisting the result (or the
+            # failure) so later queries do not repeat the lookup
+            geocoder = PlaceGeocodingService(
+                notion_client=self.notion,
+                maps_client=self.maps,
+                place_index=self.place_index,
+            )
+            place_details = await geocoder.geocode_place(place_id, place_name, place_address)
+            if place_details:
+                place_lat = place_details.lat
+                place_lng = place_details.lng
+
+        if place_lat is None or place_lng is None:
+            logger.warning(f"Place {place_name} has no coordinates and could not be geocoded")
+            return None
+
+        return IndexedPlace(
+            place_id=place_id,
+            lat=place_lat,
+            lng=place_lng,
+            name=place_name,
+            address=place_address,
+        )
+
     async def handle_proximity_query(self, text: str) -> ProximityResult | None:
         """Handle a user's proximity query.
 
@@ -0,0 +1,279 @@
+"""Background sync loop for the local Notion replica.
+
+Keeps assistant.notion.replica.NotionReplica current so that NotionClient
+reads can be served locally:
+- Incremental syncs pull only pages whose last_edited_time is at or after the
+  stored watermark (Notion timestamps are minute-granular, so the overlap is
+  re-applied idempotently).
+- A periodic full resync replaces each database's snapshot, which is how
+  pages deleted or archived in the Notion UI disappear from the replica.
+
+If Notion is unreachable the replica keeps serving its last snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from assistant.config import settings
+from assistant.notion.client import NotionClient, iter_query_results
+from assistant.notion.replica import (
+    REPLICATED_DATABASES,
+    NotionReplica,
+    database_id_for,
+    get_notion_replica,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default seconds between incremental syncs
+DEFAULT_SYNC_INTERVAL = 60
+
+# Default seconds between full resyncs
+DEFAULT_FULL_SYNC_INTERVAL = 3600
+
+
+@dataclass
+class ReplicaSyncResult:
+    """Result of a replica sync cycle."""
+
+    timestamp: datetime
+    pages_synced: dict[str, int] = field(default_factory=dict)
+    full_syncs: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """True if every database synced without errors."""
+        return len(self.errors) == 0
+
+
+class ReplicaSyncService:
+    """Background service that keeps the Notion replica in sync.
+
+    Follows the same lifecycle pattern as HeartbeatService:
+    - start() runs an initial sync and begins the background loop
+    - stop() gracefully shuts down
+    """
+
+    def __init__(
+        self,
+        replica: NotionReplica | None = None,
+        notion_client: NotionClient | None = None,
+        sync_interval: int = DEFAULT_SYNC_INTERVAL,
+        full_sync_interval: int = DEFAULT_FULL_SYNC_INTERVAL,
+    ):
+        """Initialize the sync service.
+
+        Args:
+            replica: Replica to keep in sync (defaults to the module singleton)
+            notion_client: Client used to fetch pages (created if not provided)
+            sync_interval: Seconds between incremental syncs
+            full_sync_interval: Seconds between full resyncs
+        """
+        self._replica = replica
+        self._notion = notion_client
+        self._interval = sync_interval
+        self._full_interval = full_sync_interval
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+        self._last_result: ReplicaSyncResult | None = None
+
+    @property
+    def replica(self) -> NotionReplica | None:
+        """Get the replica, resolving the singleton lazily."""
+        if self._replica is None:
+            self._replica = get_notion_replica()
+        return self._replica
+
+    @property
+    def is_configured(self) -> bool:
+        """Check if the replica is enabled and Notion is configured."""
+        return bool(settings.notion_replica_enabled and settings.has_notion)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the sync loop is running."""
+        return self._running
+
+    @property
+    def last_result(self) -> ReplicaSyncResult | None:
+        """Get the last sync result."""
+        return self._last_result
+
+    def _get_notion(self) -> NotionClient:
+        if self._notion is None:
+            self._notion = NotionClient()
+        return self._notion
+
+    def _needs_full_sync(self, replica: NotionReplica, db_type: str) -> bool:
+        last_full = replica.get_last_full_sync(db_type)
+        if last_full is None or replica.get_watermark(db_type) is None:
+            return True
+        return datetime.now(UTC) - last_full >= timedelta(seconds=self._full_interval)
+
+    async def _fetch_pages(
+        self,
+        db_id: str,
+        since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch all pages from a database, optionally edited since a watermark."""
+        body: dict[str, Any] = {}
+        if since:
+            body["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": since},
+            }
+
+        # The sync must see Notion itself, never the replica it is filling
+        notion = self._get_notion()
+        return [
+            page
+            async for page in iter_query_results(notion._request, f"/databases/{db_id}/query", body)
+        ]
+
+    async def sync_database(self, db_type: str, full: bool | None = None) -> int:
+        """Sync a single database into the replica.
+
+        Args:
+            db_type: Replicated database type
+            full: Force (True) or skip (False) a full resync; None decides by age
+
+        Returns:
+            Number of pages fetched from Notion
+        """
+        replica = self.replica
+        db_id = database_id_for(db_type)
+        if replica is None or not db_id:
+            return 0
+
+        if full is None:
+            full = self._needs_full_sync(replica, db_type)
+
+        started_at = datetime.now(UTC).isoformat()
+        previous = replica.get_watermark(db_type)
+        pages = await self._fetch_pages(db_id, since=None if full else previous)
+
+        if full:
+            await replica.areplace_all(db_type, pages)
+        else:
+            await replica.aapply_pages(db_type, pages)
+
+        edited = [p["last_edited_time"] for p in pages if p.get("last_edited_time")]
+        watermark = max(edited + ([previous] if previous else [])) if edited else previous
+        await replica.aset_sync_state(db_type, watermark or started_at, full=full)
+
+        logger.debug(
+            "Replica %s sync of %s: %d pages",
+            "full" if full else "incremental",
+            db_type,
+            len(pages),
+        )
+        return len(pages)
+
+    async def sync_now(self, full: bool | None = None) -> ReplicaSyncResult:
+        """Run one sync cycle over every replicated database."""
+        result = ReplicaSyncResult(timestamp=datetime.now(UTC))
+        replica = self.replica
+        if replica is None:
+            result.errors.append("Replica disabled")
+            self._last_result = result
+            return result
+
+        for db_type in REPLICATED_DATABASES:
+            try:
+                was_full = full if full is not None else self._needs_full_sync(replica, db_type)
+                result.pages_synced[db_type] = await self.sync_database(db_type, full=was_full)
+                if was_full:
+                    result.full_syncs.append(db_type)
+            except Exception as e:
+                logger.warning("Replica sync of %s failed: %s", db_type, e)
+                result.errors.append(f"{db_type}: {e}")
+
+        self._last_result = result
+        return result
+
+    async def start(self) -> None:
+        """Start the replica sync loop."""
+        if not self.is_configured:
+            logger.info("Notion replica not enabled (NOTION_REPLICA_ENABLED=false)")
+            return
+
+        if self._running:
+            logger.warning("Replica sync already running")
+            return
+
+        self._running = True
+        logger.info("Starting Notion replica sync (interval: %ds)", self._interval)
+
+        # Initial sync so reads can be served locally straight away
+        await self.sync_now()
+
+        self._task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self) -> None:
+        """Stop the replica sync loop."""
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._notion:
+            await self._notion.close()
+            self._notion = None
+
+        logger.info("Notion replica sync stopped")
+
+    async def _sync_loop(self) -> None:
+        """Background loop that syncs periodically."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._interval)
+                if self._running:
+                    await self.sync_now()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception("Error in replica sync loop: %s", e)
+
+
+# Module-level singleton
+_sync_service: ReplicaSyncService | None = None
+
+
+def get_replica_sync_service() -> ReplicaSyncService:
+    """Get or create the replica sync service singleton."""
+    global _sync_service
+    if _sync_service is None:
+        _sync_service = ReplicaSyncService(
+            sync_interval=settings.notion_replica_sync_interval,
+            full_sync_interval=settings.notion_replica_full_sync_interval,
+        )
+    return _sync_service
+
+
+async def start_replica_sync() -> None:
+    """Start the replica sync loop (convenience function)."""
+    await get_replica_sync_service().start()
+
+
+async def stop_replica_sync() -> None:
+    """Stop the replica sync loop (convenience function)."""
+    await get_replica_sync_service().stop()
+
+
+async def sync_replica_now(full: bool | None = None) -> ReplicaSyncResult:
+    """Trigger an immediate replica sync (convenience function)."""
+    return await get_replica_sync_service().sync_now(full=full)
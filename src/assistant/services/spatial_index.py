@@ -0,0 +1,349 @@
+"""Persistent geohash index of place coordinates.
+
+Proximity queries ("What can I do near X?") used to fetch every task's place
+from Notion, geocode places without coordinates and compute a haversine
+distance per task, all on every query. This index keeps each place's
+coordinates in SQLite, keyed by geohash, so a query for "places within R
+metres of X" only touches the grid cells that overlap the search circle:
+    1. pick a geohash precision whose cells are at least as large as R
+    2. enumerate the (few) cells covering the circle's bounding box
+    3. range-scan those cell prefixes and the bounding box in SQL
+    4. compute exact distances for the survivors only
+
+The index is maintained by PlacesService when places are created or
+enriched, and backfilled by the proximity service for places it has not
+seen yet. Entries older than INDEX_MAX_AGE_SECONDS are treated as missing so
+coordinates edited directly in Notion are eventually picked up.
+
+The same database records places that could not be geocoded, with an
+exponential retry backoff, so the background geocoder and query-time lookups
+do not keep re-geocoding places Maps cannot find.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from assistant.config import settings
+from assistant.sqlite_db import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_METERS = 6371000
+
+# Stored geohash length (~1.2 km x 0.6 km cells)
+GEOHASH_PRECISION = 6
+
+# Re-read entries from Notion after a week
+INDEX_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# Backoff after a failed geocode: doubles per attempt, capped at a week
+GEOCODE_RETRY_BASE_SECONDS = 3600
+GEOCODE_RETRY_MAX_SECONDS = 7 * 24 * 3600
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+PLACE_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS places (
+    place_id TEXT PRIMARY KEY,
+    geohash TEXT NOT NULL,
+    lat REAL NOT NULL,
+    lng REAL NOT NULL,
+    name TEXT NOT NULL,
+    address TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_places_geohash ON places (geohash);
+CREATE TABLE IF NOT EXISTS geocode_failures (
+    place_id TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    last_error TEXT NOT NULL,
+    retry_at REAL NOT NULL
+);
+"""
+
+
+def get_place_index_path() -> Path:
+    """Get path to the on-disk place index."""
+    return Path(settings.data_dir).expanduser() / "index" / "places.db"
+
+
+def geohash_encode(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode coordinates as a geohash string."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        rng, coord = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision: int) -> tuple[float, float]:
+    """(height, width) of a geohash cell in degrees."""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / 2**lat_bits, 360.0 / 2**lng_bits
+
+
+def covering_cells(
+    min_lat: float, min_lng: float, max_lat: float, max_lng: float, precision: int
+) -> set[str]:
+    """Geohash cells of the given precision that overlap a bounding box."""
+    height, width = geohash_cell_size(precision)
+    cells = set()
+    lat = min_lat
+    while True:
+        lng = min_lng
+        while True:
+            cells.add(geohash_encode(lat, lng, precision))
+            if lng >= max_lng:
+                break
+            lng = min(lng + width, max_lng)
+        if lat >= max_lat:
+            break
+        lat = min(lat + height, max_lat)
+    return cells
+
+
+def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in meters."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    delta_phi = math.radians(lat2 - lat1)
+    delta_lambda = math.radians(lng2 - lng1)
+
+    a = (
+        math.sin(delta_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+    )
+    return EARTH_RADIUS_METERS * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+@dataclass
+class IndexedPlace:
+    """A place's coordinates as stored in the index."""
+
+    place_id: str
+    lat: float
+    lng: float
+    name: str = ""
+    address: str | None = None
+
+
+class PlaceSpatialIndex:
+    """SQLite-backed geohash index of place coordinates."""
+
+    def __init__(self, path: Path | None = None, persist: bool = True):
+        """Initialize the index.
+
+        Args:
+            path: SQLite path (defaults to data_dir/index/places.db)
+            persist: Keep the index on disk; False for an in-memory index
+        """
+        self.path: Path | None = (path or get_place_index_path()) if persist else None
+        self._conn: sqlite3.Connection | None = None
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the database on first use (in memory if the file is unusable)."""
+        if self._conn is None:
+            conn = open_sqlite(self.path, PLACE_INDEX_SCHEMA) if self.path else None
+            if conn is None:
+                self.path = None
+                conn = open_sqlite(None, PLACE_INDEX_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        row = self._db().execute("SELECT COUNT(*) FROM places").fetchone()
+        return int(row[0]) if row else 0
+
+    def upsert(
+        self,
+        place_id: str,
+        lat: float,
+        lng: float,
+        name: str = "",
+        address: str | None = None,
+    ) -> None:
+        """Add or update a place's coordinates."""
+        try:
+            conn = self._db()
+            conn.execute(
+                "INSERT OR REPLACE INTO places "
+                "(place_id, geohash, lat, lng, name, address, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (place_id, geohash_encode(lat, lng), lat, lng, name, address, time.time()),
+            )
+            conn.execute("DELETE FROM geocode_failures WHERE place_id = ?", (place_id,))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Place index write failed for %s: %s", place_id, e)
+
+    def remove(self, place_id: str) -> None:
+        """Drop a place from the index."""
+        conn = self._db()
+        conn.execute("DELETE FROM places WHERE place_id = ?", (place_id,))
+        conn.commit()
+
+    def record_geocode_failure(self, place_id: str, error: str = "") -> float:
+        """Record a failed geocode and schedule the next attempt.
+
+        Returns:
+            Timestamp before which the place should not be geocoded again
+        """
+        conn = self._db()
+        row = conn.execute(
+            "SELECT attempts FROM geocode_failures WHERE place_id = ?", (place_id,)
+        ).fetchone()
+        attempts = (row[0] if row else 0) + 1
+        delay = min(GEOCODE_RETRY_BASE_SECONDS * 2 ** (attempts - 1), GEOCODE_RETRY_MAX_SECONDS)
+        retry_at = time.time() + delay
+        conn.execute(
+            "INSERT OR REPLACE INTO geocode_failures (place_id, attempts, last_error, retry_at) "
+            "VALUES (?, ?, ?, ?)",
+            (place_id, attempts, error, retry_at),
+        )
+        conn.commit()
+        return retry_at
+
+    def geocode_backoff(self, place_ids: Iterable[str]) -> set[str]:
+        """Places whose last geocode failed and are not yet due for a retry."""
+        ids = list(dict.fromkeys(place_ids))
+        if not ids:
+            return set()
+        now = time.time()
+        blocked: set[str] = set()
+        conn = self._db()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT place_id FROM geocode_failures WHERE place_id IN ({marks}) "
+                "AND retry_at > ?",
+                (*chunk, now),
+            ).fetchall()
+            blocked.update(row[0] for row in rows)
+        return blocked
+
+    def get_many(
+        self, place_ids: Iterable[str], max_age: float = INDEX_MAX_AGE_SECONDS
+    ) -> dict[str, IndexedPlace]:
+        """Look up indexed places, skipping entries older than max_age."""
+        ids = list(dict.fromkeys(place_ids))
+        if not ids:
+            return {}
+        cutoff = time.time() - max_age
+        found: dict[str, IndexedPlace] = {}
+        conn = self._db()
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT place_id, lat, lng, name, address FROM places "
+                f"WHERE place_id IN ({marks}) AND updated_at > ?",
+                (*chunk, cutoff),
+            ).fetchall()
+            for row in rows:
+                found[row[0]] = IndexedPlace(*row)
+        return found
+
+    def query_radius(
+        self,
+        lat: float,
+        lng: float,
+        radius_meters: float,
+        place_ids: Iterable[str] | None = None,
+    ) -> list[tuple[IndexedPlace, float]]:
+        """Places within radius_meters of a point, nearest first.
+
+        Args:
+            lat, lng: Centre of the search circle
+            radius_meters: Search radius
+            place_ids: Optional restriction to these places
+
+        Returns:
+            (place, distance in meters) pairs sorted by distance
+        """
+        lat_delta = math.degrees(radius_meters / EARTH_RADIUS_METERS)
+        cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+        lng_delta = min(180.0, lat_delta / cos_lat)
+        min_lat, max_lat = max(-90.0, lat - lat_delta), min(90.0, lat + lat_delta)
+        min_lng, max_lng = max(-180.0, lng - lng_delta), min(180.0, lng + lng_delta)
+
+        # Coarsest precision whose cells are no smaller than the search box
+        precision = 1
+        for candidate in range(GEOHASH_PRECISION, 0, -1):
+            height, width = geohash_cell_size(candidate)
+            if height >= 2 * lat_delta and width >= 2 * lng_delta:
+                precision = candidate
+                break
+        cells = covering_cells(min_lat, min_lng, max_lat, max_lng, precision)
+
+        clauses = " OR ".join("(geohash >= ? AND geohash < ?)" for _ in cells)
+        params: list[object] = []
+        for cell in sorted(cells):
+            params.extend([cell, cell + "~"])
+        rows = (
+            self._db()
+            .execute(
+                "SELECT place_id, lat, lng, name, address FROM places "
+                f"WHERE ({clauses}) AND lat BETWEEN ? AND ? AND lng BETWEEN ? AND ?",
+                (*params, min_lat, max_lat, min_lng, max_lng),
+            )
+            .fetchall()
+        )
+
+        allowed = set(place_ids) if place_ids is not None else None
+        results = []
+        for row in rows:
+            if allowed is not None and row[0] not in allowed:
+                continue
+            distance = haversine_distance(lat, lng, row[1], row[2])
+            if distance <= radius_meters:
+                results.append((IndexedPlace(*row), distance))
+        results.sort(key=lambda item: item[1])
+        return results
+
+
+# Module-level singleton
+_index: PlaceSpatialIndex | None = None
+
+
+def get_place_index() -> PlaceSpatialIndex | None:
+    """Get the shared on-disk place index, or None if it is disabled."""
+    global _index
+    if not settings.place_index_enabled:
+        return None
+    if _index is None:
+        _index = PlaceSpatialIndex()
+    return _index
@@ -11,6 +11,7 @@ from pathlib import Path
 import httpx
 
 from assistant.config import settings
+from assistant.http_pool import get_shared_client
 
 
 @dataclass
@@ -163,19 +164,29 @@ class WhisperTranscriber:
             "file": (filename, audio_data, self._get_content_type(filename)),
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
+        shared = get_shared_client()
+        if shared is not None:
+            response = await shared.post(
                 self.API_URL,
                 headers=headers,
                 data=data,
                 files=files,
+                timeout=self.timeout,
             )
-
-            if response.status_code != 200:
-                error_detail = response.text
-                raise TranscriptionError(f"API error {response.status_code}: {error_detail}")
-
-            result = response.json()
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(
+                    self.API_URL,
+                    headers=headers,
+                    data=data,
+                    files=files,
+                )
+
+        if response.status_code != 200:
+            error_detail = response.text
+            raise TranscriptionError(f"API error {response.status_code}: {error_detail}")
+
+        result = response.json()
 
         # Extract results
         text = result.get("text", "").strip()
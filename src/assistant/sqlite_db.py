@@ -0,0 +1,59 @@
+"""Shared opener for the local SQLite caches and indexes.
+
+The LLM cache, Maps place and travel-time caches, place spatial index,
+idempotency index and Notion replica each keep a small SQLite file under
+data_dir. They all open it the same way - create the parent directory,
+connect with WAL journaling, create the schema - and all treat the file as
+optional: if it cannot be opened they carry on without it, either memory
+only, on a private in-memory database, or (the replica) disabled so reads
+go to Notion.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import overload
+
+logger = logging.getLogger(__name__)
+
+
+@overload
+def open_sqlite(path: None, schema: str) -> sqlite3.Connection: ...
+
+
+@overload
+def open_sqlite(path: Path, schema: str) -> sqlite3.Connection | None: ...
+
+
+def open_sqlite(path: Path | None, schema: str) -> sqlite3.Connection | None:
+    """Open an SQLite database and create its schema.
+
+    Args:
+        path: Database file (parent directories are created), or None for a
+            private in-memory database
+        schema: SQL script of idempotent CREATE statements
+
+    Returns:
+        The connection, or None (after logging a warning) if the file
+        cannot be opened. An in-memory database always opens.
+    """
+    conn: sqlite3.Connection | None = None
+    try:
+        if path is None:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(schema)
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        if conn is not None:
+            conn.close()
+        if path is None:
+            raise
+        logger.warning("SQLite database %s unavailable: %s", path, e)
+        return None
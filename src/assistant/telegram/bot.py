@@ -5,8 +5,13 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 
 from assistant.config import settings
+from assistant.http_pool import close_http_pool, open_http_pool
+from assistant.notion.idempotency import start_idempotency_backfill, stop_idempotency_backfill
+from assistant.services.audit_writer import start_audit_writer, stop_audit_writer
 from assistant.services.email_scanner import start_email_scanner, stop_email_scanner
 from assistant.services.heartbeat import start_heartbeat, stop_heartbeat
+from assistant.services.place_geocoder import start_place_geocoding, stop_place_geocoding
+from assistant.services.replica_sync import start_replica_sync, stop_replica_sync
 from assistant.telegram.handlers import setup_handlers
 
 logger = logging.getLogger(__name__)
@@ -24,14 +29,25 @@ class SecondBrainBot:
 
     async def start(self) -> None:
         logger.info("Starting Second Brain bot...")
+        # Shared HTTP connection pool for Notion/Maps/WhatsApp/Whisper
+        await open_http_pool()
         # Start background services
+        await start_idempotency_backfill()  # One-time seed of dedupe keys from Notion
+        await start_audit_writer()  # Buffered audit log writes (if configured)
         await start_heartbeat()  # UptimeRobot monitoring (if configured)
+        await start_replica_sync()  # Local Notion replica (if enabled)
         await start_email_scanner()  # Email intelligence scanning (if configured)
+        await start_place_geocoding()  # Coordinate back-fill for places (if configured)
         try:
             await self.dp.start_polling(self.bot)
         finally:
+            await stop_place_geocoding()
             await stop_email_scanner()
+            await stop_replica_sync()
             await stop_heartbeat()
+            await stop_audit_writer()  # Flushes buffered entries before the pool closes
+            await stop_idempotency_backfill()
+            await close_http_pool()
             await self.bot.session.close()
 
     async def stop(self) -> None:
@@ -7,6 +7,7 @@ All messages are processed through the MessageProcessor pipeline.
 import logging
 from datetime import UTC, datetime
 from io import BytesIO
+from typing import Any
 
 from aiogram import Bot, Dispatcher, F, Router
 from aiogram.filters import Command, CommandStart
@@ -141,25 +142,31 @@ async def cmd_setup_google(message: Message) -> None:
 @router.message(Command("today"))
 async def cmd_today(message: Message) -> None:
     """Handle /today command - show today's schedule and due tasks."""
+    from assistant.services.briefing import load_fresh_snapshot
+
     try:
-        today_message = await _generate_today_message()
+        # A recent pre-computed briefing saves the Notion query for due tasks;
+        # the calendar is always fetched live
+        snapshot = load_fresh_snapshot()
+        due_tasks = snapshot.section_value("tasks_today") if snapshot else None
+        today_message = await _generate_today_message(due_tasks)
         await message.answer(today_message, parse_mode="Markdown")
     except Exception as e:
         logger.exception(f"Today command failed: {e}")
         await message.answer("Sorry, couldn't fetch today's schedule. Please try again later.")
 
 
-async def _generate_today_message() -> str:
+async def _generate_today_message(due_tasks: list[dict[str, Any]] | None = None) -> str:
     """Generate today's schedule message with calendar events and due tasks.
 
     Returns formatted message showing:
     - Today's calendar events
     - Tasks due today
-    """
-    from datetime import timedelta
-
-    from assistant.notion.client import NotionClient
 
+    Args:
+        due_tasks: Tasks due today already fetched (from a briefing snapshot);
+            queried from Notion if not provided
+    """
     sections = []
 
     # Get calendar events
@@ -183,34 +190,21 @@ async def _generate_today_message() -> str:
         # Calendar not configured is ok, continue with tasks
 
     # Get tasks due today
-    client = NotionClient()
-    try:
-        today = datetime.now(UTC).date()
-        today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=UTC)
-        today_end = datetime.combine(today, datetime.max.time()).replace(tzinfo=UTC)
-
-        due_tasks = await client.query_tasks(
-            due_before=today_end + timedelta(days=1),
-            due_after=today_start - timedelta(days=1),
-            exclude_statuses=["done", "cancelled"],
-            limit=10,
-        )
-
-        if due_tasks:
-            lines = ["✅ **DUE TODAY**"]
-            for task in due_tasks[:10]:
-                title = _extract_task_prop(task, "title")
-                priority = _extract_task_prop(task, "priority")
-
-                if title:
-                    line = f"• {title}"
-                    if priority in ("urgent", "high"):
-                        line = f"🔴 {line[2:]}"  # Replace bullet with priority
-                    lines.append(line)
-            sections.append("\n".join(lines))
-
-    finally:
-        await client.close()
+    if due_tasks is None:
+        due_tasks = await _fetch_tasks_due_today()
+
+    if due_tasks:
+        lines = ["✅ **DUE TODAY**"]
+        for task in due_tasks[:10]:
+            title = _extract_task_prop(task, "title")
+            priority = _extract_task_prop(task, "priority")
+
+            if title:
+                line = f"• {title}"
+                if priority in ("urgent", "high"):
+                    line = f"🔴 {line[2:]}"  # Replace bullet with priority
+                lines.append(line)
+        sections.append("\n".join(lines))
 
     # Build final message
     if sections:
@@ -231,6 +225,28 @@ async def _generate_today_message() -> str:
         )
 
 
+async def _fetch_tasks_due_today() -> list[dict[str, Any]]:
+    """Query Notion for open tasks due around today."""
+    from datetime import timedelta
+
+    from assistant.notion.client import NotionClient
+
+    client = NotionClient()
+    try:
+        today = datetime.now(UTC).date()
+        today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=UTC)
+        today_end = datetime.combine(today, datetime.max.time()).replace(tzinfo=UTC)
+
+        return await client.query_tasks(
+            due_before=today_end + timedelta(days=1),
+            due_after=today_start - timedelta(days=1),
+            exclude_statuses=["done", "cancelled"],
+            limit=10,
+        )
+    finally:
+        await client.close()
+
+
 def _format_event_time(start: datetime, end: datetime) -> str:
     """Format event time range for display."""
     # Check if all-day event (start and end at midnight)
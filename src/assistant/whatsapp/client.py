@@ -20,6 +20,8 @@ from typing import Any
 
 import httpx
 
+from assistant.http_pool import get_shared_client
+
 logger = logging.getLogger(__name__)
 
 # WhatsApp Cloud API base URL
@@ -140,20 +142,25 @@ class WhatsAppClient:
         """Check if WhatsApp credentials are configured."""
         return bool(self.phone_number_id and self.access_token)
 
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers sent with every Graph API request."""
+        return {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json",
+        }
+
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get the shared pooled HTTP client, or create a private one."""
+        shared = get_shared_client()
+        if shared is not None:
+            return shared
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=DEFAULT_TIMEOUT,
-                headers={
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                },
-            )
+            self._client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT)
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the private HTTP client (the shared pool is closed at shutdown)."""
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -343,6 +350,8 @@ class WhatsAppClient:
             # Step 1: Get media URL
             url_response = await client.get(
                 f"https://graph.facebook.com/{self.api_version}/{media_id}",
+                headers=self.headers,
+                timeout=DEFAULT_TIMEOUT,
             )
             url_response.raise_for_status()
             media_url = url_response.json().get("url")
@@ -354,7 +363,9 @@ class WhatsAppClient:
                 )
 
             # Step 2: Download content
-            content_response = await client.get(media_url)
+            content_response = await client.get(
+                media_url, headers=self.headers, timeout=DEFAULT_TIMEOUT
+            )
             content_response.raise_for_status()
 
             return MediaDownloadResult(
@@ -395,6 +406,8 @@ class WhatsAppClient:
                     "status": "read",
                     "message_id": message_id,
                 },
+                headers=self.headers,
+                timeout=DEFAULT_TIMEOUT,
             )
             response.raise_for_status()
             return True
@@ -417,6 +430,8 @@ class WhatsAppClient:
             response = await client.post(
                 f"{self._base_url}/messages",
                 json=payload,
+                headers=self.headers,
+                timeout=DEFAULT_TIMEOUT,
             )
             response.raise_for_status()
 
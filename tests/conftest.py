@@ -0,0 +1,62 @@
+"""Shared test fixtures."""
+
+import pytest
+
+import assistant.notion.idempotency as notion_idempotency
+import assistant.notion.throttle as notion_throttle
+import assistant.services.llm_cache as llm_cache
+import assistant.services.llm_client as llm_client
+import assistant.services.spatial_index as spatial_index
+from assistant.notion.idempotency import IdempotencyIndex
+from assistant.services.llm_cache import LLMCache
+from assistant.services.llm_client import LLMClient
+from assistant.services.spatial_index import PlaceSpatialIndex
+
+
+@pytest.fixture(autouse=True)
+def reset_notion_throttle():
+    """Give each test a fresh Notion circuit breaker and rate limiter.
+
+    They are shared process-wide, so failures in one test would otherwise
+    open the circuit for the next.
+    """
+    notion_throttle._breaker = None
+    notion_throttle._limiter = None
+    yield
+    notion_throttle._breaker = None
+    notion_throttle._limiter = None
+
+
+@pytest.fixture(autouse=True)
+def memory_idempotency_index():
+    """Keep idempotency keys in memory, fresh for each test."""
+    index = IdempotencyIndex(persist=False)
+    notion_idempotency._index = index
+    yield index
+    notion_idempotency._index = None
+    index.close()
+
+
+@pytest.fixture(autouse=True)
+def memory_place_index():
+    """Keep the place spatial index in memory instead of under the real HOME."""
+    index = PlaceSpatialIndex(persist=False)
+    spatial_index._index = index
+    yield index
+    spatial_index._index = None
+    index.close()
+
+
+@pytest.fixture(autouse=True)
+def offline_llm_client():
+    """Use a provider-less LLM client and a memory-only LLM cache.
+
+    API keys in the developer's environment must not send test prompts to
+    real providers or write the response cache under the real HOME.
+    """
+    cache = LLMCache(persist=False)
+    llm_cache._cache = cache
+    llm_client._client = LLMClient(cache=cache)
+    yield llm_client._client
+    llm_cache._cache = None
+    llm_client._client = None
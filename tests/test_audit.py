@@ -3,6 +3,7 @@
 Tests AT-111 (every action logged) and AT-113 (idempotency).
 """
 
+import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -323,6 +324,20 @@ class TestConvenienceMethods:
         assert call_args.action_type == ActionType.SEND
         assert "calendar, tasks, inbox" in call_args.action_taken
 
+    @pytest.mark.asyncio
+    async def test_log_briefing_timings(self, audit_logger, mock_notion):
+        """Briefing timings list the slowest source first."""
+        await audit_logger.log_briefing_timings(
+            {"calendar": 0.5, "email": 2.25, "til": 0.1},
+            total_seconds=2.3,
+            timed_out=["til"],
+        )
+
+        call_args = mock_notion.create_log_entry.call_args[0][0]
+        assert call_args.action_taken.startswith("Generated morning briefing in 2.30s (email 2.25s")
+        assert "timed out: til" in call_args.action_taken
+        assert json.loads(call_args.interpretation)["calendar"] == 0.5
+
     @pytest.mark.asyncio
     async def test_log_error(self, audit_logger, mock_notion):
         """Log error creates correct entry."""
@@ -0,0 +1,265 @@
+"""Tests for the buffered audit log writer."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from assistant.notion.schemas import ActionType, LogEntry
+from assistant.notion.throttle import CircuitOpenError
+from assistant.services.audit import AuditLogger, DedupeResult
+from assistant.services.audit_writer import AuditLogWriter
+
+
+@pytest.fixture
+def notion():
+    client = MagicMock()
+    client.create_log_entry = AsyncMock(return_value="log-1")
+    client.close = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def writer(notion, tmp_path):
+    return AuditLogWriter(
+        notion_client=notion,
+        spool_path=tmp_path / "audit.jsonl",
+        batch_size=3,
+        flush_interval=60,
+    )
+
+
+@pytest.fixture
+def configured():
+    with patch("assistant.services.audit_writer.settings") as mock_settings:
+        mock_settings.audit_buffer_enabled = True
+        mock_settings.has_notion = True
+        yield
+
+
+def make_entry(key: str | None = None, action_taken: str = "Did something") -> LogEntry:
+    return LogEntry(action_type=ActionType.CAPTURE, idempotency_key=key, action_taken=action_taken)
+
+
+def spooled(writer: AuditLogWriter) -> list[dict]:
+    if not writer.spool_path.exists():
+        return []
+    return [json.loads(line) for line in writer.spool_path.read_text().splitlines()]
+
+
+class TestSubmit:
+    @pytest.mark.asyncio
+    async def test_rejected_when_not_running(self, writer):
+        assert not await writer.submit(make_entry())
+        assert writer.pending_count == 0
+        assert not writer.spool_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_accepted_entries_are_spooled(self, writer, notion, configured):
+        await writer.start()
+        entry = make_entry("telegram:1:2")
+
+        assert await writer.submit(entry)
+
+        assert writer.pending_count == 1
+        assert spooled(writer)[0]["id"] == entry.id
+        notion.create_log_entry.assert_not_called()
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_spool_is_written_off_the_event_loop(self, writer):
+        writer._running = True
+        threads = []
+        append_spool = writer._append_spool
+
+        def record_thread(entry):
+            threads.append(threading.current_thread())
+            append_spool(entry)
+
+        with patch.object(writer, "_append_spool", side_effect=record_thread):
+            assert await writer.submit(make_entry("a"))
+
+        assert threads and threads[0] is not threading.current_thread()
+        assert len(spooled(writer)) == 1
+
+
+class TestFlush:
+    @pytest.mark.asyncio
+    async def test_writes_and_clears_spool(self, writer, notion):
+        writer._running = True
+        await writer.submit(make_entry("a"))
+        await writer.submit(make_entry("b"))
+
+        result = await writer.flush()
+
+        assert result.written == 2
+        assert result.success
+        assert writer.pending_count == 0
+        assert not writer.spool_path.exists()
+        notion.create_log_entry.assert_awaited_with(
+            notion.create_log_entry.await_args.args[0], queue_offline=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_coalesces_repeated_keys(self, writer, notion):
+        writer._running = True
+        await writer.submit(make_entry("same", "first"))
+        await writer.submit(make_entry("same", "second"))
+        await writer.submit(make_entry(None))
+
+        result = await writer.flush()
+
+        assert result.written == 2
+        assert result.coalesced == 1
+        written = [call.args[0].action_taken for call in notion.create_log_entry.await_args_list]
+        assert "first" in written
+        assert "second" not in written
+
+    @pytest.mark.asyncio
+    async def test_failed_entries_stay_spooled(self, writer, notion):
+        writer._running = True
+        ok, bad = make_entry("ok"), make_entry("bad")
+        notion.create_log_entry.side_effect = lambda entry, **kwargs: (
+            _raise(RuntimeError("Notion down")) if entry is bad else "log-ok"
+        )
+        await writer.submit(ok)
+        await writer.submit(bad)
+
+        result = await writer.flush()
+
+        assert result.written == 1
+        assert result.failed == 1
+        assert not result.success
+        assert [record["id"] for record in spooled(writer)] == [bad.id]
+        assert spooled(writer)[0]["attempts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_entries_are_dead_lettered(self, notion, tmp_path):
+        writer = AuditLogWriter(
+            notion_client=notion, spool_path=tmp_path / "audit.jsonl", max_attempts=2
+        )
+        writer._running = True
+        notion.create_log_entry.side_effect = RuntimeError("validation failed")
+        entry = make_entry("bad")
+        await writer.submit(entry)
+
+        assert (await writer.flush()).failed == 1
+        result = await writer.flush()
+
+        assert result.failed == 0
+        assert result.dead_lettered == 1
+        assert not result.success
+        assert writer.pending_count == 0
+        assert not writer.spool_path.exists()
+        dead = [json.loads(line) for line in writer.failed_path.read_text().splitlines()]
+        assert dead[0]["id"] == entry.id
+        assert dead[0]["error"] == "validation failed"
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_does_not_spend_attempts(self, notion, tmp_path):
+        writer = AuditLogWriter(
+            notion_client=notion, spool_path=tmp_path / "audit.jsonl", max_attempts=1
+        )
+        writer._running = True
+        notion.create_log_entry.side_effect = CircuitOpenError("circuit open")
+        await writer.submit(make_entry("k"))
+
+        result = await writer.flush()
+
+        assert result.failed == 1
+        assert result.dead_lettered == 0
+        assert writer.pending_count == 1
+        assert not writer.failed_path.exists()
+
+
+def _raise(error: Exception):
+    raise error
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_start_skips_when_not_configured(self, writer):
+        with patch("assistant.services.audit_writer.settings") as mock_settings:
+            mock_settings.audit_buffer_enabled = False
+            await writer.start()
+
+        assert not writer.is_running
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_in_background(self, writer, notion, configured):
+        await writer.start()
+        for i in range(3):
+            await writer.submit(make_entry(f"k{i}"))
+
+        for _ in range(50):
+            if notion.create_log_entry.await_count == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        assert notion.create_log_entry.await_count == 3
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_buffer(self, writer, notion, configured):
+        await writer.start()
+        await writer.submit(make_entry("k"))
+
+        await writer.stop()
+
+        assert not writer.is_running
+        notion.create_log_entry.assert_awaited_once()
+        assert not writer.spool_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_start_recovers_spooled_entries(self, writer, notion, configured, tmp_path):
+        entry = make_entry("left-over")
+        lines = json.dumps(entry.model_dump(mode="json")) + "\n" + '{"torn'
+        writer.spool_path.write_text(lines)
+
+        await writer.start()
+        assert writer.pending_count == 1
+        await writer.stop()
+
+        assert notion.create_log_entry.await_args.args[0].id == entry.id
+
+    @pytest.mark.asyncio
+    async def test_attempts_survive_restart(self, notion, configured, tmp_path):
+        entry = make_entry("left-over")
+        spool_path = tmp_path / "audit.jsonl"
+        spool_path.write_text(json.dumps({**entry.model_dump(mode="json"), "attempts": 1}) + "\n")
+        notion.create_log_entry.side_effect = RuntimeError("Notion down")
+        writer = AuditLogWriter(notion_client=notion, spool_path=spool_path, max_attempts=2)
+
+        await writer.start()
+        await writer.stop()
+
+        assert not spool_path.exists()
+        assert json.loads(writer.failed_path.read_text())["id"] == entry.id
+
+
+class TestAuditLoggerIntegration:
+    @pytest.mark.asyncio
+    async def test_log_action_acknowledges_without_notion_call(self, writer, notion):
+        writer._running = True
+        logger_notion = MagicMock()
+        logger_notion.create_log_entry = AsyncMock(return_value="log-direct")
+        audit = AuditLogger(notion_client=logger_notion)
+
+        with patch("assistant.services.audit.get_audit_writer", return_value=writer):
+            entry = await audit.log_action(
+                action_type=ActionType.CREATE, idempotency_key="telegram:1:2"
+            )
+
+        assert entry.log_id is None
+        logger_notion.create_log_entry.assert_not_called()
+        assert writer.pending_count == 1
+        # Duplicate checks see the buffered key before it reaches Notion
+        with patch("assistant.services.audit.get_audit_writer", return_value=writer):
+            result, existing = await audit.check_idempotency("telegram:1:2")
+        assert result == DedupeResult.DUPLICATE
+        assert existing is not None
+        logger_notion._check_dedupe.assert_not_called()
@@ -1,5 +1,6 @@
 """Tests for the morning briefing generator."""
 
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,7 +9,11 @@ import pytest
 import pytz
 from assistant.services.briefing import (
     BriefingGenerator,
+    BriefingSnapshot,
+    BriefingSnapshotStore,
+    SectionResult,
     generate_briefing,
+    load_fresh_snapshot,
 )
 
 
@@ -1259,3 +1264,362 @@ class TestAT122TravelTimeInMorningBriefing:
             destination="123 Main St",
             mode="driving",
         )
+
+
+class TestBatchedTravelTimes:
+    """Travel times for all tasks and events come from batched matrix requests."""
+
+    def make_generator(self, mock_maps, mock_notion=None):
+        with patch("assistant.services.briefing.settings") as mock_settings:
+            mock_settings.has_notion = False
+            mock_settings.user_timezone = "America/Los_Angeles"
+            mock_settings.user_home_address = "Home"
+            mock_settings.google_maps_api_key = "test-key"
+            return BriefingGenerator(notion_client=mock_notion, maps_client=mock_maps)
+
+    @pytest.mark.asyncio
+    async def test_ten_tasks_need_one_maps_call(self):
+        from assistant.google.maps import TravelTime
+
+        la_tz = pytz.timezone("America/Los_Angeles")
+        tasks = [
+            {
+                "id": f"task-{i}",
+                "properties": {
+                    "title": {"title": [{"text": {"content": f"Errand {i}"}}]},
+                    "due_date": {
+                        "date": {"start": la_tz.localize(datetime(2026, 1, 13, 9 + i)).isoformat()}
+                    },
+                    "places": {"relation": [{"id": f"place-{i}"}]},
+                },
+            }
+            for i in range(10)
+        ]
+        mock_notion = AsyncMock()
+        mock_notion.get_place.side_effect = lambda pid: {
+            "properties": {"address": {"rich_text": [{"text": {"content": f"{pid} St"}}]}}
+        }
+        mock_maps = MagicMock()
+        mock_maps.get_travel_time = AsyncMock()
+        mock_maps.get_travel_time_matrix = AsyncMock(
+            return_value=[
+                [TravelTime("Home", f"place-{i} St", 1000, 600 * (i + 1)) for i in range(10)]
+            ]
+        )
+        generator = self.make_generator(mock_maps, mock_notion)
+
+        travel_info = await generator._calculate_travel_times_for_tasks(tasks)
+
+        mock_maps.get_travel_time_matrix.assert_awaited_once()
+        mock_maps.get_travel_time.assert_not_called()
+        assert len(travel_info) == 10
+        assert travel_info["task-2"].travel_time.duration_minutes == 30
+        assert travel_info["task-2"].leave_by.hour == 10
+        assert travel_info["task-2"].leave_by.minute == 30
+
+    @pytest.mark.asyncio
+    async def test_event_chain_reroutes_after_missing_leg(self):
+        from assistant.google.calendar import CalendarEvent
+        from assistant.google.maps import TravelTime
+
+        la_tz = pytz.timezone("America/Los_Angeles")
+        events = [
+            CalendarEvent(
+                event_id=f"event-{name}",
+                title=name,
+                start_time=la_tz.localize(datetime(2026, 1, 13, hour)),
+                end_time=la_tz.localize(datetime(2026, 1, 13, hour + 1)),
+                timezone="America/Los_Angeles",
+                attendees=[],
+                location=name,
+            )
+            for name, hour in [("A", 9), ("B", 11), ("C", 14)]
+        ]
+
+        async def matrix(origins, destinations, mode):
+            # Home -> A and A -> B resolve; B has no route so C is reached from A
+            return [
+                [
+                    TravelTime(o, d, 1000, 600) if (o, d) != ("A", "B") else None
+                    for d in destinations
+                ]
+                for o in origins
+            ]
+
+        mock_maps = MagicMock()
+        mock_maps.get_travel_time_matrix = AsyncMock(side_effect=matrix)
+        mock_maps.get_travel_time = AsyncMock()
+        generator = self.make_generator(mock_maps)
+
+        travel_info = await generator._calculate_travel_times_for_events(events)
+
+        mock_maps.get_travel_time_matrix.assert_awaited_once()
+        assert travel_info["event-A"].from_location == "Home"
+        assert "event-B" not in travel_info
+        assert travel_info["event-C"].from_location == "A"
+
+
+class TestConcurrentSections:
+    """Tests for concurrent section assembly with timeouts."""
+
+    def make_generator(self, mock_notion, **kwargs):
+        mock_calendar = MagicMock()
+        mock_calendar.is_authenticated.return_value = False
+        with patch("assistant.services.briefing.settings") as mock_settings:
+            mock_settings.has_notion = True
+            mock_settings.user_timezone = "UTC"
+            mock_settings.user_home_address = ""
+            return BriefingGenerator(
+                notion_client=mock_notion,
+                calendar_client=mock_calendar,
+                gmail_client=MagicMock(),
+                maps_client=None,
+                audit_logger=AsyncMock(),
+                **kwargs,
+            )
+
+    @pytest.mark.asyncio
+    async def test_sources_are_fetched_concurrently(self):
+        """Wall time is roughly the slowest source, not the sum."""
+        mock_notion = AsyncMock()
+
+        async def slow_query(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return []
+
+        mock_notion.query_tasks.side_effect = slow_query
+        mock_notion.query_inbox.side_effect = slow_query
+        mock_notion.query_patterns.side_effect = slow_query
+        mock_notion.get_important_emails.side_effect = slow_query
+        generator = self.make_generator(mock_notion)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await generator.generate_morning_briefing()
+
+        # Five 0.1s sources: sequential would take 0.5s
+        assert loop.time() - started < 0.3
+
+    @pytest.mark.asyncio
+    async def test_slow_section_shows_placeholder(self):
+        """A source exceeding its timeout becomes a placeholder."""
+        mock_notion = AsyncMock()
+        mock_notion.query_tasks.return_value = []
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_notion.query_inbox.side_effect = hang
+        generator = self.make_generator(mock_notion, section_timeout=0.05)
+
+        result = await generator.generate_morning_briefing()
+
+        assert "⚠️ **NEEDS CLARIFICATION**" in result
+        assert "Still loading" in result
+        assert "Reply /debrief" in result
+
+    @pytest.mark.asyncio
+    async def test_deadline_caps_total_time(self):
+        """Sections still running at the deadline become placeholders."""
+        mock_notion = AsyncMock()
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_notion.query_tasks.side_effect = hang
+        mock_notion.query_inbox.return_value = []
+        generator = self.make_generator(mock_notion, section_timeout=5, deadline=0.05)
+
+        result = await generator.generate_morning_briefing()
+
+        assert "✅ **DUE TODAY**" in result
+        assert "📊 **THIS WEEK**" in result
+        assert result.count("Still loading") == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_section_does_not_hide_others(self):
+        """One failing source still lets the other sections render."""
+        mock_notion = AsyncMock()
+        mock_notion.query_tasks.side_effect = Exception("tasks down")
+        mock_notion.query_inbox.return_value = [make_notion_inbox_item("unclear thing")]
+        generator = self.make_generator(mock_notion)
+
+        result = await generator.generate_morning_briefing()
+
+        assert "unclear thing" in result
+        assert "*Could not fetch data from Notion: tasks down*" in result
+
+    @pytest.mark.asyncio
+    async def test_failure_is_labelled_with_its_source(self):
+        """A Google failure is not reported as a Notion one."""
+        mock_notion = AsyncMock()
+        mock_notion.query_tasks.return_value = []
+        mock_notion.query_inbox.return_value = []
+        generator = self.make_generator(mock_notion)
+        generator._generate_calendar_section = AsyncMock(side_effect=Exception("calendar down"))
+        generator._generate_email_section = AsyncMock(side_effect=Exception("gmail down"))
+
+        result = await generator.generate_morning_briefing()
+
+        assert "*Could not fetch data from Google Calendar: calendar down*" in result
+        assert "*Could not fetch data from Gmail: gmail down*" in result
+        assert "from Notion" not in result
+
+    @pytest.mark.asyncio
+    async def test_travel_skipped_when_tasks_fail(self):
+        """Dependent travel-time node is skipped if its tasks failed."""
+        generator = self.make_generator(AsyncMock())
+        travel = AsyncMock(return_value={})
+
+        async def failing():
+            raise Exception("boom")
+
+        results = await generator._run_section_graph(
+            {"tasks_today": ((), failing), "task_travel": (("tasks_today",), travel)}
+        )
+
+        assert results["tasks_today"].status == "error"
+        assert results["task_travel"].status == "skipped"
+        travel.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_section_timings_are_audited(self):
+        """Per-source timings go to the audit log."""
+        mock_notion = AsyncMock()
+        mock_notion.query_tasks.return_value = []
+        mock_notion.query_inbox.return_value = []
+        generator = self.make_generator(mock_notion)
+
+        await generator.generate_morning_briefing()
+
+        call = generator.audit.log_briefing_timings.await_args
+        assert {"calendar", "tasks_today", "flagged", "til"} <= set(call.args[0])
+        assert call.kwargs["timed_out"] == []
+
+
+class TestBriefingSnapshots:
+    """Tests for pre-computed briefing snapshots."""
+
+    def make_generator(self, mock_notion, store):
+        mock_calendar = MagicMock()
+        mock_calendar.is_authenticated.return_value = False
+        with patch("assistant.services.briefing.settings") as mock_settings:
+            mock_settings.has_notion = True
+            mock_settings.user_timezone = "UTC"
+            mock_settings.user_home_address = ""
+            return BriefingGenerator(
+                notion_client=mock_notion,
+                calendar_client=mock_calendar,
+                gmail_client=MagicMock(),
+                maps_client=None,
+                audit_logger=AsyncMock(),
+                snapshot_store=store,
+            )
+
+    def make_notion(self):
+        mock_notion = AsyncMock()
+        mock_notion.query_tasks.return_value = [
+            make_notion_task("Task for today", due_date=datetime.now(pytz.UTC))
+        ]
+        mock_notion.query_inbox.return_value = []
+        mock_notion.query_patterns.return_value = []
+        mock_notion.get_important_emails.return_value = []
+        return mock_notion
+
+    @pytest.mark.asyncio
+    async def test_briefing_is_saved_as_snapshot(self, tmp_path):
+        store = BriefingSnapshotStore(tmp_path / "snapshot.json")
+        generator = self.make_generator(self.make_notion(), store)
+
+        text = await generator.generate_morning_briefing()
+
+        snapshot = store.load()
+        assert snapshot is not None
+        assert snapshot.text == text
+        assert snapshot.results["tasks_today"].ok
+        assert "calendar" not in snapshot.results  # volatile, never reused
+
+    @pytest.mark.asyncio
+    async def test_refresh_fetches_only_volatile_sections(self, tmp_path):
+        store = BriefingSnapshotStore(tmp_path / "snapshot.json")
+        await self.make_generator(self.make_notion(), store).generate_morning_briefing(
+            use_snapshot=False
+        )
+
+        mock_notion = self.make_notion()
+        generator = self.make_generator(mock_notion, store)
+        text = await generator.generate_morning_briefing()
+
+        assert "Task for today" in text
+        mock_notion.query_tasks.assert_not_called()
+        mock_notion.query_inbox.assert_not_called()
+        generator.calendar.is_authenticated.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_refetches_failed_sections(self, tmp_path):
+        store = BriefingSnapshotStore(tmp_path / "snapshot.json")
+        failing = self.make_notion()
+        failing.query_inbox.side_effect = Exception("inbox down")
+        await self.make_generator(failing, store).generate_morning_briefing(use_snapshot=False)
+
+        mock_notion = self.make_notion()
+        mock_notion.query_inbox.return_value = [make_notion_inbox_item("unclear thing")]
+        text = await self.make_generator(mock_notion, store).generate_morning_briefing()
+
+        mock_notion.query_inbox.assert_called_once()
+        mock_notion.query_tasks.assert_not_called()
+        assert "unclear thing" in text
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_is_rebuilt(self, tmp_path):
+        store = BriefingSnapshotStore(tmp_path / "snapshot.json")
+        old = datetime.now(pytz.UTC) - timedelta(hours=5)
+        store.save(
+            BriefingSnapshot(
+                date=datetime.now(pytz.UTC).date().isoformat(),
+                generated_at=old,
+                text="old",
+                results={"flagged": SectionResult("flagged", value=[])},
+            )
+        )
+        mock_notion = self.make_notion()
+
+        await self.make_generator(mock_notion, store).generate_morning_briefing()
+
+        mock_notion.query_inbox.assert_called_once()
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text("{not json")
+
+        assert BriefingSnapshotStore(path).load() is None
+
+    def test_load_fresh_snapshot_checks_age(self, tmp_path):
+        store = BriefingSnapshotStore(tmp_path / "snapshot.json")
+        now = datetime.now(pytz.UTC)
+        store.save(BriefingSnapshot(date=now.date().isoformat(), generated_at=now, text="hi"))
+
+        with (
+            patch("assistant.services.briefing.get_briefing_snapshot_store", return_value=store),
+            patch("assistant.services.briefing.settings") as mock_settings,
+        ):
+            mock_settings.user_timezone = "UTC"
+            assert load_fresh_snapshot().text == "hi"
+            assert load_fresh_snapshot(max_age=-1) is None
+
+    def test_section_value_skips_failed_and_volatile_sections(self):
+        snapshot = BriefingSnapshot(
+            date="2026-10-16",
+            generated_at=datetime.now(pytz.UTC),
+            text="",
+            results={
+                "tasks_today": SectionResult("tasks_today", status="timeout"),
+                "flagged": SectionResult("flagged", value=[]),
+                "calendar": SectionResult("calendar", value="📅 **TODAY**"),
+            },
+        )
+
+        assert snapshot.section_value("tasks_today") is None
+        assert snapshot.section_value("flagged") == []
+        assert snapshot.section_value("calendar") is None
+        assert snapshot.section_value("this_week") is None
@@ -0,0 +1,195 @@
+"""Tests for LLM email analysis (single and batched)."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from assistant.google.gmail import EmailMessage
+from assistant.services.email_intelligence import (
+    BATCH_ANALYSIS_SYSTEM_PROMPT,
+    EmailIntelligenceService,
+)
+from assistant.services.llm_cache import LLMCache
+from assistant.services.llm_client import LLMProvider, LLMResponse
+
+
+def make_email(message_id: str, snippet: str = "Hello") -> EmailMessage:
+    return EmailMessage(
+        message_id=message_id,
+        thread_id=f"thread-{message_id}",
+        subject=f"Subject {message_id}",
+        sender_name="Ann",
+        sender_email="ann@example.com",
+        snippet=snippet,
+        received_at=datetime(2026, 1, 12, tzinfo=UTC),
+        is_read=False,
+    )
+
+
+def llm_response(data: object) -> LLMResponse:
+    text = data if isinstance(data, str) else json.dumps(data)
+    return LLMResponse(text=text, provider=LLMProvider.OPENROUTER, model="m")
+
+
+def batch_item(index: int, score: int = 70) -> dict:
+    return {"id": index, "importance_score": score, "urgency": "normal", "category": "work"}
+
+
+def make_service(**kwargs) -> tuple[EmailIntelligenceService, MagicMock]:
+    llm_client = MagicMock()
+    llm_client.acomplete = AsyncMock()
+    llm_client.available_providers = [LLMProvider.OPENROUTER]
+    service = EmailIntelligenceService(model="m", llm_client=llm_client, **kwargs)
+    return service, llm_client
+
+
+class TestAnalyzeEmailAsync:
+    """Tests for EmailIntelligenceService.analyze_email_async."""
+
+    @pytest.mark.asyncio
+    async def test_uses_async_provider_call(self):
+        service, provider = make_service()
+        provider.acomplete.return_value = llm_response(
+            {"importance_score": 91, "urgency": "urgent"}
+        )
+
+        analysis = await service.analyze_email_async(make_email("m1"))
+
+        assert analysis.importance_score == 91
+        assert analysis.urgency == "urgent"
+        provider.complete.assert_not_called()
+        options = provider.acomplete.await_args.kwargs
+        assert options["provider"] == LLMProvider.OPENROUTER
+        assert options["models"] == {LLMProvider.OPENROUTER: "m"}
+        assert options["cache_ttl"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_returns_default(self):
+        service, provider = make_service()
+        provider.acomplete.return_value = llm_response("nope")
+
+        analysis = await service.analyze_email_async(make_email("m1"))
+
+        assert analysis.importance_score == 50
+        assert analysis.summary.startswith("Analysis failed")
+
+    @pytest.mark.asyncio
+    async def test_requires_openrouter(self):
+        service, provider = make_service()
+        provider.available_providers = [LLMProvider.GEMINI]
+
+        with pytest.raises(RuntimeError, match="OPENROUTER_API_KEY"):
+            await service.analyze_email_async(make_email("m1"))
+
+        provider.acomplete.assert_not_called()
+
+
+class TestPlanBatches:
+    """Tests for token-budgeted batch planning."""
+
+    def test_respects_batch_size(self):
+        service = EmailIntelligenceService(batch_size=4)
+        batches = service.plan_batches([make_email(f"m{i}") for i in range(10)])
+        assert [len(b) for b in batches] == [4, 4, 2]
+
+    def test_respects_token_budget(self):
+        service = EmailIntelligenceService(batch_size=10, batch_token_budget=600)
+        # Each email is ~500 characters of snippet, ~150 tokens with headers
+        emails = [make_email(f"m{i}", snippet="x" * 500) for i in range(8)]
+        batches = service.plan_batches(emails)
+        assert all(len(b) <= 4 for b in batches)
+        assert sum(len(b) for b in batches) == 8
+
+    def test_oversized_email_gets_own_batch(self):
+        service = EmailIntelligenceService(batch_size=10, batch_token_budget=10)
+        batches = service.plan_batches([make_email("big", snippet="x" * 4000)])
+        assert batches == [[batches[0][0]]]
+
+
+class TestBatchAnalysis:
+    """Tests for analyze_emails_batch_async."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_for_whole_batch(self):
+        service, provider = make_service(batch_size=10)
+        emails = [make_email(f"m{i}") for i in range(5)]
+        provider.acomplete.return_value = llm_response(
+            {"results": [batch_item(i, score=60 + i) for i in range(1, 6)]}
+        )
+
+        results = await service.analyze_emails_batch_async(emails)
+
+        provider.acomplete.assert_awaited_once()
+        call = provider.acomplete.await_args
+        assert call.kwargs["system_prompt"] == BATCH_ANALYSIS_SYSTEM_PROMPT
+        assert "=== EMAIL 5 ===" in call.args[0]
+        assert results["m0"].importance_score == 61
+        assert results["m4"].importance_score == 65
+        assert service.batch_requests == 1
+        assert service.single_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_and_missing_items_fall_back_to_single_calls(self):
+        service, provider = make_service(batch_size=10)
+        emails = [make_email("m0"), make_email("m1"), make_email("m2")]
+        bad = batch_item(2)
+        bad["importance_score"] = 500  # out of range
+        provider.acomplete.side_effect = [
+            llm_response({"results": [batch_item(1), bad]}),  # item 3 missing
+            llm_response({"importance_score": 20}),
+            llm_response({"importance_score": 30}),
+        ]
+
+        results = await service.analyze_emails_batch_async(emails)
+
+        assert provider.acomplete.await_count == 3
+        assert results["m0"].importance_score == 70
+        assert results["m1"].importance_score == 20
+        assert results["m2"].importance_score == 30
+        assert service.single_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back_for_every_email(self):
+        service, provider = make_service(batch_size=10)
+        emails = [make_email("m0"), make_email("m1")]
+        provider.acomplete.side_effect = [
+            llm_response("not json"),
+            llm_response({"importance_score": 10}),
+            llm_response({"importance_score": 11}),
+        ]
+
+        results = await service.analyze_emails_batch_async(emails)
+
+        assert set(results) == {"m0", "m1"}
+        assert service.single_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_fallback_is_omitted(self):
+        service, provider = make_service(batch_size=1)
+        provider.acomplete.side_effect = Exception("OpenRouter down")
+
+        results = await service.analyze_emails_batch_async([make_email("m0")])
+
+        assert results == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_results_are_cached_per_email(self, tmp_path):
+        cache = LLMCache(path=tmp_path / "llm.db")
+        service, provider = make_service(batch_size=10, cache=cache)
+        emails = [make_email("m0"), make_email("m1")]
+        provider.acomplete.return_value = llm_response(
+            {"results": [batch_item(1, 80), batch_item(2, 40)]}
+        )
+
+        await service.analyze_emails_batch_async(emails)
+        again = await service.analyze_emails_batch_async(emails)
+        single = await service.analyze_email_async(emails[1])
+        cache.close()
+
+        provider.acomplete.assert_awaited_once()
+        assert again["m0"].importance_score == 80
+        assert single.importance_score == 40
@@ -0,0 +1,415 @@
+"""Tests for the email scanner analysis pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from assistant.google.gmail import EmailListResult, EmailMessage, HistoryResult
+from assistant.services.email_intelligence import EmailAnalysis
+from assistant.services.email_scanner import (
+    MAX_EMAIL_ATTEMPTS,
+    EmailScannerService,
+    ProcessedEmailStore,
+)
+
+
+def make_email(message_id: str, is_read: bool = False) -> EmailMessage:
+    return EmailMessage(
+        message_id=message_id,
+        thread_id=f"thread-{message_id}",
+        subject=f"Subject {message_id}",
+        sender_name="Ann",
+        sender_email="ann@example.com",
+        snippet="Hello",
+        received_at=datetime(2026, 1, 12, tzinfo=UTC),
+        is_read=is_read,
+    )
+
+
+class FakeIntelligence:
+    """Analysis stub that tracks how many calls run at once."""
+
+    def __init__(
+        self,
+        score: int = 80,
+        delay: float = 0.01,
+        fail_ids: set[str] | None = None,
+        batch_size: int = 1,
+    ):
+        self.score = score
+        self.delay = delay
+        self.fail_ids = fail_ids or set()
+        self.batch_size = batch_size
+        self.active = 0
+        self.max_active = 0
+        self.calls: list[str] = []
+        self.batches: list[list[str]] = []
+
+    def plan_batches(self, emails: list[EmailMessage]) -> list[list[EmailMessage]]:
+        return [emails[i : i + self.batch_size] for i in range(0, len(emails), self.batch_size)]
+
+    async def analyze_emails_batch_async(
+        self, emails: list[EmailMessage]
+    ) -> dict[str, EmailAnalysis]:
+        self.batches.append([e.message_id for e in emails])
+        self.calls.extend(e.message_id for e in emails)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return {
+                e.message_id: EmailAnalysis(
+                    importance_score=self.score,
+                    urgency="normal",
+                    category="work",
+                    needs_response=False,
+                )
+                for e in emails
+                if e.message_id not in self.fail_ids
+            }
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def processed_path(tmp_path):
+    path = tmp_path / "processed.json"
+    with patch("assistant.services.email_scanner.PROCESSED_EMAILS_PATH", path):
+        yield path
+
+
+def make_scanner(emails: list[EmailMessage], concurrency: int = 3) -> EmailScannerService:
+    scanner = EmailScannerService(importance_threshold=50, analysis_concurrency=concurrency)
+    scanner._gmail_client = MagicMock()
+    scanner._gmail_client.list_emails = AsyncMock(
+        return_value=EmailListResult(success=True, emails=emails, total_count=len(emails))
+    )
+    scanner._gmail_client.get_history_id = AsyncMock(return_value="100")
+    scanner._notion_client = MagicMock()
+    scanner._notion_client.create_email = AsyncMock(return_value="page-id")
+    return scanner
+
+
+class TestScanPipeline:
+    """Tests for the concurrent fetch -> analyze -> store pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_analyzes_concurrently_within_bound(self, processed_path):
+        emails = [make_email(f"m{i}") for i in range(12)]
+        scanner = make_scanner(emails, concurrency=3)
+        fake = FakeIntelligence(delay=0.02)
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=fake,
+        ):
+            result = await scanner.scan_now()
+
+        assert result.success
+        assert result.emails_analyzed == 12
+        assert result.emails_stored == 12
+        assert 1 < fake.max_active <= 3
+        assert scanner._notion_client.create_email.await_count == 12
+        assert {"fetch", "analyze", "store", "total"} <= set(result.stage_timings)
+
+    @pytest.mark.asyncio
+    async def test_skips_processed_and_stores_only_important(self, processed_path):
+        emails = [make_email("old"), make_email("new")]
+        scanner = make_scanner(emails)
+        scanner._processed_ids.add("old")
+        fake = FakeIntelligence(score=10)
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=fake,
+        ):
+            result = await scanner.scan_now()
+
+        assert result.emails_skipped == 1
+        assert fake.calls == ["new"]
+        assert result.emails_stored == 0
+        assert "new" in scanner._processed_ids
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated_and_not_marked_processed(self, processed_path):
+        emails = [make_email("ok-1"), make_email("bad"), make_email("ok-2")]
+        scanner = make_scanner(emails)
+        fake = FakeIntelligence(fail_ids={"bad"})
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=fake,
+        ):
+            result = await scanner.scan_now()
+
+        assert result.emails_stored == 2
+        assert len(result.errors) == 1
+        assert "bad" not in scanner._processed_ids
+        assert "ok-1" in scanner._processed_ids
+        assert "ok-2" in scanner._processed_ids
+
+    @pytest.mark.asyncio
+    async def test_store_failure_leaves_email_for_retry(self, processed_path):
+        scanner = make_scanner([make_email("m1")])
+        scanner._notion_client.create_email = AsyncMock(side_effect=Exception("Notion down"))
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=FakeIntelligence(),
+        ):
+            result = await scanner.scan_now()
+
+        assert result.emails_analyzed == 1
+        assert result.emails_stored == 0
+        assert "m1" not in scanner._processed_ids
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_processed_ids_during_scan(self, processed_path):
+        emails = [make_email(f"m{i}") for i in range(25)]
+        scanner = make_scanner(emails)
+        saves: list[int] = []
+        original_save = scanner._save_processed_ids
+
+        def recording_save() -> None:
+            saves.append(len(scanner._processed_ids))
+            original_save()
+
+        scanner._save_processed_ids = recording_save
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=FakeIntelligence(delay=0),
+        ):
+            await scanner.scan_now()
+
+        # Two mid-scan checkpoints (10, 20) plus the final save
+        assert saves[:2] == [10, 20]
+        assert saves[-1] == 25
+        assert len(json.loads(processed_path.read_text())["processed"]) == 25
+
+    @pytest.mark.asyncio
+    async def test_emails_are_analyzed_in_batches(self, processed_path):
+        emails = [make_email(f"m{i}") for i in range(7)]
+        scanner = make_scanner(emails)
+        fake = FakeIntelligence(batch_size=3)
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=fake,
+        ):
+            result = await scanner.scan_now()
+
+        assert [len(b) for b in fake.batches] == [3, 3, 1]
+        assert result.emails_analyzed == 7
+        assert result.emails_stored == 7
+
+
+class TestIncrementalSync:
+    """Tests for historyId-based incremental fetching."""
+
+    @pytest.mark.asyncio
+    async def test_full_scan_saves_history_checkpoint(self, processed_path):
+        scanner = make_scanner([make_email("m1")])
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=FakeIntelligence(),
+        ):
+            result = await scanner.scan_now()
+
+        assert result.sync_mode == "full"
+        assert scanner._processed_ids.history_id == "100"
+        assert json.loads(processed_path.read_text())["history_id"] == "100"
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_history_delta(self, processed_path):
+        scanner = make_scanner([])
+        scanner._processed_ids.set_history_id("100")
+        scanner._processed_ids.add("seen")
+        gmail = scanner._gmail_client
+        gmail.list_history = AsyncMock(
+            return_value=HistoryResult(
+                success=True, message_ids=["seen", "new", "read"], history_id="120"
+            )
+        )
+        gmail.get_emails = AsyncMock(
+            return_value=EmailListResult(
+                success=True, emails=[make_email("new"), make_email("read", is_read=True)]
+            )
+        )
+        fake = FakeIntelligence()
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=fake,
+        ):
+            result = await scanner.scan_now()
+
+        assert result.sync_mode == "incremental"
+        gmail.list_history.assert_awaited_once_with("100")
+        gmail.get_emails.assert_awaited_once_with(["new", "read"])
+        gmail.list_emails.assert_not_called()
+        assert fake.calls == ["new"]
+        assert result.emails_skipped == 1
+        assert scanner._processed_ids.history_id == "120"
+
+    @pytest.mark.asyncio
+    async def test_expired_checkpoint_falls_back_to_full_resync(self, processed_path):
+        scanner = make_scanner([make_email("m1")])
+        scanner._processed_ids.set_history_id("1")
+        scanner._gmail_client.list_history = AsyncMock(
+            return_value=HistoryResult(success=False, expired=True)
+        )
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=FakeIntelligence(),
+        ):
+            result = await scanner.scan_now()
+
+        assert result.sync_mode == "full"
+        scanner._gmail_client.list_emails.assert_awaited_once()
+        assert scanner._processed_ids.history_id == "100"
+
+    @pytest.mark.asyncio
+    async def test_failed_email_keeps_old_checkpoint(self, processed_path):
+        scanner = make_scanner([])
+        scanner._processed_ids.set_history_id("100")
+        gmail = scanner._gmail_client
+        gmail.list_history = AsyncMock(
+            return_value=HistoryResult(success=True, message_ids=["bad"], history_id="120")
+        )
+        gmail.get_emails = AsyncMock(
+            return_value=EmailListResult(success=True, emails=[make_email("bad")])
+        )
+
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=FakeIntelligence(fail_ids={"bad"}),
+        ):
+            await scanner.scan_now()
+
+        assert scanner._processed_ids.history_id == "100"
+
+    @pytest.mark.asyncio
+    async def test_permanently_failed_email_releases_checkpoint(self, processed_path):
+        scanner = make_scanner([])
+        scanner._processed_ids.set_history_id("100")
+        gmail = scanner._gmail_client
+        gmail.list_history = AsyncMock(
+            return_value=HistoryResult(success=True, message_ids=["bad"], history_id="120")
+        )
+        gmail.get_emails = AsyncMock(
+            return_value=EmailListResult(success=True, emails=[make_email("bad")])
+        )
+
+        results = []
+        with patch(
+            "assistant.services.email_scanner.get_email_intelligence_service",
+            return_value=FakeIntelligence(fail_ids={"bad"}),
+        ):
+            for _ in range(MAX_EMAIL_ATTEMPTS):
+                results.append(await scanner.scan_now())
+
+        assert [r.emails_retrying for r in results] == [1] * (MAX_EMAIL_ATTEMPTS - 1) + [0]
+        assert results[-1].emails_failed == 1
+        assert scanner._processed_ids.history_id == "120"
+        assert scanner._processed_ids.is_failed("bad")
+
+    @pytest.mark.asyncio
+    async def test_disabled_incremental_sync_always_lists(self, processed_path):
+        scanner = make_scanner([make_email("m1")])
+        scanner._processed_ids.set_history_id("100")
+        scanner._gmail_client.list_history = AsyncMock()
+
+        with (
+            patch("assistant.services.email_scanner.settings") as mock_settings,
+            patch(
+                "assistant.services.email_scanner.get_email_intelligence_service",
+                return_value=FakeIntelligence(),
+            ),
+        ):
+            mock_settings.email_incremental_sync = False
+            await scanner.scan_now()
+
+        scanner._gmail_client.list_history.assert_not_called()
+        scanner._gmail_client.list_emails.assert_awaited_once()
+
+
+class TestProcessedEmailStore:
+    """Tests for the bounded processed-ID store."""
+
+    def test_caps_entries_dropping_oldest(self):
+        store = ProcessedEmailStore(max_entries=3)
+        for mid in ["a", "b", "c", "d"]:
+            store.add(mid)
+
+        assert len(store) == 3
+        assert "a" not in store
+        assert "d" in store
+
+    def test_evicts_by_age(self):
+        store = ProcessedEmailStore(max_age_days=1)
+        with patch("assistant.services.email_scanner.time.time", return_value=1_000_000):
+            store.add("old")
+        store.add("fresh")
+
+        assert store.evict() == 1
+        assert "old" not in store
+        assert "fresh" in store
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "processed.json"
+        store = ProcessedEmailStore()
+        store.add("m1")
+        store.set_history_id("42")
+        store.save(path)
+
+        loaded = ProcessedEmailStore()
+        loaded.load(path)
+
+        assert "m1" in loaded
+        assert loaded.history_id == "42"
+
+    def test_failures_are_capped_and_persisted(self, tmp_path):
+        path = tmp_path / "processed.json"
+        store = ProcessedEmailStore(max_attempts=2)
+
+        assert not store.record_failure("m1")
+        assert "m1" not in store
+        assert store.record_failure("m1")
+        assert "m1" in store
+        store.save(path)
+
+        loaded = ProcessedEmailStore(max_attempts=2)
+        loaded.load(path)
+
+        assert loaded.is_failed("m1")
+        assert loaded.failed_attempts("m1") == 2
+
+    def test_unchanged_store_is_not_rewritten(self, tmp_path):
+        path = tmp_path / "processed.json"
+        store = ProcessedEmailStore()
+        store.add("m1")
+        store.save(path)
+        path.unlink()
+
+        store.save(path)
+
+        assert not path.exists()
+
+    def test_loads_legacy_format(self, tmp_path):
+        path = tmp_path / "processed.json"
+        path.write_text(json.dumps({"processed_ids": ["a", "b"]}))
+        store = ProcessedEmailStore()
+
+        store.load(path)
+        store.save(path)
+
+        assert "a" in store and "b" in store
+        assert set(json.loads(path.read_text())["processed"]) == {"a", "b"}
@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from zoneinfo import ZoneInfo
 
 import pytest
+from googleapiclient.errors import HttpError
 
 from assistant.google.gmail import (
     DraftResult,
@@ -39,6 +40,43 @@ from assistant.google.gmail import (
 )
 
 
+class FakeBatch:
+    """Stand-in for googleapiclient's BatchHttpRequest.
+
+    Executes each added request in turn and reports the result (or error)
+    through the batch callback, like the real batch endpoint does.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests: list[tuple[str, MagicMock]] = []
+        self.executed = False
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.executed = True
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+def use_fake_batches(mock_service: MagicMock) -> list[FakeBatch]:
+    """Route the service's batch requests through FakeBatch instances."""
+    batches: list[FakeBatch] = []
+
+    def new_batch(callback):
+        batch = FakeBatch(callback)
+        batches.append(batch)
+        return batch
+
+    mock_service.new_batch_http_request.side_effect = new_batch
+    return batches
+
+
 class TestEmailMessage:
     """Test EmailMessage dataclass."""
 
@@ -297,6 +335,7 @@ class TestGmailClientAsync:
         # Mock the service
         mock_service = MagicMock()
         client._service = mock_service
+        use_fake_batches(mock_service)
 
         # Mock list response
         list_response = {
@@ -374,6 +413,7 @@ class TestGmailClientAsync:
         client = GmailClient()
         mock_service = MagicMock()
         client._service = mock_service
+        use_fake_batches(mock_service)
 
         # Mock list response with promotional email
         list_response = {
@@ -444,6 +484,7 @@ class TestGmailClientAsync:
         client = GmailClient()
         mock_service = MagicMock()
         client._service = mock_service
+        use_fake_batches(mock_service)
 
         # Mock response with emails
         list_response = {
@@ -547,6 +588,169 @@ class TestGmailClientAsync:
         assert email.subject == "Test"
 
 
+def make_gmail_message(message_id: str, hour: int = 14) -> dict:
+    return {
+        "id": message_id,
+        "threadId": f"t-{message_id}",
+        "snippet": f"Snippet {message_id}",
+        "labelIds": ["INBOX"],
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": f"Subject {message_id}"},
+                {"name": "From", "value": "sender@example.com"},
+                {"name": "Date", "value": f"Mon, 10 Jan 2026 {hour:02d}:00:00 +0000"},
+            ],
+        },
+    }
+
+
+def mock_gmail_service(message_ids: list[str], get_execute) -> MagicMock:
+    """Build a service mock whose list returns message_ids."""
+    mock_service = MagicMock()
+    mock_messages = mock_service.users.return_value.messages.return_value
+    mock_messages.list.return_value.execute.return_value = {
+        "messages": [{"id": mid} for mid in message_ids]
+    }
+
+    def get(**kwargs):
+        request = MagicMock()
+        request.execute.side_effect = lambda: get_execute(kwargs["id"])
+        return request
+
+    mock_messages.get.side_effect = get
+    return mock_service
+
+
+class TestBatchedDetailFetch:
+    """Tests for fetching message details through Gmail batch requests."""
+
+    @pytest.mark.asyncio
+    async def test_details_fetched_in_batches_with_projection(self):
+        ids = [f"m{i:03d}" for i in range(120)]
+        client = GmailClient()
+        client._service = mock_gmail_service(ids, make_gmail_message)
+        batches = use_fake_batches(client._service)
+
+        result = await client.list_emails(max_results=120)
+
+        assert result.success is True
+        assert len(result.emails) == 120
+        assert [len(b.requests) for b in batches] == [50, 50, 20]
+        get_kwargs = client._service.users().messages().get.call_args.kwargs
+        assert get_kwargs["format"] == "metadata"
+        assert get_kwargs["metadataHeaders"] == ["Subject", "From", "Date"]
+        assert "snippet" in get_kwargs["fields"]
+        assert "labelIds" in get_kwargs["fields"]
+
+    @pytest.mark.asyncio
+    async def test_failed_message_is_isolated(self):
+        def get_execute(message_id: str) -> dict:
+            if message_id == "bad":
+                raise Exception("404 Not Found")
+            return make_gmail_message(message_id)
+
+        client = GmailClient()
+        client._service = mock_gmail_service(["ok1", "bad", "ok2"], get_execute)
+        use_fake_batches(client._service)
+
+        result = await client.list_emails()
+
+        assert result.success is True
+        assert sorted(e.message_id for e in result.emails) == ["ok1", "ok2"]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_single_fetches(self):
+        client = GmailClient()
+        client._service = mock_gmail_service(["a", "b"], make_gmail_message)
+        client._service.new_batch_http_request.return_value.execute.side_effect = Exception(
+            "batch endpoint unavailable"
+        )
+
+        result = await client.list_emails()
+
+        assert result.success is True
+        assert sorted(e.message_id for e in result.emails) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_input_order(self):
+        client = GmailClient()
+        client._service = mock_gmail_service(["x", "y", "z"], make_gmail_message)
+        use_fake_batches(client._service)
+
+        details = await client._get_email_details_batch(["x", "y", "z"])
+
+        assert [e.message_id for e in details] == ["x", "y", "z"]
+
+
+class TestHistorySync:
+    """Tests for historyId-based incremental listing."""
+
+    @pytest.mark.asyncio
+    async def test_get_history_id(self):
+        client = GmailClient()
+        client._service = MagicMock()
+        client._service.users().getProfile().execute.return_value = {"historyId": 987}
+
+        assert await client.get_history_id() == "987"
+
+    @pytest.mark.asyncio
+    async def test_list_history_pages_and_dedupes(self):
+        client = GmailClient()
+        client._service = MagicMock()
+        history_list = client._service.users.return_value.history.return_value.list
+        history_list.return_value.execute.side_effect = [
+            {
+                "history": [
+                    {"messagesAdded": [{"message": {"id": "m1"}}, {"message": {"id": "m2"}}]}
+                ],
+                "nextPageToken": "p2",
+                "historyId": "150",
+            },
+            {
+                "history": [{"messagesAdded": [{"message": {"id": "m2"}}]}, {"id": "x"}],
+                "historyId": "160",
+            },
+        ]
+
+        result = await client.list_history("100")
+
+        assert result.success is True
+        assert result.message_ids == ["m1", "m2"]
+        assert result.history_id == "160"
+        first_call = history_list.call_args_list[0].kwargs
+        assert first_call["startHistoryId"] == "100"
+        assert first_call["historyTypes"] == ["messageAdded"]
+        assert history_list.call_args_list[1].kwargs["pageToken"] == "p2"
+
+    @pytest.mark.asyncio
+    async def test_list_history_expired_checkpoint(self):
+        client = GmailClient()
+        client._service = MagicMock()
+        history_list = client._service.users.return_value.history.return_value.list
+        history_list.return_value.execute.side_effect = HttpError(
+            MagicMock(status=404), b"Requested entity was not found."
+        )
+
+        result = await client.list_history("1")
+
+        assert result.success is False
+        assert result.expired is True
+
+    @pytest.mark.asyncio
+    async def test_get_emails_filters_promotions(self):
+        promo = make_gmail_message("promo")
+        promo["labelIds"] = ["INBOX", "CATEGORY_PROMOTIONS"]
+        messages = {"a": make_gmail_message("a"), "promo": promo}
+        client = GmailClient()
+        client._service = mock_gmail_service([], lambda mid: messages[mid])
+        use_fake_batches(client._service)
+
+        result = await client.get_emails(["a", "promo"])
+
+        assert result.success is True
+        assert [e.message_id for e in result.emails] == ["a"]
+
+
 class TestGmailModuleFunctions:
     """Test module-level convenience functions."""
 
@@ -111,6 +111,65 @@ class TestCommandHandlers:
         call_kwargs = message.answer.call_args[1]
         assert call_kwargs.get("parse_mode") == "Markdown"
 
+    @pytest.mark.asyncio
+    async def test_cmd_today_reuses_snapshot_tasks(self):
+        """Today command takes due tasks from a recent briefing snapshot."""
+        from datetime import datetime
+
+        from assistant.services.briefing import BriefingSnapshot, SectionResult
+
+        message = AsyncMock()
+        tasks = [{"properties": {"title": {"title": [{"text": {"content": "Submit report"}}]}}}]
+        snapshot = BriefingSnapshot(
+            date="2026-10-16",
+            generated_at=datetime.now(UTC),
+            text="Good morning! Cached briefing",
+            results={"tasks_today": SectionResult("tasks_today", value=tasks)},
+        )
+
+        with (
+            patch("assistant.services.briefing.load_fresh_snapshot", return_value=snapshot),
+            patch("assistant.telegram.handlers._generate_today_message") as mock_gen,
+        ):
+            mock_gen.return_value = "📆 today"
+            await cmd_today(message)
+
+        mock_gen.assert_awaited_once_with(tasks)
+        assert message.answer.call_args[0][0] == "📆 today"
+
+    @pytest.mark.asyncio
+    async def test_cmd_today_refetches_timed_out_snapshot_section(self):
+        """A section that timed out in the snapshot is fetched again, not shown as loading."""
+        from datetime import datetime
+
+        from assistant.services.briefing import BriefingSnapshot, SectionResult
+
+        message = AsyncMock()
+        snapshot = BriefingSnapshot(
+            date="2026-10-16",
+            generated_at=datetime.now(UTC),
+            text="✅ **DUE TODAY**\n_Still loading - try /today again in a minute._",
+            results={"tasks_today": SectionResult("tasks_today", status="timeout")},
+        )
+
+        with (
+            patch("assistant.services.briefing.load_fresh_snapshot", return_value=snapshot),
+            patch(
+                "assistant.telegram.handlers._fetch_tasks_due_today",
+                new=AsyncMock(return_value=[]),
+            ) as mock_fetch,
+            patch(
+                "assistant.google.calendar.list_todays_events",
+                side_effect=Exception("No calendar"),
+            ),
+        ):
+            await cmd_today(message)
+
+        mock_fetch.assert_awaited_once()
+        reply = message.answer.call_args[0][0]
+        assert "Still loading" not in reply
+        assert "Nothing scheduled" in reply
+
     @pytest.mark.asyncio
     async def test_cmd_today_handles_error(self):
         """Today command should handle errors gracefully."""
@@ -461,6 +520,23 @@ class TestGenerateTodayMessage:
             assert "Team Meeting" in result
             assert "Room A" in result
 
+    @pytest.mark.asyncio
+    async def test_generate_today_with_given_tasks_skips_notion(self):
+        """Should use tasks passed in instead of querying Notion."""
+        tasks = [{"properties": {"title": {"title": [{"text": {"content": "Cached task"}}]}}}]
+        with (
+            patch("assistant.notion.client.NotionClient") as mock_notion_cls,
+            patch(
+                "assistant.google.calendar.list_todays_events",
+                side_effect=Exception("No calendar"),
+            ) as mock_events,
+        ):
+            result = await _generate_today_message(tasks)
+
+        assert "Cached task" in result
+        mock_notion_cls.assert_not_called()
+        mock_events.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_generate_today_with_due_tasks(self):
         """Should show due tasks."""
@@ -0,0 +1,152 @@
+"""Tests for the application-scoped HTTP connection pool."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+import assistant.http_pool as http_pool
+from assistant.google.maps import MapsClient
+from assistant.http_pool import (
+    HttpPool,
+    close_http_pool,
+    get_shared_client,
+    open_http_pool,
+)
+from assistant.notion.client import NOTION_API_URL, NotionClient
+from assistant.services.processor import MessageProcessor
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    """Ensure each test starts and ends without a shared pool."""
+    http_pool._pool = None
+    yield
+    http_pool._pool = None
+
+
+class TestHttpPool:
+    """Tests for HttpPool lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_open_is_idempotent(self):
+        pool = HttpPool(max_connections=5, max_keepalive_connections=2, keepalive_expiry=10)
+
+        first = await pool.open()
+        second = await pool.open()
+
+        assert first is second
+        assert pool.is_open
+        await pool.close()
+        assert not pool.is_open
+        assert pool.client is None
+
+    @pytest.mark.asyncio
+    async def test_http2_requires_h2(self):
+        with patch.object(http_pool, "HTTP2_AVAILABLE", False):
+            pool = HttpPool(http2=True)
+        assert pool.http2 is False
+
+    @pytest.mark.asyncio
+    async def test_limits_default_from_settings(self):
+        with patch.object(http_pool, "settings") as mock_settings:
+            mock_settings.http_max_connections = 7
+            mock_settings.http_max_keepalive_connections = 3
+            mock_settings.http_keepalive_expiry = 15.0
+            mock_settings.http2_enabled = False
+            pool = HttpPool()
+
+        assert pool.max_connections == 7
+        assert pool.max_keepalive_connections == 3
+        assert pool.keepalive_expiry == 15.0
+
+    def test_zero_keepalive_expiry_is_kept(self):
+        pool = HttpPool(keepalive_expiry=0)
+
+        assert pool.keepalive_expiry == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_client_only_while_open(self):
+        assert get_shared_client() is None
+
+        client = await open_http_pool()
+        assert get_shared_client() is client
+
+        await close_http_pool()
+        assert get_shared_client() is None
+
+
+class TestClientsUseSharedPool:
+    """Tests that API clients borrow the shared client."""
+
+    @pytest.mark.asyncio
+    async def test_notion_uses_shared_client(self):
+        shared = await open_http_pool()
+        notion = NotionClient(api_key="test")
+
+        assert await notion._get_client() is shared
+        await notion.close()
+        assert not shared.is_closed
+        await close_http_pool()
+
+    @pytest.mark.asyncio
+    async def test_notion_falls_back_to_private_client(self):
+        notion = NotionClient(api_key="test")
+
+        client = await notion._get_client()
+
+        assert client is not get_shared_client()
+        await notion.close()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_notion_request_sends_absolute_url_and_headers(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"object": "page", "id": "p1"})
+
+        pool = http_pool.get_http_pool()
+        pool._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        notion = NotionClient(api_key="secret")
+
+        await notion._request("GET", "/pages/p1")
+
+        assert str(requests[0].url) == f"{NOTION_API_URL}/pages/p1"
+        assert requests[0].headers["Authorization"] == "Bearer secret"
+        await close_http_pool()
+
+    @pytest.mark.asyncio
+    async def test_maps_uses_shared_client(self):
+        shared = await open_http_pool()
+        maps = MapsClient(api_key="test")
+
+        assert await maps._get_client() is shared
+        await maps.close()
+        assert not shared.is_closed
+        await close_http_pool()
+
+
+class TestProcessorKeepsConnection:
+    """MessageProcessor must not tear down its client after each message."""
+
+    @pytest.mark.asyncio
+    async def test_notion_not_closed_after_message(self):
+        with patch("assistant.services.processor.settings") as mock_settings:
+            mock_settings.has_notion = True
+            mock_settings.confidence_threshold = 80
+            processor = MessageProcessor()
+
+        processor.notion = AsyncMock()
+        processor.notion.query_people.return_value = []
+        processor.notion.create_task.return_value = "task-1"
+        processor.pattern_applicator.apply_patterns = AsyncMock(side_effect=Exception("skip"))
+
+        with patch("assistant.services.processor.settings") as mock_settings:
+            mock_settings.confidence_threshold = 0
+            await processor.process("Buy milk tomorrow", "chat-1", "msg-1")
+
+        processor.notion.close.assert_not_called()
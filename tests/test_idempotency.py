@@ -0,0 +1,240 @@
+"""Tests for the local idempotency key index."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from assistant.config import settings
+from assistant.notion.client import NotionClient
+from assistant.notion.idempotency import (
+    BloomFilter,
+    IdempotencyIndex,
+    backfill_idempotency_index,
+)
+from assistant.notion.schemas import ActionType, LogEntry
+from assistant.services.audit import AuditLogger, DedupeResult
+
+
+@pytest.fixture
+def index():
+    index = IdempotencyIndex(persist=False, ttl_seconds=3600, max_entries=100)
+    yield index
+    index.close()
+
+
+def make_log_page(page_id: str, key: str, created_time: str = "2026-10-01T12:00:00.000Z") -> dict:
+    return {
+        "id": page_id,
+        "created_time": created_time,
+        "properties": {
+            "idempotency_key": {"rich_text": [{"plain_text": key, "text": {"content": key}}]}
+        },
+    }
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        keys = [f"log:telegram:{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(1000, false_positive_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"present:{i}")
+
+        false_positives = sum(f"absent:{i}" in bloom for i in range(10_000))
+        assert false_positives < 300
+
+
+class TestIdempotencyIndex:
+    def test_record_and_lookup(self, index):
+        index.record("log", "telegram:1:2", "page-1")
+
+        assert index.lookup("log", "telegram:1:2") == "page-1"
+        assert index.lookup("inbox", "telegram:1:2") is None
+
+    def test_bloom_answers_misses(self, index):
+        index.record("log", "a", "page-1")
+
+        assert index.lookup("log", "never-seen") is None
+        assert index.bloom_rejects == 1
+        assert index.get_stats()["hits"] == 0
+
+    def test_error_code_is_kept(self, index):
+        index.record("log", "k", "page-1", error_code="NOTION_503")
+
+        record = index.get("log", "k")
+        assert record is not None
+        assert record.error_code == "NOTION_503"
+
+    def test_expired_keys_are_forgotten(self, index):
+        index.record("log", "old", "page-1", created_at=time.time() - 7200)
+
+        assert index.lookup("log", "old") is None
+
+    def test_prune_caps_entries(self, index):
+        now = time.time()
+        index.record_many("log", [(f"k{i}", f"p{i}", None, now + i) for i in range(150)])
+        index._prune()
+
+        assert len(index) == 100
+        assert index.lookup("log", "k0") is None
+        assert index.lookup("log", "k149") == "p149"
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "idempotency.db"
+        first = IdempotencyIndex(path=path)
+        first.record("inbox", "abc", "page-1")
+        first.mark_backfilled("inbox")
+        first.close()
+
+        second = IdempotencyIndex(path=path)
+        assert second.lookup("inbox", "abc") == "page-1"
+        assert second.is_backfilled("inbox")
+        assert not second.is_backfilled("log")
+        second.close()
+
+    def test_sees_keys_written_by_another_process(self, tmp_path):
+        path = tmp_path / "idempotency.db"
+        reader = IdempotencyIndex(path=path)
+        assert reader.lookup("log", "from-cli") is None
+
+        writer = IdempotencyIndex(path=path)
+        writer.record("log", "from-cli", "page-1")
+        writer.close()
+
+        assert reader.lookup("log", "from-cli") == "page-1"
+        assert reader.lookup("log", "never-seen") is None
+        assert reader.bloom_rejects == 2
+        reader.close()
+
+    def test_unusable_file_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        index = IdempotencyIndex(path=blocker / "idempotency.db")
+
+        index.record("log", "k", "page-1")
+
+        assert index.path is None
+        assert index.lookup("log", "k") == "page-1"
+        index.close()
+
+    def test_records_key_from_page_create_body(self, index):
+        body = {
+            "parent": {"database_id": "inbox-db"},
+            "properties": {"dedupe_key": {"rich_text": [{"text": {"content": "abc"}}]}},
+        }
+
+        with patch.object(settings, "notion_inbox_db_id", "inbox-db"):
+            assert index.record_created_page(body, "inbox-page")
+            assert not index.record_created_page({"parent": {"database_id": "other"}}, "p")
+
+        assert index.lookup("inbox", "abc") == "inbox-page"
+
+
+class TestBackfill:
+    @pytest.mark.asyncio
+    async def test_seeds_once_per_database(self, index):
+        async def pages(db_type, body, limit=None):
+            if db_type == "log":
+                yield make_log_page("log-1", "telegram:1:2")
+                yield make_log_page("log-2", "")
+
+        notion = MagicMock()
+        notion.iter_query = MagicMock(side_effect=pages)
+
+        with patch("assistant.notion.idempotency.time.time", return_value=1791000000.0):
+            count = await backfill_idempotency_index(index, notion)
+        assert count == 1
+        assert index.is_backfilled("log")
+        assert index.is_backfilled("inbox")
+
+        assert await backfill_idempotency_index(index, notion) == 0
+        assert notion.iter_query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_leaves_database_unseeded(self, index):
+        async def pages(db_type, body, limit=None):
+            raise RuntimeError("Notion down")
+            yield
+
+        notion = MagicMock()
+        notion.iter_query = MagicMock(side_effect=pages)
+
+        with pytest.raises(RuntimeError):
+            await backfill_idempotency_index(index, notion, db_types=["log"])
+        assert not index.is_backfilled("log")
+
+
+class TestNotionClientDedupe:
+    def make_client(self, index, handler) -> NotionClient:
+        client = NotionClient(api_key="secret", idempotency_index=index)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_backfilled_index_skips_notion_query(self, index):
+        requests = []
+        index.mark_backfilled("log")
+        client = self.make_client(index, lambda request: requests.append(request))
+
+        with patch.object(settings, "notion_log_db_id", "log-db"):
+            assert await client._check_dedupe("log", "telegram:1:2") is None
+
+        assert requests == []
+
+    @pytest.mark.asyncio
+    async def test_created_log_entry_is_indexed(self, index):
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path.endswith("/query"):
+                return httpx.Response(200, json={"results": []})
+            return httpx.Response(200, json={"id": "log-page"})
+
+        client = self.make_client(index, handler)
+        entry = LogEntry(action_type=ActionType.CAPTURE, idempotency_key="telegram:1:2")
+
+        with patch.object(settings, "notion_log_db_id", "log-db"):
+            assert await client.create_log_entry(entry) == "log-page"
+            assert await client.create_log_entry(entry) == "log-page"
+
+        assert paths == ["/v1/databases/log-db/query", "/v1/pages"]
+        assert index.lookup("log", "telegram:1:2") == "log-page"
+
+
+class TestAuditLoggerIndex:
+    @pytest.mark.asyncio
+    async def test_logged_key_survives_new_logger(self, index):
+        notion = MagicMock()
+        notion.create_log_entry = AsyncMock(return_value="log-1")
+        notion._check_dedupe = AsyncMock(return_value=None)
+
+        await AuditLogger(notion, idempotency_index=index).log_action(
+            ActionType.CAPTURE, idempotency_key="telegram:1:2"
+        )
+        result, entry = await AuditLogger(notion, idempotency_index=index).check_idempotency(
+            "telegram:1:2"
+        )
+
+        assert result == DedupeResult.DUPLICATE
+        assert entry is not None and entry.log_id == "log-1"
+        notion._check_dedupe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_logged_error_allows_retry(self, index):
+        index.record("log", "telegram:1:2", "log-1", error_code="NOTION_503")
+        audit = AuditLogger(MagicMock(), idempotency_index=index)
+
+        result, _ = await audit.check_idempotency("telegram:1:2")
+
+        assert result == DedupeResult.RETRY
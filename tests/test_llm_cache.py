@@ -0,0 +1,294 @@
+"""Tests for the LLM response cache."""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from assistant.google.gmail import EmailMessage
+from assistant.services.email_intelligence import EmailIntelligenceService
+from assistant.services.intent import ParsedIntent
+from assistant.services.llm_cache import LLMCache, make_cache_key
+from assistant.services.llm_client import LLMClient, LLMProvider, LLMResponse
+from assistant.services.llm_parser import LLMIntentParser
+
+
+def make_response(text: str = "Hello", provider: LLMProvider = LLMProvider.GEMINI) -> LLMResponse:
+    return LLMResponse(text=text, provider=provider, model="m", tokens_input=5, tokens_output=7)
+
+
+class FakeResponse:
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict[str, Any]:
+        return self._data
+
+
+class CountingClient:
+    """Sync HTTP client returning a Gemini payload and counting calls."""
+
+    def __init__(self, text: str = "Hi") -> None:
+        self.text = text
+        self.calls = 0
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls += 1
+        return FakeResponse({"candidates": [{"content": {"parts": [{"text": self.text}]}}]})
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(path=tmp_path / "llm.db", max_entries=2)
+    yield cache
+    cache.close()
+
+
+class TestCacheKey:
+    """Tests for content-addressed keys."""
+
+    def test_same_request_same_key(self):
+        assert make_cache_key("gemini", "m", "hi") == make_cache_key(LLMProvider.GEMINI, "m", "hi")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"system_prompt": "be brief"},
+            {"temperature": 0.9},
+            {"json_mode": True},
+            {"max_tokens": 10},
+        ],
+    )
+    def test_request_parameters_change_key(self, kwargs):
+        assert make_cache_key("gemini", "m", "hi") != make_cache_key("gemini", "m", "hi", **kwargs)
+
+    def test_provider_and_model_change_key(self):
+        base = make_cache_key("gemini", "m", "hi")
+        assert base != make_cache_key("openai", "m", "hi")
+        assert base != make_cache_key("gemini", "other", "hi")
+
+
+class TestLLMCache:
+    """Tests for the two cache tiers."""
+
+    def test_miss_then_memory_hit(self, cache):
+        assert cache.get("k") is None
+        cache.set("k", make_response())
+
+        hit = cache.get("k")
+
+        assert hit is not None
+        assert hit.text == "Hello"
+        assert hit.cached
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_expired_entry_is_a_miss(self, cache):
+        cache.set("k", make_response(), ttl=10)
+
+        with patch("assistant.services.llm_cache.time.time", return_value=9e12):
+            assert cache.get("k") is None
+
+    def test_zero_ttl_is_not_stored(self, cache):
+        cache.set("k", make_response(), ttl=0)
+        assert cache.get("k") is None
+
+    def test_lru_eviction_falls_back_to_disk(self, cache):
+        cache.set("a", make_response("A"))
+        cache.set("b", make_response("B"))
+        cache.get("a")  # a is now most recently used
+        cache.set("c", make_response("C"))  # evicts b from memory
+
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get("b").text == "B"
+        assert cache.get_stats()["disk_hits"] == 1
+
+    def test_disk_tier_survives_restart(self, cache, tmp_path):
+        cache.set("k", make_response(provider=LLMProvider.OPENAI))
+
+        reopened = LLMCache(path=tmp_path / "llm.db")
+        hit = reopened.get("k")
+        reopened.close()
+
+        assert hit is not None
+        assert hit.provider == LLMProvider.OPENAI
+        assert hit.tokens_output == 7
+
+    def test_memory_only_cache(self):
+        cache = LLMCache(persist=False)
+        cache.set("k", make_response())
+        assert cache.get("k").text == "Hello"
+        assert cache.get_stats()["disk_entries"] == 0
+
+    def test_get_any_counts_single_miss(self, cache):
+        assert cache.get_any(["a", "b", "c"]) is None
+        assert cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_disk_access_runs_off_the_event_loop(self, cache, tmp_path):
+        threads = []
+        real_read = cache._disk_read_any
+
+        def read(keys):
+            threads.append(threading.current_thread())
+            return real_read(keys)
+
+        await cache.aset("k", make_response("A"))
+        reopened = LLMCache(path=tmp_path / "llm.db")
+        reopened._disk_read_any = read
+
+        hit = await reopened.aget_any(["missing", "k"])
+        stats = reopened.get_stats()
+        reopened.close()
+
+        assert hit is not None and hit.cached and hit.text == "A"
+        assert threads and threads[0] is not threading.main_thread()
+        assert stats["disk_hits"] == 1
+
+
+class TestLLMClientCache:
+    """Tests for caching inside LLMClient."""
+
+    def test_repeated_prompt_served_from_cache(self, cache):
+        fake = CountingClient()
+        client = LLMClient(gemini_api_key="gem", cache=cache)
+        client._providers[LLMProvider.GEMINI]._client = fake
+
+        first = client.complete("Hello")
+        second = client.complete("Hello")
+
+        assert fake.calls == 1
+        assert not first.cached
+        assert second.cached
+        assert client.get_stats(LLMProvider.GEMINI)["requests"] == 1
+        assert client.get_stats()["cache"]["hits"] == 1
+
+    def test_zero_ttl_bypasses_cache(self, cache):
+        fake = CountingClient()
+        client = LLMClient(gemini_api_key="gem", cache=cache)
+        client._providers[LLMProvider.GEMINI]._client = fake
+
+        client.complete("Hello", cache_ttl=0)
+        client.complete("Hello", cache_ttl=0)
+
+        assert fake.calls == 2
+
+    def test_fallback_answer_is_reused(self, cache):
+        failing = MagicMock()
+        failing.post.side_effect = Exception("down")
+        openai = MagicMock()
+        openai.post.return_value = FakeResponse({"choices": [{"message": {"content": "OAI"}}]})
+        client = LLMClient(gemini_api_key="gem", openai_api_key="oai", cache=cache)
+        client._providers[LLMProvider.GEMINI]._client = failing
+        client._providers[LLMProvider.OPENAI]._client = openai
+
+        client.complete("Hello")
+        response = client.complete("Hello")
+
+        assert response.provider == LLMProvider.OPENAI
+        assert response.cached
+        assert openai.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_acomplete_uses_cache(self, cache):
+        client = LLMClient(gemini_api_key="gem", cache=cache)
+        key = client._cache_key(
+            LLMProvider.GEMINI,
+            "Hello",
+            {"system_prompt": None, "temperature": 0.2, "max_tokens": 1024, "json_mode": False},
+        )
+        cache.set(key, make_response("cached"))
+
+        response = await client.acomplete("Hello")
+
+        assert response.text == "cached"
+        assert response.cached
+
+
+class TestCallSiteCaching:
+    """Tests for the email analysis and intent parser call sites."""
+
+    def test_email_reanalysis_is_cached(self, cache):
+        email = EmailMessage(
+            message_id="m1",
+            thread_id="t1",
+            subject="Invoice",
+            sender_name="Ann",
+            sender_email="ann@example.com",
+            received_at=datetime(2026, 1, 12, tzinfo=UTC),
+            snippet="Please pay",
+            is_read=False,
+        )
+        provider = MagicMock()
+        provider.complete.return_value = LLMResponse(
+            text='{"importance_score": 80}',
+            provider=LLMProvider.OPENROUTER,
+            model="m",
+        )
+        provider.available_providers = [LLMProvider.OPENROUTER]
+        service = EmailIntelligenceService(model="m", cache=cache, llm_client=provider)
+
+        first = service.analyze_email(email)
+        second = service.analyze_email(email)
+
+        assert first.importance_score == second.importance_score == 80
+        provider.complete.assert_called_once()
+
+    def test_invalid_json_is_not_cached(self, cache):
+        email = EmailMessage(
+            message_id="m1",
+            thread_id="t1",
+            subject="Hi",
+            sender_name="Ann",
+            sender_email="ann@example.com",
+            received_at=datetime(2026, 1, 12, tzinfo=UTC),
+            snippet="Hello",
+            is_read=False,
+        )
+        provider = MagicMock()
+        provider.complete.return_value = LLMResponse(
+            text="not json", provider=LLMProvider.OPENROUTER, model="m"
+        )
+        provider.available_providers = [LLMProvider.OPENROUTER]
+        service = EmailIntelligenceService(model="m", cache=cache, llm_client=provider)
+
+        service.analyze_email(email)
+        service.analyze_email(email)
+
+        assert provider.complete.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_message_parsed_once(self, cache):
+        base = ParsedIntent(intent_type="note", title="x", confidence=40, raw_text="Call Bob")
+        base_parser = MagicMock()
+        base_parser.parse.return_value = base
+        parser = LLMIntentParser(
+            base_parser=base_parser, llm_client=MagicMock(is_available=True), cache=cache
+        )
+        parser._request_llm = MagicMock()
+
+        async def request(text: str) -> LLMResponse:
+            return LLMResponse(
+                text='{"intent_type": "task", "title": "Call Bob"}',
+                provider=LLMProvider.GEMINI,
+                model="m",
+            )
+
+        parser._request_llm.side_effect = request
+
+        first = await parser.parse("Call Bob")
+        second = await parser.parse("Call Bob")
+
+        assert first.intent_type == second.intent_type == "task"
+        parser._request_llm.assert_called_once()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -11,6 +12,7 @@ import pytest
 from assistant.services.llm_client import (
     AnthropicProvider,
     GeminiProvider,
+    LatencyHistogram,
     LLMClient,
     LLMProvider,
     LLMResponse,
@@ -58,6 +60,33 @@ class FakeClient:
         pass
 
 
+class FakeAsyncClient:
+    """Mock async HTTP client with an optional delay or failure."""
+
+    def __init__(
+        self,
+        response: dict[str, Any],
+        delay: float = 0.0,
+        error: Exception | None = None,
+    ) -> None:
+        self.response = response
+        self.delay = delay
+        self.error = error
+        self.requests: list[dict[str, Any]] = []
+        self.cancelled = False
+
+    async def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.requests.append({"url": url, **kwargs})
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return FakeResponse(self.response)
+
+
 def make_gemini_response(text: str, input_tokens: int = 10, output_tokens: int = 20) -> dict:
     """Create a mock Gemini API response."""
     return {
@@ -571,6 +600,178 @@ class TestLLMClientRateLimiting:
         # Should fallback to OpenAI
         assert response.provider == LLMProvider.OPENAI
 
+    def test_rate_limited_provider_is_reported_when_all_fail(self) -> None:
+        """Skipped providers should appear in the aggregated error."""
+        client = LLMClient(gemini_api_key="gem", openai_api_key="oai")
+        client._providers[LLMProvider.OPENAI]._client = FakeClient({}, status_code=500)
+        limiter = client._rate_limiters[LLMProvider.GEMINI]
+        for _ in range(100):
+            limiter.record_request(1000)
+
+        with pytest.raises(RuntimeError, match="gemini: rate limited.*openai: HTTP 500"):
+            client.complete("Test")
+
+    @pytest.mark.asyncio
+    async def test_async_rate_limited_provider_is_reported(self) -> None:
+        client = LLMClient(gemini_api_key="gem")
+        limiter = client._rate_limiters[LLMProvider.GEMINI]
+        for _ in range(100):
+            limiter.record_request(1000)
+
+        with pytest.raises(RuntimeError, match="gemini: rate limited"):
+            await client.acomplete("Test")
+
+
+class TestLLMClientModelOverride:
+    """Tests for per-request model overrides."""
+
+    def test_override_uses_requested_model(self) -> None:
+        gemini_client = FakeClient(make_gemini_response("Gemini"))
+        client = LLMClient(gemini_api_key="gem")
+        client._providers[LLMProvider.GEMINI]._client = gemini_client
+
+        response = client.complete("Test", models={LLMProvider.GEMINI: "gemini-custom"})
+
+        assert response.model == "gemini-custom"
+        assert "gemini-custom" in gemini_client.requests[0]["url"]
+        assert client._providers[LLMProvider.GEMINI].model == GeminiProvider.default_model
+
+    @pytest.mark.asyncio
+    async def test_async_override_shares_injected_client(self) -> None:
+        gemini = FakeAsyncClient(make_gemini_response("Gemini"))
+        client = LLMClient(gemini_api_key="gem")
+        client._providers[LLMProvider.GEMINI]._async_client = gemini
+
+        response = await client.acomplete("Test", models={LLMProvider.GEMINI: "gemini-custom"})
+
+        assert response.model == "gemini-custom"
+        assert "gemini-custom" in gemini.requests[0]["url"]
+
+
+class TestLatencyHistogram:
+    """Tests for per-provider latency histograms."""
+
+    def test_empty_percentile_is_none(self) -> None:
+        assert LatencyHistogram().percentile(0.95) is None
+
+    def test_percentile_uses_bucket_bounds(self) -> None:
+        histogram = LatencyHistogram()
+        for _ in range(95):
+            histogram.record(80)
+        for _ in range(5):
+            histogram.record(4000)
+
+        assert histogram.percentile(0.5) == 100
+        assert histogram.percentile(0.95) == 100
+        assert histogram.percentile(0.99) == 5000
+
+    def test_sliding_window_evicts_old_samples(self) -> None:
+        histogram = LatencyHistogram(window=10)
+        for _ in range(10):
+            histogram.record(9000)
+        for _ in range(10):
+            histogram.record(150)
+
+        assert histogram.count == 10
+        assert histogram.percentile(0.95) == 200
+        assert histogram.to_dict()["10000"] == 0
+
+
+class TestLLMClientAsyncComplete:
+    """Tests for async, hedged completions."""
+
+    def _client(self, gemini: FakeAsyncClient, openai: FakeAsyncClient, **kwargs) -> LLMClient:
+        client = LLMClient(gemini_api_key="gem", openai_api_key="oai", **kwargs)
+        client._providers[LLMProvider.GEMINI]._async_client = gemini
+        client._providers[LLMProvider.OPENAI]._async_client = openai
+        return client
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        gemini = FakeAsyncClient(make_gemini_response("Gemini"))
+        openai = FakeAsyncClient(make_openai_response("OpenAI"))
+        client = self._client(gemini, openai, hedge_delay=1.0)
+
+        response = await client.acomplete("Hello")
+
+        assert response.provider == LLMProvider.GEMINI
+        assert openai.requests == []
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self) -> None:
+        gemini = FakeAsyncClient(make_gemini_response("Gemini"), delay=5.0)
+        openai = FakeAsyncClient(make_openai_response("OpenAI"))
+        client = self._client(gemini, openai, hedge_delay=0.01)
+
+        response = await asyncio.wait_for(client.acomplete("Hello"), timeout=1)
+
+        assert response.provider == LLMProvider.OPENAI
+        assert gemini.cancelled
+        assert client.get_stats(LLMProvider.OPENAI)["hedges_won"] == 1
+        assert client.get_stats(LLMProvider.GEMINI)["errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_disabled_waits_for_primary(self) -> None:
+        gemini = FakeAsyncClient(make_gemini_response("Gemini"), delay=0.05)
+        openai = FakeAsyncClient(make_openai_response("OpenAI"))
+        client = self._client(gemini, openai, hedge_delay=0.001)
+
+        response = await client.acomplete("Hello", hedge=False)
+
+        assert response.provider == LLMProvider.GEMINI
+        assert openai.requests == []
+
+    @pytest.mark.asyncio
+    async def test_failure_falls_through_immediately(self) -> None:
+        gemini = FakeAsyncClient({}, error=Exception("API Error"))
+        openai = FakeAsyncClient(make_openai_response("OpenAI"))
+        client = self._client(gemini, openai, hedge_delay=60.0)
+
+        response = await asyncio.wait_for(client.acomplete("Hello"), timeout=1)
+
+        assert response.provider == LLMProvider.OPENAI
+        assert client.get_stats(LLMProvider.GEMINI)["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_response_is_not_accepted(self) -> None:
+        gemini = FakeAsyncClient(make_gemini_response(""))
+        openai = FakeAsyncClient(make_openai_response("OpenAI"))
+        client = self._client(gemini, openai)
+
+        response = await client.acomplete("Hello")
+
+        assert response.provider == LLMProvider.OPENAI
+
+    @pytest.mark.asyncio
+    async def test_all_providers_fail_raises(self) -> None:
+        gemini = FakeAsyncClient({}, error=Exception("down"))
+        openai = FakeAsyncClient({}, error=Exception("down"))
+        client = self._client(gemini, openai)
+
+        with pytest.raises(RuntimeError, match="All LLM providers failed"):
+            await client.acomplete("Hello")
+
+    @pytest.mark.asyncio
+    async def test_records_latency_histogram(self) -> None:
+        gemini = FakeAsyncClient(make_gemini_response("Gemini"))
+        openai = FakeAsyncClient(make_openai_response("OpenAI"))
+        client = self._client(gemini, openai)
+
+        await client.acomplete("Hello")
+
+        stats = client.get_stats(LLMProvider.GEMINI)
+        assert stats["requests"] == 1
+        assert stats["p95_latency_ms"] == 50
+
+    def test_hedge_delay_tracks_observed_p95(self) -> None:
+        client = LLMClient(gemini_api_key="gem", hedge_delay=2.0)
+        assert client.hedge_delay_for(LLMProvider.GEMINI) == 2.0
+
+        for _ in range(50):
+            client._latency[LLMProvider.GEMINI].record(400)
+
+        assert client.hedge_delay_for(LLMProvider.GEMINI) == 0.5
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Test: Module-Level Functions
@@ -1,6 +1,10 @@
+import asyncio
 from datetime import datetime
 
+import pytest
+
 from assistant.services.intent import ParsedIntent
+from assistant.services.llm_client import LLMProvider, LLMResponse
 from assistant.services.llm_parser import LLMIntentParser
 
 
@@ -14,28 +18,25 @@ class DummyParser:
         return self.result
 
 
-class FakeResponse:
-    def __init__(self, payload: dict) -> None:
-        self._payload = payload
-
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self) -> dict:
-        return self._payload
+class FakeLLMClient:
+    def __init__(self, text: str | None = None, available: bool = True) -> None:
+        self.text = text
+        self.is_available = available
+        self.requests: list[tuple[str, dict]] = []
 
+    async def acomplete(self, prompt: str, **kwargs) -> LLMResponse:
+        self.requests.append((prompt, kwargs))
+        return LLMResponse(text=self.text or "", provider=LLMProvider.GEMINI, model="m")
 
-class FakeClient:
-    def __init__(self, payload: dict) -> None:
-        self.payload = payload
-        self.requests: list[tuple[str, dict, dict]] = []
 
-    def post(self, url: str, params: dict, json: dict) -> FakeResponse:
-        self.requests.append((url, params, json))
-        return FakeResponse(self.payload)
+class SlowLLMClient(FakeLLMClient):
+    async def acomplete(self, prompt: str, **kwargs) -> LLMResponse:
+        await asyncio.sleep(10)
+        return await super().acomplete(prompt, **kwargs)
 
 
-def test_llm_parser_falls_back_without_key():
+@pytest.mark.asyncio
+async def test_llm_parser_falls_back_without_key():
     base_result = ParsedIntent(
         intent_type="task",
         title="Buy milk",
@@ -43,15 +44,16 @@ def test_llm_parser_falls_back_without_key():
         raw_text="Buy milk",
     )
     dummy = DummyParser(base_result)
-    parser = LLMIntentParser(api_key="", base_parser=dummy, client=FakeClient({}))
+    parser = LLMIntentParser(base_parser=dummy, llm_client=FakeLLMClient(available=False))
 
-    result = parser.parse("Buy milk")
+    result = await parser.parse("Buy milk")
 
     assert result is base_result
     assert dummy.calls == ["Buy milk"]
 
 
-def test_llm_parser_parses_valid_response():
+@pytest.mark.asyncio
+async def test_llm_parser_parses_valid_response():
     base_result = ParsedIntent(
         intent_type="note",
         title="Fallback",
@@ -59,30 +61,18 @@ def test_llm_parser_parses_valid_response():
         raw_text="Schedule flight",
     )
     dummy = DummyParser(base_result)
-    payload = {
-        "candidates": [
-            {
-                "content": {
-                    "parts": [
-                        {
-                            "text": (
-                                '{"intent_type": "task", '
-                                '"title": "Book flight", '
-                                '"confidence": 92, '
-                                '"due_date": "2026-01-15T09:00:00-08:00", '
-                                '"due_timezone": "America/Los_Angeles", '
-                                '"people": ["Alex"], '
-                                '"places": ["LAX"]}'
-                            )
-                        }
-                    ]
-                }
-            }
-        ]
-    }
-    parser = LLMIntentParser(api_key="test-key", base_parser=dummy, client=FakeClient(payload))
-
-    result = parser.parse("Schedule flight")
+    llm_client = FakeLLMClient(
+        '{"intent_type": "task", '
+        '"title": "Book flight", '
+        '"confidence": 92, '
+        '"due_date": "2026-01-15T09:00:00-08:00", '
+        '"due_timezone": "America/Los_Angeles", '
+        '"people": ["Alex"], '
+        '"places": ["LAX"]}'
+    )
+    parser = LLMIntentParser(model="gemini-test", base_parser=dummy, llm_client=llm_client)
+
+    result = await parser.parse("Schedule flight")
 
     assert result.intent_type == "task"
     assert result.title == "Book flight"
@@ -91,9 +81,13 @@ def test_llm_parser_parses_valid_response():
     assert result.places == ["LAX"]
     assert result.due_date == datetime.fromisoformat("2026-01-15T09:00:00-08:00")
     assert result.due_timezone == "America/Los_Angeles"
+    _, options = llm_client.requests[0]
+    assert options["json_mode"] is True
+    assert options["models"] == {LLMProvider.GEMINI: "gemini-test"}
 
 
-def test_llm_parser_falls_back_on_invalid_payload():
+@pytest.mark.asyncio
+async def test_llm_parser_falls_back_on_invalid_payload():
     base_result = ParsedIntent(
         intent_type="task",
         title="Call mom",
@@ -101,20 +95,29 @@ def test_llm_parser_falls_back_on_invalid_payload():
         raw_text="Call mom",
     )
     dummy = DummyParser(base_result)
-    payload = {
-        "candidates": [
-            {
-                "content": {
-                    "parts": [
-                        {"text": "not json"},
-                    ]
-                }
-            }
-        ]
-    }
-    parser = LLMIntentParser(api_key="test-key", base_parser=dummy, client=FakeClient(payload))
-
-    result = parser.parse("Call mom")
+    parser = LLMIntentParser(base_parser=dummy, llm_client=FakeLLMClient("not json"))
+
+    result = await parser.parse("Call mom")
 
     assert result is base_result
     assert dummy.calls == ["Call mom"]
+
+
+@pytest.mark.asyncio
+async def test_llm_parser_falls_back_when_latency_budget_exceeded():
+    base_result = ParsedIntent(
+        intent_type="task",
+        title="Buy milk",
+        confidence=55,
+        raw_text="Buy milk",
+    )
+    dummy = DummyParser(base_result)
+    parser = LLMIntentParser(
+        base_parser=dummy,
+        llm_client=SlowLLMClient("{}"),
+        latency_budget=0.01,
+    )
+
+    result = await asyncio.wait_for(parser.parse("Buy milk"), timeout=1)
+
+    assert result is base_result
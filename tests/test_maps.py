@@ -0,0 +1,206 @@
+"""Tests for the Google Maps client travel-time matrix and batching."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from assistant.google.maps import (
+    MATRIX_MAX_ELEMENTS,
+    MapsClient,
+    TravelTime,
+    TravelTimeBatcher,
+    matrix_chunks,
+)
+from assistant.google.travel_cache import TravelTimeCache
+
+
+def matrix_response(origins: list[str], destinations: list[str]) -> MagicMock:
+    """Distance Matrix payload where duration = 60 * (row + 1) + column."""
+    response = MagicMock()
+    response.json.return_value = {
+        "status": "OK",
+        "rows": [
+            {
+                "elements": [
+                    {
+                        "status": "OK",
+                        "distance": {"value": 1000},
+                        "duration": {"value": 60 * (i + 1) + j},
+                    }
+                    for j in range(len(destinations))
+                ]
+            }
+            for i in range(len(origins))
+        ],
+    }
+    return response
+
+
+def make_client() -> tuple[MapsClient, MagicMock]:
+    http = MagicMock()
+
+    async def get(url, params):
+        return matrix_response(params["origins"].split("|"), params["destinations"].split("|"))
+
+    http.get = AsyncMock(side_effect=get)
+    client = MapsClient(api_key="test-key", travel_cache=TravelTimeCache(persist=False))
+    client._get_client = AsyncMock(return_value=http)
+    return client, http
+
+
+def travel(origin: str, destination: str, seconds: int = 600) -> TravelTime:
+    return TravelTime(
+        origin=origin, destination=destination, distance_meters=1000, duration_seconds=seconds
+    )
+
+
+class TestMatrixChunks:
+    """Tests for splitting a matrix into API-sized requests."""
+
+    def test_small_matrix_is_one_request(self):
+        assert matrix_chunks(1, 10) == [(slice(0, 1), slice(0, 10))]
+
+    def test_chunks_respect_limits_and_cover_every_element(self):
+        chunks = matrix_chunks(30, 40)
+        covered = set()
+        for origins, destinations in chunks:
+            rows = range(30)[origins]
+            cols = range(40)[destinations]
+            assert len(rows) <= 25 and len(cols) <= 25
+            assert len(rows) * len(cols) <= MATRIX_MAX_ELEMENTS
+            covered.update((r, c) for r in rows for c in cols)
+        assert len(covered) == 30 * 40
+
+    def test_empty_matrix(self):
+        assert matrix_chunks(0, 5) == []
+
+
+class TestTravelTimeMatrix:
+    """Tests for MapsClient.get_travel_time_matrix."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_for_many_destinations(self):
+        client, http = make_client()
+        destinations = [f"Place {i}" for i in range(10)]
+
+        matrix = await client.get_travel_time_matrix(["Home"], destinations)
+
+        http.get.assert_awaited_once()
+        params = http.get.await_args.kwargs["params"]
+        assert params["destinations"] == "|".join(destinations)
+        assert params["departure_time"] == "now"
+        assert [t.duration_seconds for t in matrix[0]] == [60 + j for j in range(10)]
+        assert matrix[0][3].destination == "Place 3"
+
+    @pytest.mark.asyncio
+    async def test_large_matrix_is_chunked_and_reassembled(self):
+        client, http = make_client()
+        origins = [(37.0 + i, -122.0) for i in range(3)]
+        destinations = [f"Place {j}" for j in range(60)]
+
+        matrix = await client.get_travel_time_matrix(origins, destinations)
+
+        assert http.get.await_count == len(matrix_chunks(3, 60))
+        assert matrix[2][59].origin == "39.0,-122.0"
+        assert matrix[2][59].destination == "Place 59"
+        assert all(cell is not None for row in matrix for cell in row)
+
+    @pytest.mark.asyncio
+    async def test_failed_routes_are_none(self):
+        client, http = make_client()
+        response = matrix_response(["Home"], ["A", "B"])
+        response.json.return_value["rows"][0]["elements"][1] = {"status": "ZERO_RESULTS"}
+        http.get = AsyncMock(return_value=response)
+
+        matrix = await client.get_travel_time_matrix(["Home"], ["A", "B"])
+
+        assert matrix[0][0] is not None
+        assert matrix[0][1] is None
+
+    @pytest.mark.asyncio
+    async def test_without_api_key_returns_empty_cells(self):
+        client = MapsClient(api_key="")
+        client.api_key = ""
+
+        assert await client.get_travel_time_matrix(["Home"], ["A"]) == [[None]]
+
+
+class TestTravelTimeBatcher:
+    """Tests for collecting travel-time lookups into matrix requests."""
+
+    @pytest.mark.asyncio
+    async def test_same_origin_lookups_share_one_matrix_call(self):
+        maps = MagicMock()
+        maps.get_travel_time_matrix = AsyncMock(
+            return_value=[[travel("Home", f"P{i}", 60 * i) for i in range(10)]]
+        )
+        batcher = TravelTimeBatcher(maps)
+        for i in range(10):
+            batcher.add("Home", f"P{i}")
+
+        await batcher.resolve()
+
+        maps.get_travel_time_matrix.assert_awaited_once_with(
+            ["Home"], [f"P{i}" for i in range(10)], mode="driving"
+        )
+        assert batcher.get("Home", "P7").duration_seconds == 420
+
+    @pytest.mark.asyncio
+    async def test_single_lookup_uses_plain_request(self):
+        maps = MagicMock()
+        maps.get_travel_time = AsyncMock(return_value=travel("Home", "A"))
+        batcher = TravelTimeBatcher(maps)
+        batcher.add("Home", "A")
+
+        await batcher.resolve()
+
+        maps.get_travel_time.assert_awaited_once_with(
+            origin="Home", destination="A", mode="driving"
+        )
+        assert batcher.has("Home", "A")
+
+    @pytest.mark.asyncio
+    async def test_oversized_grid_groups_by_origin(self):
+        maps = MagicMock()
+
+        async def matrix(origins, destinations, mode):
+            return [[travel(o, d) for d in destinations] for o in origins]
+
+        maps.get_travel_time_matrix = AsyncMock(side_effect=matrix)
+        batcher = TravelTimeBatcher(maps)
+        # A chain of 12 legs: a 12 x 12 grid exceeds one request
+        for i in range(12):
+            batcher.add(f"L{i}", f"L{i + 1}")
+
+        await batcher.resolve()
+
+        for call in maps.get_travel_time_matrix.await_args_list:
+            assert len(call.args[0]) * len(call.args[1]) <= MATRIX_MAX_ELEMENTS
+        assert batcher.get("L11", "L12").destination == "L12"
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_resolves_to_none(self):
+        maps = MagicMock()
+        maps.get_travel_time_matrix = AsyncMock(side_effect=Exception("quota"))
+        batcher = TravelTimeBatcher(maps)
+        batcher.add("Home", "A")
+        batcher.add("Home", "B")
+
+        results = await batcher.resolve()
+
+        assert results == {("Home", "A"): None, ("Home", "B"): None}
+
+    @pytest.mark.asyncio
+    async def test_resolved_pairs_are_not_refetched(self):
+        maps = MagicMock()
+        maps.get_travel_time = AsyncMock(return_value=travel("Home", "A"))
+        batcher = TravelTimeBatcher(maps)
+        batcher.add("Home", "A")
+        await batcher.resolve()
+
+        batcher.add("Home", "A")
+        await batcher.resolve()
+
+        maps.get_travel_time.assert_awaited_once()
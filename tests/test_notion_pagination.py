@@ -0,0 +1,190 @@
+"""Tests for cursor-based pagination of Notion database queries."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from assistant.notion.client import NotionClient, iter_query_results
+from assistant.services.audit import AuditLogger
+
+
+def make_pages(total: int, page_size: int = 100) -> list[dict[str, Any]]:
+    """Build a sequence of Notion query responses covering `total` results."""
+    responses = []
+    for start in range(0, total, page_size):
+        end = min(start + page_size, total)
+        has_more = end < total
+        responses.append(
+            {
+                "results": [{"id": f"page-{i}"} for i in range(start, end)],
+                "has_more": has_more,
+                "next_cursor": f"cursor-{end}" if has_more else None,
+            }
+        )
+    return responses
+
+
+class FakeNotion:
+    """Serves paginated responses and records each request body."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.bodies: list[dict[str, Any]] = []
+
+    async def request(self, method: str, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        self.bodies.append(body)
+        start = int(body.get("start_cursor", "cursor-0").split("-")[1])
+        end = min(start + body["page_size"], self.total)
+        has_more = end < self.total
+        return {
+            "results": [{"id": f"page-{i}"} for i in range(start, end)],
+            "has_more": has_more,
+            "next_cursor": f"cursor-{end}" if has_more else None,
+        }
+
+
+class TestIterQueryResults:
+    """Tests for the streaming pagination iterator."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    async def test_follows_cursor_to_the_end(self, prefetch):
+        fake = FakeNotion(total=250)
+
+        pages = [
+            p
+            async for p in iter_query_results(
+                fake.request, "/databases/db/query", {}, prefetch=prefetch
+            )
+        ]
+
+        assert len(pages) == 250
+        assert pages[-1]["id"] == "page-249"
+        assert [b.get("start_cursor") for b in fake.bodies] == [None, "cursor-100", "cursor-200"]
+
+    @pytest.mark.asyncio
+    async def test_limit_caps_results_and_page_size(self):
+        fake = FakeNotion(total=500)
+
+        pages = [
+            p async for p in iter_query_results(fake.request, "/databases/db/query", {}, limit=150)
+        ]
+
+        assert len(pages) == 150
+        assert [b["page_size"] for b in fake.bodies] == [100, 50]
+
+    @pytest.mark.asyncio
+    async def test_early_termination_stops_fetching(self):
+        fake = FakeNotion(total=1000)
+
+        stream = iter_query_results(fake.request, "/databases/db/query", {}, prefetch=0)
+        async for page in stream:
+            assert page["id"] == "page-0"
+            break
+        await stream.aclose()
+
+        assert len(fake.bodies) == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_is_bounded(self):
+        fake = FakeNotion(total=1000)
+
+        stream = iter_query_results(fake.request, "/databases/db/query", {}, prefetch=1)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        # The consumed page, one buffered page and at most one in flight
+        assert len(fake.bodies) <= 3
+
+    @pytest.mark.asyncio
+    async def test_preserves_filter_and_sorts(self):
+        fake = FakeNotion(total=120)
+        body = {"filter": {"property": "x"}, "sorts": [{"property": "y"}]}
+
+        _ = [p async for p in iter_query_results(fake.request, "/databases/db/query", body)]
+
+        assert all(b["filter"] == {"property": "x"} for b in fake.bodies)
+        assert "start_cursor" not in body
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_from_prefetch(self):
+        request = AsyncMock(
+            side_effect=[make_pages(200)[0], RuntimeError("Notion down")],
+        )
+
+        with pytest.raises(RuntimeError, match="Notion down"):
+            _ = [p async for p in iter_query_results(request, "/databases/db/query", {})]
+
+    @pytest.mark.asyncio
+    async def test_response_without_has_more_is_single_page(self):
+        request = AsyncMock(return_value={"results": [{"id": "a"}]})
+
+        pages = [p async for p in iter_query_results(request, "/databases/db/query", {})]
+
+        assert pages == [{"id": "a"}]
+        request.assert_called_once()
+
+
+class TestClientPagination:
+    """Tests for NotionClient query methods returning every page."""
+
+    @pytest.mark.asyncio
+    async def test_query_tasks_returns_more_than_one_page(self):
+        client = NotionClient(api_key="test")
+        client._request = AsyncMock(side_effect=make_pages(230))
+
+        tasks = await client.query_tasks(exclude_statuses=["done"])
+
+        assert len(tasks) == 230
+        assert client._request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_query_people_paginates(self):
+        client = NotionClient(api_key="test")
+        client._request = AsyncMock(side_effect=make_pages(150))
+
+        people = await client.query_people()
+
+        assert len(people) == 150
+
+    @pytest.mark.asyncio
+    async def test_query_emails_respects_limit(self):
+        client = NotionClient(api_key="test")
+        client._request = AsyncMock(side_effect=make_pages(300))
+
+        emails = await client.query_emails(limit=20)
+
+        assert len(emails) == 20
+        client._request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_query_streams_lazily(self):
+        client = NotionClient(api_key="test")
+        client._request = AsyncMock(side_effect=make_pages(300))
+
+        seen = 0
+        async for _ in client.iter_query("tasks", prefetch=0):
+            seen += 1
+            if seen == 100:
+                break
+
+        assert client._request.call_count == 1
+
+
+class TestAuditQueryLogPagination:
+    """Tests for AuditLogger.query_log pagination."""
+
+    @pytest.mark.asyncio
+    async def test_query_log_follows_cursor(self):
+        notion = MagicMock()
+        notion._request = AsyncMock(side_effect=make_pages(180))
+        audit = AuditLogger(notion_client=notion)
+
+        results = await audit.query_log(limit=500)
+
+        assert len(results) == 180
+        assert notion._request.call_count == 2
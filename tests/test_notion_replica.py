@@ -0,0 +1,384 @@
+"""Tests for the local Notion replica and its sync service."""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from assistant.config import settings
+from assistant.notion.client import NotionClient
+from assistant.notion.replica import (
+    NotionReplica,
+    UnsupportedFilterError,
+    get_notion_replica,
+    matches_filter,
+    sort_pages,
+)
+from assistant.services.replica_sync import ReplicaSyncService
+
+TASKS_DB = "tasks-db-0001"
+
+
+def make_task(
+    page_id: str,
+    title: str,
+    status: str = "todo",
+    due: str | None = None,
+    deleted_at: str | None = None,
+    edited: str = "2026-01-12T10:00:00.000Z",
+) -> dict:
+    """Build a Notion task page object."""
+    return {
+        "object": "page",
+        "id": page_id,
+        "parent": {"type": "database_id", "database_id": TASKS_DB},
+        "last_edited_time": edited,
+        "archived": False,
+        "properties": {
+            "title": {"type": "title", "title": [{"plain_text": title}]},
+            "status": {"type": "select", "select": {"name": status}},
+            "due_date": {"type": "date", "date": {"start": due} if due else None},
+            "deleted_at": {"type": "date", "date": {"start": deleted_at} if deleted_at else None},
+            "place_ids": {"type": "rich_text", "rich_text": []},
+        },
+    }
+
+
+@pytest.fixture
+def replica(tmp_path):
+    """Create a replica in a temp directory with a tasks database configured."""
+    with patch("assistant.notion.replica.settings") as mock_settings:
+        mock_settings.notion_tasks_db_id = TASKS_DB
+        replica = NotionReplica(path=tmp_path / "notion.db")
+        yield replica
+        replica.close()
+
+
+class TestMatchesFilter:
+    """Tests for local evaluation of Notion filters."""
+
+    def test_select_equals_and_does_not_equal(self):
+        page = make_task("t1", "Buy milk", status="done")
+        assert matches_filter(page, {"property": "status", "select": {"equals": "done"}})
+        assert not matches_filter(
+            page, {"property": "status", "select": {"does_not_equal": "done"}}
+        )
+
+    def test_date_is_empty(self):
+        page = make_task("t1", "Buy milk")
+        assert matches_filter(page, {"property": "deleted_at", "date": {"is_empty": True}})
+
+    def test_date_range(self):
+        page = make_task("t1", "Buy milk", due="2026-01-12")
+        assert matches_filter(
+            page,
+            {"property": "due_date", "date": {"on_or_before": "2026-01-12T23:59:59+00:00"}},
+        )
+        assert not matches_filter(
+            page,
+            {"property": "due_date", "date": {"on_or_after": "2026-01-13T00:00:00+00:00"}},
+        )
+
+    def test_date_only_value_compares_by_local_day(self):
+        """A task due on a date matches that local day's bounds west of UTC."""
+        page = make_task("t1", "Buy milk", due="2026-10-16")
+        today = {
+            "and": [
+                {"property": "due_date", "date": {"on_or_after": "2026-10-16T00:00:00-07:00"}},
+                {"property": "due_date", "date": {"on_or_before": "2026-10-16T23:59:59-07:00"}},
+            ]
+        }
+        tomorrow = {"property": "due_date", "date": {"on_or_after": "2026-10-17T00:00:00-07:00"}}
+
+        with patch.object(settings, "user_timezone", "America/Los_Angeles"):
+            assert matches_filter(page, today)
+            assert not matches_filter(page, tomorrow)
+            assert matches_filter(page, {"property": "due_date", "date": {"equals": "2026-10-16"}})
+
+    def test_datetime_value_against_date_only_bound(self):
+        page = make_task("t1", "Call", due="2026-10-16T23:30:00-07:00")
+
+        with patch.object(settings, "user_timezone", "America/Los_Angeles"):
+            assert matches_filter(page, {"property": "due_date", "date": {"equals": "2026-10-16"}})
+            assert not matches_filter(
+                page, {"property": "due_date", "date": {"after": "2026-10-16"}}
+            )
+
+    def test_compound_and_or(self):
+        page = make_task("t1", "Call Sarah", status="todo")
+        query_filter = {
+            "and": [
+                {"property": "status", "select": {"equals": "todo"}},
+                {
+                    "or": [
+                        {"property": "title", "title": {"contains": "sarah"}},
+                        {"property": "title", "title": {"contains": "mike"}},
+                    ]
+                },
+            ]
+        }
+        assert matches_filter(page, query_filter)
+
+    def test_timestamp_filter(self):
+        page = make_task("t1", "Buy milk", edited="2026-01-12T10:00:00.000Z")
+        assert matches_filter(
+            page,
+            {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": "2026-01-12T09:00:00Z"},
+            },
+        )
+
+    def test_unsupported_filter_raises(self):
+        page = make_task("t1", "Buy milk")
+        with pytest.raises(UnsupportedFilterError):
+            matches_filter(page, {"property": "people", "relation": {"contains": "x"}})
+
+
+class TestSortPages:
+    """Tests for local sorting."""
+
+    def test_ascending_with_empty_last(self):
+        pages = [
+            make_task("t1", "A"),
+            make_task("t2", "B", due="2026-01-14"),
+            make_task("t3", "C", due="2026-01-12"),
+        ]
+        ordered = sort_pages(pages, [{"property": "due_date", "direction": "ascending"}])
+        assert [p["id"] for p in ordered] == ["t3", "t2", "t1"]
+
+    def test_descending_with_empty_last(self):
+        pages = [
+            make_task("t1", "A"),
+            make_task("t2", "B", due="2026-01-14"),
+            make_task("t3", "C", due="2026-01-12"),
+        ]
+        ordered = sort_pages(pages, [{"property": "due_date", "direction": "descending"}])
+        assert [p["id"] for p in ordered] == ["t2", "t3", "t1"]
+
+
+class TestNotionReplica:
+    """Tests for replica storage."""
+
+    def test_upsert_resolves_db_from_parent(self, replica):
+        assert replica.upsert_page(make_task("t1", "Buy milk"))
+        assert replica.count("tasks") == 1
+        assert replica.get_page("t1")["id"] == "t1"
+
+    def test_upsert_ignores_unreplicated_pages(self, replica):
+        page = make_task("t1", "Buy milk")
+        page["parent"]["database_id"] = "other-db"
+        assert not replica.upsert_page(page)
+        assert replica.get_page("t1") is None
+
+    def test_archived_page_is_removed(self, replica):
+        replica.upsert_page(make_task("t1", "Buy milk"))
+        archived = make_task("t1", "Buy milk")
+        archived["archived"] = True
+        replica.upsert_page(archived)
+        assert replica.get_page("t1") is None
+
+    def test_query_filters_sorts_and_limits(self, replica):
+        replica.apply_pages(
+            "tasks",
+            [
+                make_task("t1", "A", status="done", due="2026-01-10"),
+                make_task("t2", "B", due="2026-01-14"),
+                make_task("t3", "C", due="2026-01-12"),
+            ],
+        )
+        results = replica.query(
+            "tasks",
+            {
+                "filter": {"property": "status", "select": {"does_not_equal": "done"}},
+                "sorts": [{"property": "due_date", "direction": "ascending"}],
+            },
+            limit=1,
+        )
+        assert [p["id"] for p in results] == ["t3"]
+
+    def test_replace_all_drops_missing_pages(self, replica):
+        replica.apply_pages("tasks", [make_task("t1", "A"), make_task("t2", "B")])
+        replica.replace_all("tasks", [make_task("t2", "B")])
+        assert replica.get_page("t1") is None
+        assert replica.count("tasks") == 1
+
+    def test_persists_across_instances(self, replica, tmp_path):
+        replica.apply_pages("tasks", [make_task("t1", "A")])
+        replica.set_sync_state("tasks", "2026-01-12T10:00:00.000Z", full=True)
+
+        reopened = NotionReplica(path=tmp_path / "notion.db")
+        assert reopened.get_page("t1") is not None
+        assert reopened.is_ready("tasks")
+        assert reopened.get_watermark("tasks") == "2026-01-12T10:00:00.000Z"
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_async_writes_commit_off_the_event_loop(self, replica, tmp_path):
+        threads = []
+        persist = replica._persist
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            persist(*args, **kwargs)
+
+        with patch.object(replica, "_persist", side_effect=record_thread):
+            await replica.aapply_pages("tasks", [make_task("t1", "A"), make_task("t2", "B")])
+            await replica.areplace_all("tasks", [make_task("t2", "B")])
+            await replica.aupsert_page(make_task("t3", "C"))
+        await replica.aset_sync_state("tasks", "2026-01-12T10:00:00.000Z", full=True)
+
+        assert len(threads) == 3
+        assert all(thread is not threading.current_thread() for thread in threads)
+        assert replica.get_page("t1") is None
+
+        reopened = NotionReplica(path=tmp_path / "notion.db")
+        assert sorted(reopened._page_db) == ["t2", "t3"]
+        assert reopened.is_ready("tasks")
+        reopened.close()
+
+    def test_not_ready_before_full_sync(self, replica):
+        assert not replica.is_ready("tasks")
+        replica.set_sync_state("tasks", "2026-01-12T10:00:00.000Z")
+        assert not replica.is_ready("tasks")
+
+    def test_unwritable_data_dir_disables_replica(self, tmp_path, monkeypatch):
+        import assistant.notion.replica as replica_module
+
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setattr(replica_module, "_replica", None)
+        monkeypatch.setattr(replica_module, "_replica_failed", False)
+        monkeypatch.setattr(settings, "notion_replica_enabled", True)
+        monkeypatch.setattr(settings, "data_dir", str(blocker))
+
+        assert get_notion_replica() is None
+        assert NotionClient(api_key="secret")._replica is None
+
+
+class TestNotionClientReplica:
+    """Tests for NotionClient reads/writes through the replica."""
+
+    @pytest.mark.asyncio
+    async def test_query_tasks_served_from_replica(self, replica):
+        replica.apply_pages("tasks", [make_task("t1", "A"), make_task("t2", "B", status="done")])
+        replica.set_sync_state("tasks", None, full=True)
+        client = NotionClient(api_key="test", replica=replica)
+        client._request = AsyncMock()
+
+        results = await client.query_tasks(exclude_statuses=["done"])
+
+        assert [p["id"] for p in results] == ["t1"]
+        client._request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_falls_back_to_network_when_not_ready(self, replica):
+        client = NotionClient(api_key="test", replica=replica)
+        client._request = AsyncMock(return_value={"results": [{"id": "remote"}]})
+
+        results = await client.query_tasks()
+
+        assert results == [{"id": "remote"}]
+        client._request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_task_served_from_replica(self, replica):
+        replica.apply_pages("tasks", [make_task("t1", "A")])
+        client = NotionClient(api_key="test", replica=replica)
+        client._request = AsyncMock()
+
+        page = await client.get_task("t1")
+
+        assert page["id"] == "t1"
+        client._request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_through_mirrors_returned_page(self, replica):
+        client = NotionClient(api_key="test", replica=replica)
+        await client._mirror_write("POST", "/pages", make_task("t9", "New task"))
+        assert replica.get_page("t9") is not None
+
+    @pytest.mark.asyncio
+    async def test_write_through_ignores_queries(self, replica):
+        client = NotionClient(api_key="test", replica=replica)
+        await client._mirror_write("POST", f"/databases/{TASKS_DB}/query", make_task("t9", "X"))
+        assert replica.get_page("t9") is None
+
+
+class TestReplicaSyncService:
+    """Tests for the replica sync loop."""
+
+    @pytest.mark.asyncio
+    async def test_full_sync_follows_cursor(self, replica):
+        notion = NotionClient(api_key="test", replica=replica)
+        notion._request = AsyncMock(
+            side_effect=[
+                {"results": [make_task("t1", "A")], "has_more": True, "next_cursor": "c1"},
+                {"results": [make_task("t2", "B")], "has_more": False, "next_cursor": None},
+            ]
+        )
+        service = ReplicaSyncService(replica=replica, notion_client=notion)
+
+        with patch("assistant.services.replica_sync.database_id_for", return_value=TASKS_DB):
+            count = await service.sync_database("tasks")
+
+        assert count == 2
+        assert replica.is_ready("tasks")
+        second_body = notion._request.call_args_list[1].args[2]
+        assert second_body["start_cursor"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_uses_watermark(self, replica):
+        replica.apply_pages("tasks", [make_task("t1", "A")])
+        replica.set_sync_state("tasks", "2026-01-12T10:00:00.000Z", full=True)
+        notion = NotionClient(api_key="test", replica=replica)
+        notion._request = AsyncMock(
+            return_value={
+                "results": [make_task("t1", "A renamed", edited="2026-01-12T11:00:00.000Z")],
+                "has_more": False,
+            }
+        )
+        service = ReplicaSyncService(replica=replica, notion_client=notion)
+
+        with patch("assistant.services.replica_sync.database_id_for", return_value=TASKS_DB):
+            await service.sync_database("tasks")
+
+        body = notion._request.call_args.args[2]
+        assert body["filter"]["last_edited_time"] == {"on_or_after": "2026-01-12T10:00:00.000Z"}
+        assert replica.get_watermark("tasks") == "2026-01-12T11:00:00.000Z"
+        title = replica.get_page("t1")["properties"]["title"]["title"][0]["plain_text"]
+        assert title == "A renamed"
+
+    @pytest.mark.asyncio
+    async def test_sync_failure_keeps_snapshot(self, replica):
+        replica.apply_pages("tasks", [make_task("t1", "A")])
+        replica.set_sync_state("tasks", "2026-01-12T10:00:00.000Z", full=True)
+        notion = NotionClient(api_key="test", replica=replica)
+        notion._request = AsyncMock(side_effect=Exception("Notion down"))
+        service = ReplicaSyncService(replica=replica, notion_client=notion)
+
+        with (
+            patch("assistant.services.replica_sync.REPLICATED_DATABASES", {"tasks": "x"}),
+            patch("assistant.services.replica_sync.database_id_for", return_value=TASKS_DB),
+        ):
+            result = await service.sync_now(full=False)
+
+        assert not result.success
+        assert replica.get_page("t1") is not None
+
+    @pytest.mark.asyncio
+    async def test_start_noop_when_disabled(self):
+        service = ReplicaSyncService()
+        with patch("assistant.services.replica_sync.settings") as mock_settings:
+            mock_settings.notion_replica_enabled = False
+            await service.start()
+        assert not service.is_running
+
+    def test_last_full_sync_recorded(self, replica):
+        replica.set_sync_state("tasks", None, full=True)
+        last = replica.get_last_full_sync("tasks")
+        assert last is not None
+        assert (datetime.now(UTC) - last).total_seconds() < 60
@@ -0,0 +1,200 @@
+"""Tests for the Notion circuit breaker and rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from assistant.notion.client import NotionClient
+from assistant.notion.throttle import (
+    MIN_RATE,
+    CircuitBreaker,
+    CircuitOpenError,
+    NotionRateLimiter,
+    get_throttle_stats,
+)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+        for _ in range(3):
+            assert breaker.allow_request()
+            breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.get_stats()["rejected"] == 1
+        assert breaker.opened == 1
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+
+        with patch("assistant.notion.throttle.time.monotonic", return_value=time.monotonic() + 11):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow_request()
+            assert not breaker.allow_request()
+
+            breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+
+        with patch("assistant.notion.throttle.time.monotonic", return_value=time.monotonic() + 11):
+            assert breaker.allow_request()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+
+        assert breaker.opened == 2
+
+    def test_released_probe_can_be_claimed_again(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.allow_request()
+        breaker.release_probe()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+
+
+class TestNotionRateLimiter:
+    def test_burst_then_spaced(self):
+        limiter = NotionRateLimiter(rate=2.0, burst=2)
+
+        waits = [limiter.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.5, abs=0.01)
+        assert waits[3] == pytest.approx(1.0, abs=0.01)
+        assert limiter.get_stats()["delayed"] == 2
+
+    def test_throttle_halves_rate_and_holds_callers(self):
+        limiter = NotionRateLimiter(rate=3.0, burst=3)
+
+        limiter.record_throttle(retry_after=2.0)
+
+        assert limiter.rate == 1.5
+        assert limiter.reserve() == pytest.approx(2.0 + 1 / 1.5, abs=0.01)
+        assert limiter.get_stats()["throttled"] == 1
+
+    def test_rate_floor_and_recovery(self):
+        limiter = NotionRateLimiter(rate=3.0)
+        for _ in range(10):
+            limiter.record_throttle(retry_after=0)
+        assert limiter.rate == MIN_RATE
+
+        for _ in range(1000):
+            limiter.record_success()
+        assert limiter.rate == 3.0
+
+
+def make_client(handler, **kwargs) -> NotionClient:
+    client = NotionClient(api_key="secret", **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._queue_offline = MagicMock()  # type: ignore[method-assign]
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with (
+        patch("assistant.notion.client.asyncio.sleep", new=AsyncMock()),
+        patch("assistant.notion.throttle.asyncio.sleep", new=AsyncMock()),
+    ):
+        yield
+
+
+class TestRequestGuards:
+    @pytest.mark.asyncio
+    async def test_outage_opens_circuit_and_fails_fast(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        client = make_client(handler, circuit_breaker=CircuitBreaker(failure_threshold=3))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._request("POST", "/pages", {"a": 1})
+        assert len(calls) == 3
+
+        with pytest.raises(CircuitOpenError):
+            await client._request("POST", "/pages", {"a": 2})
+        assert len(calls) == 3
+        assert client._queue_offline.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_429_throttles_and_retries(self):
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json={"object": "list", "id": "ok"}),
+            ]
+        )
+        limiter = NotionRateLimiter(rate=3.0)
+        client = make_client(lambda request: next(responses), rate_limiter=limiter)
+
+        result = await client._request("GET", "/users/me")
+
+        assert result["id"] == "ok"
+        assert limiter.get_stats()["throttled"] == 1
+        assert limiter.get_stats()["delayed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = make_client(lambda request: httpx.Response(404), circuit_breaker=breaker)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._request("GET", "/pages/missing")
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        client._queue_offline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_circuit(self):
+        async def hang(request):
+            await asyncio.Event().wait()
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        client = make_client(hang, circuit_breaker=breaker)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(client._request("GET", "/users/me"), timeout=0.05)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_guards_by_default(self):
+        def handler(request):
+            raise httpx.ConnectError("down")
+
+        for _ in range(5):
+            with pytest.raises(httpx.ConnectError):
+                await make_client(handler)._request("GET", "/users/me", retries=1)
+
+        stats = get_throttle_stats()
+        assert stats["circuit"]["state"] == CircuitBreaker.OPEN
+        assert stats["rate_limiter"]["requests"] == 5
@@ -5,6 +5,7 @@ Implements tests for PRD Section 4.8 (Failure Handling):
 - AT-115: Notion Recovery Sync
 """
 
+import asyncio
 import json
 from datetime import UTC, datetime
 from pathlib import Path
@@ -12,12 +13,16 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from assistant.notion.schemas import LogEntry, Person, Place, Project
+from assistant.notion.throttle import CircuitOpenError
 from assistant.services.offline_queue import (
     OfflineQueue,
     QueuedAction,
     QueuedActionType,
     get_offline_queue,
     get_offline_response,
+    notion_request_action,
+    pending_ref,
     queue_for_offline_sync,
 )
 
@@ -322,6 +327,535 @@ class TestQueueProcessing:
             assert task_arg.title == titles[i]
 
 
+class TestDurableLog:
+    """Test the append-only log behind the queue."""
+
+    @pytest.fixture
+    def queue(self, tmp_path: Path) -> OfflineQueue:
+        return OfflineQueue(queue_path=tmp_path / "queue" / "pending.jsonl")
+
+    @pytest.fixture
+    def mock_notion_client(self):
+        client = MagicMock()
+        client.create_task = AsyncMock(return_value="task-id")
+        client.close = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_dedupe_survives_restart(self, queue: OfflineQueue, mock_notion_client):
+        """Test an action processed by an earlier drain is not replayed again."""
+        queue.queue_task(title="Task 1", chat_id="123", message_id="1")
+        await queue.process_queue(notion_client=mock_notion_client)
+
+        restarted = OfflineQueue(queue_path=queue.queue_path)
+        restarted.queue_task(title="Task 1", chat_id="123", message_id="1")
+        result = await restarted.process_queue(notion_client=mock_notion_client)
+
+        assert result.deduplicated == 1
+        assert mock_notion_client.create_task.call_count == 1
+        assert restarted.get_pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_drain_compacts_log(self, queue: OfflineQueue, mock_notion_client):
+        """Test processed entries are removed from the file after a drain."""
+        for i in range(5):
+            queue.queue_task(title=f"Task {i}", chat_id="123", message_id=str(i))
+        mock_notion_client.create_task.side_effect = [
+            "task-0",
+            Exception("API error"),
+            "task-2",
+            "task-3",
+            "task-4",
+        ]
+
+        await queue.process_queue(notion_client=mock_notion_client)
+
+        records = [json.loads(line) for line in queue.queue_path.read_text().splitlines()]
+        assert [r["op"] for r in records if "op" in r] == ["done"] * 4
+        pending = [r for r in records if "op" not in r]
+        assert len(pending) == 1
+        assert pending[0]["retry_count"] == 1
+
+    def test_torn_line_is_skipped(self, queue: OfflineQueue):
+        """Test a partially written record does not corrupt later appends."""
+        queue.queue_task(title="Task 1", chat_id="123", message_id="1")
+        with open(queue.queue_path, "a") as f:
+            f.write('{"id": "torn", "action_ty')
+
+        queue.queue_task(title="Task 2", chat_id="123", message_id="2")
+
+        assert [a.data["title"] for a in queue.read_queue()] == ["Task 1", "Task 2"]
+
+    def test_reads_legacy_notion_client_entries(self, queue: OfflineQueue):
+        """Test raw requests in the old NotionClient format are replayable."""
+        queue.queue_path.parent.mkdir(parents=True)
+        queue.queue_path.write_text(
+            json.dumps(
+                {
+                    "timestamp": "2026-01-12T10:00:00+00:00",
+                    "method": "POST",
+                    "path": "/pages",
+                    "data": {"parent": {"database_id": "db"}},
+                }
+            )
+            + "\n"
+        )
+
+        actions = queue.read_queue()
+
+        assert len(actions) == 1
+        assert actions[0].action_type == QueuedActionType.NOTION_REQUEST
+        assert actions[0].data["path"] == "/pages"
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_move_to_dead_letter(
+        self, queue: OfflineQueue, mock_notion_client
+    ):
+        """Test an action failing MAX_RETRIES times is kept in the failed file."""
+        queue.queue_task(title="Broken", chat_id="123", message_id="1")
+        mock_notion_client.create_task.side_effect = Exception("validation error")
+
+        for _ in range(OfflineQueue.MAX_RETRIES):
+            await queue.process_queue(notion_client=mock_notion_client)
+
+        assert queue.get_pending_count() == 0
+        dead = [json.loads(line) for line in queue.failed_path.read_text().splitlines()]
+        assert dead[0]["data"]["title"] == "Broken"
+        assert "validation error" in dead[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_does_not_spend_retries(
+        self, queue: OfflineQueue, mock_notion_client
+    ):
+        """Test actions refused by an open Notion circuit stay queued as they were."""
+        queue.queue_task(title="Task 1", chat_id="123", message_id="1")
+        mock_notion_client.create_task.side_effect = CircuitOpenError("open")
+
+        result = await queue.process_queue(notion_client=mock_notion_client)
+
+        assert result.failed == 0
+        assert result.deferred == 1
+        assert queue.read_queue()[0].retry_count == 0
+
+    def test_write_queue_keeps_processed_keys(self, queue: OfflineQueue):
+        """Test rewriting pending actions keeps deduplication state."""
+        queue.queue_task(title="Task 1", chat_id="123", message_id="1")
+        queue._record({"op": "done", "key": "telegram:123:0"})
+
+        queue.write_queue(queue.read_queue())
+
+        assert queue.get_pending_count() == 1
+        assert "telegram:123:0" in queue._read_log().processed_keys
+
+
+class TestConcurrentReplay:
+    """Test bounded concurrent replay with per-entity ordering."""
+
+    @pytest.fixture
+    def queue(self, tmp_path: Path) -> OfflineQueue:
+        return OfflineQueue(queue_path=tmp_path / "queue" / "pending.jsonl", concurrency=3)
+
+    def _slow_client(self, calls: list[str], active: list[int]):
+        async def request(method, path, body, queue_offline=True):
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            await asyncio.sleep(0.01)
+            calls.append(body["n"])
+            active[0] -= 1
+            return {"id": path}
+
+        client = MagicMock()
+        client._request = AsyncMock(side_effect=request)
+        client.close = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_independent_entities_replay_concurrently(self, queue: OfflineQueue):
+        """Test concurrency is bounded while same-page updates stay ordered."""
+        for n in range(4):
+            for page in ("a", "b", "c", "d"):
+                queue.enqueue(notion_request_action("PATCH", f"/pages/{page}", {"n": f"{page}{n}"}))
+        calls: list[str] = []
+        active = [0, 0]
+
+        result = await queue.process_queue(notion_client=self._slow_client(calls, active))
+
+        assert result.successful == 16
+        assert active[1] == 3
+        for page in ("a", "b", "c", "d"):
+            assert [c for c in calls if c[0] == page] == [f"{page}{n}" for n in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_failure_defers_later_actions_on_entity(self, queue: OfflineQueue):
+        """Test later updates to a page wait behind a failed one."""
+        for n in range(3):
+            queue.enqueue(notion_request_action("PATCH", "/pages/a", {"n": n}))
+        queue.enqueue(notion_request_action("PATCH", "/pages/b", {"n": 9}))
+        client = MagicMock()
+        client._request = AsyncMock(side_effect=[Exception("API error"), {"id": "b"}])
+        client.close = AsyncMock()
+
+        result = await queue.process_queue(notion_client=client)
+
+        assert result.failed == 1
+        assert result.deferred == 2
+        assert result.successful == 1
+        assert [a.data["body"]["n"] for a in queue.read_queue()] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_drains_replay_each_action_once(self, queue: OfflineQueue):
+        """Test two drains of the same file never replay the same action."""
+        for n in range(10):
+            queue.enqueue(notion_request_action("PATCH", f"/pages/p{n}", {"n": f"p{n}"}))
+        other = OfflineQueue(queue_path=queue.queue_path)
+        calls: list[str] = []
+        active = [0, 0]
+        client = self._slow_client(calls, active)
+
+        results = await asyncio.gather(
+            queue.process_queue(notion_client=client),
+            other.process_queue(notion_client=client),
+        )
+
+        assert sorted(calls) == sorted(f"p{n}" for n in range(10))
+        assert sum(r.successful for r in results) == 10
+        assert queue.get_pending_count() == 0
+
+
+def make_action(action_type: QueuedActionType, key: str, data: dict) -> QueuedAction:
+    return QueuedAction(
+        action_type=action_type,
+        timestamp=datetime.now(UTC),
+        idempotency_key=key,
+        data=data,
+    )
+
+
+class TestActionCoverage:
+    """Test every queued action type is replayed."""
+
+    @pytest.fixture
+    def queue(self, tmp_path: Path) -> OfflineQueue:
+        return OfflineQueue(queue_path=tmp_path / "queue" / "pending.jsonl")
+
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        for method in ("create_person", "create_place", "create_project", "create_log_entry"):
+            setattr(client, method, AsyncMock(return_value=f"{method}-id"))
+        client.create_task = AsyncMock(return_value="task-id")
+        client.update_task_status = AsyncMock()
+        client.update_page = AsyncMock()
+        client.soft_delete = AsyncMock()
+        client.close = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("action_type", "model", "method"),
+        [
+            (QueuedActionType.CREATE_PERSON, Person(name="Sarah"), "create_person"),
+            (QueuedActionType.CREATE_PLACE, Place(name="Cafe"), "create_place"),
+            (QueuedActionType.CREATE_PROJECT, Project(name="Move"), "create_project"),
+            (
+                QueuedActionType.CREATE_LOG_ENTRY,
+                LogEntry(action_type="capture", action_taken="Saved"),
+                "create_log_entry",
+            ),
+        ],
+    )
+    async def test_create_actions(self, queue, client, action_type, model, method):
+        """Test create actions rebuild the model and call the client."""
+        queue.enqueue(make_action(action_type, "k1", model.model_dump(mode="json")))
+
+        result = await queue.process_queue(notion_client=client)
+
+        assert result.successful == 1
+        created = getattr(client, method).call_args[0][0]
+        assert created == model
+
+    @pytest.mark.asyncio
+    async def test_update_task(self, queue, client):
+        """Test task updates set status via update_task_status and other fields via update_page."""
+        queue.enqueue(
+            make_action(
+                QueuedActionType.UPDATE_TASK,
+                "k1",
+                {
+                    "page_id": "task-1",
+                    "values": {"status": "done", "due_date": "2026-01-15T14:00:00"},
+                },
+            )
+        )
+
+        await queue.process_queue(notion_client=client)
+
+        client.update_task_status.assert_awaited_once_with("task-1", "done")
+        client.update_page.assert_awaited_once_with(
+            "task-1", "tasks", {"due_date": datetime(2026, 1, 15, 14, 0)}
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_person_and_soft_delete(self, queue, client):
+        """Test person updates and soft deletes reach the client."""
+        queue.enqueue(
+            make_action(
+                QueuedActionType.UPDATE_PERSON,
+                "k1",
+                {"page_id": "person-1", "values": {"relationship": "friend"}},
+            )
+        )
+        queue.enqueue(make_action(QueuedActionType.SOFT_DELETE, "k2", {"page_id": "task-1"}))
+
+        result = await queue.process_queue(notion_client=client)
+
+        assert result.successful == 2
+        client.update_page.assert_awaited_once()
+        assert client.update_page.call_args[0][2]["relationship"].value == "friend"
+        client.soft_delete.assert_awaited_once_with("task-1")
+
+
+class TestDependencyReplay:
+    """Test actions wait for pages created by other queued actions."""
+
+    @pytest.fixture
+    def queue(self, tmp_path: Path) -> OfflineQueue:
+        return OfflineQueue(queue_path=tmp_path / "queue" / "pending.jsonl")
+
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        client.create_person = AsyncMock(return_value="person-page")
+        client.create_task = AsyncMock(return_value="task-page")
+        client.update_task_status = AsyncMock()
+        client.close = AsyncMock()
+        return client
+
+    def _queue_person_and_task(self, queue: OfflineQueue) -> None:
+        queue.enqueue(
+            make_action(
+                QueuedActionType.CREATE_PERSON,
+                "person:sarah",
+                Person(name="Sarah").model_dump(mode="json"),
+            )
+        )
+        queue.enqueue(
+            make_action(
+                QueuedActionType.CREATE_TASK,
+                "task:call",
+                {"title": "Call Sarah", "people_ids": [pending_ref("person:sarah")]},
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_task_waits_for_person_page_id(self, queue, client):
+        """Test a task referencing an offline person gets the real page ID."""
+        self._queue_person_and_task(queue)
+
+        result = await queue.process_queue(notion_client=client)
+
+        assert result.successful == 2
+        assert client.create_task.call_args[0][0].people_ids == ["person-page"]
+
+    @pytest.mark.asyncio
+    async def test_failed_dependency_defers_dependent(self, queue, client):
+        """Test a dependent action stays queued until its dependency syncs."""
+        self._queue_person_and_task(queue)
+        client.create_person.side_effect = [Exception("API error"), "person-page"]
+
+        first = await queue.process_queue(notion_client=client)
+
+        assert first.failed == 1
+        assert first.deferred == 1
+        client.create_task.assert_not_called()
+        assert queue.get_pending_count() == 2
+
+        second = await queue.process_queue(notion_client=client)
+
+        assert second.successful == 2
+        assert client.create_task.call_args[0][0].people_ids == ["person-page"]
+
+    @pytest.mark.asyncio
+    async def test_reference_resolved_from_earlier_drain(self, queue, client):
+        """Test page IDs of actions synced before a restart are remembered."""
+        queue.enqueue(
+            make_action(
+                QueuedActionType.CREATE_TASK, "task:call", {"title": "Call", "priority": "low"}
+            )
+        )
+        await queue.process_queue(notion_client=client)
+
+        restarted = OfflineQueue(queue_path=queue.queue_path)
+        restarted.enqueue(
+            make_action(
+                QueuedActionType.UPDATE_TASK,
+                "task:call:done",
+                {"page_id": pending_ref("task:call"), "values": {"status": "done"}},
+            )
+        )
+        await restarted.process_queue(notion_client=client)
+
+        client.update_task_status.assert_awaited_once_with("task-page", "done")
+
+    @pytest.mark.asyncio
+    async def test_unknown_reference_fails(self, queue, client):
+        """Test a reference to an action that is not queued is an error."""
+        queue.enqueue(
+            make_action(
+                QueuedActionType.CREATE_TASK,
+                "task:call",
+                {"title": "Call", "people_ids": [pending_ref("missing")]},
+            )
+        )
+
+        result = await queue.process_queue(notion_client=client)
+
+        assert result.failed == 1
+        assert "Unresolved queued reference" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_independent_chains_do_not_wait_for_each_other(self, queue, client):
+        """Test a slow dependency only holds back its own dependents."""
+        gate = asyncio.Event()
+        order: list[str] = []
+
+        async def create_person(person):
+            if person.name == "Slow":
+                await gate.wait()
+            order.append(person.name)
+            return f"page-{person.name}"
+
+        async def create_task(task):
+            order.append(task.title)
+            if task.title == "Call Fast":
+                gate.set()
+            return "task-page"
+
+        client.create_person = AsyncMock(side_effect=create_person)
+        client.create_task = AsyncMock(side_effect=create_task)
+        for name in ("Slow", "Fast"):
+            queue.enqueue(
+                make_action(
+                    QueuedActionType.CREATE_PERSON,
+                    f"person:{name}",
+                    Person(name=name).model_dump(mode="json"),
+                )
+            )
+        for name in ("Slow", "Fast"):
+            queue.enqueue(
+                make_action(
+                    QueuedActionType.CREATE_TASK,
+                    f"task:{name}",
+                    {"title": f"Call {name}", "people_ids": [pending_ref(f"person:{name}")]},
+                )
+            )
+
+        result = await asyncio.wait_for(queue.process_queue(notion_client=client), timeout=5)
+
+        assert result.successful == 4
+        assert order == ["Fast", "Call Fast", "Slow", "Call Slow"]
+
+
+class TestNotionClientOfflineQueue:
+    """Test NotionClient failures feed the shared queue."""
+
+    @pytest.fixture(autouse=True)
+    def queue(self, tmp_path: Path):
+        import assistant.services.offline_queue as module
+
+        module._offline_queue = OfflineQueue(queue_path=tmp_path / "queue" / "pending.jsonl")
+        yield module._offline_queue
+        module._offline_queue = None
+
+    def test_queues_writes_only(self, queue: OfflineQueue):
+        """Test failed writes are queued and failed reads are not."""
+        from assistant.notion.client import NotionClient
+
+        client = NotionClient(api_key="test", replica=None)
+        client._queue_offline("POST", "/pages", {"properties": {}})
+        client._queue_offline("GET", "/pages/abc", None)
+        client._queue_offline("POST", "/databases/db/query", {})
+
+        actions = queue.read_queue()
+        assert len(actions) == 1
+        assert actions[0].action_type == QueuedActionType.NOTION_REQUEST
+        assert actions[0].data == {"method": "POST", "path": "/pages", "body": {"properties": {}}}
+
+    @pytest.mark.asyncio
+    async def test_process_offline_queue_replays_without_requeueing(self, queue: OfflineQueue):
+        """Test replayed requests do not queue themselves again on failure."""
+        from assistant.notion.client import NotionClient
+
+        queue.enqueue(notion_request_action("PATCH", "/pages/abc", {"archived": True}))
+        client = NotionClient(api_key="test", replica=None)
+        client._request = AsyncMock(return_value={"id": "abc"})  # type: ignore[method-assign]
+
+        assert await client.process_offline_queue() == 1
+        client._request.assert_awaited_once_with(
+            "PATCH", "/pages/abc", {"archived": True}, queue_offline=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_replay_is_not_queued_twice(self, queue: OfflineQueue):
+        """Test a typed action that fails during a drain syncs once on recovery."""
+        from unittest.mock import patch
+
+        import httpx
+
+        from assistant.notion.client import NotionClient
+        from assistant.notion.throttle import CircuitBreaker
+
+        created = []
+        notion_up = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if not notion_up:
+                raise httpx.ConnectError("down")
+            created.append(request.url.path)
+            return httpx.Response(200, json={"id": f"page-{len(created)}"})
+
+        queue.queue_task("Call dentist", chat_id="1", message_id="2")
+        client = NotionClient(
+            api_key="test", replica=None, circuit_breaker=CircuitBreaker(failure_threshold=100)
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch("assistant.notion.client.asyncio.sleep", new=AsyncMock()):
+            first = await queue.process_queue(notion_client=client)
+            assert first.failed == 1
+            assert queue.get_pending_count() == 1
+
+            notion_up = True
+            second = await queue.process_queue(notion_client=client)
+
+        assert second.successful == 1
+        assert created == ["/v1/pages"]
+        assert queue.get_pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_replayed_log_create_is_indexed(self, queue: OfflineQueue):
+        """Test a replayed raw page create records its idempotency key."""
+        from unittest.mock import patch
+
+        from assistant.config import settings
+        from assistant.notion.client import NotionClient
+        from assistant.notion.idempotency import IdempotencyIndex
+
+        body = {
+            "parent": {"database_id": "log-db"},
+            "properties": {"idempotency_key": {"rich_text": [{"text": {"content": "tg:1:2"}}]}},
+        }
+        queue.enqueue(notion_request_action("POST", "/pages", body))
+        index = IdempotencyIndex(persist=False)
+        client = NotionClient(api_key="test", replica=None, idempotency_index=index)
+        client._request = AsyncMock(return_value={"id": "log-page"})  # type: ignore[method-assign]
+
+        with patch.object(settings, "notion_log_db_id", "log-db"):
+            assert await client.process_offline_queue() == 1
+
+        assert index.lookup("log", "tg:1:2") == "log-page"
+
+
 class TestAT114OfflineCapture:
     """Tests for AT-114: Notion Offline Queue.
 
@@ -4,6 +4,8 @@ Tests for T-093: Apply patterns to new inputs - checks patterns before
 classification and applies learned behaviors to correct likely errors.
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock
 
 import pytest
@@ -12,6 +14,7 @@ from assistant.services.pattern_applicator import (
     AppliedPattern,
     PatternApplicationResult,
     PatternApplicator,
+    PatternIndex,
     apply_patterns,
     get_pattern_applicator,
     load_patterns,
@@ -467,6 +470,182 @@ class TestPatternApplicatorApplyPatterns:
         assert result.patterns_applied[0].trigger == "shopping"
 
 
+class TestPatternIndex:
+    """Tests for the compiled trigger index."""
+
+    @staticmethod
+    def make_patterns(*triggers: str) -> list[dict]:
+        return [{"id": f"p{i}", "trigger": t, "meaning": t.upper()} for i, t in enumerate(triggers)]
+
+    def test_exact_match_ignores_case_and_punctuation(self):
+        index = PatternIndex(self.make_patterns("Jess", "Mike"))
+        assert index.match("jess!")["id"] == "p0"
+        assert index.match("MIKE")["id"] == "p1"
+
+    def test_value_contains_trigger(self):
+        index = PatternIndex(self.make_patterns("jess"))
+        assert index.match("Jess Smith")["id"] == "p0"
+
+    def test_value_inside_trigger_needs_three_chars(self):
+        index = PatternIndex(self.make_patterns("Sarah Chen"))
+        assert index.match("Sarah")["id"] == "p0"
+        assert index.match("Sa") is None
+
+    def test_first_pattern_in_cache_order_wins(self):
+        index = PatternIndex(self.make_patterns("smith", "jess smith", "jess"))
+        assert index.match("Jess Smith")["id"] == "p0"
+
+    def test_overlapping_triggers_found_in_text(self):
+        index = PatternIndex(self.make_patterns("she", "he", "hers", "his"))
+        found = [p["trigger"] for p in index.in_text("ushers")]
+        assert found == ["she", "he", "hers"]
+
+    def test_no_match(self):
+        index = PatternIndex(self.make_patterns("jess"))
+        assert index.match("Tom") is None
+        assert index.in_text("Call Tom") == []
+
+    @pytest.mark.asyncio
+    async def test_load_patterns_compiles_index(self):
+        mock_notion = AsyncMock()
+        mock_notion.query_patterns = AsyncMock(
+            return_value=[
+                {
+                    "id": "p1",
+                    "properties": {
+                        "trigger": {"title": [{"text": {"content": "Jess"}}]},
+                        "meaning": {"rich_text": [{"text": {"content": "Tess"}}]},
+                        "confidence": {"number": 80},
+                    },
+                }
+            ]
+        )
+        applicator = PatternApplicator(notion_client=mock_notion)
+
+        await applicator.load_patterns()
+
+        assert applicator._index is not None
+        assert len(applicator._index) == 1
+
+
+def make_pattern_page(
+    page_id: str,
+    trigger: str,
+    meaning: str,
+    confidence: int = 80,
+    edited: str = "2026-01-12T10:00:00.000Z",
+) -> dict:
+    """Build a Notion pattern page object."""
+    return {
+        "id": page_id,
+        "last_edited_time": edited,
+        "properties": {
+            "trigger": {"title": [{"text": {"content": trigger}}]},
+            "meaning": {"rich_text": [{"text": {"content": meaning}}]},
+            "confidence": {"number": confidence},
+        },
+    }
+
+
+class TestPatternCacheRefresh:
+    """Tests for TTL refresh, incremental updates and live pushes."""
+
+    @pytest.fixture
+    async def applicator(self):
+        mock_notion = AsyncMock()
+        mock_notion.query_patterns = AsyncMock(
+            return_value=[make_pattern_page("p1", "Jess", "Tess", 90)]
+        )
+        applicator = PatternApplicator(notion_client=mock_notion)
+        await applicator.load_patterns()
+        return applicator
+
+    @staticmethod
+    def expire(applicator: PatternApplicator) -> None:
+        applicator._refreshed_at = time.monotonic() - 10_000
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_is_not_refreshed(self, applicator):
+        await applicator.apply_patterns(text="Call Jess", people=["Jess"])
+
+        assert applicator.notion.query_patterns.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_served_while_refreshing(self, applicator):
+        applicator.notion.query_patterns.return_value = [
+            make_pattern_page("p2", "Mike", "Michael", 85, edited="2026-01-12T11:00:00.000Z")
+        ]
+        self.expire(applicator)
+
+        result = await applicator.apply_patterns(text="Call Mike", people=["Mike"])
+        assert result.people == ["Mike"]  # Served from the stale cache
+
+        await asyncio.sleep(0)  # Let the background refresh run
+        applicator.notion.query_patterns.assert_awaited_with(
+            edited_after="2026-01-12T10:00:00.000Z"
+        )
+        assert {p["id"] for p in applicator._pattern_cache} == {"p1", "p2"}
+        assert applicator._watermark == "2026-01-12T11:00:00.000Z"
+
+        result = await applicator.apply_patterns(text="Call Mike", people=["Mike"])
+        assert result.people == ["Michael"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_drops_patterns_below_threshold(self, applicator):
+        applicator.notion.query_patterns.return_value = [
+            make_pattern_page("p1", "Jess", "Tess", 40, edited="2026-01-12T11:00:00.000Z")
+        ]
+
+        await applicator.refresh()
+
+        assert applicator._pattern_cache == []
+
+    @pytest.mark.asyncio
+    async def test_full_reload_when_due(self, applicator):
+        applicator._full_loaded_at = time.monotonic() - 10_000
+
+        await applicator.refresh()
+
+        applicator.notion.query_patterns.assert_awaited_with(
+            min_confidence=PATTERN_CONFIDENCE_THRESHOLD, limit=100
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_cache_and_backs_off(self, applicator):
+        applicator.notion.query_patterns.side_effect = Exception("Notion down")
+        self.expire(applicator)
+
+        await applicator.refresh()
+
+        assert [p["id"] for p in applicator._pattern_cache] == ["p1"]
+        assert not applicator.is_stale  # Waiting out the backoff
+        result = await applicator.apply_patterns(text="Call Jess", people=["Jess"])
+        assert result.people == ["Tess"]
+
+    @pytest.mark.asyncio
+    async def test_add_pattern_updates_live_cache(self, applicator):
+        applicator.add_pattern("p2", "Mike", "Michael", 95)
+
+        result = await applicator.apply_patterns(text="Call Mike", people=["Mike"])
+
+        assert result.people == ["Michael"]
+        assert applicator._pattern_cache[0]["id"] == "p2"  # Highest confidence first
+
+    @pytest.mark.asyncio
+    async def test_add_pattern_below_threshold_removes(self, applicator):
+        applicator.add_pattern("p1", "Jess", "Tess", 30)
+
+        assert applicator._pattern_cache == []
+
+    def test_add_pattern_before_load_is_ignored(self):
+        applicator = PatternApplicator(notion_client=AsyncMock())
+
+        applicator.add_pattern("p1", "Jess", "Tess", 90)
+
+        assert applicator._pattern_cache == []
+        assert not applicator._cache_loaded
+
+
 class TestPatternApplicatorClearCache:
     """Tests for cache clearing."""
 
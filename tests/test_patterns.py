@@ -5,7 +5,7 @@ and builds patterns that can be applied to future inputs.
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -19,6 +19,8 @@ from assistant.services.patterns import (
     PatternDetector,
     add_correction,
     get_pattern_detector,
+    levenshtein_distance,
+    string_similarity,
 )
 
 
@@ -167,6 +169,29 @@ class TestPatternDetectorSimilarity:
         sim = detector._string_similarity("alice", "bob")
         assert sim < 0.5
 
+    def test_levenshtein_distance(self):
+        """Test edit distance counts insertions, deletions and substitutions."""
+        assert levenshtein_distance("kitten", "sitting") == 3
+        assert levenshtein_distance("sarah", "sara") == 1
+        assert levenshtein_distance("", "abc") == 3
+        assert levenshtein_distance("abc", "abc") == 0
+
+    def test_levenshtein_distance_bounded(self):
+        """Test bounded distance stops at max_distance + 1."""
+        assert levenshtein_distance("kitten", "sitting", max_distance=1) == 2
+        assert levenshtein_distance("a", "abcdef", max_distance=2) == 3
+        assert levenshtein_distance("kitten", "sitting", max_distance=3) == 3
+
+    def test_similarity_handles_insertions(self):
+        """Test a shifted string is not scored as completely different."""
+        # A positional comparison sees no matching characters here
+        assert string_similarity("jonathan", "jjonathan") > 0.8
+
+    def test_similarity_threshold_rejects_without_exact_score(self):
+        """Test bounded similarity stays below the threshold for different strings."""
+        assert string_similarity("alice", "bob", threshold=0.8) <= 0.8
+        assert string_similarity("tesss", "tess", threshold=0.75) == 0.8
+
 
 class TestPatternDetectorAddCorrection:
     """Tests for adding corrections and detecting patterns."""
@@ -362,6 +387,31 @@ class TestPatternDetectorStorePattern:
         assert call_args.confidence == 60
         assert call_args.times_confirmed == 3
 
+    @pytest.mark.asyncio
+    async def test_store_pattern_updates_live_applicator_cache(self):
+        """Test that a stored pattern is applied without waiting for a reload."""
+        from assistant.services.pattern_applicator import PatternApplicator
+
+        applicator = PatternApplicator(notion_client=AsyncMock())
+        applicator.notion.query_patterns = AsyncMock(return_value=[])
+        await applicator.load_patterns()
+
+        mock_notion = AsyncMock()
+        mock_notion.create_pattern = AsyncMock(return_value="pattern-123")
+        detector = PatternDetector(notion_client=mock_notion)
+        pattern = DetectedPattern(
+            trigger="Jess", meaning="Tess", occurrences=3, confidence=80, examples=[]
+        )
+
+        with patch(
+            "assistant.services.pattern_applicator.get_pattern_applicator",
+            return_value=applicator,
+        ):
+            await detector.store_pattern(pattern)
+
+        result = await applicator.apply_patterns(text="Call Jess", people=["Jess"])
+        assert result.people == ["Tess"]
+
     @pytest.mark.asyncio
     async def test_store_pattern_removes_from_pending(self):
         """Test that stored pattern is removed from pending list."""
@@ -484,6 +534,78 @@ class TestPatternDetectorAnalyze:
         assert "Bob" in triggers
 
 
+class TestPatternDetectorBlockingIndex:
+    """Tests for the candidate index over correction history."""
+
+    def test_misspellings_of_same_name_form_pattern(self):
+        """Test similar originals with the same correction are grouped."""
+        detector = PatternDetector()
+
+        detector.add_correction(CorrectionRecord("Jonathan", "Jon Smith"))
+        detector.add_correction(CorrectionRecord("Jonathon", "Jon Smith"))
+        patterns = detector.add_correction(CorrectionRecord("Jonathn", "Jon Smith"))
+
+        assert len(patterns) == 1
+        assert patterns[0].occurrences == 3
+        assert patterns[0].meaning == "Jon Smith"
+
+    def test_unrelated_corrections_not_compared(self):
+        """Test only records sharing a value are considered."""
+        detector = PatternDetector()
+        for i in range(50):
+            detector.add_correction(CorrectionRecord(f"name{i}", f"other{i}"))
+
+        with patch.object(
+            detector, "_is_similar_correction", wraps=detector._is_similar_correction
+        ) as similar:
+            detector.add_correction(CorrectionRecord("Jess", "Tess"))
+
+        assert similar.call_count == 1
+
+    def test_index_picks_up_direct_history_changes(self):
+        """Test records appended or cleared outside add_correction are indexed."""
+        detector = PatternDetector()
+        detector.add_correction(CorrectionRecord("Jess", "Tess"))
+        detector._correction_history.append(CorrectionRecord("Jess", "Tess"))
+
+        patterns = detector.add_correction(CorrectionRecord("Jess", "Tess"))
+        assert len(patterns) == 1
+
+        detector.clear_history()
+        assert detector.add_correction(CorrectionRecord("Jess", "Tess")) == []
+
+    def test_matches_full_history_scan(self):
+        """Test blocked lookups find the same corrections as a full scan."""
+        detector = PatternDetector()
+        values = ["Jess", "Tess", "Jes", "Bob", "Rob", "Bobby", "Sarah", "Sara"]
+        for i in range(60):
+            detector._correction_history.append(
+                CorrectionRecord(values[i % len(values)], values[(i * 3) % len(values)])
+            )
+        detector._sync_index()
+
+        for orig in values:
+            for corr in values:
+                norm_orig, norm_corr = orig.lower(), corr.lower()
+                expected = [
+                    id(r)
+                    for r in detector._correction_history
+                    if detector._is_similar_correction(
+                        norm_orig, norm_corr, r.original_value.lower(), r.corrected_value.lower()
+                    )
+                ]
+                candidates = dict(detector._by_original.get(norm_orig, []))
+                candidates.update(detector._by_corrected.get(norm_corr, []))
+                found = [
+                    id(r)
+                    for _, r in sorted(candidates.items())
+                    if detector._is_similar_correction(
+                        norm_orig, norm_corr, r.original_value.lower(), r.corrected_value.lower()
+                    )
+                ]
+                assert found == expected
+
+
 class TestPatternDetectorClearHistory:
     """Tests for clearing history."""
 
@@ -0,0 +1,200 @@
+"""Tests for the persistent Maps geocode/place cache."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from assistant.google.maps import MapsClient, PlaceDetails
+from assistant.google.place_cache import (
+    DETAILS_CACHE_TTL,
+    NOT_FOUND,
+    PlaceCache,
+    normalize_place_key,
+)
+
+
+def make_place(name: str = "Blue Bottle", place_id: str = "pid-1") -> PlaceDetails:
+    return PlaceDetails(
+        name=name, address="1 Ferry Building", lat=37.79, lng=-122.39, place_id=place_id
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PlaceCache(path=tmp_path / "places.db", max_entries=2)
+    yield cache
+    cache.close()
+
+
+def geocode_payload(status: str = "OK") -> dict[str, Any]:
+    if status != "OK":
+        return {"status": status, "results": []}
+    return {
+        "status": "OK",
+        "results": [
+            {
+                "formatted_address": "123 Main St, Springfield",
+                "geometry": {"location": {"lat": 1.5, "lng": 2.5}},
+                "place_id": "pid-main",
+                "types": ["street_address"],
+            }
+        ],
+    }
+
+
+def details_payload() -> dict[str, Any]:
+    return {
+        "status": "OK",
+        "result": {
+            "name": "Dr Smith",
+            "formatted_address": "123 Main St",
+            "geometry": {"location": {"lat": 1.5, "lng": 2.5}},
+            "formatted_phone_number": "555-0100",
+            "website": "https://example.com",
+            "types": ["dentist"],
+        },
+    }
+
+
+def make_maps(cache: PlaceCache, payload: dict[str, Any]) -> tuple[MapsClient, MagicMock]:
+    response = MagicMock()
+    response.json.return_value = payload
+    http = MagicMock()
+    http.get = AsyncMock(return_value=response)
+    client = MapsClient(api_key="test-key", cache=cache)
+    client._get_client = AsyncMock(return_value=http)
+    return client, http
+
+
+class TestNormalizePlaceKey:
+    """Tests for address normalization."""
+
+    def test_case_whitespace_and_punctuation(self):
+        assert normalize_place_key("  123  Main St.,  ") == normalize_place_key("123 main st")
+
+
+class TestPlaceCache:
+    """Tests for the two-tier place cache."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        first = PlaceCache(path=tmp_path / "places.db")
+        first.set("geocode", "1 Ferry Building", make_place())
+        first.close()
+
+        second = PlaceCache(path=tmp_path / "places.db")
+        hit = second.get("geocode", "1 ferry building")
+        second.close()
+
+        assert hit == make_place()
+
+    def test_not_found_is_cached(self, cache):
+        cache.set("geocode", "Nowhere", None)
+
+        assert cache.get("geocode", "nowhere") is NOT_FOUND
+        assert cache.get("geocode", "somewhere") is None
+
+    def test_details_expire_before_coordinates(self, cache):
+        cache.set("geocode", "a", make_place())
+        cache.set("details", "pid-1", make_place())
+
+        later = time.time() + DETAILS_CACHE_TTL + 1
+        with patch("assistant.google.place_cache.time.time", return_value=later):
+            assert cache.get("details", "pid-1") is None
+            assert cache.get("geocode", "a") == make_place()
+
+    def test_memory_tier_is_bounded(self, cache):
+        for i in range(4):
+            cache.set("geocode", f"addr {i}", make_place())
+
+        assert len(cache._memory) == 2
+        assert cache.evictions == 2
+        # Evicted entries are still served from disk
+        assert cache.get("geocode", "addr 0") == make_place()
+
+    def test_disk_tier_drops_least_recently_used(self, tmp_path):
+        cache = PlaceCache(path=tmp_path / "places.db", max_entries=1, max_disk_entries=2)
+        cache.get_stats()  # open the disk tier
+        with patch("assistant.google.place_cache.time.time", side_effect=[1.0, 2.0, 3.0]):
+            cache.set("geocode", "a", make_place())
+            cache.set("geocode", "b", make_place())
+            cache.set("geocode", "c", make_place())
+
+        assert cache.get_stats()["disk_entries"] == 2
+        assert cache.get("geocode", "a") is None
+        cache.close()
+
+    def test_disk_hit_access_times_are_batched(self, tmp_path):
+        first = PlaceCache(path=tmp_path / "places.db")
+        first.set("geocode", "a", make_place())
+        first.close()
+
+        second = PlaceCache(path=tmp_path / "places.db")
+        assert second.get("geocode", "a") == make_place()
+        assert "geocode:a" in second._touched
+        second.close()
+
+        assert second._touched == {}
+
+    def test_unusable_path_degrades_to_memory(self, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        cache = PlaceCache(path=blocker / "places.db")
+
+        cache.set("geocode", "a", make_place())
+
+        assert cache.path is None
+        assert cache.get("geocode", "a") == make_place()
+
+    def test_place_ids_are_case_sensitive(self, cache):
+        cache.set("details", "ChIJAbc", make_place())
+
+        assert cache.get("details", "chijabc") is None
+
+
+class TestMapsClientCaching:
+    """MapsClient serves repeat lookups from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_geocode_makes_no_request(self, cache):
+        maps, http = make_maps(cache, geocode_payload())
+
+        first = await maps.geocode("123 Main St")
+        second = await maps.geocode("123 main st.")
+
+        http.get.assert_awaited_once()
+        assert second is not None and first is not None
+        assert second.coordinates == first.coordinates
+        assert second.name == "123 main st."
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_retried(self, cache):
+        maps, http = make_maps(cache, geocode_payload("ZERO_RESULTS"))
+
+        assert await maps.geocode("Nowhere Lane") is None
+        assert await maps.geocode("Nowhere Lane") is None
+
+        http.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_not_cached(self, cache):
+        maps, http = make_maps(cache, geocode_payload("OVER_QUERY_LIMIT"))
+
+        await maps.geocode("123 Main St")
+        await maps.geocode("123 Main St")
+
+        assert http.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_place_details_are_cached(self, cache):
+        maps, http = make_maps(cache, details_payload())
+
+        await maps.get_place_details("pid-main")
+        details = await maps.get_place_details("pid-main")
+
+        http.get.assert_awaited_once()
+        assert details is not None
+        assert details.phone == "555-0100"
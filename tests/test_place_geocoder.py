@@ -0,0 +1,213 @@
+"""Tests for the background place geocoding service."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from assistant.google.maps import PlaceDetails
+from assistant.services.place_geocoder import PlaceGeocodingService, parse_place_page
+from assistant.services.spatial_index import PlaceSpatialIndex
+
+
+def make_place_page(
+    place_id: str,
+    name: str,
+    address: str | None = None,
+    lat: float | None = None,
+    lng: float | None = None,
+) -> dict:
+    """Build a Notion place page object."""
+    return {
+        "id": place_id,
+        "properties": {
+            "name": {"title": [{"text": {"content": name}}]},
+            "address": {"rich_text": [{"text": {"content": address}}] if address else []},
+            "lat": {"number": lat},
+            "lng": {"number": lng},
+        },
+    }
+
+
+def make_details(lat: float = 37.79, lng: float = -122.40) -> PlaceDetails:
+    return PlaceDetails(name="", address="addr", lat=lat, lng=lng, place_id="gpid")
+
+
+@pytest.fixture
+def index():
+    index = PlaceSpatialIndex(persist=False)
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def notion():
+    client = MagicMock()
+    client.query_places = AsyncMock(return_value=[])
+    client.update_place = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def maps():
+    client = MagicMock()
+    client.geocode = AsyncMock(return_value=make_details())
+    client.search_place = AsyncMock(return_value=make_details())
+    return client
+
+
+@pytest.fixture
+def service(notion, maps, index):
+    return PlaceGeocodingService(notion_client=notion, maps_client=maps, place_index=index, delay=0)
+
+
+class TestParsePlacePage:
+    def test_extracts_fields(self):
+        page = make_place_page("p1", "Cafe", "1 Main St", 1.5, 2.5)
+        assert parse_place_page(page) == ("Cafe", "1 Main St", 1.5, 2.5)
+
+    def test_missing_fields(self):
+        assert parse_place_page({"properties": {}}) == ("", None, None, None)
+
+
+class TestGeocodePlace:
+    @pytest.mark.asyncio
+    async def test_geocodes_address_and_persists(self, service, notion, maps, index):
+        details = await service.geocode_place("p1", "Cafe", "1 Main St")
+
+        assert details is not None
+        maps.geocode.assert_awaited_once_with("1 Main St")
+        maps.search_place.assert_not_called()
+        notion.update_place.assert_awaited_once_with(
+            place_id="p1", lat=37.79, lng=-122.40, google_place_id="gpid"
+        )
+        assert index.get_many(["p1"])["p1"].name == "Cafe"
+
+    @pytest.mark.asyncio
+    async def test_searches_name_without_address(self, service, maps):
+        await service.geocode_place("p1", "Blue Bottle")
+
+        maps.search_place.assert_awaited_once_with("Blue Bottle")
+        maps.geocode.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_backs_off(self, service, maps, index):
+        maps.geocode.return_value = None
+
+        assert await service.geocode_place("p1", "Nowhere", "???") is None
+        assert await service.geocode_place("p1", "Nowhere", "???") is None
+
+        assert maps.geocode.await_count == 1
+        assert index.geocode_backoff(["p1"]) == {"p1"}
+
+    def test_backoff_expires_and_doubles(self, index):
+        first_retry = index.record_geocode_failure("p1")
+        second_retry = index.record_geocode_failure("p1")
+        assert second_retry - time.time() > first_retry - time.time()
+
+        with patch("assistant.services.spatial_index.time.time", return_value=second_retry + 1):
+            assert index.geocode_backoff(["p1"]) == set()
+
+    @pytest.mark.asyncio
+    async def test_success_clears_failure(self, service, index):
+        index.record_geocode_failure("p1")
+        with patch("assistant.services.spatial_index.time.time", return_value=time.time() + 1e7):
+            assert await service.geocode_place("p1", "Cafe", "1 Main St") is not None
+
+        assert index.geocode_backoff(["p1"]) == set()
+
+    @pytest.mark.asyncio
+    async def test_notion_write_failure_still_indexes(self, service, notion, index):
+        notion.update_place.side_effect = RuntimeError("rate limited")
+
+        assert await service.geocode_place("p1", "Cafe", "1 Main St") is not None
+        assert "p1" in index.get_many(["p1"])
+
+
+class TestRunOnce:
+    @pytest.mark.asyncio
+    async def test_geocodes_places_missing_coordinates(self, service, notion):
+        notion.query_places.return_value = [
+            make_place_page("p1", "Cafe", "1 Main St"),
+            make_place_page("p2", "Gym", "2 Main St"),
+        ]
+
+        result = await service.run_once()
+
+        notion.query_places.assert_awaited_once_with(missing_coordinates=True)
+        assert result.geocoded == ["p1", "p2"]
+        assert result.failed == []
+        assert result.success
+
+    @pytest.mark.asyncio
+    async def test_respects_batch_size(self, notion, maps, index):
+        service = PlaceGeocodingService(
+            notion_client=notion, maps_client=maps, place_index=index, batch_size=2, delay=0
+        )
+        notion.query_places.return_value = [
+            make_place_page(f"p{i}", f"Place {i}", f"{i} Main St") for i in range(5)
+        ]
+
+        result = await service.run_once()
+
+        assert len(result.geocoded) == 2
+        assert maps.geocode.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_places_in_backoff(self, service, notion, maps, index):
+        index.record_geocode_failure("p1")
+        notion.query_places.return_value = [
+            make_place_page("p1", "Nowhere", "???"),
+            make_place_page("p2", "Gym", "2 Main St"),
+        ]
+
+        result = await service.run_once()
+
+        assert result.skipped == 1
+        assert result.geocoded == ["p2"]
+        maps.geocode.assert_awaited_once_with("2 Main St")
+
+    @pytest.mark.asyncio
+    async def test_records_failures(self, service, notion, maps):
+        maps.geocode.return_value = None
+        notion.query_places.return_value = [make_place_page("p1", "Nowhere", "???")]
+
+        result = await service.run_once()
+
+        assert result.failed == ["p1"]
+        assert result.success
+
+    @pytest.mark.asyncio
+    async def test_query_error(self, service, notion):
+        notion.query_places.side_effect = RuntimeError("Notion down")
+
+        result = await service.run_once()
+
+        assert not result.success
+        assert "Notion down" in result.errors[0]
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_start_skips_when_not_configured(self, service, notion):
+        with patch("assistant.services.place_geocoder.settings") as mock_settings:
+            mock_settings.place_geocode_enabled = False
+            await service.start()
+
+        assert not service.is_running
+        notion.query_places.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, service, notion):
+        with patch("assistant.services.place_geocoder.settings") as mock_settings:
+            mock_settings.place_geocode_enabled = True
+            mock_settings.has_notion = True
+            mock_settings.has_google_maps = True
+            await service.start()
+
+        assert service.is_running
+        assert service.last_result is not None
+        await service.stop()
+        assert not service.is_running
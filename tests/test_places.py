@@ -882,6 +882,27 @@ class TestPlacesServiceMapsIntegration:
             website="https://bluebottlecoffee.com",
         )
 
+    @pytest.mark.asyncio
+    async def test_enrich_indexes_coordinates(self, mock_notion_client, mock_maps_client):
+        """enrich should add the geocoded place to the proximity index."""
+        from assistant.notion.schemas import Place
+        from assistant.services.spatial_index import PlaceSpatialIndex
+
+        index = PlaceSpatialIndex(persist=False)
+        service = PlacesService(
+            notion_client=mock_notion_client,
+            maps_client=mock_maps_client,
+            place_index=index,
+        )
+        place = Place(id="place-123", name="Blue Bottle Coffee")
+
+        await service.enrich(place)
+
+        indexed = index.get_many(["place-123"])["place-123"]
+        assert indexed.lat == 37.7749
+        assert indexed.lng == -122.4194
+        assert indexed.address == "315 Linden St, San Francisco, CA 94102"
+
     @pytest.mark.asyncio
     async def test_enrich_handles_no_results(self, mock_notion_client, mock_maps_client):
         """enrich should handle when Maps API returns no results."""
@@ -6,10 +6,11 @@ Tests cover:
 - Haversine distance calculations
 - Task filtering by place associations
 - Distance sorting and formatting
+- Place index reuse and backfill
 - AT-127 acceptance test
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -23,6 +24,16 @@ from assistant.services.proximity import (
     haversine_distance,
     is_proximity_query,
 )
+from assistant.services.spatial_index import PlaceSpatialIndex
+
+
+@pytest.fixture(autouse=True)
+def place_index():
+    """Give each test a fresh in-memory place index."""
+    index = PlaceSpatialIndex(persist=False)
+    with patch("assistant.services.proximity.get_place_index", return_value=index):
+        yield index
+    index.close()
 
 
 class TestNearbyTask:
@@ -505,6 +516,90 @@ class TestProximityTaskService:
         assert result.tasks[0].title == "Near task"  # Nearest first
         assert result.tasks[1].title == "Far task"
 
+    @pytest.mark.asyncio
+    async def test_find_tasks_near_uses_indexed_places(self, place_index):
+        """Places already in the index are not fetched from Notion."""
+        place_index.upsert("place-1", 37.7880, -122.4075, "Walgreens", "135 Powell St")
+
+        maps_mock = MagicMock()
+        maps_mock.geocode = AsyncMock(return_value=MagicMock(lat=37.7879, lng=-122.4074))
+
+        notion_mock = MagicMock()
+        notion_mock.query_tasks = AsyncMock(
+            return_value=[
+                {
+                    "id": "task-1",
+                    "properties": {
+                        "title": {"title": [{"text": {"content": "Pick up prescription"}}]},
+                        "status": {"select": {"name": "todo"}},
+                        "priority": {"select": None},
+                        "due_date": {"date": None},
+                        "place_ids": {"relation": [{"id": "place-1"}]},
+                    },
+                }
+            ]
+        )
+        notion_mock.get_place = AsyncMock()
+
+        service = ProximityTaskService(notion_client=notion_mock, maps_client=maps_mock)
+        result = await service.find_tasks_near("Union Square", include_travel_time=False)
+
+        notion_mock.get_place.assert_not_called()
+        assert result.task_count == 1
+        assert result.tasks[0].place_name == "Walgreens"
+        assert result.tasks[0].place_address == "135 Powell St"
+
+    @pytest.mark.asyncio
+    async def test_find_tasks_near_indexes_geocoded_places(self, place_index):
+        """Places geocoded during a query are saved and indexed for the next one."""
+        maps_mock = MagicMock()
+        maps_mock.geocode = AsyncMock(
+            side_effect=[
+                MagicMock(lat=37.7879, lng=-122.4074),  # query location
+                MagicMock(lat=37.7890, lng=-122.4080),  # place address
+                MagicMock(lat=37.7879, lng=-122.4074),  # second query location
+            ]
+        )
+
+        notion_mock = MagicMock()
+        notion_mock.query_tasks = AsyncMock(
+            return_value=[
+                {
+                    "id": "task-1",
+                    "properties": {
+                        "title": {"title": [{"text": {"content": "Return shoes"}}]},
+                        "status": {"select": {"name": "todo"}},
+                        "priority": {"select": None},
+                        "due_date": {"date": None},
+                        "place_ids": {"relation": [{"id": "place-1"}]},
+                    },
+                }
+            ]
+        )
+        notion_mock.get_place = AsyncMock(
+            return_value={
+                "properties": {
+                    "name": {"title": [{"text": {"content": "Shoe Store"}}]},
+                    "address": {"rich_text": [{"text": {"content": "170 O'Farrell St"}}]},
+                    "lat": {"number": None},
+                    "lng": {"number": None},
+                }
+            }
+        )
+        notion_mock.update_place = AsyncMock()
+
+        service = ProximityTaskService(notion_client=notion_mock, maps_client=maps_mock)
+        first = await service.find_tasks_near("Union Square", include_travel_time=False)
+        second = await service.find_tasks_near("Union Square", include_travel_time=False)
+
+        assert first.task_count == 1
+        assert second.task_count == 1
+        assert notion_mock.get_place.await_count == 1
+        assert maps_mock.geocode.await_count == 3
+        assert "place-1" in place_index.get_many(["place-1"])
+        notion_mock.update_place.assert_awaited_once()
+        assert notion_mock.update_place.await_args.kwargs["lat"] == 37.7890
+
     @pytest.mark.asyncio
     async def test_handle_proximity_query_not_proximity(self):
         """Test handle_proximity_query returns None for non-proximity queries."""
@@ -547,6 +642,9 @@ class TestAT127ProximityTaskSuggestions:
         maps_mock.get_travel_time = AsyncMock(
             return_value=MagicMock(duration_seconds=300)  # 5 min
         )
+        maps_mock.get_travel_time_matrix = AsyncMock(
+            return_value=[[MagicMock(duration_seconds=300)] * 3]
+        )
 
         # Mock notion client with 3 tasks in downtown SF
         sf_tasks = [
@@ -631,6 +729,11 @@ class TestAT127ProximityTaskSuggestions:
         distances = [t.distance_meters for t in result.tasks]
         assert distances == sorted(distances), "Tasks should be sorted by distance"
 
+        # Travel times for all results come from one matrix request
+        maps_mock.get_travel_time_matrix.assert_awaited_once()
+        maps_mock.get_travel_time.assert_not_called()
+        assert [t.duration_seconds for t in result.tasks] == [300, 300, 300]
+
         # Format response and verify content
         response = result.format_response()
         assert "Union Square" in response
@@ -88,6 +88,18 @@ class TestSystemdFiles:
             "Service should run briefing command"
         )
 
+    def test_precompute_timer_runs_before_briefing(self, systemd_dir: Path):
+        """Pre-compute timer fires before the 7am send and runs its service."""
+        timer = (systemd_dir / "second-brain-briefing-precompute.timer").read_text()
+        service = (systemd_dir / "second-brain-briefing-precompute.service").read_text()
+        install = (systemd_dir / "install.sh").read_text()
+
+        assert "OnCalendar=*-*-* 06:40:00" in timer
+        assert "Unit=second-brain-briefing-precompute.service" in timer
+        assert "-m assistant briefing-precompute" in service
+        assert "Type=oneshot" in service
+        assert "second-brain-briefing-precompute.timer" in install
+
     def test_main_service_is_always_restart(self, systemd_dir: Path):
         """Main bot service has Restart=always."""
         service_file = systemd_dir / "second-brain.service"
@@ -208,6 +220,27 @@ class TestBriefingCLI:
 
             assert exc_info.value.code == 1
 
+    @pytest.mark.asyncio
+    async def test_precompute_briefing_command(self):
+        """briefing-precompute builds and saves a snapshot."""
+        snapshot = MagicMock()
+        snapshot.generated_at.strftime.return_value = "06:40"
+
+        with (
+            patch("assistant.cli.settings") as mock_settings,
+            patch(
+                "assistant.services.briefing.precompute_briefing",
+                AsyncMock(return_value=snapshot),
+            ) as mock_precompute,
+        ):
+            mock_settings.has_notion = True
+
+            from assistant.cli import precompute_briefing
+
+            await precompute_briefing()
+
+        mock_precompute.assert_awaited_once()
+
 
 class TestAT106:
     """AT-106: Morning Briefing Delivery.
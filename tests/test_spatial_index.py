@@ -0,0 +1,118 @@
+"""Tests for the geohash place index used by proximity search."""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from assistant.services.spatial_index import (
+    PlaceSpatialIndex,
+    covering_cells,
+    geohash_encode,
+    haversine_distance,
+)
+
+UNION_SQUARE = (37.7879, -122.4074)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = PlaceSpatialIndex(path=tmp_path / "places.db")
+    yield index
+    index.close()
+
+
+class TestGeohash:
+    def test_known_value(self):
+        assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_prefix_of_longer_hash(self):
+        lat, lng = UNION_SQUARE
+        assert geohash_encode(lat, lng, 8).startswith(geohash_encode(lat, lng, 4))
+
+    def test_covering_cells_include_corners(self):
+        cells = covering_cells(37.7, -122.5, 37.8, -122.4, 5)
+        for lat, lng in [(37.7, -122.5), (37.8, -122.4), (37.7, -122.4), (37.8, -122.5)]:
+            assert geohash_encode(lat, lng, 5) in cells
+
+
+class TestPlaceSpatialIndex:
+    def test_upsert_and_get_many(self, index):
+        index.upsert("place-1", 37.78, -122.41, "Cafe", "1 Main St")
+
+        found = index.get_many(["place-1", "place-2"])
+
+        assert list(found) == ["place-1"]
+        assert found["place-1"].name == "Cafe"
+        assert found["place-1"].address == "1 Main St"
+        assert len(index) == 1
+
+    def test_upsert_replaces_coordinates(self, index):
+        index.upsert("place-1", 37.78, -122.41)
+        index.upsert("place-1", 34.05, -118.24)
+
+        assert index.get_many(["place-1"])["place-1"].lat == 34.05
+        assert index.query_radius(*UNION_SQUARE, 5000) == []
+
+    def test_get_many_skips_stale_entries(self, index, monkeypatch):
+        index.upsert("place-1", 37.78, -122.41)
+        later = time.time() + 3600
+        monkeypatch.setattr(time, "time", lambda: later)
+
+        assert index.get_many(["place-1"], max_age=60) == {}
+
+    def test_remove(self, index):
+        index.upsert("place-1", 37.78, -122.41)
+        index.remove("place-1")
+
+        assert len(index) == 0
+
+    def test_query_radius_sorted_by_distance(self, index):
+        index.upsert("near", 37.7880, -122.4075)
+        index.upsert("mid", 37.7950, -122.4100)
+        index.upsert("far", 34.0522, -118.2437)
+
+        results = index.query_radius(*UNION_SQUARE, 5000)
+
+        assert [place.place_id for place, _ in results] == ["near", "mid"]
+        assert results[0][1] < results[1][1] <= 5000
+
+    def test_query_radius_restricted_to_place_ids(self, index):
+        index.upsert("a", 37.7880, -122.4075)
+        index.upsert("b", 37.7881, -122.4076)
+
+        results = index.query_radius(*UNION_SQUARE, 1000, place_ids={"b"})
+
+        assert [place.place_id for place, _ in results] == ["b"]
+
+    def test_query_radius_matches_brute_force(self, index):
+        rng = random.Random(7)
+        points = {
+            f"p{i}": (37.7 + rng.uniform(-0.2, 0.2), -122.4 + rng.uniform(-0.2, 0.2))
+            for i in range(500)
+        }
+        for place_id, (lat, lng) in points.items():
+            index.upsert(place_id, lat, lng)
+
+        for radius in (500, 3000, 15000):
+            found = {place.place_id for place, _ in index.query_radius(37.7, -122.4, radius)}
+            expected = {
+                place_id
+                for place_id, (lat, lng) in points.items()
+                if haversine_distance(37.7, -122.4, lat, lng) <= radius
+            }
+            assert found == expected
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "places.db"
+        first = PlaceSpatialIndex(path=path)
+        first.upsert("place-1", 37.78, -122.41, "Cafe")
+        first.close()
+
+        second = PlaceSpatialIndex(path=path)
+        try:
+            assert "place-1" in second.get_many(["place-1"])
+        finally:
+            second.close()
@@ -0,0 +1,206 @@
+"""Tests for the time-bucketed travel-time cache and history model."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from assistant.google.maps import MapsClient, TravelTime
+from assistant.google.travel_cache import (
+    TRAVEL_TIME_TTLS,
+    TravelTimeCache,
+    normalize_location,
+    time_bucket,
+)
+
+MONDAY_8AM = datetime(2026, 1, 12, 8, 15)
+MONDAY_2PM = datetime(2026, 1, 12, 14, 0)
+TUESDAY_8AM = datetime(2026, 1, 13, 8, 30)
+
+
+def travel(seconds: int, traffic: int | None = None, origin: str = "Home") -> TravelTime:
+    return TravelTime(
+        origin=origin,
+        destination="Office",
+        distance_meters=5000,
+        duration_seconds=seconds,
+        duration_in_traffic_seconds=traffic,
+    )
+
+
+@pytest.fixture
+def cache():
+    cache = TravelTimeCache(persist=False)
+    yield cache
+    cache.close()
+
+
+def matrix_payload(seconds: int = 900) -> dict[str, Any]:
+    return {
+        "status": "OK",
+        "rows": [
+            {
+                "elements": [
+                    {
+                        "status": "OK",
+                        "distance": {"value": 5000},
+                        "duration": {"value": seconds},
+                        "duration_in_traffic": {"value": seconds + 300},
+                    }
+                ]
+            }
+        ],
+    }
+
+
+def make_maps(cache: TravelTimeCache, get: AsyncMock) -> MapsClient:
+    http = MagicMock()
+    http.get = get
+    client = MapsClient(api_key="test-key", travel_cache=cache)
+    client._get_client = AsyncMock(return_value=http)
+    return client
+
+
+def ok_response(seconds: int = 900) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = matrix_payload(seconds)
+    return response
+
+
+class TestKeys:
+    """Tests for location normalization and time buckets."""
+
+    def test_coordinates_are_rounded(self):
+        assert normalize_location("37.78791,-122.40741") == normalize_location("37.7881, -122.4069")
+
+    def test_addresses_are_normalized(self):
+        assert normalize_location("123 Main St.") == "123 main st"
+
+    def test_bucket_is_day_and_hour(self):
+        assert time_bucket(MONDAY_8AM) == "0-08"
+        assert time_bucket(TUESDAY_8AM) == "1-08"
+
+
+class TestTravelTimeCache:
+    """Tests for freshness and the historical model."""
+
+    def test_fresh_hit_within_bucket(self, cache):
+        cache.record(travel(600, 900), "driving", when=MONDAY_8AM)
+
+        hit = cache.get("home", "office", "driving", when=MONDAY_8AM)
+
+        assert hit is not None
+        assert hit.duration_in_traffic_seconds == 900
+        assert cache.get("Home", "Office", "driving", when=MONDAY_2PM) is None
+        assert cache.get("Home", "Office", "walking", when=MONDAY_8AM) is None
+
+    def test_driving_expires_before_walking(self, cache):
+        cache.record(travel(600), "driving", when=MONDAY_8AM)
+        cache.record(travel(3000), "walking", when=MONDAY_8AM)
+
+        later = time.time() + TRAVEL_TIME_TTLS["driving"] + 1
+        with patch("assistant.google.travel_cache.time.time", return_value=later):
+            assert cache.get("Home", "Office", "driving", when=MONDAY_8AM) is None
+            assert cache.get("Home", "Office", "walking", when=MONDAY_8AM) is not None
+
+    def test_estimate_prefers_same_bucket(self, cache):
+        cache.record(travel(600, 1200), "driving", when=MONDAY_8AM)
+        cache.record(travel(600, 700), "driving", when=MONDAY_2PM)
+
+        estimate = cache.estimate("Home", "Office", "driving", when=MONDAY_8AM)
+
+        assert estimate is not None
+        assert estimate.estimated
+        assert estimate.duration_in_traffic_seconds == 1200
+
+    def test_estimate_falls_back_to_same_hour_other_day(self, cache):
+        cache.record(travel(600, 1200), "driving", when=MONDAY_8AM)
+        cache.record(travel(600, 700), "driving", when=MONDAY_2PM)
+
+        estimate = cache.estimate("Home", "Office", "driving", when=TUESDAY_8AM)
+
+        assert estimate is not None
+        assert estimate.duration_in_traffic_seconds == 1200
+
+    def test_estimate_smooths_observations(self, cache):
+        cache.record(travel(1000), "driving", when=MONDAY_8AM)
+        cache.record(travel(2000), "driving", when=MONDAY_8AM)
+
+        estimate = cache.estimate("Home", "Office", "driving", when=MONDAY_8AM)
+
+        assert estimate is not None
+        assert 1000 < estimate.duration_seconds < 2000
+
+    def test_unknown_pair_has_no_estimate(self, cache):
+        assert cache.estimate("Home", "Moon", "driving") is None
+
+    def test_rows_are_bounded(self):
+        cache = TravelTimeCache(persist=False, max_entries=2)
+        for hour in range(4):
+            cache.record(travel(600), "driving", when=datetime(2026, 1, 12, hour))
+
+        assert cache.get_stats()["entries"] == 2
+
+
+class TestMapsClientTravelCache:
+    """MapsClient answers from the cache and falls back to history."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_is_served_from_cache(self, cache):
+        get = AsyncMock(return_value=ok_response())
+        maps = make_maps(cache, get)
+
+        first = await maps.get_travel_time("Home", "Office")
+        second = await maps.get_travel_time("Home", "Office")
+
+        get.assert_awaited_once()
+        assert first is not None and second is not None
+        assert second.duration_in_traffic_seconds == 1200
+        assert not second.estimated
+
+    @pytest.mark.asyncio
+    async def test_unavailable_api_answers_from_history(self, cache):
+        cache.record(travel(900, 1500), "driving")
+        cache._db().execute("UPDATE travel_times SET fetched_at = 0")  # stale
+        maps = make_maps(cache, AsyncMock(side_effect=Exception("connection refused")))
+
+        result = await maps.get_travel_time("Home", "Office")
+
+        assert result is not None
+        assert result.estimated
+        assert result.duration_in_traffic_seconds == 1500
+
+    @pytest.mark.asyncio
+    async def test_slow_api_answers_from_history(self, cache):
+        cache.record(travel(900, 1500), "driving")
+        cache._db().execute("UPDATE travel_times SET fetched_at = 0")
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(1)
+            return ok_response()
+
+        maps = make_maps(cache, AsyncMock(side_effect=slow_get))
+
+        with patch("assistant.google.maps.SLOW_MATRIX_TIMEOUT", 0.01):
+            result = await maps.get_travel_time("Home", "Office")
+
+        assert result is not None
+        assert result.estimated
+
+    @pytest.mark.asyncio
+    async def test_matrix_only_requests_missing_pairs(self, cache):
+        cache.record(travel(600, origin="A"), "driving")
+        get = AsyncMock(return_value=ok_response())
+        maps = make_maps(cache, get)
+
+        matrix = await maps.get_travel_time_matrix(["A", "B"], ["Office"])
+
+        get.assert_awaited_once()
+        assert get.await_args.kwargs["params"]["origins"] == "B"
+        assert matrix[0][0] is not None and matrix[0][0].duration_seconds == 600
+        assert matrix[1][0] is not None and matrix[1][0].duration_seconds == 900